@@ -0,0 +1,76 @@
+"""
+Micro-benchmarks of the DualKeyDict lookup patterns used by OpcodeInfoAPI and OpcodeInfo.
+Run with "python -m benchmarks.dual_key_dict" from the repository root
+"""
+from timeit import repeat
+
+from pypenguin.utility     import DualKeyDict, FrozenDualKeyDict
+from pypenguin.opcode_info import info_api
+
+
+def get_benchmarks(opcode_info: DualKeyDict, inputs: DualKeyDict) -> dict[str, tuple[str, dict]]:
+    """
+    Get the benchmarked statements and their namespaces
+    
+    Args:
+        opcode_info: the opcode information of all opcodes
+        inputs: the input information of one opcode
+    
+    Returns:
+        the statement and namespace of each benchmark by name
+    """
+    old_opcodes = list(opcode_info.keys_key1())
+    new_opcodes = list(opcode_info.keys_key2())
+    same_keys = {f"argument {i}": i for i in range(5)}
+    namespace = {
+        "opcode_info": opcode_info, "inputs": inputs, "old_opcodes": old_opcodes, "new_opcodes": new_opcodes,
+        "same_keys": same_keys, "cls": type(opcode_info), "DualKeyDict": DualKeyDict,
+    }
+    return {
+        # get_info_by_old_safe / get_new_by_old_safe
+        "has_key1+get_by_key1"     : ("for o in old_opcodes: opcode_info.has_key1(o) and opcode_info.get_by_key1(o)", namespace),
+        "get_key2_for_key1"        : ("for o in old_opcodes: opcode_info.get_key2_for_key1(o)", namespace),
+        # get_info_by_new_safe / get_old_by_new_safe
+        "has_key2+get_by_key2"     : ("for n in new_opcodes: opcode_info.has_key2(n) and opcode_info.get_by_key2(n)", namespace),
+        "get_key1_for_key2"        : ("for n in new_opcodes: opcode_info.get_key1_for_key2(n)", namespace),
+        # add_group, get_all_old, get_all_new
+        "items_key1_key2"          : ("for _ in opcode_info.items_key1_key2(): pass", namespace),
+        "list(keys_key1)"          : ("list(opcode_info.keys_key1())", namespace),
+        # get_new_input_ids_types, get_input_ids_types
+        "dict(inputs.items_key2)"  : ("dict(inputs.items_key2())", namespace),
+        "copy inputs"              : ("DualKeyDict({(o, n): i for o, n, i in inputs.items_key1_key2()})", namespace),
+        # GET_ALL_INPUT_TYPES__CB_CALL
+        "from_same_keys"           : ("DualKeyDict.from_same_keys(same_keys)", namespace),
+    }
+
+def run_benchmarks(number: int = 2000, repeats: int = 5) -> None:
+    """
+    Run the benchmarks with a DualKeyDict and a FrozenDualKeyDict and print the best time of each
+    
+    Args:
+        number: how often each statement is executed per measurement
+        repeats: how many measurements are taken
+    
+    Returns:
+        None
+    """
+    info_api.load_all_groups()
+    opcode_info = DualKeyDict({(old, new): info for old, new, info in info_api.opcode_info.items_key1_key2()})
+    inputs = info_api.get_info_by_old("control_if_else").inputs
+    variants = {
+        "DualKeyDict"      : (opcode_info, DualKeyDict({(old, new): info for old, new, info in inputs.items_key1_key2()})),
+        "FrozenDualKeyDict": (FrozenDualKeyDict(opcode_info), FrozenDualKeyDict(inputs)),
+    }
+    results = {}
+    for variant_name, (variant_opcode_info, variant_inputs) in variants.items():
+        for name, (statement, namespace) in get_benchmarks(variant_opcode_info, variant_inputs).items():
+            best_time = min(repeat(statement, globals=namespace, number=number, repeat=repeats)) / number
+            results.setdefault(name, {})[variant_name] = best_time
+    
+    print(f"{'benchmark':<26}" + "".join(f"{name:>20}" for name in variants))
+    for name, times in results.items():
+        print(f"{name:<26}" + "".join(f"{times[variant_name]*1e6:>17.2f} us" for variant_name in variants))
+
+
+if __name__ == "__main__":
+    run_benchmarks()
@@ -0,0 +1,149 @@
+"""
+Benchmarks of SRProject.validate with and without a ValidationCache.
+Run with "python -m benchmarks.validation_cache" from the repository root
+"""
+import os
+from tempfile import mkdtemp
+from timeit   import repeat
+
+from pypenguin.utility     import ValidationConfig, ValidationCache
+from pypenguin.opcode_info import info_api
+from pypenguin.core.block      import SRScript, SRBlock, SRBlockAndTextInputValue, SRScriptInputValue
+from pypenguin.core.project    import SRProject
+from pypenguin.core.target     import SRSprite
+from pypenguin.core.vars_lists import SRVariable
+
+
+def create_script(i: int) -> SRScript:
+    """
+    Create a small script, which is different for every i
+
+    Args:
+        i: the index of the script
+
+    Returns:
+        the script
+    """
+    def create_block(opcode: str, inputs: dict) -> SRBlock:
+        return SRBlock(opcode=opcode, inputs=inputs, dropdowns={}, comment=None, mutation=None)
+
+    return SRScript(position=(0, i), blocks=[
+        create_block("when green flag clicked", {}),
+        create_block("forever {BODY}", {"BODY": SRScriptInputValue(blocks=[
+            create_block("move (STEPS) steps", {"STEPS": SRBlockAndTextInputValue(block=None, text=str(i))}),
+            create_block("turn clockwise (DEGREES) degrees", {"DEGREES": SRBlockAndTextInputValue(block=None, text="15")}),
+        ])}),
+    ])
+
+def create_project(script_count: int) -> SRProject:
+    """
+    Create a project with one sprite, which has many scripts
+
+    Args:
+        script_count: the amount of scripts
+
+    Returns:
+        the project
+    """
+    project = SRProject.create_empty()
+    sprite = SRSprite.create_empty(name="Sprite1")
+    sprite.scripts = [create_script(i) for i in range(script_count)]
+    project.sprites = [sprite]
+    project.sprite_layer_stack = [sprite.uuid]
+    return project
+
+def edit_project(project: SRProject) -> None:
+    """
+    Change one input of one script of a project in place
+
+    Args:
+        project: the project created with create_project
+
+    Returns:
+        None
+    """
+    scripts = project.sprites[0].scripts
+    move_block = scripts[len(scripts) // 2].blocks[1].inputs["BODY"].blocks[0]
+    move_block.inputs["STEPS"].text = str(int(move_block.inputs["STEPS"].text) + 1)
+
+def add_variable(project: SRProject) -> SRProject:
+    """
+    Create a structurally sharing copy of a project with an additional variable, so its scripts have another context
+
+    Args:
+        project: the project
+
+    Returns:
+        the new project
+    """
+    return project.evolve(all_sprite_variables=[*project.all_sprite_variables, SRVariable(name="a variable", current_value=0)])
+
+def save_and_load(cache: ValidationCache) -> ValidationCache:
+    """
+    Save a cache to a temporary file and load it again, like a cache of a previous run
+
+    Args:
+        cache: the cache
+
+    Returns:
+        the loaded cache
+    """
+    file_path = os.path.join(mkdtemp(), "validation_cache.json")
+    cache.save(file_path)
+    return ValidationCache.load(file_path)
+
+def get_benchmarks(script_count: int) -> dict[str, tuple[str, str, dict]]:
+    """
+    Get the benchmarked statements, their setup statements and their namespaces.
+    The setup is executed before every measurement and isn't measured
+
+    Args:
+        script_count: the amount of scripts of the validated project
+
+    Returns:
+        the statement, setup and namespace of each benchmark by name
+    """
+    namespace = {
+        "create_project": create_project, "edit_project": edit_project, "add_variable": add_variable, 
+        "save_and_load": save_and_load, "script_count": script_count,
+        "config": ValidationConfig(), "info_api": info_api, "ValidationCache": ValidationCache,
+    }
+    validate = "project.validate(config, info_api)"
+    validate_cached = "project.validate(config, info_api, cache)"
+    new_project = "project = create_project(script_count)"
+    warm_cache = f"{new_project}; cache = ValidationCache(); {validate_cached}"
+    return {
+        "validate"              : (validate       , new_project                                 , namespace),
+        "cached, first run"     : (validate_cached, f"{new_project}; cache = ValidationCache()", namespace),
+        "cached, unchanged"     : (validate_cached, warm_cache                                  , namespace),
+        "cached, after one edit": (validate_cached, f"{warm_cache}; edit_project(project)"      , namespace),
+        # another project with the same scripts
+        "shared, evolved project"          : (validate_cached, f"{warm_cache}; project = add_variable(project)", namespace),
+        "shared, new equal project"        : (validate_cached, f"{warm_cache}; {new_project}"                  , namespace),
+        "shared, new project other context": (validate_cached, f"{warm_cache}; project = add_variable(create_project(script_count))", namespace),
+        "persisted, new equal project"     : (validate_cached, f"{warm_cache}; cache = save_and_load(cache); {new_project}", namespace),
+    }
+
+def run_benchmarks(script_count: int = 6007, repeats: int = 5) -> None:
+    """
+    Run the benchmarks and print the best time of each, also relative to validating without a cache
+
+    Args:
+        script_count: the amount of scripts of the validated project
+        repeats: how many measurements are taken
+
+    Returns:
+        None
+    """
+    info_api.load_all_groups()
+    results = {}
+    for name, (statement, setup, namespace) in get_benchmarks(script_count).items():
+        results[name] = min(repeat(statement, setup, globals=namespace, number=1, repeat=repeats))
+
+    print(f"{'benchmark':<36}{'time':>12}{'relative':>12}")
+    for name, best_time in results.items():
+        print(f"{name:<36}{best_time*1e3:>9.2f} ms{best_time / results['validate']:>11.2f}x")
+
+
+if __name__ == "__main__":
+    run_benchmarks()
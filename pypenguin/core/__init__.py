@@ -1,7 +1,9 @@
 from pypenguin.core.asset          import *
 from pypenguin.core.block          import *
 from pypenguin.core.block_api      import *
+from pypenguin.core.block_index    import *
 from pypenguin.core.block_mutation import *
+from pypenguin.core.block_store    import *
 from pypenguin.core.comment        import *
 from pypenguin.core.context        import *
 from pypenguin.core.custom_block   import *
@@ -10,5 +12,7 @@ from pypenguin.core.enums          import *
 from pypenguin.core.extension      import *
 from pypenguin.core.monitor        import *
 from pypenguin.core.project        import *
+from pypenguin.core.project_diff   import *
+from pypenguin.core.raw_validation import *
 from pypenguin.core.target         import *
 from pypenguin.core.vars_lists     import *
@@ -1,15 +1,38 @@
-from typing    import Any
-from PIL       import Image
-from xml.etree import ElementTree
-from pydub     import AudioSegment
-import wave
+from io     import BytesIO
+from types  import ModuleType
+from typing import Any, TYPE_CHECKING
 
 from pypenguin.utility import (
-    grepr_dataclass, ValidationConfig, 
+    grepr_dataclass, ContentHashMixin, ValidationConfig, FieldConstraint, compile_field_validator, lazy_field_validator,
     AA_TYPE, AA_COORD_PAIR, AA_MIN,
     ThanksError,
 )
 
+if TYPE_CHECKING:
+    # PIL and ElementTree are slow to import, so they are only imported when a costume is decoded or validated
+    from PIL       import Image
+    from xml.etree import ElementTree
+
+
+def _import_image() -> ModuleType:
+    """
+    *[Internal Function]* Import PIL.Image on first use
+    
+    Returns:
+        the PIL.Image module
+    """
+    from PIL import Image
+    return Image
+
+def _import_element_tree() -> ModuleType:
+    """
+    *[Internal Function]* Import xml.etree.ElementTree on first use
+    
+    Returns:
+        the ElementTree module
+    """
+    from xml.etree import ElementTree
+    return ElementTree
 
 @grepr_dataclass(grepr_fields=["name", "asset_id", "data_format", "md5ext", "rotation_center_x", "rotation_center_y", "bitmap_resolution"])
 class FRCostume:
@@ -46,10 +69,14 @@ class FRCostume:
             bitmap_resolution = data.get("bitmapResolution", None),
         )
 
-    def step(self, asset_files: dict[str, bytes]) -> "SRCostume": # TODO: update tests
+    def step(self, asset_files: dict[str, bytes], decode_assets: bool = True) -> "SRCostume": # TODO: update tests
         """
         Converts a FRComment into a SRComment
         
+        Args:
+            asset_files: the contents of the costume and sound files
+            decode_assets: wether to decode the costume file. If not, a SRRawCostume keeping the raw bytes is returned
+        
         Returns:
             the SRComment
         """
@@ -57,7 +84,16 @@ class FRCostume:
         bitmap_resolution = 1 if self.bitmap_resolution is None else self.bitmap_resolution
         content_bytes = asset_files[self.md5ext]
         
-        if   self.data_format == "svg":
+        if   not decode_assets:
+            return SRRawCostume(
+                name              = self.name,
+                file_extension    = self.data_format,
+                rotation_center   = rotation_center,
+                bitmap_resolution = bitmap_resolution,
+                content           = content_bytes,
+            )
+        elif self.data_format == "svg":
+            ElementTree = _import_element_tree()
             return SRVectorCostume(
                 name              = self.name,
                 file_extension    = self.data_format,
@@ -66,7 +102,7 @@ class FRCostume:
                 content           = ElementTree.fromstring(content_bytes.decode("utf-8")),
             )
         elif self.data_format in {"png", "jpg", "jpeg", "bmp", "gif"}:
-            image = Image.open(content_bytes)
+            image = _import_image().open(BytesIO(content_bytes))
             image.load()  # Ensure it's fully loaded into memory
             return SRBitmapCostume(
                 name              = self.name,
@@ -124,7 +160,7 @@ class FRSound:
         )
 
 @grepr_dataclass(grepr_fields=["name", "file_extension", "rotation_center", "bitmap_resolution"])
-class SRCostume:
+class SRCostume(ContentHashMixin):
     """
     The second representation for a costume. It is more user friendly then the first representation
     """
@@ -133,6 +169,14 @@ class SRCostume:
     file_extension: str
     rotation_center: tuple[int | float, int | float]
     bitmap_resolution: int
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "name", str),
+        FieldConstraint(AA_TYPE, "file_extension", str),
+        FieldConstraint(AA_COORD_PAIR, "rotation_center"),
+        FieldConstraint(AA_TYPE, "bitmap_resolution", int),
+        FieldConstraint(AA_MIN, "bitmap_resolution", min=1),
+    )
     
     @classmethod
     def create_empty(cls, name: str = "empty") -> "SRCostume": # TODO: move
@@ -157,11 +201,7 @@ class SRCostume:
         Raises:
             ValidationError: if the SRCostume is invalid
         """
-        AA_TYPE(self, path, "name", str)
-        AA_TYPE(self, path, "file_extension", str)
-        AA_COORD_PAIR(self, path, "rotation_center")
-        AA_TYPE(self, path, "bitmap_resolution", int)
-        AA_MIN(self, path, "bitmap_resolution", min=1)
+        self.__validate_fields(path)
 
 @grepr_dataclass(grepr_fields=["content"], parent_cls=SRCostume)
 class SRVectorCostume(SRCostume):
@@ -169,7 +209,11 @@ class SRVectorCostume(SRCostume):
     The second representation for a vector(SVG) costume. It is more user friendly then the first representation
     """
     
-    content: ElementTree.Element
+    content: "ElementTree.Element"
+
+    __validate_fields = lazy_field_validator(lambda: (
+        FieldConstraint(AA_TYPE, "content", _import_element_tree().Element),
+    ))
     
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
@@ -187,7 +231,7 @@ class SRVectorCostume(SRCostume):
         """
         super().validate(path, config)
         
-        AA_TYPE(self, path, "content", ElementTree.Element)
+        self.__validate_fields(path)
 
 @grepr_dataclass(grepr_fields=["content"], parent_cls=SRCostume)
 class SRBitmapCostume(SRCostume):
@@ -195,7 +239,11 @@ class SRBitmapCostume(SRCostume):
     The second representation for a bitmap(usually PNG) costume. It is more user friendly then the first representation
     """
     
-    content: Image.Image
+    content: "Image.Image"
+
+    __validate_fields = lazy_field_validator(lambda: (
+        FieldConstraint(AA_TYPE, "content", _import_image().Image),
+    ))
     
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
@@ -213,16 +261,52 @@ class SRBitmapCostume(SRCostume):
         """
         super().validate(path, config)
         
-        AA_TYPE(self, path, "content", Image.Image)
+        self.__validate_fields(path)
+
+@grepr_dataclass(grepr_fields=["content"], parent_cls=SRCostume)
+class SRRawCostume(SRCostume):
+    """
+    The second representation for a costume, whose file wasn't decoded(see FRProject.step with decode_assets=False). 
+    Used by tools, which only work with scripts and never touch images
+    """
+    
+    content: bytes
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "content", bytes),
+    )
+    
+    def validate(self, path: list, config: ValidationConfig) -> None:
+        """
+        Ensure a SRRawCostume is valid, raise ValidationError if not
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+        
+        Returns:
+            None
+        
+        Raises:
+            ValidationError: if the SRRawCostume is invalid
+        """
+        super().validate(path, config)
+        
+        self.__validate_fields(path)
 
 @grepr_dataclass(grepr_fields=["name", "file_extension"])
-class SRSound:
+class SRSound(ContentHashMixin):
     """
     The second representation for a sound. It is more user friendly then the first representation
     """
 
     name: str
     file_extension: str
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "name", str),
+        FieldConstraint(AA_TYPE, "file_extension", str),
+    )
     
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
@@ -238,9 +322,8 @@ class SRSound:
         Raises:
             ValidationError: if the SRSound is invalid
         """
-        AA_TYPE(self, path, "name", str)
-        AA_TYPE(self, path, "file_extension", str)
+        self.__validate_fields(path)
  
 
-__all__ = ["FRCostume", "SRVectorCostume", "SRBitmapCostume", "FRSound", "SRCostume", "SRSound"]
+__all__ = ["FRCostume", "SRVectorCostume", "SRBitmapCostume", "SRRawCostume", "FRSound", "SRCostume", "SRSound"]
 
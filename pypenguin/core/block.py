@@ -1,9 +1,10 @@
-from typing      import Any, TYPE_CHECKING
+from typing      import Any, Iterator, TYPE_CHECKING
 from dataclasses import field
 from abc         import ABC, abstractmethod
 
 from pypenguin.utility           import (
-    grepr_dataclass, ValidationConfig, get_closest_matches, tuplify,
+    grepr_dataclass, ContentHashMixin, ValidationConfig, ValidationLevel, tuplify,
+    FieldConstraint, compile_field_validator, lazy_field_validator, PathNode,
     AA_TYPE, AA_NONE, AA_NONE_OR_TYPE, AA_COORD_PAIR, AA_LIST_OF_TYPE, AA_DICT_OF_TYPE, AA_MIN_LEN,
     DeserializationError, FirstToInterConversionError, InterToSecondConversionError,
     UnnecessaryInputError, MissingInputError, UnnecessaryDropdownError, MissingDropdownError, InvalidOpcodeError, InvalidBlockShapeError,
@@ -53,22 +54,13 @@ class FRBlock:
             the FRBlock
         """
         opcode = data["opcode"]
-        opcode_info = info_api.get_info_by_old(opcode)
-        if opcode_info.old_mutation_cls is None:
-            if "mutation" in data:
-                raise DeserializationError(f"Invalid mutation for FRBlock with opcode {repr(opcode)}: {data['mutation']}")
-            mutation = None
-        else:
-            if "mutation" not in data:
-                cls_name = opcode_info.old_mutation_cls.__name__
-                raise DeserializationError(f"Missing mutation of type {cls_name} for FRBlock with opcode {repr(opcode)}")
-            mutation = opcode_info.old_mutation_cls.from_data(data["mutation"])
+        mutation = FRBlock._mutation_from_data(opcode, data, info_api) # loads the lazy group of the opcode before interning
         return cls(
-            opcode    = opcode,
+            opcode    = info_api.intern(opcode),
             next      = data["next"    ],
             parent    = data["parent"  ],
-            inputs    = tuplify(data["inputs"]),
-            fields    = tuplify(data["fields"]),
+            inputs    = info_api.intern_keys(tuplify(data["inputs"])),
+            fields    = info_api.intern_keys(tuplify(data["fields"])),
             shadow    = data["shadow"  ],
             top_level = data["topLevel"],
             x         = data.get("x", None),
@@ -77,6 +69,32 @@ class FRBlock:
             mutation  = mutation,
         )
     
+    @staticmethod
+    def _mutation_from_data(opcode: str, data: dict[str, Any], info_api: OpcodeInfoAPI) -> FRMutation | None:
+        """
+        *[Helper Method]* Deserializes the mutation in the raw data of a block. Also used by FRBlockStore.from_data
+        
+        Args:
+            opcode: the opcode of the block
+            data: the raw data of the block
+            info_api: the opcode info api used to fetch information about opcodes
+        
+        Returns:
+            the FRMutation or None if the opcode has no mutation
+        
+        Raises:
+            DeserializationError: if the opcode requires a mutation, which is missing, or the opcode has no mutation, but one is given
+        """
+        opcode_info = info_api.get_info_by_old(opcode)
+        if opcode_info.old_mutation_cls is None:
+            if "mutation" in data:
+                raise DeserializationError(f"Invalid mutation for FRBlock with opcode {repr(opcode)}: {data['mutation']}")
+            return None
+        if "mutation" not in data:
+            cls_name = opcode_info.old_mutation_cls.__name__
+            raise DeserializationError(f"Missing mutation of type {cls_name} for FRBlock with opcode {repr(opcode)}")
+        return opcode_info.old_mutation_cls.from_data(data["mutation"])
+    
     @classmethod
     def from_tuple(cls, 
             data: tuple[str, str, str] | tuple[str, str, str, int|float, int|float],
@@ -149,11 +167,13 @@ class FRBlock:
             the IRBlock
         """
         opcode_info = info_api.get_info_by_old(self.opcode)
-        pre_handler = opcode_info.get_special_case(SpecialCaseType.PRE_FR_STEP)
-        if pre_handler is not None:
-            self = pre_handler.call(ficapi=ficapi, block=self)
+        instead_handler = None
+        if opcode_info.has_special_cases():
+            pre_handler = opcode_info.get_special_case(SpecialCaseType.PRE_FR_STEP)
+            if pre_handler is not None:
+                self = pre_handler.call(ficapi=ficapi, block=self)
+            instead_handler = opcode_info.get_special_case(SpecialCaseType.FR_STEP)
         
-        instead_handler = opcode_info.get_special_case(SpecialCaseType.FR_STEP)
         if instead_handler is None:
             new_inputs = self._step_inputs(
                 ficapi  = ficapi,
@@ -427,8 +447,52 @@ class IRBlockReference:
 
 
 
-@grepr_dataclass(grepr_fields=["position", "blocks"])
-class SRScript:
+def _run_validation_steps(steps: Iterator[Iterator]) -> None:
+    """
+    *[Internal Function]* Run validation steps with an explicit stack instead of recursion, 
+    so deeply nested scripts don't hit the recursion limit.
+    Validation steps are generators, which yield the validation steps of their children. 
+    A child is completely validated before its parent continues, just like with recursive calls
+    
+    Args:
+        steps: the validation steps of the item to validate
+    
+    Returns:
+        None
+    """
+    stack = [steps]
+    while stack:
+        child_steps = next(stack[-1], None)
+        if child_steps is None:
+            stack.pop()
+        else:
+            stack.append(child_steps)
+
+def _get_opcode_type_to_check(
+    opcode_info: OpcodeInfo,
+    block: "SRBlock",
+    config: ValidationConfig,
+    validation_api: "ValidationAPI",
+) -> OpcodeType | None:
+    """
+    *[Internal Function]* Get the opcode type of a block for the shape checks.
+    Dynamic opcode types might depend on other blocks(e.g. custom block definitions), so they are only checked from ValidationLevel.REFERENTIAL on
+
+    Args:
+        opcode_info: the opcode info of the block
+        block: the block
+        config: Configuration for Validation Behaviour
+        validation_api: API used to fetch information about other blocks
+
+    Returns:
+        the opcode type or None if it shouldn't be checked
+    """
+    if (opcode_info.opcode_type == OpcodeType.DYNAMIC) and not config.level.includes(ValidationLevel.REFERENTIAL):
+        return None
+    return opcode_info.get_opcode_type(block=block, validation_api=validation_api)
+
+@grepr_dataclass(grepr_fields=["position", "blocks"], eq=False)
+class SRScript(ContentHashMixin):
     """
     The second representation for a script. 
     It uses a nested block structure and is much more user friendly then the first representation
@@ -437,6 +501,12 @@ class SRScript:
     position: tuple[int | float, int | float]
     blocks: list["SRBlock"]
 
+    __validate_fields = lazy_field_validator(lambda: (
+        FieldConstraint(AA_COORD_PAIR, "position"),
+        FieldConstraint(AA_LIST_OF_TYPE, "blocks", SRBlock),
+        FieldConstraint(AA_MIN_LEN, "blocks", min_len=1),
+    ))
+
     def validate(self, 
         path: list, 
         config: ValidationConfig,
@@ -460,13 +530,33 @@ class SRScript:
         Raises:
             ValidationError: if the SRScript is invalid
         """
-        AA_COORD_PAIR(self, path, "position")
-        AA_LIST_OF_TYPE(self, path, "blocks", SRBlock)
-        AA_MIN_LEN(self, path, "blocks", min_len=1)
+        _run_validation_steps(self._validation_steps(path, config, info_api, validation_api, context))
+
+    def _validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        validation_api: "ValidationAPI",
+        context: CompleteContext,
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The validation steps of a SRScript(see validate and _run_validation_steps)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            validation_api: API used to fetch information about other blocks 
+            context: Context about parts of the project. Used to validate the values of dropdowns
+        
+        Returns:
+            the validation steps of the blocks
+        """
+        self.__validate_fields(path)
         
         for i, block in enumerate(self.blocks):
-            current_path = path+["blocks", i]
-            block.validate(
+            current_path = PathNode(path, "blocks", i)
+            yield block._validation_steps(
                 path             = current_path,
                 config           = config,
                 info_api         = info_api,
@@ -475,7 +565,9 @@ class SRScript:
                 expects_reporter = False,
             )
             opcode_info = info_api.get_info_by_new(block.opcode)
-            opcode_type = opcode_info.get_opcode_type(block=block, validation_api=validation_api)
+            opcode_type = _get_opcode_type_to_check(opcode_info, block, config, validation_api)
+            if opcode_type is None:
+                continue
             SRBlock.validate_opcode_type(
                 opcode_type  = opcode_type,
                 path         = current_path,
@@ -485,8 +577,55 @@ class SRScript:
                 is_last      = ((i+1) == len(self.blocks)),
             )
 
-@grepr_dataclass(grepr_fields=["opcode", "inputs", "dropdowns", "comment", "mutation"])
-class SRBlock:
+    def validate_dropdown_values(self, 
+        path: list, 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        context: CompleteContext,
+    ) -> None:
+        """
+        Ensure the dropdown values of all blocks of a SRScript are valid in the given context, raise ValidationError if not.
+        This is the only part of validate, which depends on the project context. 
+        So it is enough to call it for a script, which is known to be valid otherwise(see ValidationCache). 
+        **Requires the script to be valid except for the dropdown values.** The dropdowns are checked in the same order as in validate
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            context: Context about parts of the project. Used to validate the values of dropdowns
+        
+        Returns:
+            None
+        
+        Raises:
+            ValidationError: if a dropdown value of the SRScript is invalid
+        """
+        _run_validation_steps(self._dropdown_validation_steps(path, config, info_api, context))
+
+    def _dropdown_validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        context: CompleteContext,
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The dropdown validation steps of a SRScript(see validate_dropdown_values and _run_validation_steps)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            context: Context about parts of the project. Used to validate the values of dropdowns
+        
+        Returns:
+            the dropdown validation steps of the blocks
+        """
+        for i, block in enumerate(self.blocks):
+            yield block._dropdown_validation_steps(PathNode(path, "blocks", i), config, info_api, context)
+
+@grepr_dataclass(grepr_fields=["opcode", "inputs", "dropdowns", "comment", "mutation"], eq=False)
+class SRBlock(ContentHashMixin):
     """
     The second representation for a block. 
     It uses a nested block structure and is much more user friendly then the first representation
@@ -497,6 +636,14 @@ class SRBlock:
     dropdowns: dict[str, SRDropdownValue]
     comment: SRComment | None
     mutation: "SRMutation | None"
+
+    __validate_fields = lazy_field_validator(lambda: (
+        FieldConstraint(AA_TYPE, "opcode", str),
+        FieldConstraint(AA_DICT_OF_TYPE, "inputs"   , key_t=str, value_t=SRInputValue   ),
+        FieldConstraint(AA_DICT_OF_TYPE, "dropdowns", key_t=str, value_t=SRDropdownValue),
+        FieldConstraint(AA_NONE_OR_TYPE, "comment", SRComment),
+        FieldConstraint(AA_NONE_OR_TYPE, "mutation", SRMutation),
+    ))
     
     def validate(self, 
         path: list, 
@@ -529,16 +676,36 @@ class SRBlock:
             MissingDropdownError(ValidationError): if an expected key of dropdowns for the specific opcode is missing
             InvalidBlockShapeError(ValidationError): if a reporter block was expected but a non-reporter block was found
         """
-        AA_TYPE(self, path, "opcode", str)
-        AA_DICT_OF_TYPE(self, path, "inputs"   , key_t=str, value_t=SRInputValue   )
-        AA_DICT_OF_TYPE(self, path, "dropdowns", key_t=str, value_t=SRDropdownValue)
-        AA_NONE_OR_TYPE(self, path, "comment", SRComment)
-        AA_NONE_OR_TYPE(self, path, "mutation", SRMutation)
+        _run_validation_steps(self._validation_steps(path, config, info_api, validation_api, context, expects_reporter))
+
+    def _validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        validation_api: "ValidationAPI", 
+        context: CompleteContext,
+        expects_reporter: bool,
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The validation steps of a SRBlock(see validate and _run_validation_steps)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            validation_api: API used to fetch information about other blocks 
+            context: Context about parts of the project. Used to validate dropdowns
+            expects_reporter: Wether this block should be a reporter
+        
+        Returns:
+            the validation steps of the inputs
+        """
+        self.__validate_fields(path)
         
         cls_name = self.__class__.__name__
         opcode_info = info_api.get_info_by_new_safe(self.opcode)
         if opcode_info is None:
-            closest_matches = get_closest_matches(self.opcode, info_api.get_all_new(), n=10)
+            closest_matches = info_api.get_closest_new_opcodes(self.opcode, n=10)
             msg = (
                 f"opcode of {cls_name} must be a defined opcode not {repr(self.opcode)}. "
                 f"The closest matches are: \n  - "+"\n  - ".join([repr(m) for m in closest_matches])
@@ -546,13 +713,13 @@ class SRBlock:
             raise InvalidOpcodeError(path, msg)
         
         if self.comment is not None:
-            self.comment.validate(path+["comment"], config)
+            self.comment.validate(PathNode(path, "comment"), config)
         
         if opcode_info.new_mutation_cls is None:
             AA_NONE(self, path, "mutation", condition="For this opcode")
         else:
             AA_TYPE(self, path, "mutation", opcode_info.new_mutation_cls, condition="For this opcode")
-            self.mutation.validate(path+["mutation"], config)
+            self.mutation.validate(PathNode(path, "mutation"), config)
 
         input_types = opcode_info.get_new_input_ids_types(block=self, ficapi=None) 
         # maps input ids to their types # ficapi isn't necessary for a IRBlock
@@ -562,8 +729,8 @@ class SRBlock:
                 raise UnnecessaryInputError(path, 
                     f"inputs of {cls_name} with opcode {repr(self.opcode)} includes unnecessary input {repr(new_input_id)}",
                 )
-            input.validate(
-                path           = path+["inputs", (new_input_id,)],
+            yield input._validation_steps(
+                path           = PathNode(path, "inputs", (new_input_id,)),
                 config         = config,
                 info_api       = info_api,
                 validation_api = validation_api,
@@ -582,27 +749,67 @@ class SRBlock:
                 raise UnnecessaryDropdownError(path, 
                     f"dropdowns of {cls_name} with opcode {repr(self.opcode)} includes unnecessary dropdown {repr(new_dropdown_id)}",
                 )
-            current_path = path+["dropdowns", (new_dropdown_id,)]
+            current_path = PathNode(path, "dropdowns", (new_dropdown_id,))
             dropdown.validate(current_path, config)
-            dropdown.validate_value(
-                path          = current_path,
-                config        = config,
-                dropdown_type = opcode_info.get_dropdown_info_by_new(new_dropdown_id).type,
-                context       = context,
-            )
+            if config.level.includes(ValidationLevel.REFERENTIAL):
+                dropdown.validate_value(
+                    path          = current_path,
+                    config        = config,
+                    dropdown_type = opcode_info.get_dropdown_info_by_new(new_dropdown_id).type,
+                    context       = context,
+                )
         for new_dropdown_id in new_dropdown_ids:
             if new_dropdown_id not in self.dropdowns:
                 raise MissingDropdownError(path, 
                     f"dropdowns of {cls_name} with opcode {repr(self.opcode)} is missing dropdown {repr(new_dropdown_id)}",
                 )
         
-        opcode_type = opcode_info.get_opcode_type(block=self, validation_api=validation_api)
-        if expects_reporter and not(opcode_type.is_reporter()):
-            raise InvalidBlockShapeError(path, "Expected a reporter block here")
+        if expects_reporter:
+            opcode_type = _get_opcode_type_to_check(opcode_info, self, config, validation_api)
+            if (opcode_type is not None) and not(opcode_type.is_reporter()):
+                raise InvalidBlockShapeError(path, "Expected a reporter block here")
 
-        post_case = opcode_info.get_special_case(SpecialCaseType.POST_VALIDATION)
-        if post_case is not None:
-            post_case.call(path=path, block=self)
+        if opcode_info.has_special_cases() and config.level.includes(ValidationLevel.FULL):
+            post_case = opcode_info.get_special_case(SpecialCaseType.POST_VALIDATION)
+            if post_case is not None:
+                post_case.call(path=path, block=self)
+
+    def _dropdown_validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        context: CompleteContext,
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The dropdown validation steps of a SRBlock(see SRScript.validate_dropdown_values and _run_validation_steps)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            context: Context about parts of the project. Used to validate dropdowns
+        
+        Returns:
+            the dropdown validation steps of the inputs
+        """
+        opcode_info = info_api.get_info_by_new(self.opcode)
+        if self.inputs:
+            input_types = opcode_info.get_new_input_ids_types(block=self, ficapi=None)
+            for new_input_id, input in self.inputs.items():
+                yield input._dropdown_validation_steps(
+                    path       = PathNode(path, "inputs", (new_input_id,)),
+                    config     = config,
+                    info_api   = info_api,
+                    context    = context,
+                    input_type = input_types[new_input_id],
+                )
+        for new_dropdown_id, dropdown in self.dropdowns.items():
+            dropdown.validate_value(
+                path          = PathNode(path, "dropdowns", (new_dropdown_id,)),
+                config        = config,
+                dropdown_type = opcode_info.get_dropdown_info_by_new(new_dropdown_id).type,
+                context       = context,
+            )
 
     @staticmethod
     def validate_opcode_type(
@@ -647,7 +854,7 @@ class SRBlock:
 
 
 @grepr_dataclass(grepr_fields=[], eq=False, init=False)
-class SRInputValue(ABC):
+class SRInputValue(ContentHashMixin, ABC):
     """
     The second representation for a block input. 
     It can contain a substack of blocks, a block, a text field and a dropdown
@@ -661,6 +868,10 @@ class SRInputValue(ABC):
     text: str                 | None = field(init=False)
     dropdown: SRDropdownValue | None = field(init=False)
 
+    __validate_block_field = compile_field_validator(
+        FieldConstraint(AA_NONE_OR_TYPE, "block", SRBlock),
+    )
+
     def __init__(self) -> None:
         """
         Create a SRInputValue. 
@@ -688,6 +899,9 @@ class SRInputValue(ABC):
             return NotImplemented
         if type(self) != type(other):
             return NotImplemented
+        is_equal = self._compare_content_hashes(other)
+        if is_equal is not None:
+            return is_equal
         if len(self._grepr_fields) != len(other._grepr_fields):
             return False
         for attr in self._grepr_fields:
@@ -755,6 +969,58 @@ class SRInputValue(ABC):
             ValidationError: if the SRInputValue is invalid
         """
 
+    def _validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        validation_api: "ValidationAPI", 
+        context: CompleteContext, 
+        input_type: InputType, 
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The validation steps of this input(see validate and _run_validation_steps). 
+        Subclasses, which don't override this method, are validated by calling their validate method
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            validation_api: API used to fetch information about other blocks 
+            context: Context about parts of the project. Used to validate dropdowns
+            input_type: the type of this input. Used to valdiate dropdowns
+        
+        Returns:
+            the validation steps of the contained blocks
+        """
+        self.validate(path, config, info_api, validation_api, context, input_type)
+        return
+        yield
+
+    def _dropdown_validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        context: CompleteContext, 
+        input_type: InputType, 
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The dropdown validation steps of this input(see SRScript.validate_dropdown_values and _run_validation_steps). 
+        By default only the block of the input is checked
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            context: Context about parts of the project. Used to validate dropdowns
+            input_type: the type of this input. Used to valdiate dropdowns
+        
+        Returns:
+            the dropdown validation steps of the contained blocks
+        """
+        block: SRBlock | None = self.block
+        if block is not None:
+            yield block._dropdown_validation_steps(PathNode(path, "block"), config, info_api, context)
+
     def _validate_block(self, 
         path: list, 
         config: ValidationConfig,
@@ -778,11 +1044,33 @@ class SRInputValue(ABC):
         Raises:
             ValidationError: if the block of the SRInputValue is invalid
         """
+        _run_validation_steps(self._block_validation_steps(path, config, info_api, validation_api, context))
+
+    def _block_validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        validation_api: "ValidationAPI", 
+        context: CompleteContext, 
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The validation steps of the block of this input
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            validation_api: API used to fetch information about other blocks 
+            context: Context about parts of the project. Used to validate dropdowns
+        
+        Returns:
+            the validation steps of the block
+        """
         block: SRBlock = self.block
-        AA_NONE_OR_TYPE(self, path, "block", SRBlock)
+        self.__validate_block_field(path)
         if block is not None:
-            block.validate(
-                path             = path+["block"],
+            yield block._validation_steps(
+                path             = PathNode(path, "block"),
                 config           = config,
                 info_api         = info_api,
                 validation_api   = validation_api,
@@ -798,6 +1086,10 @@ class SRBlockAndTextInputValue(SRInputValue):
 
     block: SRBlock | None
     text : str
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "text", str),
+    )
     
     def validate(self, 
         path: list, 
@@ -824,14 +1116,38 @@ class SRBlockAndTextInputValue(SRInputValue):
         Raises:
             ValidationError: if the SRBlockAndTextInputValue is invalid
         """
-        self._validate_block(
+        _run_validation_steps(self._validation_steps(path, config, info_api, validation_api, context, input_type))
+
+    def _validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        validation_api: "ValidationAPI", 
+        context: CompleteContext, 
+        input_type: InputType, 
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The validation steps of a SRBlockAndTextInputValue(see validate and _run_validation_steps)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            validation_api: API used to fetch information about other blocks 
+            context: Context about parts of the project. Used to validate dropdowns
+            input_type: the type of this input. Used to valdiate dropdowns
+        
+        Returns:
+            the validation steps of the contained blocks
+        """
+        yield from self._block_validation_steps(
             path           = path,
             config         = config,
             info_api       = info_api,
             validation_api = validation_api,
             context        = context,
         )
-        AA_TYPE(self, path, "text", str)
+        self.__validate_fields(path)
 
 @grepr_dataclass(grepr_fields=["block", "dropdown"], parent_cls=SRInputValue, eq=False)
 class SRBlockAndDropdownInputValue(SRInputValue):
@@ -842,6 +1158,10 @@ class SRBlockAndDropdownInputValue(SRInputValue):
     block   : SRBlock         | None
     dropdown: SRDropdownValue | None
 
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_NONE_OR_TYPE, "dropdown", SRDropdownValue),
+    )
+
     def validate(self, 
         path: list, 
         config: ValidationConfig,
@@ -867,19 +1187,73 @@ class SRBlockAndDropdownInputValue(SRInputValue):
         Raises:
             ValidationError: if the SRBlockAndDropdownInputValue is invalid
         """
-        self._validate_block(
+        _run_validation_steps(self._validation_steps(path, config, info_api, validation_api, context, input_type))
+
+    def _validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        validation_api: "ValidationAPI", 
+        context: CompleteContext, 
+        input_type: InputType, 
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The validation steps of a SRBlockAndDropdownInputValue(see validate and _run_validation_steps)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            validation_api: API used to fetch information about other blocks 
+            context: Context about parts of the project. Used to validate dropdowns
+            input_type: the type of this input. Used to valdiate dropdowns
+        
+        Returns:
+            the validation steps of the contained blocks
+        """
+        yield from self._block_validation_steps(
             path           = path,
             config         = config,
             info_api       = info_api,
             validation_api = validation_api,
             context        = context,
         )
-        AA_NONE_OR_TYPE(self, path, "dropdown", SRDropdownValue)
+        self.__validate_fields(path)
         if self.dropdown is not None:
-            current_path = path+["dropdown"]
+            current_path = PathNode(path, "dropdown")
             self.dropdown.validate(current_path, config)
+            if config.level.includes(ValidationLevel.REFERENTIAL):
+                self.dropdown.validate_value(
+                    path          = current_path,
+                    config        = config,
+                    dropdown_type = input_type.get_corresponding_dropdown_type(),
+                    context       = context,
+                )
+
+    def _dropdown_validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        context: CompleteContext, 
+        input_type: InputType, 
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The dropdown validation steps of a SRBlockAndDropdownInputValue(see SRScript.validate_dropdown_values)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            context: Context about parts of the project. Used to validate dropdowns
+            input_type: the type of this input. Used to valdiate dropdowns
+        
+        Returns:
+            the dropdown validation steps of the contained block
+        """
+        yield from super()._dropdown_validation_steps(path, config, info_api, context, input_type)
+        if self.dropdown is not None:
             self.dropdown.validate_value(
-                path          = current_path,
+                path          = PathNode(path, "dropdown"),
                 config        = config,
                 dropdown_type = input_type.get_corresponding_dropdown_type(),
                 context       = context,
@@ -918,7 +1292,31 @@ class SRBlockOnlyInputValue(SRInputValue):
         Raises:
             ValidationError: if the SRBlockOnlyInputValue is invalid
         """
-        self._validate_block(
+        _run_validation_steps(self._validation_steps(path, config, info_api, validation_api, context, input_type))
+
+    def _validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        validation_api: "ValidationAPI", 
+        context: CompleteContext, 
+        input_type: InputType, 
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The validation steps of a SRBlockOnlyInputValue(see validate and _run_validation_steps)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            validation_api: API used to fetch information about other blocks 
+            context: Context about parts of the project. Used to validate dropdowns
+            input_type: the type of this input. Used to valdiate dropdowns
+        
+        Returns:
+            the validation steps of the contained blocks
+        """
+        yield from self._block_validation_steps(
             path           = path,
             config         = config,
             info_api       = info_api,
@@ -934,6 +1332,10 @@ class SRScriptInputValue(SRInputValue):
     
     blocks: list[SRBlock]
 
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_LIST_OF_TYPE, "blocks", SRBlock),
+    )
+
     def validate(self, 
         path: list, 
         config: ValidationConfig,
@@ -959,10 +1361,34 @@ class SRScriptInputValue(SRInputValue):
         Raises:
             ValidationError: if the SRScriptInputValue is invalid
         """
-        AA_LIST_OF_TYPE(self, path, "blocks", SRBlock)
+        _run_validation_steps(self._validation_steps(path, config, info_api, validation_api, context, input_type))
+
+    def _validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        validation_api: "ValidationAPI", 
+        context: CompleteContext, 
+        input_type: InputType, 
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The validation steps of a SRScriptInputValue(see validate and _run_validation_steps)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            validation_api: API used to fetch information about other blocks 
+            context: Context about parts of the project. Used to validate dropdowns
+            input_type: the type of this input. Used to valdiate dropdowns
+        
+        Returns:
+            the validation steps of the contained blocks
+        """
+        self.__validate_fields(path)
         for i, block in enumerate(self.blocks):
-            current_path = path+["blocks", i]
-            block.validate(
+            current_path = PathNode(path, "blocks", i)
+            yield block._validation_steps(
                 path             = current_path,
                 config           = config,
                 info_api         = info_api,
@@ -971,7 +1397,9 @@ class SRScriptInputValue(SRInputValue):
                 expects_reporter = False,
             )
             opcode_info = info_api.get_info_by_new(block.opcode)
-            opcode_type = opcode_info.get_opcode_type(block=block, validation_api=validation_api)
+            opcode_type = _get_opcode_type_to_check(opcode_info, block, config, validation_api)
+            if opcode_type is None:
+                continue
             SRBlock.validate_opcode_type(
                 opcode_type  = opcode_type,
                 path         = current_path,
@@ -981,6 +1409,29 @@ class SRScriptInputValue(SRInputValue):
                 is_last      = ((i+1) == len(self.blocks)),
             )
 
+    def _dropdown_validation_steps(self, 
+        path: "list | PathNode", 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        context: CompleteContext, 
+        input_type: InputType, 
+    ) -> Iterator[Iterator]:
+        """
+        *[Internal Method]* The dropdown validation steps of a SRScriptInputValue(see SRScript.validate_dropdown_values)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            context: Context about parts of the project. Used to validate dropdowns
+            input_type: the type of this input. Used to valdiate dropdowns
+        
+        Returns:
+            the dropdown validation steps of the contained blocks
+        """
+        for i, block in enumerate(self.blocks):
+            yield block._dropdown_validation_steps(PathNode(path, "blocks", i), config, info_api, context)
+
 
 __all__ = [
     "FRBlock", "IRBlock", "IRInputValue", "IRBlockReference", 
@@ -7,6 +7,8 @@ from pypenguin.core.custom_block import SRCustomBlockOpcode
 from pypenguin.core.block          import FRBlock, SRBlock, SRScript
 from pypenguin.core.comment        import SRComment
 from pypenguin.core.block_mutation import FRCustomBlockMutation, SRCustomBlockMutation
+from pypenguin.core.block_index    import SRBlockIndex
+from pypenguin.core.block_store    import FRBlockStore
 
 @grepr_dataclass(grepr_fields=["blocks", "scheduled_block_deletions"])
 class FIConversionAPI:
@@ -14,7 +16,7 @@ class FIConversionAPI:
     An API which allows the access to other blocks in the same target during **conversion** from **f**irst to **i**ntermediate representation
     """
 
-    blocks: dict[str, FRBlock]
+    blocks: dict[str, FRBlock] | FRBlockStore
     block_comments: dict[str, SRComment]
     scheduled_block_deletions: list[str] = field(default_factory=list)
 
@@ -25,6 +27,8 @@ class FIConversionAPI:
         Returns:
             the set of block ids
         """
+        if isinstance(self.blocks, FRBlockStore):
+            return self.blocks.get_block_ids_by_parent_id(parent_id)
         block_ids = set()
         for block_id_candidate, block_candidate in self.blocks.items():
             if block_candidate.parent == parent_id:
@@ -65,6 +69,11 @@ class FIConversionAPI:
         Returns:
             the custom block mutation
         """
+        if isinstance(self.blocks, FRBlockStore):
+            mutation = self.blocks.get_cb_mutation(proccode)
+            if mutation is not None:
+                return mutation
+            raise FirstToInterConversionError(f"Mutation of proccode {repr(proccode)} not found")
         for block in self.blocks.values():
             if not isinstance(block.mutation, FRCustomBlockMutation): continue
             if block.mutation.proccode == proccode:
@@ -92,25 +101,20 @@ class ValidationAPI:
     """
 
     scripts: list["SRScript"]
+    block_index: SRBlockIndex | None = None
     cb_mutations: dict[SRCustomBlockOpcode, "SRCustomBlockMutation"] = field(init=False)
-    # Safe access is needed because blocks haven't actually been validated yet (see get_all_blocks)
+    # The block index skips invalid parts, because blocks haven't actually been validated yet
     
     def __post_init__(self) -> None:
         """
-        Fetch and store custom block mutations for later
+        Build the block index if none was given and fetch the custom block mutations for later
         
         Returns:
             None
         """
-        all_blocks = self._get_all_blocks()
-        self.cb_mutations = {}
-        for block in all_blocks:
-            if not isinstance(getattr(block, "mutation", None), SRCustomBlockMutation):
-                continue
-            mutation: SRCustomBlockMutation = block.mutation
-            if not isinstance(getattr(mutation, "custom_opcode", None), SRCustomBlockOpcode):
-                continue
-            self.cb_mutations[mutation.custom_opcode] = mutation
+        if self.block_index is None:
+            self.block_index = SRBlockIndex.from_scripts(self.scripts)
+        self.cb_mutations = self.block_index.get_cb_mutations()
 
     def _get_all_blocks(self) -> list["SRBlock"]:
         """
@@ -119,25 +123,7 @@ class ValidationAPI:
         Returns:
             all blocks in the target 
         """
-        def recursive_block_search(block: "SRBlock") -> None:
-            blocks.append(block)
-            if not isinstance(getattr(block, "inputs", None), dict):
-                return
-            for input in block.inputs.values(): 
-                if isinstance(getattr(input, "block", None), SRBlock):
-                    recursive_block_search(input.block)
-                if isinstance(getattr(input, "blocks", None), list):
-                    [recursive_block_search(sub_block) for sub_block in input.blocks if isinstance(sub_block, SRBlock)]
-        
-        blocks = []
-        for script in self.scripts:
-            if not isinstance(getattr(script, "blocks", None), list):
-                continue
-            for block in script.blocks:
-                if not isinstance(block, SRBlock):
-                    continue
-                recursive_block_search(block)
-        return blocks
+        return [entry.block for entry in self.block_index]
     
     def get_cb_mutation(self, custom_opcode: SRCustomBlockOpcode) -> "SRCustomBlockMutation":
         """
@@ -0,0 +1,324 @@
+from typing import Any, Iterator
+
+from pypenguin.utility import grepr_dataclass
+
+from pypenguin.core.custom_block   import SRCustomBlockOpcode
+from pypenguin.core.block          import SRScript, SRBlock
+from pypenguin.core.block_mutation import SRMutation, SRCustomBlockMutation
+
+
+@grepr_dataclass(grepr_fields=["path_segment", "opcode", "mutation"], eq=False, slots=True)
+class SRBlockIndexEntry:
+    """
+    Information about a block recorded by a SRBlockIndex. 
+    To keep indexing cheap, only the last segment of the path is stored and the full path is built on demand
+    """
+
+    block: SRBlock
+    script: SRScript
+    parent_entry: "SRBlockIndexEntry | None"
+    path_segment: tuple
+    opcode: str
+    mutation: SRMutation | None
+
+    @property
+    def parent(self) -> SRBlock | None:
+        """
+        The block, which contains the block in one of its inputs or None for blocks at the top level of a script
+        """
+        return None if self.parent_entry is None else self.parent_entry.block
+
+    @property
+    def relative_path(self) -> list:
+        """
+        The path from the script to the block eg. ["blocks", 1, "inputs", ("CONDITION",), "block"]
+        """
+        segments = []
+        entry = self
+        while entry is not None:
+            segments.append(entry.path_segment)
+            entry = entry.parent_entry
+        return [part for segment in reversed(segments) for part in segment]
+
+_ScriptRecord = tuple[SRScript, bytes | None, list[SRBlockIndexEntry], list[SRBlockIndexEntry], bool]
+
+class SRBlockIndex:
+    """
+    A flat index of all blocks in the scripts of a target, built in a single traversal.
+    It maps every block to its path, parent, opcode and mutation.
+    The scripts might not have been validated yet, so invalid parts are skipped instead of raising errors.
+    The index can be updated incrementally: scripts, which are unchanged since they were indexed, are not traversed again.
+    This requires the content hash of the script to be cached at indexing time(e.g. by validating with a ValidationCache).
+    Every change of a script, also in place, discards its cached hash, so it is traversed again
+    """
+
+    def __init__(self) -> None:
+        """
+        Create an empty SRBlockIndex. **Please use from_scripts or SRTarget.get_block_index instead**
+
+        Returns:
+            None
+        """
+        # (script, content hash of the script, entries of the script, entries with a custom block mutation, wether it has dropdowns)
+        self._script_records    : list[_ScriptRecord] = []
+        self._script_index_by_id: dict[int, int]               = {}
+        self._entry_by_block_id : dict[int, SRBlockIndexEntry] = {}
+
+        self._blocks_by_opcode  : dict[str, list[SRBlock]] | None                  = None
+        self._cb_mutations      : dict[SRCustomBlockOpcode, SRCustomBlockMutation] | None = None
+
+    @classmethod
+    def from_scripts(cls, scripts: list[SRScript]) -> "SRBlockIndex":
+        """
+        Create a SRBlockIndex of the given scripts
+
+        Args:
+            scripts: the scripts of a target
+
+        Returns:
+            the SRBlockIndex
+        """
+        index = cls()
+        index.update(scripts)
+        return index
+
+    def update(self, scripts: list[SRScript]) -> None:
+        """
+        Update the index to match the given scripts.
+        Scripts, which are the same objects as before and still have the same cached content hash object, are not traversed again.
+        A recomputed hash is a new object even if it is equal, e.g. after a block was replaced by an equal one
+
+        Args:
+            scripts: the current scripts of the target
+
+        Returns:
+            None
+        """
+        if not isinstance(scripts, list):
+            scripts = []
+        old_records = {id(record[0]): record for record in self._script_records}
+        new_records = []
+        changed = False
+        for script in scripts:
+            record = old_records.pop(id(script), None)
+            if (
+                (record is None) or (record[0] is not script) or (record[1] is None)
+                or (script.get_cached_content_hash() is not record[1])
+            ):
+                if record is not None:
+                    self._remove_entries(record[2])
+                record = self._index_script(script)
+                changed = True
+            new_records.append(record)
+        for record in old_records.values():
+            self._remove_entries(record[2])
+            changed = True
+
+        if changed or (len(new_records) != len(self._script_records)) or any(
+            new_record is not old_record for new_record, old_record in zip(new_records, self._script_records)
+        ):
+            self._blocks_by_opcode = None
+            self._cb_mutations     = None
+        self._script_records     = new_records
+        self._script_index_by_id = {id(record[0]): i for i, record in enumerate(new_records)}
+
+    def _index_script(self, script: SRScript) -> _ScriptRecord:
+        """
+        *[Internal Method]* Traverse a script and record all its blocks
+
+        Args:
+            script: the script to traverse
+
+        Returns:
+            the record of the script
+        """
+        entries = []
+        cb_entries = []
+        has_dropdowns = False
+        blocks = getattr(script, "blocks", None)
+        if not isinstance(blocks, list):
+            return (script, None, entries, cb_entries, has_dropdowns)
+
+        # the stack is reversed, so blocks are recorded in depth-first pre-order
+        stack: list[tuple[Any, tuple, SRBlockIndexEntry | None]] = [
+            (blocks[i], ("blocks", i), None) for i in range(len(blocks)-1, -1, -1)
+        ]
+        entry_by_block_id = self._entry_by_block_id
+        while stack:
+            block, path_segment, parent_entry = stack.pop()
+            if not isinstance(block, SRBlock):
+                continue
+            entry = SRBlockIndexEntry(block, script, parent_entry, path_segment, block.opcode, block.mutation)
+            entries.append(entry)
+            entry_by_block_id[id(block)] = entry
+            if isinstance(block.mutation, SRCustomBlockMutation):
+                cb_entries.append(entry)
+            if block.dropdowns:
+                has_dropdowns = True
+
+            inputs = block.inputs
+            if not isinstance(inputs, dict):
+                continue
+            children = []
+            for input_id, input_value in inputs.items():
+                if getattr(input_value, "dropdown", None) is not None:
+                    has_dropdowns = True
+                sub_block = getattr(input_value, "block", None)
+                if sub_block is not None:
+                    children.append((sub_block, ("inputs", (input_id,), "block"), entry))
+                sub_blocks = getattr(input_value, "blocks", None)
+                if isinstance(sub_blocks, list):
+                    for i, sub_block in enumerate(sub_blocks):
+                        children.append((sub_block, ("inputs", (input_id,), "blocks", i), entry))
+            if children:
+                children.reverse()
+                stack.extend(children)
+
+        # Computing the content hash would cost more than the traversal, so only an already cached hash is used.
+        # Scripts without one are traversed again on the next update
+        script_hash = script.get_cached_content_hash() if isinstance(script, SRScript) else None
+        return (script, script_hash, entries, cb_entries, has_dropdowns)
+
+    def _remove_entries(self, entries: list[SRBlockIndexEntry]) -> None:
+        """
+        *[Internal Method]* Forget the entries of a script, which is no longer indexed
+
+        Args:
+            entries: the entries of the script
+
+        Returns:
+            None
+        """
+        for entry in entries:
+            if self._entry_by_block_id.get(id(entry.block), None) is entry:
+                del self._entry_by_block_id[id(entry.block)]
+
+    def __len__(self) -> int:
+        return len(self._entry_by_block_id)
+
+    def __iter__(self) -> Iterator[SRBlockIndexEntry]:
+        """
+        Iterate over the entries of all blocks in depth-first pre-order, script by script
+
+        Returns:
+            the iterator
+        """
+        for record in self._script_records:
+            yield from record[2]
+
+    def __contains__(self, block: object) -> bool:
+        entry = self._entry_by_block_id.get(id(block), None)
+        return (entry is not None) and (entry.block is block)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} blocks, {len(self._script_records)} scripts)"
+
+    def get_entry(self, block: SRBlock) -> SRBlockIndexEntry:
+        """
+        Get the entry of a block
+
+        Args:
+            block: the block
+
+        Raises:
+            KeyError: if the block is not part of the index
+
+        Returns:
+            the entry
+        """
+        entry = self._entry_by_block_id.get(id(block), None)
+        if (entry is None) or (entry.block is not block):
+            raise KeyError(f"Block is not part of the index: {block}")
+        return entry
+
+    def get_script_entries(self, script_index: int) -> list[SRBlockIndexEntry]:
+        """
+        Get the entries of all blocks of a script in depth-first pre-order
+
+        Args:
+            script_index: the index of the script in the scripts of the target
+
+        Returns:
+            the entries
+        """
+        return self._script_records[script_index][2]
+
+    def script_has_dropdowns(self, script_index: int) -> bool:
+        """
+        Check wether any block of a script has a dropdown, also in a dropdown input
+
+        Args:
+            script_index: the index of the script in the scripts of the target
+
+        Returns:
+            wether the script has a dropdown
+        """
+        return self._script_records[script_index][4]
+
+    def get_path(self, block: SRBlock) -> list:
+        """
+        Get the path of a block from the target
+
+        Args:
+            block: the block
+
+        Raises:
+            KeyError: if the block is not part of the index
+
+        Returns:
+            the path eg. ["scripts", 0, "blocks", 1, "inputs", ("CONDITION",), "block"]
+        """
+        entry = self.get_entry(block)
+        return ["scripts", self._script_index_by_id[id(entry.script)]] + entry.relative_path
+
+    def get_parent(self, block: SRBlock) -> SRBlock | None:
+        """
+        Get the block, which contains a block in one of its inputs
+
+        Args:
+            block: the block
+
+        Raises:
+            KeyError: if the block is not part of the index
+
+        Returns:
+            the parent block or None for blocks at the top level of a script
+        """
+        return self.get_entry(block).parent
+
+    def get_blocks_by_opcode(self, opcode: str) -> list[SRBlock]:
+        """
+        Get all blocks with an opcode in depth-first pre-order
+
+        Args:
+            opcode: the new opcode
+
+        Returns:
+            the blocks
+        """
+        if self._blocks_by_opcode is None:
+            blocks_by_opcode = {}
+            for entry in self:
+                blocks_by_opcode.setdefault(entry.opcode, []).append(entry.block)
+            self._blocks_by_opcode = blocks_by_opcode
+        return self._blocks_by_opcode.get(opcode, [])
+
+    def get_cb_mutations(self) -> dict[SRCustomBlockOpcode, SRCustomBlockMutation]:
+        """
+        Get the mutations of all custom block definitions by their custom opcode
+
+        Returns:
+            the custom block mutations
+        """
+        if self._cb_mutations is None:
+            cb_mutations = {}
+            for record in self._script_records:
+                for entry in record[3]:
+                    mutation = entry.mutation
+                    if isinstance(getattr(mutation, "custom_opcode", None), SRCustomBlockOpcode):
+                        cb_mutations[mutation.custom_opcode] = mutation
+            self._cb_mutations = cb_mutations
+        return self._cb_mutations
+
+
+__all__ = ["SRBlockIndexEntry", "SRBlockIndex"]
@@ -3,8 +3,8 @@ from abc         import ABC, abstractmethod
 from typing      import Any, TYPE_CHECKING
 from dataclasses import dataclass, field
 
-from pypenguin.utility import grepr_dataclass, ThanksError, ValidationConfig, FirstToSecondConversionError, DeserializationError
-from pypenguin.utility import AA_TYPE, AA_HEX_COLOR
+from pypenguin.utility import grepr_dataclass, ContentHashMixin, ThanksError, ValidationConfig, FirstToSecondConversionError, DeserializationError
+from pypenguin.utility import FieldConstraint, compile_field_validator, AA_TYPE, AA_HEX_COLOR
 
 from pypenguin.core.custom_block import SRCustomBlockOpcode, SRCustomBlockOptype
 
@@ -292,7 +292,7 @@ class FRStopScriptMutation(FRMutation):
 
 
 @grepr_dataclass(grepr_fields=[])
-class SRMutation(ABC):
+class SRMutation(ContentHashMixin, ABC):
     """
     The second representation for the mutation of a block. Mutations hold special information, which only special blocks have. This representation is much more user friendly then the first representation
     """
@@ -326,6 +326,13 @@ class SRCustomBlockArgumentMutation(SRMutation):
     prototype_color: str
     outline_color: str
 
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "argument_name", str),
+        FieldConstraint(AA_HEX_COLOR, "main_color"),
+        FieldConstraint(AA_HEX_COLOR, "prototype_color"),
+        FieldConstraint(AA_HEX_COLOR, "outline_color"),
+    )
+
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
         Ensure the custom block argument mutation is valid, raise ValidationError if not
@@ -340,10 +347,7 @@ class SRCustomBlockArgumentMutation(SRMutation):
         Raises:
             ValidationError: if the SRCustomBlockArgumentMutation is invalid
         """
-        AA_TYPE(self, path, "argument_name", str)
-        AA_HEX_COLOR(self, path, "main_color")
-        AA_HEX_COLOR(self, path, "prototype_color")
-        AA_HEX_COLOR(self, path, "outline_color")
+        self.__validate_fields(path)
     
 @grepr_dataclass(grepr_fields=["custom_opcode", "no_screen_refresh", "optype", "main_color", "prototype_color", "outline_color"], parent_cls=SRMutation)
 class SRCustomBlockMutation(SRMutation):
@@ -360,6 +364,15 @@ class SRCustomBlockMutation(SRMutation):
     main_color: str
     prototype_color: str
     outline_color: str
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "custom_opcode", SRCustomBlockOpcode),
+        FieldConstraint(AA_TYPE, "no_screen_refresh", bool),
+        FieldConstraint(AA_TYPE, "optype", SRCustomBlockOptype),
+        FieldConstraint(AA_HEX_COLOR, "main_color"),
+        FieldConstraint(AA_HEX_COLOR, "prototype_color"),
+        FieldConstraint(AA_HEX_COLOR, "outline_color"),
+    )
     
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
@@ -375,12 +388,7 @@ class SRCustomBlockMutation(SRMutation):
         Raises:
             ValidationError: if the SRCustomBlockMutation is invalid
         """
-        AA_TYPE(self, path, "custom_opcode", SRCustomBlockOpcode)
-        AA_TYPE(self, path, "no_screen_refresh", bool)
-        AA_TYPE(self, path, "optype", SRCustomBlockOptype)
-        AA_HEX_COLOR(self, path, "main_color")
-        AA_HEX_COLOR(self, path, "prototype_color")
-        AA_HEX_COLOR(self, path, "outline_color")
+        self.__validate_fields(path)
 
         self.custom_opcode.validate(path+["custom_opcode"], config)
 
@@ -391,6 +399,10 @@ class SRCustomBlockCallMutation(SRMutation):
     """
     
     custom_opcode: "SRCustomBlockOpcode"
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "custom_opcode", SRCustomBlockOpcode),
+    )
     
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
@@ -406,7 +418,7 @@ class SRCustomBlockCallMutation(SRMutation):
         Raises:
             ValidationError: if the SRCustomBlockCallMutation is invalid
         """
-        AA_TYPE(self, path, "custom_opcode", SRCustomBlockOpcode)
+        self.__validate_fields(path)
 
         self.custom_opcode.validate(path+["custom_opcode"], config)
 
@@ -418,6 +430,10 @@ class SRStopScriptMutation(SRMutation):
     
     is_ending_statement: bool
 
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "is_ending_statement", bool),
+    )
+
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
         Ensure the stop script mutation is valid, raise ValidationError if not
@@ -432,7 +448,7 @@ class SRStopScriptMutation(SRMutation):
         Raises:
             ValidationError: if the SRStopScriptMutation is invalid
         """
-        AA_TYPE(self, path, "is_ending_statement", bool)
+        self.__validate_fields(path)
 
 
 __all__ = [
@@ -0,0 +1,375 @@
+from array           import array
+from collections.abc import Mapping
+from typing          import Any, Iterator
+
+from pypenguin.utility     import tuplify
+from pypenguin.opcode_info import OpcodeInfoAPI
+
+from pypenguin.core.block          import FRBlock
+from pypenguin.core.block_mutation import FRMutation, FRCustomBlockMutation
+
+_NO_BLOCK    : int = -1 # the reference is None
+_MISSING_BLOCK: int = -2 # the reference points to a block id, which is not part of the store
+
+_FLAG_SHADOW   : int = 0b01
+_FLAG_TOP_LEVEL: int = 0b10
+
+class FRBlockStore(Mapping[str, FRBlock]):
+    """
+    A read-only, columnar alternative to `dict[str, FRBlock]` for targets with a huge amount of blocks.
+    Opcodes, parent and next references and flags are stored in compact arrays.
+    Inputs, fields, positions, comments and mutations are stored in sparse side tables.
+    FRBlocks are only created on access, so the store can be used wherever a dict of FRBlocks is expected
+    """
+
+    def __init__(self) -> None:
+        """
+        Create an empty FRBlockStore. **Please use from_data or from_blocks instead**
+
+        Returns:
+            None
+        """
+        self._ids         : list[str]      = []
+        self._index_by_id : dict[str, int] = {}
+
+        self._opcode_table: list[str]      = []
+        self._opcode_index: dict[str, int] = {}
+        self._opcodes     : array          = array("H")
+        self._parents     : array          = array("l")
+        self._nexts       : array          = array("l")
+        self._flags       : array          = array("B")
+
+        self._inputs      : dict[int, dict[str, tuple]]               = {}
+        self._fields      : dict[int, dict[str, tuple]]               = {}
+        self._positions   : dict[int, tuple[int|float|None, int|float|None]] = {}
+        self._comments    : dict[int, str]                            = {}
+        self._mutations   : dict[int, FRMutation]                     = {}
+        self._missing_refs: dict[tuple[int, str], str]                = {}
+
+        self._children_by_parent: dict[int, list[int]] | None = None
+
+    @classmethod
+    def from_data(cls, data: dict[str, dict[str, Any] | list], info_api: OpcodeInfoAPI) -> "FRBlockStore":
+        """
+        Deserializes the raw block data of a target into a FRBlockStore without creating a FRBlock for every block
+
+        Args:
+            data: the raw block data of a target, mapping block ids to block data
+            info_api: the opcode info api used to fetch information about opcodes
+
+        Returns:
+            the FRBlockStore
+        """
+        store = cls()
+        store._reserve_ids(data.keys())
+        for block_id, block_data in data.items():
+            if isinstance(block_data, list):
+                # top level variable and list reporters are stored as tuples
+                store._append_block(block_id, FRBlock.from_tuple(tuple(block_data), parent_id=None))
+                continue
+
+            opcode = block_data["opcode"]
+            mutation = FRBlock._mutation_from_data(opcode, block_data, info_api) # loads the lazy group of the opcode before interning
+            store._append(
+                block_id  = block_id,
+                opcode    = info_api.intern(opcode),
+                next      = block_data["next"  ],
+                parent    = block_data["parent"],
+                inputs    = info_api.intern_keys(tuplify(block_data["inputs"])),
+                fields    = info_api.intern_keys(tuplify(block_data["fields"])),
+                shadow    = block_data["shadow"  ],
+                top_level = block_data["topLevel"],
+                x         = block_data.get("x", None),
+                y         = block_data.get("y", None),
+                comment   = block_data.get("comment", None),
+                mutation  = mutation,
+            )
+        return store
+
+    @classmethod
+    def from_blocks(cls, blocks: dict[str, tuple | FRBlock]) -> "FRBlockStore":
+        """
+        Creates a FRBlockStore from a dict of FRBlocks(or block tuples) as stored in a FRTarget
+
+        Args:
+            blocks: a dict mapping block ids to FRBlocks or block tuples
+
+        Returns:
+            the FRBlockStore
+        """
+        store = cls()
+        store._reserve_ids(blocks.keys())
+        for block_id, block in blocks.items():
+            if isinstance(block, tuple):
+                block = FRBlock.from_tuple(block, parent_id=None)
+            store._append_block(block_id, block)
+        return store
+
+    def _reserve_ids(self, block_ids: Iterator[str]) -> None:
+        """
+        *[Internal Method]* Assign an index to every block id, so references can be resolved in a single pass
+
+        Args:
+            block_ids: all the block ids of the target
+
+        Returns:
+            None
+        """
+        for block_id in block_ids:
+            self._index_by_id[block_id] = len(self._ids)
+            self._ids.append(block_id)
+
+    def _append_block(self, block_id: str, block: FRBlock) -> None:
+        """
+        *[Internal Method]* Store the data of a FRBlock
+
+        Args:
+            block_id: the id of the block
+            block: the block
+
+        Returns:
+            None
+        """
+        self._append(
+            block_id  = block_id,
+            opcode    = block.opcode,
+            next      = block.next,
+            parent    = block.parent,
+            inputs    = block.inputs,
+            fields    = block.fields,
+            shadow    = block.shadow,
+            top_level = block.top_level,
+            x         = block.x,
+            y         = block.y,
+            comment   = block.comment,
+            mutation  = block.mutation,
+        )
+
+    def _append(self,
+        block_id: str,
+        opcode: str,
+        next: str | None,
+        parent: str | None,
+        inputs: dict[str, tuple],
+        fields: dict[str, tuple],
+        shadow: bool,
+        top_level: bool,
+        x: int | float | None,
+        y: int | float | None,
+        comment: str | None,
+        mutation: FRMutation | None,
+    ) -> None:
+        """
+        *[Internal Method]* Store the data of a block in the columns and side tables.
+        Blocks must be appended in the same order their ids were reserved
+
+        Returns:
+            None
+        """
+        index = len(self._opcodes)
+        assert self._ids[index] == block_id, "Blocks must be appended in the same order their ids were reserved"
+
+        opcode_index = self._opcode_index.get(opcode)
+        if opcode_index is None:
+            opcode_index = len(self._opcode_table)
+            self._opcode_index[opcode] = opcode_index
+            self._opcode_table.append(opcode)
+        self._opcodes.append(opcode_index)
+        self._parents.append(self._resolve_reference(index, "parent", parent))
+        self._nexts  .append(self._resolve_reference(index, "next"  , next  ))
+        self._flags  .append((_FLAG_SHADOW if shadow else 0) | (_FLAG_TOP_LEVEL if top_level else 0))
+
+        if inputs:
+            self._inputs[index] = inputs
+        if fields:
+            self._fields[index] = fields
+        if (x is not None) or (y is not None):
+            self._positions[index] = (x, y)
+        if comment is not None:
+            self._comments[index] = comment
+        if mutation is not None:
+            self._mutations[index] = mutation
+
+    def _resolve_reference(self, index: int, attr: str, reference: str | None) -> int:
+        """
+        *[Internal Method]* Convert a block id reference into a block index
+
+        Args:
+            index: the index of the referencing block
+            attr: the name of the reference attribute ("parent" or "next")
+            reference: the referenced block id or None
+
+        Returns:
+            the block index or one of the markers for None and unknown block ids
+        """
+        if reference is None:
+            return _NO_BLOCK
+        referenced_index = self._index_by_id.get(reference)
+        if referenced_index is None:
+            self._missing_refs[(index, attr)] = reference
+            return _MISSING_BLOCK
+        return referenced_index
+
+    def _get_reference(self, index: int, attr: str, referenced_index: int) -> str | None:
+        """
+        *[Internal Method]* Convert a block index back into a block id reference
+
+        Args:
+            index: the index of the referencing block
+            attr: the name of the reference attribute ("parent" or "next")
+            referenced_index: the stored index or marker
+
+        Returns:
+            the referenced block id or None
+        """
+        if referenced_index == _NO_BLOCK:
+            return None
+        if referenced_index == _MISSING_BLOCK:
+            return self._missing_refs[(index, attr)]
+        return self._ids[referenced_index]
+
+    def _get_index(self, block_id: str) -> int:
+        """
+        *[Internal Method]* Get the index of a block by id, raise KeyError if it does not exist
+
+        Args:
+            block_id: the block id
+
+        Returns:
+            the block index
+        """
+        return self._index_by_id[block_id]
+
+    # Mapping Interface
+    def __getitem__(self, block_id: str) -> FRBlock:
+        index = self._get_index(block_id)
+        x, y = self._positions.get(index, (None, None))
+        flags = self._flags[index]
+        return FRBlock(
+            opcode    = self._opcode_table[self._opcodes[index]],
+            next      = self._get_reference(index, "next"  , self._nexts  [index]),
+            parent    = self._get_reference(index, "parent", self._parents[index]),
+            inputs    = dict(self._inputs.get(index, {})),
+            fields    = dict(self._fields.get(index, {})),
+            shadow    = bool(flags & _FLAG_SHADOW),
+            top_level = bool(flags & _FLAG_TOP_LEVEL),
+            x         = x,
+            y         = y,
+            comment   = self._comments.get(index, None),
+            mutation  = self._mutations.get(index, None),
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, block_id: object) -> bool:
+        return block_id in self._index_by_id
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} blocks, {len(self._opcode_table)} opcodes)"
+
+    # Lookups without creating FRBlocks
+    def get_opcode(self, block_id: str) -> str:
+        """
+        Get the opcode of a block
+
+        Args:
+            block_id: the block id
+
+        Returns:
+            the opcode
+        """
+        return self._opcode_table[self._opcodes[self._get_index(block_id)]]
+
+    def get_parent_id(self, block_id: str) -> str | None:
+        """
+        Get the id of the parent of a block
+
+        Args:
+            block_id: the block id
+
+        Returns:
+            the parent id or None
+        """
+        index = self._get_index(block_id)
+        return self._get_reference(index, "parent", self._parents[index])
+
+    def get_next_id(self, block_id: str) -> str | None:
+        """
+        Get the id of the next block of a block
+
+        Args:
+            block_id: the block id
+
+        Returns:
+            the id of the next block or None
+        """
+        index = self._get_index(block_id)
+        return self._get_reference(index, "next", self._nexts[index])
+
+    def is_top_level(self, block_id: str) -> bool:
+        """
+        Get wether a block is a top level block
+
+        Args:
+            block_id: the block id
+
+        Returns:
+            wether the block is a top level block
+        """
+        return bool(self._flags[self._get_index(block_id)] & _FLAG_TOP_LEVEL)
+
+    def get_top_level_block_ids(self) -> list[str]:
+        """
+        Get the ids of all top level blocks
+
+        Returns:
+            the ids of all top level blocks
+        """
+        return [self._ids[index] for index, flags in enumerate(self._flags) if flags & _FLAG_TOP_LEVEL]
+
+    def get_block_ids_by_parent_id(self, parent_id: str) -> set[str]:
+        """
+        Get all ids of the blocks whose parent attribute is parent_id.
+        The children index is built on the first call
+
+        Args:
+            parent_id: the id of the parent block
+
+        Returns:
+            the set of block ids
+        """
+        if self._children_by_parent is None:
+            self._children_by_parent = {}
+            for index, parent_index in enumerate(self._parents):
+                if parent_index >= 0:
+                    self._children_by_parent.setdefault(parent_index, []).append(index)
+
+        parent_index = self._index_by_id.get(parent_id)
+        if parent_index is None: # parent_id might still be referenced by an unknown reference
+            return {
+                self._ids[index] for (index, attr), reference in self._missing_refs.items()
+                if (attr == "parent") and (reference == parent_id)
+            }
+        return {self._ids[index] for index in self._children_by_parent.get(parent_index, [])}
+
+    def get_cb_mutation(self, proccode: str) -> FRCustomBlockMutation | None:
+        """
+        Get a custom block mutation by its procedure code. Only the mutation side table is searched
+
+        Args:
+            proccode: the procedure code of the desired mutation
+
+        Returns:
+            the custom block mutation or None if it doesn't exist
+        """
+        for mutation in self._mutations.values():
+            if isinstance(mutation, FRCustomBlockMutation) and (mutation.proccode == proccode):
+                return mutation
+        return None
+
+
+__all__ = ["FRBlockStore"]
@@ -1,6 +1,9 @@
 from typing import Any
 
-from pypenguin.utility import grepr_dataclass, ValidationConfig, AA_COORD_PAIR, AA_TYPE, InvalidValueError
+from pypenguin.utility import (
+    grepr_dataclass, ContentHashMixin, ValidationConfig, FieldConstraint, compile_field_validator, 
+    AA_COORD_PAIR, AA_TYPE, InvalidValueError,
+)
 
 @grepr_dataclass(grepr_fields=["block_id", "x", "y", "width", "height", "minimized", "text"])
 class FRComment:
@@ -55,7 +58,7 @@ class FRComment:
         return (self.block_id is not None, comment)
 
 @grepr_dataclass(grepr_fields=["position", "size", "is_minimized", "text"])
-class SRComment:
+class SRComment(ContentHashMixin):
     """
     The second representation for a comment
     """
@@ -64,6 +67,13 @@ class SRComment:
     size: tuple[int | float, int | float]
     is_minimized: bool
     text: str
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_COORD_PAIR, "position"),
+        FieldConstraint(AA_COORD_PAIR, "size"),
+        FieldConstraint(AA_TYPE, "is_minimized", bool),
+        FieldConstraint(AA_TYPE, "text", str),
+    )
     
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
@@ -79,12 +89,9 @@ class SRComment:
             ValidationError: if the SRComment is invalid
             InvalidValueError(ValidationError): if size is smaller then the minimum
         """
-        AA_COORD_PAIR(self, path, "position")
-        AA_COORD_PAIR(self, path, "size")
+        self.__validate_fields(path)
         if (self.size[0] < 52) or (self.size[1] < 32):
             raise InvalidValueError(path, f"size of {self.__class__.__name__} must be at least 52 by 32")
-        AA_TYPE(self, path, "is_minimized", bool)
-        AA_TYPE(self, path, "text", str)
 
 
 __all__ = ["FRComment", "SRComment"]
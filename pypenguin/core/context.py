@@ -1,13 +1,83 @@
 from typing      import TYPE_CHECKING, Any
+from dataclasses import field
 
 from pypenguin.utility import grepr_dataclass
 
 if TYPE_CHECKING:
-    from pypenguin.opcode_info import DropdownValueKind
+    from pypenguin.opcode_info import DropdownValueKind, DropdownType
+    from pypenguin.utility     import SimilarityIndex
+
+
+class _PossibleValuesCacheMixin:
+    """
+    *[Internal Class]* Stores the sets of possible dropdown values and their similarity indexes per dropdown type, 
+    which were calculated for a context. Changing the context discards them
+    """
+
+    def get_cached_possible_values(self, dropdown_type: "DropdownType") -> frozenset[tuple["DropdownValueKind", Any]] | None:
+        """
+        Get the set of possible dropdown values for a dropdown type, if it was already calculated for this context
+
+        Args:
+            dropdown_type: the dropdown type
+
+        Returns:
+            the set of possible values or None
+        """
+        return self._possible_values.get(dropdown_type, None)
+
+    def set_cached_possible_values(self, dropdown_type: "DropdownType", values: frozenset[tuple["DropdownValueKind", Any]]) -> None:
+        """
+        Remember the set of possible dropdown values for a dropdown type in this context
+
+        Args:
+            dropdown_type: the dropdown type
+            values: the set of possible values
+
+        Returns:
+            None
+        """
+        self._possible_values[dropdown_type] = values
+
+    def get_cached_value_index(self, 
+        dropdown_type: "DropdownType",
+    ) -> tuple["SimilarityIndex", dict[str, list[tuple["DropdownValueKind", Any]]]] | None:
+        """
+        Get the similarity index over the possible dropdown values for a dropdown type, if it was already built for this context
+
+        Args:
+            dropdown_type: the dropdown type
+
+        Returns:
+            the similarity index and the possible values by their string or None
+        """
+        return self._value_indexes.get(dropdown_type, None)
+
+    def set_cached_value_index(self, 
+        dropdown_type: "DropdownType", 
+        value_index: tuple["SimilarityIndex", dict[str, list[tuple["DropdownValueKind", Any]]]],
+    ) -> None:
+        """
+        Remember the similarity index over the possible dropdown values for a dropdown type in this context
+
+        Args:
+            dropdown_type: the dropdown type
+            value_index: the similarity index and the possible values by their string
+
+        Returns:
+            None
+        """
+        self._value_indexes[dropdown_type] = value_index
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name not in {"_possible_values", "_value_indexes"}:
+            self.__dict__.get("_possible_values", {}).clear()
+            self.__dict__.get("_value_indexes"  , {}).clear()
 
 
 @grepr_dataclass(grepr_fields=["scope_variables", "scope_lists", "all_sprite_variables", "sprite_only_variables", "sprite_only_lists", "other_sprites", "backdrops"])
-class PartialContext:
+class PartialContext(_PossibleValuesCacheMixin):
     """
     A temporary dataclass which stores the context for dropdown validation excluding sprite context
     """
@@ -20,8 +90,11 @@ class PartialContext:
     other_sprites: list[tuple["DropdownValueKind", Any]]
     backdrops: list[tuple["DropdownValueKind", Any]]
 
+    _possible_values: dict["DropdownType", frozenset] = field(init=False, default_factory=dict, compare=False)
+    _value_indexes  : dict["DropdownType", tuple] = field(init=False, default_factory=dict, compare=False)
+
 @grepr_dataclass(grepr_fields=["scope_variables", "scope_lists", "all_sprite_variables", "sprite_only_variables", "sprite_only_lists", "other_sprites", "backdrops", "costumes", "sounds", "is_stage"])
-class CompleteContext:
+class CompleteContext(_PossibleValuesCacheMixin):
     """
     A temporary dataclass which stores the context for dropdown validation including sprite context
     """
@@ -38,6 +111,9 @@ class CompleteContext:
     sounds: list[tuple["DropdownValueKind", Any]]
     is_stage: bool
 
+    _possible_values: dict["DropdownType", frozenset] = field(init=False, default_factory=dict, compare=False)
+    _value_indexes  : dict["DropdownType", tuple] = field(init=False, default_factory=dict, compare=False)
+
     @classmethod
     def from_partial(cls, 
         pc: PartialContext, 
@@ -1,7 +1,7 @@
 from re import split 
 
 from pypenguin.utility import (
-    grepr_dataclass, PypenguinEnum, ValidationConfig,
+    grepr_dataclass, PypenguinEnum, ValidationConfig, FieldConstraint, lazy_field_validator,
     SameValueTwiceError, FirstToInterConversionError,
     AA_TYPE, AA_TUPLE_OF_TYPES, AA_MIN_LEN,
 )
@@ -17,6 +17,11 @@ class SRCustomBlockOpcode:
 
     segments: tuple["str | SRCustomBlockArgument"]
 
+    __validate_fields = lazy_field_validator(lambda: (
+        FieldConstraint(AA_TUPLE_OF_TYPES, "segments", (str, SRCustomBlockArgument)),
+        FieldConstraint(AA_MIN_LEN, "segments", min_len=1),
+    ))
+
     @classmethod
     def from_proccode_argument_names(cls, proccode: str, argument_names: list[str]) -> "SRCustomBlockOpcode":
         """
@@ -72,8 +77,7 @@ class SRCustomBlockOpcode:
             ValidationError: if the SRCustomBlockOpcode is invalid
             SameValueTwiceError(ValidationError): if two arguments have the same name
         """
-        AA_TUPLE_OF_TYPES(self, path, "segments", (str, SRCustomBlockArgument))
-        AA_MIN_LEN(self, path, "segments", min_len=1)
+        self.__validate_fields(path)
 
         names = {}
         for i, segment in enumerate(self.segments):
@@ -110,6 +114,11 @@ class SRCustomBlockArgument:
     name: str
     type: "SRCustomBlockArgumentType"
 
+    __validate_fields = lazy_field_validator(lambda: (
+        FieldConstraint(AA_TYPE, "name", str),
+        FieldConstraint(AA_TYPE, "type", SRCustomBlockArgumentType),
+    ))
+
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
         Ensures the custom block argument is valid, raise if not
@@ -124,8 +133,7 @@ class SRCustomBlockArgument:
         Raises:
             ValidationError: if the SRCustomBlockArgument is invalid
         """
-        AA_TYPE(self, path, "name", str)
-        AA_TYPE(self, path, "type", SRCustomBlockArgumentType)
+        self.__validate_fields(path)
     
     def _copymodify_(self, attr: str, value) -> "SRCustomBlockArgument":
         """
@@ -1,20 +1,28 @@
 from typing      import Any
 from dataclasses import dataclass
 
-from pypenguin.utility     import grepr_dataclass, ValidationConfig, AA_TYPE, AA_JSON_COMPATIBLE, InvalidDropdownValueError
+from pypenguin.utility     import (
+    grepr_dataclass, ContentHashMixin, ValidationConfig, FieldConstraint, compile_field_validator, 
+    AA_TYPE, AA_JSON_COMPATIBLE, InvalidDropdownValueError,
+)
 from pypenguin.opcode_info import DropdownType, DropdownValueKind
 
 from pypenguin.core.context import PartialContext, CompleteContext
 
 
 @grepr_dataclass(grepr_fields=["kind", "value"])
-class SRDropdownValue:
+class SRDropdownValue(ContentHashMixin):
     """
     The second representation for a block dropdown, containing a kind and a value
     """
 
     kind: DropdownValueKind
     value: Any
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "kind", DropdownValueKind),
+        FieldConstraint(AA_JSON_COMPATIBLE, "value"),
+    )
     
     @classmethod
     def from_tuple(cls, data: tuple[DropdownValueKind, Any]) -> "SRDropdownValue":
@@ -47,8 +55,7 @@ class SRDropdownValue:
         Raises:
             ValidationError: if the SRDropdownValue is invalid
         """
-        AA_TYPE(self, path, "kind", DropdownValueKind)
-        AA_JSON_COMPATIBLE(self, path, "value")
+        self.__validate_fields(path)
 
     def validate_value(self, 
         path: list, 
@@ -74,20 +81,36 @@ class SRDropdownValue:
         Raises:
             InvalidDropdownValueError(ValidationError): if the value is invalid in the specific situation
         """
-        possible_values = dropdown_type.calculate_possible_new_dropdown_values(context=context)
+        possible_values = dropdown_type.get_possible_new_dropdown_value_set(context=context)
+        try:
+            is_possible = (self.kind, self.value) in possible_values
+        except TypeError: # unhashable value
+            is_possible = False
+        if is_possible:
+            return
+        
         default_kind = dropdown_type.get_default_kind_for_calculation()
+        if (default_kind is not None) and (self.kind is default_kind):
+            return
+        # only build the message when validation fails
+        possible_value_list = dropdown_type.calculate_possible_new_dropdown_values(context=context)
         possible_values_string = (
-            "No possible values" if possible_values == [] else
-            "".join(["\n- "+repr(value) for value in possible_values])
+            "No possible values" if possible_value_list == [] else
+            "".join(["\n- "+repr(value) for value in possible_value_list])
+        )
+        closest_matches = dropdown_type.get_closest_possible_new_dropdown_values(self.value, context=context, n=5)
+        closest_matches_string = (
+            "" if closest_matches == [] else
+            "\nThe closest matches are: "+"".join(["\n- "+repr(value) for value in closest_matches])
         )
-        print((self.kind, self.value))
-        if (self.kind, self.value) not in possible_values:
-            if default_kind is None:
-                raise InvalidDropdownValueError(path, f"In this case must be one of these: {possible_values_string}")
-            elif self.kind is not default_kind:
-                raise InvalidDropdownValueError(
-                    path, f"Either kind must be {default_kind} or (kind, value) must be one of these: {possible_values_string}"
-                )
+        if default_kind is None:
+            raise InvalidDropdownValueError(path, 
+                f"In this case must be one of these: {possible_values_string}{closest_matches_string}"
+            )
+        else:
+            raise InvalidDropdownValueError(path, 
+                f"Either kind must be {default_kind} or (kind, value) must be one of these: {possible_values_string}{closest_matches_string}"
+            )
 
 
 __all__ = ["SRDropdownValue"]
@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 
-from pypenguin.utility import grepr_dataclass, ValidationConfig, AA_TYPE, AA_ALNUM, is_valid_js_data_uri, is_valid_url, InvalidValueError
+from pypenguin.utility import (
+    grepr_dataclass, ContentHashMixin, ValidationConfig, FieldConstraint, compile_field_validator, 
+    AA_TYPE, AA_ALNUM, is_valid_js_data_uri, is_valid_url, InvalidValueError,
+)
 
 @grepr_dataclass(grepr_fields=["id"])
-class SRExtension:
+class SRExtension(ContentHashMixin):
     """
     The second representation for an extension.
     Creating an extension and adding it to a project is equivalent to clicking the "add extension" button
@@ -11,6 +14,11 @@ class SRExtension:
     
     id: str
 
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "id", str), # TODO: possibly verify its one of PenguinMod's extension if not custom
+        FieldConstraint(AA_ALNUM, "id"),
+    )
+
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
         Ensure a SRExtension is valid, raise ValidationError if not
@@ -25,8 +33,7 @@ class SRExtension:
         Raises:
             ValidationError: if the SRExtension is invalid
         """
-        AA_TYPE(self, path, "id", str) # TODO: possibly verify its one of PenguinMod's extension if not custom
-        AA_ALNUM(self, path, "id")
+        self.__validate_fields(path)
 
 class SRBuiltinExtension(SRExtension):
     """
@@ -44,6 +51,10 @@ class SRCustomExtension(SRExtension):
     """
     
     url: str # either "https://..." or "data:application/javascript,..."
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "url", str),
+    )
     
     def validate(self, path: list, config: ValidationConfig):
         """
@@ -62,7 +73,7 @@ class SRCustomExtension(SRExtension):
         """
         super().validate(path, config)
 
-        AA_TYPE(self, path, "url", str)
+        self.__validate_fields(path)
         if not (is_valid_url(self.url) or is_valid_js_data_uri(self.url)):
             raise InvalidValueError(path, f"url of {self.__class__.__name__} must be either a valid url or a valid javascript data uri.")
 
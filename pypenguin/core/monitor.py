@@ -2,7 +2,7 @@ from typing      import Any
 from dataclasses import dataclass
 
 from pypenguin.utility           import (
-    grepr_dataclass, ValidationConfig,
+    grepr_dataclass, ContentHashMixin, ValidationConfig, FieldConstraint, compile_field_validator,
     AA_TYPE, AA_TYPES, AA_DICT_OF_TYPE, AA_COORD_PAIR, AA_BOXED_COORD_PAIR, AA_EQUAL, AA_BIGGER_OR_EQUAL, 
     InvalidOpcodeError, MissingDropdownError, UnnecessaryDropdownError, ThanksError,
 )
@@ -147,7 +147,7 @@ class FRMonitor:
             ))
 
 @grepr_dataclass(grepr_fields=["opcode", "dropdowns", "sprite", "position", "is_visible"])
-class SRMonitor:
+class SRMonitor(ContentHashMixin):
     """
     The second representation for a monitor. It is much more user friendly
     """
@@ -156,6 +156,22 @@ class SRMonitor:
     dropdowns: dict[str, SRDropdownValue]
     position: tuple[int | float, int | float] # Center of the Stage is the origin
     is_visible: bool
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "opcode", str),
+        FieldConstraint(AA_DICT_OF_TYPE, "dropdowns", key_t=str, value_t=SRDropdownValue),
+        FieldConstraint(AA_COORD_PAIR, "position"),
+        FieldConstraint(AA_TYPE, "is_visible", bool),
+    )
+    __validate_fields_inside_stage = compile_field_validator(
+        FieldConstraint(AA_TYPE, "opcode", str),
+        FieldConstraint(AA_DICT_OF_TYPE, "dropdowns", key_t=str, value_t=SRDropdownValue),
+        FieldConstraint(AA_BOXED_COORD_PAIR, "position", 
+            min_x=-(STAGE_WIDTH //2), max_x=(STAGE_WIDTH //2), 
+            min_y=-(STAGE_HEIGHT//2), max_y=(STAGE_HEIGHT//2),
+        ),
+        FieldConstraint(AA_TYPE, "is_visible", bool),
+    )
     
     def __post_init__(self) -> None:
         """
@@ -190,16 +206,10 @@ class SRMonitor:
             UnnecessaryDropdownError(ValidationError): if a key of dropdowns is not expected for the specific opcode
             MissingDropdownError(ValidationError): if an expected key of dropdowns for the specific opcode is missing
         """
-        AA_TYPE(self, path, "opcode", str)
-        AA_DICT_OF_TYPE(self, path, "dropdowns", key_t=str, value_t=SRDropdownValue)
         if config.raise_when_monitor_position_outside_stage:
-            AA_BOXED_COORD_PAIR(self, path, "position", 
-                min_x=-(STAGE_WIDTH //2), max_x=(STAGE_WIDTH //2), 
-                min_y=-(STAGE_HEIGHT//2), max_y=(STAGE_HEIGHT//2),
-            )
+            self.__validate_fields_inside_stage(path)
         else:
-            AA_COORD_PAIR(self, path, "position")
-        AA_TYPE(self, path, "is_visible", bool)
+            self.__validate_fields(path)
         
         cls_name = self.__class__.__name__
         opcode_info = info_api.get_info_by_new_safe(self.opcode)
@@ -263,6 +273,12 @@ class SRVariableMonitor(SRMonitor):
     slider_min: int | float
     slider_max: int | float
     allow_only_integers: bool
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_EQUAL, "opcode", NEW_OPCODE_VAR_VALUE),
+        FieldConstraint(AA_TYPE, "readout_mode", SRVariableMonitorReadoutMode),
+        FieldConstraint(AA_TYPE, "allow_only_integers", bool),
+    )
     
     def validate(self, path: list, config: ValidationConfig, info_api: OpcodeInfoAPI):
         """
@@ -281,10 +297,7 @@ class SRVariableMonitor(SRMonitor):
             ValidationError: if the SRVariableMonitor is invalid
         """
         super().validate(path, config, info_api)
-        AA_EQUAL(self, path, "opcode", NEW_OPCODE_VAR_VALUE)
-        
-        AA_TYPE(self, path, "readout_mode", SRVariableMonitorReadoutMode)
-        AA_TYPE(self, path, "allow_only_integers", bool)
+        self.__validate_fields(path)
         if self.allow_only_integers:
             allowed_types = (int,)
             condition = "When allow_only_integers is True"
@@ -303,6 +316,10 @@ class SRListMonitor(SRMonitor):
     """
 
     size: tuple[int | float, int | float]
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_EQUAL, "opcode", NEW_OPCODE_LIST_VALUE),
+    )
     
     def validate(self, path: list, config: ValidationConfig, info_api: OpcodeInfoAPI):
         """
@@ -321,7 +338,7 @@ class SRListMonitor(SRMonitor):
             ValidationError: if the SRListMonitor is invalid
         """
         super().validate(path, config, info_api)
-        AA_EQUAL(self, path, "opcode", NEW_OPCODE_LIST_VALUE)
+        self.__validate_fields(path)
         
         if config.raise_when_monitor_bigger_then_stage:
             max_x, max_y = STAGE_WIDTH, STAGE_HEIGHT
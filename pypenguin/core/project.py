@@ -1,20 +1,24 @@
-from json        import loads
-from uuid        import UUID
+from concurrent.futures import Executor, Future
+from json               import loads
+from uuid               import UUID
+from time               import perf_counter
+from typing             import Any, Iterable, Iterator, Generator
 
 from pypenguin.utility     import (
-    read_all_files_of_zip, string_to_sha256, ThanksError, grepr_dataclass, ValidationConfig, 
+    read_all_files_of_zip, string_to_sha256, evolve_dataclass, ThanksError, grepr_dataclass, ContentHashMixin, ValidationConfig, ValidationLevel, ValidationCache, 
     AA_TYPE, AA_NONE_OR_TYPE, AA_TYPES, AA_LIST_OF_TYPE, AA_RANGE, AA_EXACT_LEN,
-    SameValueTwiceError, SpriteLayerStackError,
+    FieldConstraint, compile_field_validator, PathError, ValidationError, SameValueTwiceError, SpriteLayerStackError,
 )
 from pypenguin.opcode_info import OpcodeInfoAPI, DropdownValueKind
 
-from pypenguin.core.context       import PartialContext
-from pypenguin.core.extension     import SRExtension, SRCustomExtension, SRBuiltinExtension
-from pypenguin.core.meta          import FRMeta
-from pypenguin.core.monitor       import FRMonitor, SRMonitor
-from pypenguin.core.enums         import SRTTSLanguage, SRVideoState
-from pypenguin.core.target        import FRTarget, FRStage, FRSprite, SRStage, SRSprite
-from pypenguin.core.vars_lists    import SRVariable, SRList
+from pypenguin.core.context        import PartialContext
+from pypenguin.core.extension      import SRExtension, SRCustomExtension, SRBuiltinExtension
+from pypenguin.core.meta           import FRMeta
+from pypenguin.core.monitor        import FRMonitor, SRMonitor
+from pypenguin.core.raw_validation import prevalidate_project_data
+from pypenguin.core.enums          import SRTTSLanguage, SRVideoState
+from pypenguin.core.target         import FRTarget, FRStage, FRSprite, SRStage, SRSprite
+from pypenguin.core.vars_lists     import SRVariable, SRList
 
 @grepr_dataclass(grepr_fields=["targets", "monitors", "extension_data", "extensions", "extension_urls", "meta", "asset_files"])
 class FRProject: 
@@ -35,6 +39,8 @@ class FRProject:
         data: dict, 
         asset_files: dict[str, bytes], 
         info_api: OpcodeInfoAPI,
+        columnar_blocks: bool = False,
+        prevalidate: bool = False,
     ) -> "FRProject":
         """
         Deserializes raw data into a FRProject
@@ -43,13 +49,21 @@ class FRProject:
             data: the raw data
             asset_files: the contents of the costume and sound files
             info_api: the opcode info api used to fetch information about opcodes
+            columnar_blocks: wether to store the blocks of each target in a memory efficient FRBlockStore instead of a dict
+            prevalidate: wether to quickly check the raw data first(see prevalidate_project_data), so broken data is rejected early
         
         Returns:
             the FRProject
+        
+        Raises:
+            RawDataError(ValidationError): if prevalidate is True and the raw data is broken
         """
+        if prevalidate:
+            prevalidate_project_data(data, info_api, max_errors=1).raise_first()
+        info_api.load_extensions(data["extensions"]) # extension opcodes are only loaded, when a project uses them
         return cls(
             targets = [
-                (FRStage if i==0 else FRSprite).from_data(target_data, info_api=info_api)
+                (FRStage if i==0 else FRSprite).from_data(target_data, info_api=info_api, columnar_blocks=columnar_blocks)
                 for i, target_data in enumerate(data["targets"])
             ],
             monitors = [
@@ -83,16 +97,26 @@ class FRProject:
         return project_data
 
     @classmethod
-    def from_file(cls, file_path: str, info_api: OpcodeInfoAPI) -> "FRProject":
+    def from_file(cls, 
+        file_path: str, 
+        info_api: OpcodeInfoAPI, 
+        columnar_blocks: bool = False, 
+        prevalidate: bool = False,
+    ) -> "FRProject":
         """
         Reads project data from a project file(.sb3 or .pmp) and creates a FRProject from it
 
         Args:
             file_path: file path to the .sb3 or .pmp file
             info_api: the opcode info api used to fetch information about opcodes
+            columnar_blocks: wether to store the blocks of each target in a memory efficient FRBlockStore instead of a dict
+            prevalidate: wether to quickly check the raw data first(see prevalidate_project_data), so broken data is rejected early
         
         Returns:
             the FRProject
+        
+        Raises:
+            RawDataError(ValidationError): if prevalidate is True and the raw data is broken
         """
         assert file_path.endswith(".sb3") or file_path.endswith(".pmp")
         contents = read_all_files_of_zip(file_path)
@@ -100,7 +124,9 @@ class FRProject:
         del contents["project.json"]
         if   file_path.endswith(".sb3"):
             project_data = FRProject._data_sb3_to_pmp(project_data)
-        return FRProject.from_data(project_data, asset_files=contents, info_api=info_api)
+        return FRProject.from_data(project_data, 
+            asset_files=contents, info_api=info_api, columnar_blocks=columnar_blocks, prevalidate=prevalidate,
+        )
 
     def __post_init__(self) -> None:
         """
@@ -111,16 +137,19 @@ class FRProject:
         """
         if self.extension_data != {}: raise ThanksError()
 
-    def step(self, info_api: OpcodeInfoAPI):
+    def step(self, info_api: OpcodeInfoAPI, decode_assets: bool = True):
         """
         Converts a FRProject into a SRProject
         
         Args:
             info_api: the opcode info api used to fetch information about opcodes
+            decode_assets: wether to decode the costume files. Script-only tools should pass False, 
+                so costumes keep their raw bytes(see SRRawCostume) and the slow image libraries are never imported
         
         Returns:
             the SRProject
         """
+        info_api.load_extensions(self.extensions)
         old_stage: FRStage
         new_stage: SRStage
         new_sprites: list[SRSprite] = []
@@ -131,12 +160,14 @@ class FRProject:
                 new_stage, all_sprite_variables, all_sprite_lists = old_stage.step(
                     asset_files=self.asset_files, 
                     info_api=info_api,
+                    decode_assets=decode_assets,
                 )
             else:
                 target: FRSprite
                 new_sprite, _, _ = target.step(
                     asset_files=self.asset_files, 
                     info_api=info_api,
+                    decode_assets=decode_assets,
                 )
                 new_sprite: SRSprite
                 new_sprites.append(new_sprite)
@@ -187,7 +218,7 @@ class FRProject:
 
 
 @grepr_dataclass(grepr_fields=["stage", "sprites", "sprite_layer_stack", "all_sprite_variables", "all_sprite_lists", "tempo", "video_transparency", "video_state", "text_to_speech_language", "global_monitors", "extensions"], eq=False)
-class SRProject:
+class SRProject(ContentHashMixin):
     """
     The second representation (SR) of a Scratch/PenguinMod Project
     """
@@ -204,6 +235,21 @@ class SRProject:
     global_monitors: list[SRMonitor]
     extensions: list[SRExtension]
 
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "stage", SRStage),
+        FieldConstraint(AA_LIST_OF_TYPE, "sprites", SRSprite),
+        FieldConstraint(AA_LIST_OF_TYPE, "sprite_layer_stack", UUID),
+        FieldConstraint(AA_LIST_OF_TYPE, "all_sprite_variables", SRVariable),
+        FieldConstraint(AA_LIST_OF_TYPE, "all_sprite_lists", SRList),
+        FieldConstraint(AA_TYPE, "tempo", int),
+        FieldConstraint(AA_RANGE, "tempo", min=20, max=500),
+        FieldConstraint(AA_TYPES, "video_transparency", (int, float)),
+        FieldConstraint(AA_TYPE, "video_state", SRVideoState),
+        FieldConstraint(AA_NONE_OR_TYPE, "text_to_speech_language", SRTTSLanguage),
+        FieldConstraint(AA_LIST_OF_TYPE, "global_monitors", SRMonitor),
+        FieldConstraint(AA_LIST_OF_TYPE, "extensions", SRExtension),
+    )
+
     @classmethod
     def create_empty(cls) -> "SRProject":
         """
@@ -226,6 +272,60 @@ class SRProject:
             extensions=[],
         )
 
+    def clone(self) -> "SRProject":
+        """
+        Create a structurally sharing copy of a SRProject. 
+        Only the lists of the project are copied, the stage, sprites, variables, monitors etc. are shared.
+        Copy-on-write: replace shared objects (e.g. with evolve_stage or evolve_sprite) instead of mutating them in place.
+        This is much faster than deepcopy, which would also copy every block, image and sound
+        
+        Returns:
+            the new SRProject
+        """
+        return evolve_dataclass(self)
+
+    def evolve(self, **changes) -> "SRProject":
+        """
+        Create a structurally sharing copy of a SRProject with some fields replaced (see clone)
+        
+        Args:
+            **changes: the new values of the fields to replace
+        
+        Returns:
+            the new SRProject
+        """
+        return evolve_dataclass(self, **changes)
+
+    def evolve_stage(self, **changes) -> "SRProject":
+        """
+        Create a structurally sharing copy of a SRProject, whose stage has some fields replaced.
+        The original project and its stage remain unchanged
+        
+        Args:
+            **changes: the new values of the stage fields to replace
+        
+        Returns:
+            the new SRProject
+        """
+        return self.evolve(stage=self.stage.evolve(**changes))
+
+    def evolve_sprite(self, index: int, **changes) -> "SRProject":
+        """
+        Create a structurally sharing copy of a SRProject, whose sprite at index has some fields replaced.
+        The new sprite keeps the uuid of the old one, so the sprite layer stack stays valid.
+        The original project and its sprites remain unchanged
+        
+        Args:
+            index: the index of the sprite in sprites
+            **changes: the new values of the sprite fields to replace
+        
+        Returns:
+            the new SRProject
+        """
+        new_project = self.clone()
+        new_project.sprites[index] = self.sprites[index].evolve(**changes)
+        return new_project
+
     def __eq__(self, other) -> bool: # TODO: test
         """
         Checks whether an SRProject is equal to another.
@@ -240,6 +340,12 @@ class SRProject:
         """
         if not isinstance(other, SRProject):
             return NotImplemented
+        if self is other:
+            return True
+        if self.__class__ is other.__class__:
+            is_equal = self._compare_content_hashes(other)
+            if is_equal is not None:
+                return is_equal
 
         if self.sprites != other.sprites:
             return False
@@ -265,13 +371,86 @@ class SRProject:
             self.extensions == other.extensions
         )
 
-    def validate(self, config: ValidationConfig, info_api: OpcodeInfoAPI) -> None:
+    def _get_content_hash_items(self) -> Iterable[tuple[str, Any]]:
+        """
+        *[Internal Method]* Get the named values, which make up the content hash. 
+        Mirrors __eq__: the UUIDs of the sprite layer stack are replaced by the sprites they reference
+
+        Returns:
+            the field names and values
+        """
+        uuid_to_sprite = {sprite.uuid: sprite for sprite in self.sprites}
+        yield "stage"                  , self.stage
+        yield "sprites"                , self.sprites
+        yield "sprite_layer_stack"     , tuple(uuid_to_sprite.get(uuid) for uuid in self.sprite_layer_stack)
+        yield "all_sprite_variables"   , self.all_sprite_variables
+        yield "all_sprite_lists"       , self.all_sprite_lists
+        yield "tempo"                  , self.tempo
+        yield "video_transparency"     , self.video_transparency
+        yield "text_to_speech_language", self.text_to_speech_language
+        yield "global_monitors"        , self.global_monitors
+        yield "extensions"             , self.extensions
+
+    def _get_content_hash_dependencies(self) -> Iterable[Any]:
+        """
+        *[Internal Method]* Get the sprite layer stack, which the content hash only includes indirectly
+
+        Returns:
+            the sprite layer stack
+        """
+        return (self.sprite_layer_stack,)
+
+    def mark_dirty(self, path: list) -> None:
         """
-        Ensure a SRProject is valid, raise ValidationError if not
+        Mark the part of a SRProject at path and everything containing it as changed.
+        Setting attributes and mutating lists or dicts of the parts are detected automatically. 
+        So this is only needed after writing to the __dict__ of a part directly(see invalidate_content_hash)
+
+        Args:
+            path: the path from the project to the changed part e.g. ["sprites", 0, "scripts", 2]. Dict keys are wrapped in a tuple
+        
+        Returns:
+            None
+        
+        Raises:
+            PathError: if the path does not exist
+        """
+        current = self
+        nodes: list[ContentHashMixin] = [self]
+        for i, key in enumerate(path):
+            try:
+                if isinstance(key, str):
+                    current = getattr(current, key)
+                elif isinstance(key, tuple):
+                    (dict_key,) = key
+                    current = current[dict_key]
+                else:
+                    current = current[key]
+            except (AttributeError, KeyError, IndexError, TypeError, ValueError) as error:
+                raise PathError(f"Invalid path {path}: can not resolve {key!r} at position {i}") from error
+            if isinstance(current, ContentHashMixin):
+                nodes.append(current)
+        for node in reversed(nodes):
+            node.invalidate_content_hash()
+
+    def validate(self, 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        cache: ValidationCache | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Ensure a SRProject is valid, raise ValidationError if not.
+        If a cache is given, scripts, which didn't change since the last successful validation, are skipped.
+        Changes are also detected after mutating lists or dicts in place.
+        If an executor(e.g. a ProcessPoolExecutor) is given, the scripts of the targets are validated concurrently. 
+        The raised error is the same as without an executor, independent of which target finishes first
         
         Args:
             config: Configuration for Validation Behaviour
             info_api: the opcode info api used to fetch information about opcodes
+            cache: remembers successfully validated parts of projects (optional)
+            executor: used to validate the scripts of the targets concurrently (optional)
         
         Returns:
             None
@@ -280,52 +459,278 @@ class SRProject:
             ValidationError: if the SRProject is invalid
             SameValueTwiceError(ValidationError): if two sprites have the same name
         """
+        errors = self.iter_validation_errors(config, info_api, cache, executor=executor)
+        error = next(errors, None)
+        errors.close() # cancels the validation of the other targets
+        if error is not None:
+            raise error
+
+    def get_validation_errors(self, 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        cache: ValidationCache | None = None,
+        executor: Executor | None = None,
+    ) -> list[ValidationError]:
+        """
+        Validate a SRProject like the iter_validation_errors method and return all errors as a list. 
+        The errors are always in the order of validation, also with an executor
+        
+        Args:
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            cache: remembers successfully validated parts of projects (optional)
+            executor: used to validate the scripts of the targets concurrently (optional)
+        
+        Returns:
+            the validation errors, empty if the SRProject is valid
+        """
+        return list(self.iter_validation_errors(config, info_api, cache, executor=executor))
+
+    def iter_validation_errors(self, 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        cache: ValidationCache | None = None,
+        max_errors: int | None = None,
+        time_budget: float | None = None,
+        executor: Executor | None = None,
+    ) -> Iterator[ValidationError]:
+        """
+        Validate a SRProject like the validate method, but yield every error(with its path) instead of raising the first one.
+        The errors are found in a single pass, in the order of validation. 
+        Invalid parts are skipped where later checks rely on them: 
+        invalid project fields end the validation, at most one error is yielded per script 
+        and the scripts of an invalid target are not validated. 
+        The scripts of all targets are skipped, if the stage, the all sprite variables or the all sprite lists are invalid, 
+        because their dropdowns can't be validated without them
+        
+        Args:
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            cache: remembers successfully validated parts of projects (optional)
+            max_errors: stop after this many errors (optional)
+            time_budget: stop after about this many seconds (optional). 
+                The budget is checked after every error and every target, so the validation of the scripts of a target is never interrupted
+            executor: used to validate the scripts of the targets concurrently (optional). 
+                The errors are still yielded in the order of validation. Closing the iterator cancels the targets, which didn't start yet
+        
+        Returns:
+            an iterator of the validation errors, empty if the SRProject is valid
+        """
+        if (max_errors is not None) and (max_errors <= 0):
+            return
+        deadline = None if time_budget is None else (perf_counter() + time_budget)
+        error_count = 0
+        for error in self._iter_all_validation_errors(config, info_api, cache, executor):
+            if error is not None:
+                yield error
+                error_count += 1
+                if (max_errors is not None) and (error_count >= max_errors):
+                    return
+            if (deadline is not None) and (perf_counter() >= deadline):
+                return
+
+    def _iter_all_validation_errors(self, 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        cache: ValidationCache | None,
+        executor: Executor | None,
+    ) -> Iterator[ValidationError | None]:
+        """
+        *[Internal Method]* Validate a SRProject and yield every error in the order of validation. 
+        None is yielded after every unit of work(the structure and the scripts of each target), so the caller can stop early
+        
+        Args:
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            cache: remembers successfully validated parts of projects (optional)
+            executor: used to validate the scripts of the targets concurrently (optional)
+        
+        Returns:
+            an iterator of the validation errors and None as progress markers
+        """
         path = []
-        AA_TYPE(self, path, "stage", SRStage)
-        AA_LIST_OF_TYPE(self, path, "sprites", SRSprite)
-        AA_LIST_OF_TYPE(self, path, "sprite_layer_stack", UUID)
-        AA_EXACT_LEN(self, path, "sprite_layer_stack", 
-            length=len(self.sprites), condition=f"In this case the project has {len(self.sprites)} sprites(s)"
-        )
-        AA_LIST_OF_TYPE(self, path, "all_sprite_variables", SRVariable)
-        AA_LIST_OF_TYPE(self, path, "all_sprite_lists", SRList)
-        AA_TYPE(self, path, "tempo", int)
-        AA_RANGE(self, path, "tempo", min=20, max=500)
-        AA_TYPES(self, path, "video_transparency", (int, float))
-        AA_TYPE(self, path, "video_state", SRVideoState)
-        AA_NONE_OR_TYPE(self, path, "text_to_speech_language", SRTTSLanguage)
-        AA_LIST_OF_TYPE(self, path, "global_monitors", SRMonitor)
-        AA_LIST_OF_TYPE(self, path, "extensions", SRExtension)
+        if cache is not None:
+            cache.bind(config, info_api)
+        invalid_sprites: set[int] = set()
+        invalid_monitors: set[int] = set()
+        structure_errors = self._iter_structure_errors(path, config, info_api, invalid_sprites=invalid_sprites)
+        while True:
+            try:
+                error = next(structure_errors)
+            except StopIteration as stop:
+                context_valid = stop.value
+                break
+            error_path = getattr(error, "path", [])
+            if error_path[:1] == ["global_monitors"]:
+                invalid_monitors.add(error_path[1])
+            yield error
+        yield None
+        if not context_valid:
+            return
+        yield from self._iter_sprite_name_errors(path, invalid_sprites=invalid_sprites)
         
-        self.stage.validate(path+["stage"], config, info_api)
+        target_contexts, global_context = self._get_validation_contexts(path, config, invalid_sprites=invalid_sprites)
+        if executor is None:
+            for target, current_path, partial_context in target_contexts:
+                yield from _iter_target_script_errors(target, current_path, config, info_api, partial_context, cache)
+                yield None
+        else:
+            yield from self._iter_target_errors_concurrently(target_contexts, config, info_api, cache, executor)
+        
+        if global_context is None:
+            return
+        for i, monitor in enumerate(self.global_monitors):
+            if i in invalid_monitors:
+                continue
+            try:
+                monitor.validate_dropdown_values(
+                    path     = path+["global_monitors", i], 
+                    config   = config,
+                    info_api = info_api, 
+                    context  = global_context,
+                )
+            except ValidationError as error:
+                yield error
 
-        self._validate_sprites(path, config, info_api)
+    def _iter_structure_errors(self, 
+        path: list,
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        invalid_sprites: set[int],
+    ) -> Generator[ValidationError, None, bool]:
+        """
+        *[Internal Method]* Validate everything of a SRProject except scripts and dropdown values and yield every error. 
+        Invalid project fields end the validation, because the other checks rely on them
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            invalid_sprites: receives the indexes of the invalid sprites
         
+        Returns:
+            an iterator of the validation errors in the order of validation. 
+            Its return value is wether the stage, the all sprite variables and the all sprite lists are valid, 
+            which the context for the dropdown validation is built from
+        """
+        try:
+            self.__validate_fields(path)
+        except ValidationError as error:
+            yield error
+            return False
+        try:
+            AA_EXACT_LEN(self, path, "sprite_layer_stack", 
+                length=len(self.sprites), condition=f"In this case the project has {len(self.sprites)} sprites(s)"
+            )
+        except ValidationError as error:
+            yield error
+        
+        context_valid = True
+        for error in self.stage._iter_validation_errors(path+["stage"], config, info_api):
+            context_valid = False
+            yield error
+
+        yield from self._iter_sprite_errors(path, config, info_api, invalid_sprites=invalid_sprites)
+        
+        variables_valid = True
         for i, variable in enumerate(self.all_sprite_variables):
-            variable.validate(path+["all_sprite_variables", i], config)
+            try:
+                variable.validate(path+["all_sprite_variables", i], config)
+            except ValidationError as error:
+                variables_valid = False
+                yield error
+        lists_valid = True
         for i, list_ in enumerate(self.all_sprite_lists):
-            list_.validate(path+["all_sprite_lists", i], config)
+            try:
+                list_.validate(path+["all_sprite_lists", i], config)
+            except ValidationError as error:
+                lists_valid = False
+                yield error
         
-        self._validate_var_names(path, config)
-        self._validate_list_names(path, config)
+        if variables_valid:
+            yield from self._iter_var_name_errors(path, config, invalid_sprites=invalid_sprites)
+        if lists_valid:
+            yield from self._iter_list_name_errors(path, config, invalid_sprites=invalid_sprites)
         
         for i, monitor in enumerate(self.global_monitors):
-            monitor.validate(path+["global_monitors", i], config, info_api)
+            try:
+                monitor.validate(path+["global_monitors", i], config, info_api)
+            except ValidationError as error:
+                yield error
         
         for i, extension in enumerate(self.extensions):
-            extension.validate(path+["extensions", i], config)
+            try:
+                extension.validate(path+["extensions", i], config)
+            except ValidationError as error:
+                yield error
+        return context_valid and variables_valid and lists_valid
+
+    def _iter_sprite_name_errors(self, path: list, invalid_sprites: set[int] = frozenset()) -> Iterator[ValidationError]:
+        """
+        *[Internal Method]* Ensure no two sprites have the same name and yield every error
         
-        # 1. Ensure no same sprite name
-        # 2. Validate Dropdown Values
-        defined_sprites      = {}
-        sprite_only_variables = {None: []}
-        sprite_only_lists     = {None: []}
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            invalid_sprites: the indexes of the sprites to skip, because they are invalid
+        
+        Returns:
+            an iterator of the validation errors
+        """
+        defined_sprites = {}
         for i, sprite in enumerate(self.sprites):
+            if i in invalid_sprites:
+                continue
             current_path = path+["sprites", i]
             if sprite.name in defined_sprites:
                 other_path = defined_sprites[sprite.name]
-                raise SameValueTwiceError(other_path, current_path, "Two sprites mustn't have the same name")
+                yield SameValueTwiceError(other_path, current_path, "Two sprites mustn't have the same name")
+                continue
             defined_sprites[sprite.name] = current_path
+
+    def _get_validation_contexts(self, 
+        path: list,
+        config: ValidationConfig,
+        invalid_sprites: set[int] = frozenset(),
+    ) -> tuple[list[tuple[SRStage | SRSprite, list, PartialContext | None]], PartialContext | None]:
+        """
+        *[Internal Method]* Get the context for the dropdown validation of every target like _get_partial_contexts. 
+        Below ValidationLevel.REFERENTIAL dropdown values aren't validated, so the contexts are None and building them is skipped
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            invalid_sprites: the indexes of the sprites to leave out, because they are invalid
+        
+        Returns:
+            a (target, path, context) tuple for the stage and every sprite and the context for global monitors
+        """
+        if config.level.includes(ValidationLevel.REFERENTIAL):
+            return self._get_partial_contexts(path, invalid_sprites=invalid_sprites)
+        target_contexts = [(self.stage, path+["stage"], None)]
+        for i, sprite in enumerate(self.sprites):
+            if i not in invalid_sprites:
+                target_contexts.append((sprite, path+["sprites", i], None))
+        return target_contexts, None
+
+    def _get_partial_contexts(self, path: list, invalid_sprites: set[int] = frozenset()) -> tuple[list[tuple[SRStage | SRSprite, list, PartialContext]], PartialContext]:
+        """
+        *[Internal Method]* Get the context for the dropdown validation of every target. 
+        Ensure no two sprites have the same name before(see _iter_sprite_name_errors)
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            invalid_sprites: the indexes of the sprites to leave out, because they are invalid
+        
+        Returns:
+            a (target, path, context) tuple for the stage and every sprite and the context for global monitors
+        """
+        sprite_names          = []
+        sprite_only_variables = {None: []}
+        sprite_only_lists     = {None: []}
+        for i, sprite in enumerate(self.sprites):
+            if i in invalid_sprites:
+                continue
+            sprite_names.append(sprite.name)
             sprite_only_variables[sprite.name] = [
                 (DropdownValueKind.VARIABLE, variable.name) for variable in sprite.sprite_only_variables]
             sprite_only_lists    [sprite.name] = [
@@ -334,7 +739,11 @@ class SRProject:
         all_sprite_variables = [(DropdownValueKind.VARIABLE, variable.name) for variable in self.all_sprite_variables]
         all_sprite_lists     = [(DropdownValueKind.LIST    , list_   .name) for list_    in self.all_sprite_lists    ]
         backdrops            = [(DropdownValueKind.BACKDROP, backdrop.name) for backdrop in self.stage.costumes      ]
+        other_sprites        = [(DropdownValueKind.SPRITE  , sprite_name  ) for sprite_name in dict.fromkeys(sprite_names)]
+        target_contexts = []
         for i, target in enumerate([self.stage]+self.sprites):
+            if (i-1) in invalid_sprites:
+                continue
             if i == 0:
                 target_key = None
                 current_path = path+["stage"]
@@ -347,34 +756,67 @@ class SRProject:
                 all_sprite_variables  = all_sprite_variables,
                 sprite_only_variables = sprite_only_variables,
                 sprite_only_lists     = sprite_only_lists,
-                other_sprites         = [
-                    (DropdownValueKind.SPRITE, sprite_name) for sprite_name in defined_sprites.keys()],
+                other_sprites         = other_sprites,
                 backdrops             = backdrops,
             )
-            target.validate_scripts(
-                path     = current_path, 
-                config   = config,
-                info_api = info_api, 
-                context  = partial_context,
-            )
-            if i == 0: 
-                global_context = partial_context
-            else:
-                target: SRSprite
-                target.validate_monitor_dropdown_values(
-                    path     = current_path, 
-                    config   = config,
-                    info_api = info_api, 
-                    context  = partial_context,
-                )
+            target_contexts.append((target, current_path, partial_context))
+        global_context = target_contexts[0][2]
+        return target_contexts, global_context
+
+    def _iter_target_errors_concurrently(self, 
+        target_contexts: list[tuple[SRStage | SRSprite, list, PartialContext | None]],
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        cache: ValidationCache | None,
+        executor: Executor,
+    ) -> Iterator[ValidationError | None]:
+        """
+        *[Internal Method]* Validate the scripts and monitor dropdown values of the targets with an executor 
+        and yield the errors in target order, followed by None after every target. 
+        Targets, whose scripts are known to be valid by the cache, are validated directly. 
+        All lazy groups of the info api are loaded first, so worker threads only read it. 
+        Closing the iterator cancels the targets, which didn't start yet
         
-        for i, monitor in enumerate(self.global_monitors):
-            monitor.validate_dropdown_values(
-                path     = path+["global_monitors", i], 
-                config   = config,
-                info_api = info_api, 
-                context  = global_context,
-            )
+        Args:
+            target_contexts: a (target, path, context) tuple for every target
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            cache: remembers successfully validated parts of projects (optional)
+            executor: the executor to submit the validation of the targets to
+        
+        Returns:
+            an iterator of the validation errors and None as progress markers
+        """
+        from pypenguin.opcode_info import info_api as default_info_api
+        # the default info api doesn't need to be sent to worker processes
+        worker_info_api = None if info_api is default_info_api else info_api
+        # loading lazy groups from several worker threads at once would break the info api
+        info_api.load_all_groups()
+        
+        results: list[Future | list[ValidationError]] = []
+        try:
+            for target, current_path, partial_context in target_contexts:
+                complete_context = None if partial_context is None else target._get_complete_context(partial_context)
+                if (cache is not None) and cache.is_valid(*target._get_scripts_cache_key(complete_context)):
+                    results.append(list(_iter_target_script_errors(target, current_path, config, info_api, partial_context, cache)))
+                else:
+                    results.append(executor.submit(_validate_target_scripts_in_worker, 
+                        target, current_path, config, worker_info_api, partial_context, cache is not None,
+                    ))
+            
+            for result in results:
+                if isinstance(result, Future):
+                    errors, cache_keys = result.result()
+                    if cache is not None:
+                        cache.add_keys(cache_keys)
+                else:
+                    errors = result
+                yield from errors
+                yield None
+        finally:
+            for result in results:
+                if isinstance(result, Future):
+                    result.cancel()
 
     def _validate_sprites(self, path: list, config: ValidationConfig, info_api: OpcodeInfoAPI) -> None:
         """
@@ -392,29 +834,55 @@ class SRProject:
             SameValueTwiceError(ValidationError): if two sprites have the same UUID **OR** if the same UUID is included twice in sprite_layer_stack 
             SpriteLayerStackError(ValidationError): if the sprite_layer_stack contains a UUID which belongs to no sprite 
         """
+        for error in self._iter_sprite_errors(path, config, info_api):
+            raise error
+
+    def _iter_sprite_errors(self, 
+        path: list,
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        invalid_sprites: set[int] | None = None,
+    ) -> Iterator[ValidationError]:
+        """
+        *[Internal Method]* Validate the sprites of a SRProject like the _validate_sprites method, but yield every error instead of raising the first one
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            invalid_sprites: receives the indexes of the invalid sprites (optional)
+        
+        Returns:
+            an iterator of the validation errors
+        """
         sprite_uuid_paths: dict[UUID, list] = {}
         for i, sprite in enumerate(self.sprites):
             current_path = path+["sprites", i]
-            sprite.validate(current_path, config, info_api)
+            for error in sprite._iter_validation_errors(current_path, config, info_api):
+                if invalid_sprites is not None:
+                    invalid_sprites.add(i)
+                yield error
+            if not isinstance(sprite.uuid, UUID):
+                continue
             if sprite.uuid in sprite_uuid_paths:
                 other_path = sprite_uuid_paths[sprite.uuid]
-                raise SameValueTwiceError(other_path, current_path, "Two sprites mustn't have the same UUID")
+                yield SameValueTwiceError(other_path, current_path, "Two sprites mustn't have the same UUID")
+                continue
             sprite_uuid_paths[sprite.uuid] = current_path
         
-
         stack_uuid_paths: dict[UUID, list] = {}
         for i, uuid in enumerate(self.sprite_layer_stack):
             current_path = path+["sprite_layer_stack", i]
             if uuid in stack_uuid_paths:
-                other_path = stack_uuid_paths[sprite.uuid]
-                raise SameValueTwiceError(other_path, current_path, "The same UUID mustn't be included twice")
+                other_path = stack_uuid_paths[uuid]
+                yield SameValueTwiceError(other_path, current_path, "The same UUID mustn't be included twice")
+                continue
             if uuid not in sprite_uuid_paths:
-                raise SpriteLayerStackError(current_path, "Must be the UUID of an existing sprite")
+                yield SpriteLayerStackError(current_path, "Must be the UUID of an existing sprite")
+                continue
             stack_uuid_paths[uuid] = current_path
         # same length and uniqueness is assured and every UUID must have a partner sprite
         # => no sprite can possibly be missing a partner UUID
-        
-            
 
     def _validate_var_names(self, path: list, config: ValidationConfig) -> None:
         """
@@ -430,20 +898,39 @@ class SRProject:
         Raises:
             SameValueTwiceError(ValidationError): if the project contains vars with the same name
         """
+        for error in self._iter_var_name_errors(path, config):
+            raise error
+
+    def _iter_var_name_errors(self, path: list, config: ValidationConfig, invalid_sprites: set[int] = frozenset()) -> Iterator[ValidationError]:
+        """
+        *[Internal Method]* Find variables with the same name like the _validate_var_names method, but yield every error instead of raising the first one
+
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            invalid_sprites: the indexes of the sprites to skip, because they are invalid
+        
+        Returns:
+            an iterator of the validation errors
+        """
         defined_variables = {}
         for i, variable in enumerate(self.all_sprite_variables):
             current_path = path+["all_sprite_variables", i]
             if variable.name in defined_variables:
                 other_path = defined_variables[variable.name]
-                raise SameValueTwiceError(other_path, current_path, "Two variables mustn't have the same name")
+                yield SameValueTwiceError(other_path, current_path, "Two variables mustn't have the same name")
+                continue
             defined_variables[variable.name] = current_path
         
         for i, sprite in enumerate(self.sprites):
+            if i in invalid_sprites:
+                continue
             for j, variable in enumerate(sprite.sprite_only_variables):
                 current_path = path+["sprites", i, "sprite_only_variables", j]
                 if variable.name in defined_variables:
                     other_path = defined_variables[variable.name]
-                    raise SameValueTwiceError(other_path, current_path, "Two variables mustn't have the same name")
+                    yield SameValueTwiceError(other_path, current_path, "Two variables mustn't have the same name")
+                    continue
                 defined_variables[variable.name] = current_path
         
     def _validate_list_names(self, path: list, config: ValidationConfig) -> None:
@@ -460,22 +947,99 @@ class SRProject:
         Raises:
             SameValueTwiceError(ValidationError): if the project contains lists with the same name
         """
+        for error in self._iter_list_name_errors(path, config):
+            raise error
+
+    def _iter_list_name_errors(self, path: list, config: ValidationConfig, invalid_sprites: set[int] = frozenset()) -> Iterator[ValidationError]:
+        """
+        *[Internal Method]* Find lists with the same name like the _validate_list_names method, but yield every error instead of raising the first one
+
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            invalid_sprites: the indexes of the sprites to skip, because they are invalid
+        
+        Returns:
+            an iterator of the validation errors
+        """
         defined_lists = {}
         for i, list_ in enumerate(self.all_sprite_lists):
             current_path = path+["all_sprite_lists", i]
             if list_.name in defined_lists:
                 other_path = defined_lists[list_.name]
-                raise SameValueTwiceError(other_path, current_path, "Two lists mustn't have the same name")
+                yield SameValueTwiceError(other_path, current_path, "Two lists mustn't have the same name")
+                continue
             defined_lists[list_.name] = current_path
         
         for i, sprite in enumerate(self.sprites):
+            if i in invalid_sprites:
+                continue
             for j, list_ in enumerate(sprite.sprite_only_lists):
                 current_path = path+["sprites", i, "sprite_only_lists", j]
                 if list_.name in defined_lists:
                     other_path = defined_lists[list_.name]
-                    raise SameValueTwiceError(other_path, current_path, "Two lists mustn't have the same name")
+                    yield SameValueTwiceError(other_path, current_path, "Two lists mustn't have the same name")
+                    continue
                 defined_lists[list_.name] = current_path
 
 
+def _iter_target_script_errors(
+    target: SRStage | SRSprite,
+    path: list,
+    config: ValidationConfig,
+    info_api: OpcodeInfoAPI,
+    context: PartialContext | None,
+    cache: ValidationCache | None,
+) -> Iterator[ValidationError]:
+    """
+    *[Internal Function]* Validate the scripts and monitor dropdown values of a target and yield every error
+
+    Args:
+        target: the stage or sprite
+        path: the path from the project to the target. Used for better error messages
+        config: Configuration for Validation Behaviour
+        info_api: the opcode info api used to fetch information about opcodes
+        context: the context of the target or None if dropdown values aren't validated
+        cache: remembers successfully validated parts of projects (optional)
+
+    Returns:
+        an iterator of the validation errors in the order of validation
+    """
+    yield from target._iter_script_validation_errors(path, config, info_api, context, cache)
+    if isinstance(target, SRSprite) and (context is not None):
+        yield from target._iter_monitor_dropdown_value_errors(path, config, info_api, context)
+
+def _validate_target_scripts_in_worker(
+    target: SRStage | SRSprite,
+    path: list,
+    config: ValidationConfig,
+    info_api: OpcodeInfoAPI | None,
+    context: PartialContext | None,
+    use_cache: bool,
+) -> tuple[list[ValidationError], list[tuple]]:
+    """
+    *[Internal Function]* Validate the scripts and monitor dropdown values of a target in a worker (process)
+
+    Args:
+        target: the stage or sprite
+        path: the path from the project to the target. Used for better error messages
+        config: Configuration for Validation Behaviour
+        info_api: the opcode info api used to fetch information about opcodes. None means the default info api
+        context: the context of the target or None if dropdown values aren't validated
+        use_cache: wether to record the successfully validated parts for the validation cache of the caller
+
+    Returns:
+        the validation errors and the recorded validation cache keys
+    """
+    if info_api is None:
+        from pypenguin.opcode_info import info_api
+    cache = None
+    if use_cache:
+        cache = ValidationCache()
+        cache.bind(config, info_api)
+    errors = list(_iter_target_script_errors(target, path, config, info_api, context, cache))
+    return errors, ([] if cache is None else cache.get_keys())
+
+
 __all__ = ["FRProject", "SRProject"]
 
@@ -0,0 +1,484 @@
+from dataclasses import fields, is_dataclass
+from difflib     import SequenceMatcher
+from typing      import Any, Generator
+
+from pypenguin.utility import grepr_dataclass, PypenguinEnum, PatchError, PathNode, content_hash, evolve_dataclass
+
+from pypenguin.core.project import SRProject
+
+# Items of these lists are matched by an attribute instead of their content
+_LIST_ITEM_KEYS: dict[str, str] = {
+    "sprites"              : "name",
+    "costumes"             : "name",
+    "sounds"               : "name",
+    "all_sprite_variables" : "name",
+    "all_sprite_lists"     : "name",
+    "sprite_only_variables": "name",
+    "sprite_only_lists"    : "name",
+    "extensions"           : "id",
+}
+
+class SRChangeKind(PypenguinEnum):
+    """
+    The kind of a change between two SRProjects
+    """
+
+    ADDED    = 0
+    REMOVED  = 1
+    MODIFIED = 2
+
+@grepr_dataclass(grepr_fields=["kind", "path", "old", "new"])
+class SRChange:
+    """
+    A single change between two SRProjects.
+    The path uses the same format as validation paths:
+    attribute names(str), list indices(int) and dict keys(tuple with one str).
+    The index of an ADDED list item refers to the new list, all other indices refer to the old list.
+    The sprite layer stack is represented by sprite names, because the UUIDs differ between projects
+    """
+
+    kind: SRChangeKind
+    path: list
+    old: Any = None
+    new: Any = None
+
+def diff(a: SRProject, b: SRProject) -> list[SRChange]:
+    """
+    Compute a minimal list of changes, which turn project a into project b.
+    Subtrees with equal content hashes are skipped, so unchanged scripts, sprites etc. are not walked again.
+    Scripts and blocks are matched by content, sprites, variables, lists, costumes and sounds by name.
+    Nested values are compared with an explicit stack, so deeply nested scripts don't hit the recursion limit
+
+    Args:
+        a: the old project
+        b: the new project
+
+    Returns:
+        the changes, which can be applied to a with apply_patch
+    """
+    changes = []
+    known_digests = {} # every node is only hashed once
+    if content_hash(a, known_digests) == content_hash(b, known_digests) and (a.video_state == b.video_state):
+        return changes # content hashes ignore video_state like SRProject.__eq__
+    _diff_values([
+        ([field.name], getattr(a, field.name), getattr(b, field.name))
+        for field in fields(SRProject) if field.name != "sprite_layer_stack"
+    ], changes, known_digests)
+
+    old_stack = _get_layer_stack_names(a)
+    new_stack = _get_layer_stack_names(b)
+    if old_stack != new_stack:
+        changes.append(SRChange(kind=SRChangeKind.MODIFIED, path=["sprite_layer_stack"], old=old_stack, new=new_stack))
+    return changes
+
+def apply_patch(project: SRProject, changes: list[SRChange]) -> SRProject:
+    """
+    Apply changes created by diff to a project. The project is not modified.
+    Unchanged subtrees are shared between the project and the result (see SRProject.evolve)
+
+    Args:
+        project: the project to apply the changes to
+        changes: the changes created by diff
+
+    Returns:
+        the patched project
+
+    Raises:
+        PatchError: if the changes don't fit the project
+    """
+    layer_stack_changes = [change for change in changes if change.path == ["sprite_layer_stack"]]
+    other_changes       = [change for change in changes if change.path != ["sprite_layer_stack"]]
+    new_project: SRProject = _apply_to_value(project, other_changes, depth=0)
+
+    if layer_stack_changes:
+        name_to_uuid = {sprite.name: sprite.uuid for sprite in new_project.sprites}
+        try:
+            new_stack = [name_to_uuid[name] for name in layer_stack_changes[-1].new]
+        except KeyError as error:
+            raise PatchError(f"Sprite layer stack references unknown sprite {error}") from error
+    else:
+        # keep the order, but drop removed sprites and put added sprites on top
+        uuid_to_name = {sprite.uuid: sprite.name for sprite in project.sprites}
+        name_to_uuid = {sprite.name: sprite.uuid for sprite in new_project.sprites}
+        new_stack = [
+            name_to_uuid[uuid_to_name[uuid]] for uuid in project.sprite_layer_stack
+            if uuid_to_name.get(uuid) in name_to_uuid
+        ]
+        new_stack += [uuid for uuid in name_to_uuid.values() if uuid not in new_stack]
+    if new_project is project:
+        new_project = project.clone()
+    new_project.sprite_layer_stack = new_stack
+    return new_project
+
+
+def _get_layer_stack_names(project: SRProject) -> list[str | None]:
+    """
+    *[Internal Method]* Get the sprite layer stack of a project as sprite names
+
+    Args:
+        project: the project
+
+    Returns:
+        the sprite names in layer order
+    """
+    uuid_to_name = {sprite.uuid: sprite.name for sprite in project.sprites}
+    return [uuid_to_name.get(uuid) for uuid in project.sprite_layer_stack]
+
+def _is_node(value: Any) -> bool:
+    """
+    *[Internal Method]* Get wether a value is a dataclass instance, whose fields should be diffed individually
+
+    Args:
+        value: the value
+
+    Returns:
+        wether the value is a node
+    """
+    return is_dataclass(value) and not isinstance(value, type)
+
+def _can_pair(old: Any, new: Any) -> bool:
+    """
+    *[Internal Method]* Get wether two list items should be diffed as a modification instead of a replacement.
+    Blocks are only paired if they have the same opcode
+
+    Args:
+        old: the old item
+        new: the new item
+
+    Returns:
+        wether the items can be paired
+    """
+    return (
+        _is_node(old) and (type(old) is type(new))
+        and (getattr(old, "opcode", None) == getattr(new, "opcode", None))
+    )
+
+# A task of _diff_values: either compare two values at a path or add a change. 
+# The paths are only materialized for the changes, so deep paths aren't copied on every level
+_DiffTask = tuple[PathNode | list, Any, Any] | SRChange
+
+def _diff_values(tasks: list[_DiffTask], changes: list[SRChange], known_digests: dict[int, bytes]) -> None:
+    """
+    *[Internal Method]* Add the changes between pairs of values. 
+    Uses an explicit stack instead of recursion, the changes are added in depth-first order
+
+    Args:
+        tasks: the paths and the old and new values to compare
+        changes: the list to add the changes to
+        known_digests: the content hashes of the already hashed nodes(see content_hash)
+
+    Returns:
+        None
+    """
+    stack = list(reversed(tasks))
+    while stack:
+        task = stack.pop()
+        if isinstance(task, SRChange):
+            changes.append(task)
+            continue
+        path, old, new = task
+        if (old is new) or (content_hash(old, known_digests) == content_hash(new, known_digests)):
+            continue
+        if isinstance(old, list) and isinstance(new, list):
+            sub_tasks = _diff_lists(path, old, new, known_digests)
+        elif isinstance(old, dict) and isinstance(new, dict):
+            sub_tasks = _diff_dicts(path, old, new)
+        elif _is_node(old) and (type(old) is type(new)):
+            sub_tasks = _diff_nodes(path, old, new)
+        else:
+            sub_tasks = [SRChange(kind=SRChangeKind.MODIFIED, path=_to_list(path), old=old, new=new)]
+        stack.extend(reversed(sub_tasks))
+
+def _to_list(path: PathNode | list) -> list:
+    """
+    *[Internal Method]* Materialize a path for a change
+
+    Args:
+        path: the path
+
+    Returns:
+        the path as a new list
+    """
+    return path.to_list() if isinstance(path, PathNode) else list(path)
+
+def _diff_nodes(path: PathNode | list, old: Any, new: Any) -> list[_DiffTask]:
+    """
+    *[Internal Method]* Get the tasks to find the changes between the fields of two dataclass instances of the same type
+
+    Args:
+        path: the path of the nodes
+        old: the old node
+        new: the new node
+
+    Returns:
+        the tasks in order
+    """
+    tasks = []
+    for field in fields(old):
+        if not field.compare:
+            continue
+        has_old = hasattr(old, field.name)
+        has_new = hasattr(new, field.name)
+        if has_old and has_new:
+            tasks.append((PathNode(path, field.name), getattr(old, field.name), getattr(new, field.name)))
+        elif has_old or has_new:
+            tasks.append(SRChange(
+                kind=SRChangeKind.MODIFIED, path=_to_list(PathNode(path, field.name)),
+                old=getattr(old, field.name, None), new=getattr(new, field.name, None),
+            ))
+    return tasks
+
+def _diff_dicts(path: PathNode | list, old: dict, new: dict) -> list[_DiffTask]:
+    """
+    *[Internal Method]* Get the tasks to find the changes between two dicts
+
+    Args:
+        path: the path of the dicts
+        old: the old dict
+        new: the new dict
+
+    Returns:
+        the tasks in order
+    """
+    tasks = []
+    for key, old_value in old.items():
+        if key in new:
+            tasks.append((PathNode(path, (key,)), old_value, new[key]))
+        else:
+            tasks.append(SRChange(kind=SRChangeKind.REMOVED, path=_to_list(PathNode(path, (key,))), old=old_value))
+    for key, new_value in new.items():
+        if key not in old:
+            tasks.append(SRChange(kind=SRChangeKind.ADDED, path=_to_list(PathNode(path, (key,))), new=new_value))
+    return tasks
+
+def _diff_lists(path: PathNode | list, old: list, new: list, known_digests: dict[int, bytes]) -> list[_DiffTask]:
+    """
+    *[Internal Method]* Get the tasks to find the changes between two lists.
+    Items are matched by key(see _LIST_ITEM_KEYS) or by content hash.
+    Unmatched items at the same position are diffed as modifications if possible(e.g. a renamed variable)
+
+    Args:
+        path: the path of the lists
+        old: the old list
+        new: the new list
+        known_digests: the content hashes of the already hashed nodes(see content_hash)
+
+    Returns:
+        the tasks in order
+    """
+    tasks = []
+    last_item = path.segment[-1] if isinstance(path, PathNode) else path[-1]
+    key_attr = _LIST_ITEM_KEYS.get(last_item) if isinstance(last_item, str) else None
+    if key_attr is None:
+        old_keys = [content_hash(item, known_digests) for item in old]
+        new_keys = [content_hash(item, known_digests) for item in new]
+    else:
+        old_keys = [getattr(item, key_attr, None) for item in old]
+        new_keys = [getattr(item, key_attr, None) for item in new]
+
+    matcher = SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            if key_attr is not None: # same key, but the content might differ
+                for i, j in zip(range(i1, i2), range(j1, j2)):
+                    tasks.append((PathNode(path, i), old[i], new[j]))
+            continue
+
+        paired = 0
+        if tag == "replace":
+            for i, j in zip(range(i1, i2), range(j1, j2)):
+                if not _can_pair(old[i], new[j]):
+                    break
+                tasks.append((PathNode(path, i), old[i], new[j]))
+                paired += 1
+        for i in range(i1+paired, i2):
+            tasks.append(SRChange(kind=SRChangeKind.REMOVED, path=_to_list(PathNode(path, i)), old=old[i]))
+        for j in range(j1+paired, j2):
+            tasks.append(SRChange(kind=SRChangeKind.ADDED, path=_to_list(PathNode(path, j)), new=new[j]))
+    return tasks
+
+
+# A generator, which applies changes to a value. 
+# It yields (value, changes, depth) for every nested value to change, receives the new nested value and returns the new value
+_ApplyGenerator = Generator[tuple[Any, list[SRChange], int], Any, Any]
+
+def _apply_to_value(value: Any, changes: list[SRChange], depth: int) -> Any:
+    """
+    *[Internal Method]* Apply changes to a value. The paths of all changes start with the path of the value.
+    Nested values are changed with an explicit stack of generators, so deep paths don't hit the recursion limit
+
+    Args:
+        value: the value
+        changes: the changes
+        depth: the length of the path of the value
+
+    Returns:
+        the new value
+    """
+    stack = [_get_apply_generator(value, changes, depth)]
+    result = None
+    while stack:
+        try:
+            request = stack[-1].send(result)
+        except StopIteration as stop:
+            stack.pop()
+            result = stop.value
+            continue
+        result = None
+        stack.append(_get_apply_generator(*request))
+    return result
+
+def _get_apply_generator(value: Any, changes: list[SRChange], depth: int) -> _ApplyGenerator:
+    """
+    *[Internal Method]* Get the generator, which applies changes to a value(see _apply_to_value)
+
+    Args:
+        value: the value
+        changes: the changes
+        depth: the length of the path of the value
+
+    Returns:
+        the generator
+    """
+    if isinstance(value, list):
+        return _apply_to_list(value, changes, depth)
+    if isinstance(value, dict):
+        return _apply_to_dict(value, changes, depth)
+    if _is_node(value):
+        return _apply_to_node(value, changes, depth)
+    raise PatchError(f"Can't apply change at {changes[0].path} to value of type {type(value).__name__}")
+
+def _group_changes(changes: list[SRChange], depth: int) -> tuple[dict[Any, SRChange], dict[Any, list[SRChange]]]:
+    """
+    *[Internal Method]* Group changes by their path item at depth
+
+    Args:
+        changes: the changes
+        depth: the index of the relevant path item
+
+    Returns:
+        the changes, which end at depth and the changes, which go deeper, grouped by path item
+    """
+    direct = {}
+    nested = {}
+    for change in changes:
+        if len(change.path) <= depth:
+            raise PatchError(f"Invalid change path: {change.path}")
+        item = change.path[depth]
+        if len(change.path) == depth+1:
+            if change.kind == SRChangeKind.ADDED:
+                item = ("added", item) # indices of added items refer to the new list
+            direct[item] = change
+        else:
+            nested.setdefault(item, []).append(change)
+    return direct, nested
+
+def _apply_to_node(node: Any, changes: list[SRChange], depth: int) -> _ApplyGenerator:
+    """
+    *[Internal Method]* Apply changes to the fields of a dataclass instance
+
+    Args:
+        node: the dataclass instance
+        changes: the changes
+        depth: the length of the path of the node
+
+    Returns:
+        the generator returning the new node, which shares unchanged fields with the old one
+    """
+    if not changes:
+        return node
+    direct, nested = _group_changes(changes, depth)
+    updates = {}
+    for name, change in direct.items():
+        if change.kind != SRChangeKind.MODIFIED:
+            raise PatchError(f"Fields can only be modified, not added or removed: {change.path}")
+        updates[name] = change.new
+    for name, sub_changes in nested.items():
+        if not hasattr(node, name):
+            raise PatchError(f"{type(node).__name__} has no attribute {repr(name)}: {sub_changes[0].path}")
+        updates[name] = yield (getattr(node, name), sub_changes, depth+1)
+    try:
+        return evolve_dataclass(node, **updates)
+    except (TypeError, AttributeError) as error:
+        raise PatchError(f"Can't apply changes to {type(node).__name__}: {error}") from error
+
+def _apply_to_dict(value: dict, changes: list[SRChange], depth: int) -> _ApplyGenerator:
+    """
+    *[Internal Method]* Apply changes to a dict
+
+    Args:
+        value: the dict
+        changes: the changes
+        depth: the length of the path of the dict
+
+    Returns:
+        the generator returning the new dict
+    """
+    direct, nested = _group_changes(changes, depth)
+    new_value = dict(value)
+    for item, change in direct.items():
+        if change.kind == SRChangeKind.ADDED:
+            item = item[1]
+        if not(isinstance(item, tuple) and (len(item) == 1)):
+            raise PatchError(f"Invalid dict key in change path: {change.path}")
+        if change.kind == SRChangeKind.REMOVED:
+            if item[0] not in new_value:
+                raise PatchError(f"Can't remove missing key: {change.path}")
+            del new_value[item[0]]
+        else:
+            new_value[item[0]] = change.new
+    for item, sub_changes in nested.items():
+        if not(isinstance(item, tuple) and (len(item) == 1) and (item[0] in new_value)):
+            raise PatchError(f"Invalid dict key in change path: {sub_changes[0].path}")
+        new_value[item[0]] = yield (new_value[item[0]], sub_changes, depth+1)
+    return new_value
+
+def _apply_to_list(value: list, changes: list[SRChange], depth: int) -> _ApplyGenerator:
+    """
+    *[Internal Method]* Apply changes to a list.
+    Removed, modified and nested changes refer to old indices, added items are inserted at their new indices
+
+    Args:
+        value: the list
+        changes: the changes
+        depth: the length of the path of the list
+
+    Returns:
+        the generator returning the new list
+    """
+    direct, nested = _group_changes(changes, depth)
+    removed  = set()
+    replaced = {}
+    added    = []
+    for item, change in direct.items():
+        if change.kind == SRChangeKind.ADDED:
+            added.append((item[1], change.new))
+            continue
+        if not(isinstance(item, int) and (0 <= item < len(value))):
+            raise PatchError(f"Invalid list index in change path: {change.path}")
+        if change.kind == SRChangeKind.REMOVED:
+            removed.add(item)
+        else:
+            replaced[item] = change.new
+    for item in nested:
+        if not(isinstance(item, int) and (0 <= item < len(value))):
+            raise PatchError(f"Invalid list index in change path: {nested[item][0].path}")
+
+    new_value = []
+    for i, old_item in enumerate(value):
+        if i in removed:
+            continue
+        if i in replaced:
+            new_value.append(replaced[i])
+        elif i in nested:
+            new_value.append((yield (old_item, nested[i], depth+1)))
+        else:
+            new_value.append(old_item)
+    for index, new_item in sorted(added, key=lambda pair: pair[0]):
+        if not(isinstance(index, int) and (0 <= index <= len(new_value))):
+            raise PatchError(f"Invalid list index for added item: {index}")
+        new_value.insert(index, new_item)
+    return new_value
+
+
+__all__ = ["SRChangeKind", "SRChange", "diff", "apply_patch"]
@@ -0,0 +1,264 @@
+from itertools import islice
+from typing    import Any, Iterator
+
+from pypenguin.utility     import (
+    grepr_dataclass, RawDataError, RawMissingKeyError, RawTypeError, RawReferenceError, RawOpcodeError, RawMutationError,
+)
+from pypenguin.opcode_info import OpcodeInfoAPI
+
+
+_PROJECT_KEYS: dict[str, type | tuple[type, ...]] = {
+    "targets": list, "monitors": list, "extensions": list, "meta": dict,
+}
+_META_KEYS: dict[str, type | tuple[type, ...]] = {
+    "semver": str, "vm": str, "agent": str,
+}
+_TARGET_KEYS: dict[str, type | tuple[type, ...]] = {
+    "isStage": bool, "name": str, "variables": dict, "lists": dict, "broadcasts": dict, "blocks": dict, "comments": dict,
+    "currentCostume": int, "costumes": list, "sounds": list, "volume": (int, float), "layerOrder": int,
+}
+_STAGE_KEYS: dict[str, type | tuple[type, ...]] = {
+    "tempo": (int, float), "videoTransparency": (int, float), "videoState": str, "textToSpeechLanguage": (str, type(None)),
+}
+_SPRITE_KEYS: dict[str, type | tuple[type, ...]] = {
+    "visible": bool, "x": (int, float), "y": (int, float), "size": (int, float), "direction": (int, float),
+    "draggable": bool, "rotationStyle": str,
+}
+_COSTUME_KEYS: dict[str, type | tuple[type, ...]] = {
+    "name": str, "assetId": str, "dataFormat": str, "md5ext": str, "rotationCenterX": (int, float), "rotationCenterY": (int, float),
+}
+_SOUND_KEYS: dict[str, type | tuple[type, ...]] = {
+    "name": str, "assetId": str, "dataFormat": str, "md5ext": str, "rate": int, "sampleCount": int,
+}
+_COMMENT_KEYS: dict[str, type | tuple[type, ...]] = {
+    "blockId": (str, type(None)), "x": (int, float, type(None)), "y": (int, float, type(None)),
+    "width": (int, float), "height": (int, float), "minimized": bool, "text": str,
+}
+_BLOCK_KEYS: dict[str, type | tuple[type, ...]] = {
+    "opcode": str, "next": (str, type(None)), "parent": (str, type(None)), "inputs": dict, "fields": dict,
+    "shadow": bool, "topLevel": bool,
+}
+_MONITOR_KEYS: dict[str, type | tuple[type, ...]] = {
+    "id": str, "mode": str, "opcode": str, "params": dict, "spriteName": (str, type(None)), "value": object,
+    "x": (int, float), "y": (int, float), "visible": bool, "width": (int, float), "height": (int, float),
+}
+_TUPLE_BLOCK_CONSTANTS = {12, 13} # variable and list reporters stored as arrays
+
+
+@grepr_dataclass(grepr_fields=["errors", "is_truncated"])
+class RawProjectReport:
+    """
+    The result of the pre-validation of raw project data(see prevalidate_project_data)
+    """
+
+    errors: list[RawDataError]
+    is_truncated: bool # wether the pre-validation stopped after max_errors errors
+
+    def is_valid(self) -> bool:
+        """
+        Check wether no errors were found
+
+        Returns:
+            wether the raw project data passed the pre-validation
+        """
+        return len(self.errors) == 0
+
+    def get_error_counts(self) -> dict[str, int]:
+        """
+        Count the errors by their kind(class name) e.g. for logging rejected uploads
+
+        Returns:
+            the amount of errors of each kind
+        """
+        counts = {}
+        for error in self.errors:
+            kind = error.__class__.__name__
+            counts[kind] = counts.get(kind, 0) + 1
+        return counts
+
+    def raise_first(self) -> None:
+        """
+        Raise the first error if there is one
+
+        Returns:
+            None
+
+        Raises:
+            RawDataError(ValidationError): if the raw project data didn't pass the pre-validation
+        """
+        if self.errors:
+            raise self.errors[0]
+
+def prevalidate_project_data(data: Any, info_api: OpcodeInfoAPI, max_errors: int | None = 100) -> RawProjectReport:
+    """
+    Quickly check raw project data(the parsed project.json) before the much slower conversion with FRProject.from_data.
+    Checks required keys and their types, opcodes, the presence of mutations and wether block and comment references exist.
+    The values themselves are validated only after the conversion(see SRProject.validate)
+
+    Args:
+        data: the raw project data
+        info_api: the opcode info api used to fetch information about opcodes
+        max_errors: stop after this many errors (optional)
+
+    Returns:
+        the report of the found errors
+    """
+    errors = _iter_project_errors(data, info_api)
+    if max_errors is None:
+        return RawProjectReport(errors=list(errors), is_truncated=False)
+    found_errors = list(islice(errors, max_errors+1))
+    return RawProjectReport(errors=found_errors[:max_errors], is_truncated=(len(found_errors) > max_errors))
+
+def _iter_key_errors(data: Any, path: list, required_keys: dict[str, type | tuple[type, ...]]) -> Iterator[RawDataError]:
+    """
+    *[Internal Function]* Check the presence and types of the required keys of a raw data dict
+
+    Args:
+        data: the raw data
+        path: the path from the project data to the raw data. Used for better error messages
+        required_keys: the required keys and their types
+
+    Returns:
+        an iterator of the errors
+    """
+    if not isinstance(data, dict):
+        yield RawTypeError(path, f"Must be an object not {type(data).__name__}")
+        return
+    for key, expected_types in required_keys.items():
+        if key not in data:
+            yield RawMissingKeyError(path, f"Missing required key {repr(key)}")
+        elif not isinstance(data[key], expected_types):
+            type_names = " or ".join(t.__name__ for t in (expected_types if isinstance(expected_types, tuple) else (expected_types,)))
+            yield RawTypeError(path+[(key,)], f"Must be of type {type_names} not {type(data[key]).__name__}")
+
+def _iter_project_errors(data: Any, info_api: OpcodeInfoAPI) -> Iterator[RawDataError]:
+    """
+    *[Internal Function]* Pre-validate raw project data and yield every error
+
+    Args:
+        data: the raw project data
+        info_api: the opcode info api used to fetch information about opcodes
+
+    Returns:
+        an iterator of the errors
+    """
+    path = []
+    project_key_errors = list(_iter_key_errors(data, path, _PROJECT_KEYS))
+    yield from project_key_errors
+    if project_key_errors:
+        return # the remaining checks rely on the project structure
+    yield from _iter_key_errors(data["meta"], [("meta",)], _META_KEYS)
+
+    if len(data["targets"]) == 0:
+        yield RawTypeError([("targets",)], "Must contain at least the stage")
+    for i, target_data in enumerate(data["targets"]):
+        yield from _iter_target_errors(target_data, [("targets",), i], info_api, is_stage=(i == 0))
+
+    for i, monitor_data in enumerate(data["monitors"]):
+        current_path = [("monitors",), i]
+        monitor_key_errors = list(_iter_key_errors(monitor_data, current_path, _MONITOR_KEYS))
+        yield from monitor_key_errors
+        if (not monitor_key_errors) and (info_api.get_info_by_old_safe(monitor_data["opcode"]) is None):
+            yield RawOpcodeError(current_path+[("opcode",)], f"Unknown opcode {repr(monitor_data['opcode'])}")
+
+def _iter_target_errors(data: Any, path: list, info_api: OpcodeInfoAPI, is_stage: bool) -> Iterator[RawDataError]:
+    """
+    *[Internal Function]* Pre-validate the raw data of a target and yield every error
+
+    Args:
+        data: the raw target data
+        path: the path from the project data to the target data. Used for better error messages
+        info_api: the opcode info api used to fetch information about opcodes
+        is_stage: wether the target is the stage
+
+    Returns:
+        an iterator of the errors
+    """
+    target_key_errors = list(_iter_key_errors(data, path, _TARGET_KEYS))
+    yield from target_key_errors
+    if not isinstance(data, dict):
+        return
+    yield from _iter_key_errors(data, path, _STAGE_KEYS if is_stage else _SPRITE_KEYS)
+    if target_key_errors:
+        return # the remaining checks rely on the target structure
+    if data["isStage"] != is_stage:
+        yield RawTypeError(path+[("isStage",)], "Only the first target must be the stage")
+
+    for i, costume_data in enumerate(data["costumes"]):
+        yield from _iter_key_errors(costume_data, path+[("costumes",), i], _COSTUME_KEYS)
+    for i, sound_data in enumerate(data["sounds"]):
+        yield from _iter_key_errors(sound_data, path+[("sounds",), i], _SOUND_KEYS)
+
+    blocks = data["blocks"]
+    comments = data["comments"]
+    for comment_id, comment_data in comments.items():
+        current_path = path+[("comments",), (comment_id,)]
+        comment_key_errors = list(_iter_key_errors(comment_data, current_path, _COMMENT_KEYS))
+        yield from comment_key_errors
+        if (not comment_key_errors) and (comment_data["blockId"] is not None) and (comment_data["blockId"] not in blocks):
+            yield RawReferenceError(current_path+[("blockId",)], f"References a block, which doesn't exist: {repr(comment_data['blockId'])}")
+
+    for block_id, block_data in blocks.items():
+        yield from _iter_block_errors(block_data, path+[("blocks",), (block_id,)], blocks, comments, info_api)
+
+def _iter_block_errors(
+    data: Any,
+    path: list,
+    blocks: dict[str, Any],
+    comments: dict[str, Any],
+    info_api: OpcodeInfoAPI,
+) -> Iterator[RawDataError]:
+    """
+    *[Internal Function]* Pre-validate the raw data of a block and yield every error
+
+    Args:
+        data: the raw block data
+        path: the path from the project data to the block data. Used for better error messages
+        blocks: the raw data of all blocks of the target
+        comments: the raw data of all comments of the target
+        info_api: the opcode info api used to fetch information about opcodes
+
+    Returns:
+        an iterator of the errors
+    """
+    if isinstance(data, list):
+        if (len(data) not in {3, 5}) or (data[0] not in _TUPLE_BLOCK_CONSTANTS):
+            yield RawTypeError(path, "Must be a variable or list reporter array of length 3 or 5")
+        return
+    block_key_errors = list(_iter_key_errors(data, path, _BLOCK_KEYS))
+    yield from block_key_errors
+    if block_key_errors:
+        return # the remaining checks rely on the block structure
+
+    opcode_info = info_api.get_info_by_old_safe(data["opcode"])
+    if opcode_info is None:
+        yield RawOpcodeError(path+[("opcode",)], f"Unknown opcode {repr(data['opcode'])}")
+    elif (opcode_info.old_mutation_cls is None) and ("mutation" in data):
+        yield RawMutationError(path+[("mutation",)], f"Blocks with opcode {repr(data['opcode'])} mustn't have a mutation")
+    elif (opcode_info.old_mutation_cls is not None) and not isinstance(data.get("mutation", None), dict):
+        yield RawMutationError(path, f"Blocks with opcode {repr(data['opcode'])} must have a mutation object")
+
+    for key in ("next", "parent"):
+        if (data[key] is not None) and (data[key] not in blocks):
+            yield RawReferenceError(path+[(key,)], f"References a block, which doesn't exist: {repr(data[key])}")
+    comment_id = data.get("comment", None)
+    if (comment_id is not None) and (comment_id not in comments):
+        yield RawReferenceError(path+[("comment",)], f"References a comment, which doesn't exist: {repr(comment_id)}")
+
+    for input_id, input_data in data["inputs"].items():
+        current_path = path+[("inputs",), (input_id,)]
+        if not isinstance(input_data, list) or (len(input_data) < 2):
+            yield RawTypeError(current_path, "Must be an array with at least two items")
+            continue
+        for i, item in enumerate(input_data[1:], start=1):
+            if isinstance(item, str):
+                if item not in blocks:
+                    yield RawReferenceError(current_path+[i], f"References a block, which doesn't exist: {repr(item)}")
+            elif not isinstance(item, (list, type(None))):
+                yield RawTypeError(current_path+[i], "Must be a block id, an array or null")
+    for field_id, field_data in data["fields"].items():
+        if not isinstance(field_data, list) or (len(field_data) == 0):
+            yield RawTypeError(path+[("fields",), (field_id,)], "Must be a non-empty array")
+
+
+__all__ = ["RawProjectReport", "prevalidate_project_data"]
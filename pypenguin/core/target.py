@@ -1,14 +1,15 @@
-from typing      import Any
+from typing      import Any, Iterator
 from copy        import deepcopy
 from dataclasses import field
 from abc         import ABC, abstractmethod
 from uuid        import uuid4, UUID
 
 from pypenguin.utility     import (
-    string_to_sha256,
-    grepr_dataclass, ThanksError, ValidationConfig, 
+    string_to_sha256, evolve_dataclass,
+    grepr_dataclass, ContentHashMixin, content_hash, ThanksError, ValidationConfig, ValidationLevel, ValidationCache, 
+    FieldConstraint, compile_field_validator,
     AA_TYPE, AA_TYPES, AA_LIST_OF_TYPE, AA_MIN_LEN, AA_MIN, AA_RANGE, AA_COORD_PAIR, AA_NOT_ONE_OF, 
-    SameValueTwiceError, FirstToSecondConversionError,
+    ValidationError, SameValueTwiceError, FirstToSecondConversionError,
 )
 from pypenguin.opcode_info import OpcodeInfoAPI, DropdownValueKind
 
@@ -19,6 +20,8 @@ from pypenguin.core.comment        import FRComment, SRComment
 from pypenguin.core.context        import PartialContext, CompleteContext
 from pypenguin.core.enums          import SRSpriteRotationStyle
 from pypenguin.core.block_api      import FIConversionAPI, ValidationAPI
+from pypenguin.core.block_index    import SRBlockIndex
+from pypenguin.core.block_store    import FRBlockStore
 from pypenguin.core.monitor        import SRMonitor
 from pypenguin.core.vars_lists     import SRVariable, SRVariable, SRVariable, SRCloudVariable
 from pypenguin.core.vars_lists     import SRList, SRList, SRList
@@ -35,7 +38,7 @@ class FRTarget(ABC):
     lists: dict[str, tuple[str, Any]]
     broadcasts: dict[str, str]
     custom_vars: list
-    blocks: dict[str, tuple | FRBlock]
+    blocks: dict[str, tuple | FRBlock] | FRBlockStore
     comments: dict[str, FRComment]
     current_costume: int
     costumes: list[FRCostume]
@@ -46,26 +49,28 @@ class FRTarget(ABC):
     
     @classmethod
     @abstractmethod
-    def from_data(cls, data: dict[str, Any], info_api: OpcodeInfoAPI) -> "FRTarget":
+    def from_data(cls, data: dict[str, Any], info_api: OpcodeInfoAPI, columnar_blocks: bool = False) -> "FRTarget":
         """
         Deserializes raw data into a FRTarget
         
         Args:
             data: the raw data
             info_api: the opcode info api used to fetch information about opcodes
+            columnar_blocks: wether to store the blocks in a memory efficient FRBlockStore instead of a dict
         
         Returns:
             the FRTarget
         """
 
     @staticmethod
-    def _from_data_common(data: dict[str, Any], info_api: OpcodeInfoAPI) -> dict[str, Any]:
+    def _from_data_common(data: dict[str, Any], info_api: OpcodeInfoAPI, columnar_blocks: bool = False) -> dict[str, Any]:
         """
         *[Helper Method]* Prepare common fields for FRTarget and its subclasses
 
         Args:
             data: the raw data
             info_api: the opcode info api used to fetch information about opcodes
+            columnar_blocks: wether to store the blocks in a memory efficient FRBlockStore instead of a dict
 
         Returns:
             a dict containing the prepared values for common fields
@@ -77,7 +82,7 @@ class FRTarget(ABC):
             "lists": {key: tuple(value) for key, value in data["lists"].items()},
             "broadcasts": data["broadcasts"],
             "custom_vars": data.get("customVars", []),
-            "blocks": {
+            "blocks": FRBlockStore.from_data(data["blocks"], info_api=info_api) if columnar_blocks else {
                 block_id: (
                     tuple(block_data)
                     if isinstance(block_data, list)
@@ -105,7 +110,7 @@ class FRTarget(ABC):
         """
         if self.custom_vars != []: raise ThanksError()
 
-    def _step_common(self, asset_files: dict[str, bytes], info_api: OpcodeInfoAPI) -> tuple[
+    def _step_common(self, asset_files: dict[str, bytes], info_api: OpcodeInfoAPI, decode_assets: bool = True) -> tuple[
         list[SRScript], 
         list[SRComment], 
         list[SRCostume], 
@@ -117,7 +122,9 @@ class FRTarget(ABC):
         *[Helper Method]* Convert common fields into second representation
 
         Args:
+            asset_files: the contents of the costume and sound files
             info_api: the opcode info api used to fetch information about opcodes
+            decode_assets: wether to decode the costume files(see FRCostume.step)
         
         Returns:
             lists of scripts, floating comments, costumes, sounds, variables and lists
@@ -131,10 +138,14 @@ class FRTarget(ABC):
             else:
                 floating_comments.append(new_comment)
 
-        blocks = deepcopy(self.blocks)
-        for block_reference, block in blocks.items():
-            if isinstance(block, tuple):
-                blocks[block_reference] = FRBlock.from_tuple(block, parent_id=None)
+        if isinstance(self.blocks, FRBlockStore):
+            # the store is read-only and creates new FRBlocks on access, so no copy is needed
+            blocks = self.blocks
+        else:
+            blocks = deepcopy(self.blocks)
+            for block_reference, block in blocks.items():
+                if isinstance(block, tuple):
+                    blocks[block_reference] = FRBlock.from_tuple(block, parent_id=None)
 
         ficapi = FIConversionAPI(blocks=blocks, block_comments=attached_comments)
         new_blocks: dict["IRBlockReference", "IRBlock"] = {}
@@ -183,7 +194,7 @@ class FRTarget(ABC):
         return (
             new_scripts,
             floating_comments,
-            [costume.step(asset_files) for costume in self.costumes],
+            [costume.step(asset_files, decode_assets) for costume in self.costumes],
             [sound  .step(asset_files) for sound   in self.sounds  ],
             new_variables,
             new_lists,
@@ -231,18 +242,19 @@ class FRStage(FRTarget):
     text_to_speech_language: str | None
 
     @classmethod
-    def from_data(cls, data: dict[str, Any], info_api: OpcodeInfoAPI) -> "FRStage":
+    def from_data(cls, data: dict[str, Any], info_api: OpcodeInfoAPI, columnar_blocks: bool = False) -> "FRStage":
         """
         Deserializes raw data into a FRStage
         
         Args:
             data: the raw data
             info_api: the opcode info api used to fetch information about opcodes
+            columnar_blocks: wether to store the blocks in a memory efficient FRBlockStore instead of a dict
         
         Returns:
             the FRStage
         """
-        common_fields = cls._from_data_common(data, info_api)
+        common_fields = cls._from_data_common(data, info_api, columnar_blocks)
         if "id" in data:
             id = data["id"]
         else:
@@ -259,12 +271,15 @@ class FRStage(FRTarget):
     def step(self, 
         asset_files: dict[str, bytes],
         info_api: OpcodeInfoAPI,
+        decode_assets: bool = True,
     ) -> tuple["SRStage", list[SRVariable],  list[SRList]]:
         """
         Converts a FRStage into a SRStage
         
         Args:
+            asset_files: the contents of the costume and sound files
             info_api: the opcode info api used to fetch information about opcodes
+            decode_assets: wether to decode the costume files(see FRCostume.step)
         
         Returns:
             the SRStage, a list of the global variables, a list of the global lists
@@ -276,7 +291,7 @@ class FRStage(FRTarget):
             sounds,
             all_sprite_variables,
             all_sprite_lists,
-        ) = super()._step_common(asset_files, info_api)
+        ) = super()._step_common(asset_files, info_api, decode_assets)
         return (SRStage(
             scripts       = scripts,
             comments      = comments,
@@ -304,18 +319,19 @@ class FRSprite(FRTarget):
     rotation_style: str
 
     @classmethod
-    def from_data(cls, data: dict[str, Any], info_api: OpcodeInfoAPI) -> "FRSprite":
+    def from_data(cls, data: dict[str, Any], info_api: OpcodeInfoAPI, columnar_blocks: bool = False) -> "FRSprite":
         """
         Deserializes raw data into a FRSprite
         
         Args:
             data: the raw data
             info_api: the opcode info api used to fetch information about opcodes
+            columnar_blocks: wether to store the blocks in a memory efficient FRBlockStore instead of a dict
         
         Returns:
             the FRSprite
         """
-        common_fields = cls._from_data_common(data, info_api)
+        common_fields = cls._from_data_common(data, info_api, columnar_blocks)
         if "id" in data:
             id = data["id"]
         else:
@@ -335,12 +351,15 @@ class FRSprite(FRTarget):
     def step(self, 
         asset_files: dict[str, bytes],
         info_api: OpcodeInfoAPI,
+        decode_assets: bool = True,
     ) -> tuple["SRSprite", None, None]:
         """
         Converts a FRSprite into a SRSprite
         
         Args:
+            asset_files: the contents of the costume and sound files
             info_api: the opcode info api used to fetch information about opcodes
+            decode_assets: wether to decode the costume files(see FRCostume.step)
         
         Returns:
             the SRSprite, None, None
@@ -352,7 +371,7 @@ class FRSprite(FRTarget):
             sounds,
             sprite_only_variables,
             sprite_only_lists,
-        ) = super()._step_common(asset_files, info_api)
+        ) = super()._step_common(asset_files, info_api, decode_assets)
         return (SRSprite(
             name                  = self.name,
             scripts               = scripts,
@@ -373,8 +392,8 @@ class FRSprite(FRTarget):
         ), None, None)
 
 
-@grepr_dataclass(grepr_fields=["scripts", "comments", "costume_index", "costumes", "sounds", "volume"])
-class SRTarget:
+@grepr_dataclass(grepr_fields=["scripts", "comments", "costume_index", "costumes", "sounds", "volume"], eq=False)
+class SRTarget(ContentHashMixin):
     """
     The second representation (SR) of a target, which is much more user friendly. A target can be either a sprite or the stage
     """
@@ -385,6 +404,20 @@ class SRTarget:
     sounds: list[SRSound]
     volume: int | float
 
+    # the range of costume_index depends on the costumes, so it is checked between the two validators
+    __validate_costume_fields = compile_field_validator(
+        FieldConstraint(AA_LIST_OF_TYPE, "scripts", SRScript),
+        FieldConstraint(AA_LIST_OF_TYPE, "comments", SRComment),
+        FieldConstraint(AA_LIST_OF_TYPE, "costumes", SRCostume),
+        FieldConstraint(AA_MIN_LEN, "costumes", min_len=1),
+        FieldConstraint(AA_TYPE, "costume_index", int),
+    )
+    __validate_sound_fields = compile_field_validator(
+        FieldConstraint(AA_LIST_OF_TYPE, "sounds", SRSound),
+        FieldConstraint(AA_TYPES, "volume", (int, float)),
+        FieldConstraint(AA_RANGE, "volume", min=0, max=100),
+    )
+
     @classmethod
     def create_empty(cls) -> "SRTarget":
         """
@@ -402,6 +435,20 @@ class SRTarget:
             volume=100,
         )
 
+    def evolve(self, **changes) -> "SRTarget":
+        """
+        Create a copy of a SRTarget with some fields replaced. Unchanged scripts, costumes etc. are shared with the original.
+        Lists are copied shallowly, so adding or removing items is safe, but shared items must not be mutated in place.
+        A SRSprite keeps its uuid, so the sprite layer stack stays valid
+        
+        Args:
+            **changes: the new values of the fields to replace
+        
+        Returns:
+            the new SRTarget
+        """
+        return evolve_dataclass(self, **changes)
+
     def validate(self, path: list, config: ValidationConfig, info_api: OpcodeInfoAPI) -> None:
         """
         Ensure a SRTarget is valid, raise ValidationError if not
@@ -418,53 +465,91 @@ class SRTarget:
             ValidationError: if the SRTarget is invalid
             SameValueTwiceError(ValidationError): if two costumes or two sounds have the same name
         """
-        AA_LIST_OF_TYPE(self, path, "scripts", SRScript)
-        AA_LIST_OF_TYPE(self, path, "comments", SRComment)
-        AA_LIST_OF_TYPE(self, path, "costumes", SRCostume)
-        AA_MIN_LEN(self, path, "costumes", min_len=1)
-        AA_TYPE(self, path, "costume_index", int)
-        AA_RANGE(self, path, "costume_index", 
-            min=0, max=len(self.costumes)-1, condition=f"In this case the sprite has {len(self.costumes)} costume(s)",
-        )
-        AA_LIST_OF_TYPE(self, path, "sounds", SRSound)
-        AA_TYPES(self, path, "volume", (int, float))
-        AA_RANGE(self, path, "volume", min=0, max=100)
+        for error in self._iter_validation_errors(path, config, info_api):
+            raise error
+
+    def _iter_validation_errors(self, path: list, config: ValidationConfig, info_api: OpcodeInfoAPI) -> Iterator[ValidationError]:
+        """
+        *[Internal Method]* Validate a SRTarget like the validate method, but yield every error instead of raising the first one.
+        Invalid fields end the validation, because the other checks rely on them
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+        
+        Returns:
+            an iterator of the validation errors in the order of validation
+        """
+        try:
+            self.__validate_costume_fields(path)
+        except ValidationError as error:
+            yield error
+            return
+        if not (0 <= self.costume_index < len(self.costumes)):
+            try:
+                AA_RANGE(self, path, "costume_index", 
+                    min=0, max=len(self.costumes)-1, condition=f"In this case the sprite has {len(self.costumes)} costume(s)",
+                )
+            except ValidationError as error:
+                yield error
+        try:
+            self.__validate_sound_fields(path)
+        except ValidationError as error:
+            yield error
+            return
         
         for i, comment in enumerate(self.comments):
-            comment.validate(path+["comments", i], config)
+            try:
+                comment.validate(path+["comments", i], config)
+            except ValidationError as error:
+                yield error
 
         defined_costumes = {}
         for i, costume in enumerate(self.costumes):
             current_path = path+["costumes", i]
-            costume.validate(path, config)
+            try:
+                costume.validate(current_path, config)
+            except ValidationError as error:
+                yield error
+                continue
             if costume.name in defined_costumes:
                 other_path = defined_costumes[costume.name]
-                raise SameValueTwiceError(other_path, current_path, "Two costumes mustn't have the same name")
+                yield SameValueTwiceError(other_path, current_path, "Two costumes mustn't have the same name")
+                continue
             defined_costumes[costume.name] = current_path
         
         defined_sounds = {}
         for i, sound in enumerate(self.sounds):
             current_path = path+["sounds", i]
-            sound.validate(path, config)
+            try:
+                sound.validate(current_path, config)
+            except ValidationError as error:
+                yield error
+                continue
             if sound.name in defined_sounds:
                 other_path = defined_sounds[sound.name]
-                raise SameValueTwiceError(other_path, current_path, "Two sounds mustn't have the same name")
+                yield SameValueTwiceError(other_path, current_path, "Two sounds mustn't have the same name")
+                continue
             defined_sounds[sound.name] = current_path
     
     def validate_scripts(self, 
         path: list, 
         config: ValidationConfig,
         info_api: OpcodeInfoAPI,
-        context: PartialContext,
+        context: PartialContext | None,
+        cache: ValidationCache | None = None,
     ) -> None:
         """
-        Ensure the scripts of a SRTarget are valid, raise ValidationError if not
+        Ensure the scripts of a SRTarget are valid, raise ValidationError if not.
+        If a cache is given, scripts, which were already validated with the same context, are skipped
         
         Args:
             path: the path from the project to itself. Used for better error messages
             config: Configuration for Validation Behaviour
             info_api: the opcode info api used to fetch information about opcodes
-            context: Context about parts of the project. Used to validate dropdowns
+            context: Context about parts of the project. Used to validate dropdowns. Only needed from ValidationLevel.REFERENTIAL on
+            cache: remembers successfully validated scripts (optional)
         
         Returns:
             None
@@ -473,27 +558,146 @@ class SRTarget:
             ValidationError: if the scripts of the SRTarget are invalid
             SameValueTwiceError(ValidationError): if two custom blocks have the same custom_opcode.
         """
-        context = self._get_complete_context(partial_context=context)
-        validation_api = ValidationAPI(scripts=self.scripts)
+        for error in self._iter_script_validation_errors(path, config, info_api, context, cache):
+            raise error
+
+    def _iter_script_validation_errors(self, 
+        path: list, 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        context: PartialContext | None,
+        cache: ValidationCache | None = None,
+    ) -> Iterator[ValidationError]:
+        """
+        *[Internal Method]* Validate the scripts of a SRTarget like the validate_scripts method, but yield every error instead of raising the first one.
+        At most one error is yielded per script, because the rest of an invalid script is not validated
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            context: Context about parts of the project. Used to validate dropdowns. Only needed from ValidationLevel.REFERENTIAL on
+            cache: remembers successfully validated scripts (optional)
+        
+        Returns:
+            an iterator of the validation errors in the order of validation
+        """
+        check_references = config.level.includes(ValidationLevel.REFERENTIAL)
+        # the context is only needed to validate dropdown values
+        context = self._get_complete_context(partial_context=context) if check_references else None
+        if cache is not None:
+            # every script is hashed at most once per run, also if its hash can't be cached
+            known_digests = {}
+            scripts_key = self._get_scripts_cache_key(context, known_digests)
+            context_hash = scripts_key[2]
+            if cache.is_valid(*scripts_key):
+                return
+            script_hashes = [content_hash(script, known_digests) for script in self.scripts]
+        block_index = self.get_block_index()
+        validation_api = ValidationAPI(scripts=self.scripts, block_index=block_index)
+        if cache is not None:
+            # a script is only valid in combination with the custom blocks it calls
+            cb_mutations_hash = content_hash(validation_api.cb_mutations) if check_references else None
         cb_custom_opcodes = {}
+        scripts_valid = True
         for i, script in enumerate(self.scripts):
-            script.validate(
-                path           = path+["scripts", i],
-                config         = config,
-                info_api       = info_api,
-                validation_api = validation_api,
-                context        = context,
-            )
-            for j, block in enumerate(script.blocks):
-                current_path = path+["scripts", i, "blocks", j]
-                if isinstance(block.mutation, SRCustomBlockMutation):
-                    custom_opcode = block.mutation.custom_opcode
+            if cache is None:
+                script_valid = False
+                shape_valid = False
+            else:
+                script_key = ("script", script_hashes[i], context_hash, cb_mutations_hash)
+                script_valid = cache.is_valid(*script_key)
+                # everything except the dropdown values is independent of the context, 
+                # so a script validated in another target or project only needs its dropdowns checked again
+                shape_key = ("script_shape", script_hashes[i], cb_mutations_hash)
+                shape_valid = (not script_valid) and check_references and cache.is_valid(*shape_key)
+                if shape_valid and not block_index.script_has_dropdowns(i):
+                    script_valid = True
+                    cache.mark_valid(*script_key)
+            if not script_valid:
+                try:
+                    if shape_valid:
+                        script.validate_dropdown_values(
+                            path     = path+["scripts", i],
+                            config   = config,
+                            info_api = info_api,
+                            context  = context,
+                        )
+                    else:
+                        script.validate(
+                            path           = path+["scripts", i],
+                            config         = config,
+                            info_api       = info_api,
+                            validation_api = validation_api,
+                            context        = context,
+                        )
+                except ValidationError as error:
+                    scripts_valid = False
+                    yield error
+                else:
+                    if cache is not None:
+                        cache.mark_valid(*script_key)
+                        if check_references:
+                            cache.mark_valid(*shape_key)
+            if not check_references:
+                continue
+            for entry in block_index.get_script_entries(i):
+                if (entry.parent is None) and isinstance(entry.mutation, SRCustomBlockMutation):
+                    current_path = path+["scripts", i]+entry.relative_path
+                    custom_opcode = entry.mutation.custom_opcode
                     if custom_opcode in cb_custom_opcodes:
                         other_path = cb_custom_opcodes[custom_opcode]
-                        raise SameValueTwiceError(
+                        scripts_valid = False
+                        yield SameValueTwiceError(
                             other_path, current_path, "Two custom blocks mustn't have the same custom_opcode(see .mutation.custom_opcode)",
                         )
+                        continue
                     cb_custom_opcodes[custom_opcode] = current_path
+        if (cache is not None) and scripts_valid:
+            cache.mark_valid(*scripts_key)
+
+    def get_block_index(self) -> SRBlockIndex:
+        """
+        Get the flat index of all blocks in the scripts of a SRTarget. 
+        The index is kept and updated incrementally on every call, so only changed scripts are traversed again.
+        Changes are detected by the cached content hashes of the scripts, so also mutations in place
+        
+        Returns:
+            the up-to-date block index
+        """
+        block_index = self.__dict__.get("_block_index", None)
+        if block_index is None:
+            block_index = SRBlockIndex()
+            object.__setattr__(self, "_block_index", block_index)
+        block_index.update(self.scripts)
+        return block_index
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Exclude the block index from copies and pickles, it is rebuilt on demand
+
+        Returns:
+            the state of the object
+        """
+        state = super().__getstate__()
+        state.pop("_block_index", None)
+        return state
+
+    def _get_scripts_cache_key(self, 
+        context: CompleteContext | None, 
+        known_digests: dict[int, bytes] | None = None,
+    ) -> tuple[str, bytes, bytes]:
+        """
+        *[Internal Method]* Get the validation cache key for all scripts of a SRTarget in the given context
+
+        Args:
+            context: the complete context or None if dropdown values aren't validated
+            known_digests: the content hashes of the nodes without a cached hash, which were already hashed(see content_hash) (optional)
+
+        Returns:
+            the cache key
+        """
+        return ("scripts", content_hash(self.scripts, known_digests), content_hash(context))
 
     def _get_complete_context(self, partial_context: PartialContext) -> CompleteContext:
         """
@@ -507,7 +711,7 @@ class SRTarget:
         """
         return CompleteContext.from_partial(
             pc       = partial_context,
-            costumes = [(SropdownValueKind.COSTUME, costume.name) for costume in self.costumes],
+            costumes = [(DropdownValueKind.COSTUME, costume.name) for costume in self.costumes],
             sounds   = [(DropdownValueKind.SOUND  , sound  .name) for sound   in self.sounds  ],
             is_stage = isinstance(self, SRStage),
         )
@@ -519,7 +723,7 @@ class SRStage(SRTarget):
 
 @grepr_dataclass(
     grepr_fields=["name", "sprite_only_variables", "sprite_only_lists", "local_monitors", "is_visible", "position", "size", "direction", "is_draggable", " rotation_style", "uuid"],
-    parent_cls=SRTarget,
+    parent_cls=SRTarget, eq=False,
 )
 class SRSprite(SRTarget):
     """
@@ -537,6 +741,23 @@ class SRSprite(SRTarget):
     is_draggable: bool
     rotation_style: "SRSpriteRotationStyle"
     uuid: UUID = field(default_factory=uuid4, init=False, compare=False)
+
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "name", str),
+        FieldConstraint(AA_NOT_ONE_OF, "name", ["_myself_", "_stage_", "_mouse_", "_edge_"]),
+        FieldConstraint(AA_LIST_OF_TYPE, "sprite_only_variables", SRVariable),
+        FieldConstraint(AA_LIST_OF_TYPE, "sprite_only_lists", SRList),
+        FieldConstraint(AA_LIST_OF_TYPE, "local_monitors", SRMonitor),
+        FieldConstraint(AA_TYPE, "is_visible", bool),
+        FieldConstraint(AA_COORD_PAIR, "position"),
+        FieldConstraint(AA_TYPES, "size", (int, float)),
+        FieldConstraint(AA_MIN, "size", min=0),
+        FieldConstraint(AA_TYPES, "direction", (int, float)),
+        FieldConstraint(AA_RANGE, "direction", min=-180, max=180),
+        FieldConstraint(AA_TYPE, "is_draggable", bool),
+        FieldConstraint(AA_TYPE, "rotation_style", SRSpriteRotationStyle),
+        FieldConstraint(AA_TYPE, "uuid", UUID),
+    )
     
     @classmethod
     def create_empty(cls, name: str) -> "SRSprite":
@@ -585,31 +806,45 @@ class SRSprite(SRTarget):
         Raises:
             ValidationError: if the SRSprite is invalid
         """
-        super().validate(path, config, info_api)
+        for error in self._iter_validation_errors(path, config, info_api):
+            raise error
+
+    def _iter_validation_errors(self, path: list, config: ValidationConfig, info_api: OpcodeInfoAPI) -> Iterator[ValidationError]:
+        """
+        *[Internal Method]* Validate a SRSprite like the validate method, but yield every error instead of raising the first one
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
         
-        AA_TYPE(self, path, "name", str)
-        AA_NOT_ONE_OF(self, path, "name", ["_myself_", "_stage_", "_mouse_", "_edge_"])
-        AA_LIST_OF_TYPE(self, path, "sprite_only_variables", SRVariable)
-        AA_LIST_OF_TYPE(self, path, "sprite_only_lists", SRList)
-        AA_LIST_OF_TYPE(self, path, "local_monitors", SRMonitor)
-        AA_TYPE(self, path, "is_visible", bool)
-        AA_COORD_PAIR(self, path, "position")
-        AA_TYPES(self, path, "size", (int, float))
-        AA_MIN(self, path, "size", min=0)
-        AA_TYPES(self, path, "direction", (int, float))
-        AA_RANGE(self, path, "direction", min=-180, max=180)
-        AA_TYPE(self, path, "is_draggable", bool)
-        AA_TYPE(self, path, "rotation_style", SRSpriteRotationStyle)
-        AA_TYPE(self, path, "uuid", UUID)
+        Returns:
+            an iterator of the validation errors in the order of validation
+        """
+        yield from super()._iter_validation_errors(path, config, info_api)
         
+        try:
+            self.__validate_fields(path)
+        except ValidationError as error:
+            yield error
+            return
         
         for i, variable in enumerate(self.sprite_only_variables):
-            variable.validate(path+["sprite_only_variables", i], config)
+            try:
+                variable.validate(path+["sprite_only_variables", i], config)
+            except ValidationError as error:
+                yield error
         for i, list_ in enumerate(self.sprite_only_lists):
-            list_.validate(path+["sprite_only_lists", i], config)
+            try:
+                list_.validate(path+["sprite_only_lists", i], config)
+            except ValidationError as error:
+                yield error
         
         for i, monitor in enumerate(self.local_monitors):
-            monitor.validate(path+["local_monitors", i], config, info_api)
+            try:
+                monitor.validate(path+["local_monitors", i], config, info_api)
+            except ValidationError as error:
+                yield error
     
     def validate_monitor_dropdown_values(self, 
         path: list, 
@@ -632,14 +867,38 @@ class SRSprite(SRTarget):
         Raises:
             ValidationError: if the monitor dropdown values of the SRSprite are invalid
         """
+        for error in self._iter_monitor_dropdown_value_errors(path, config, info_api, context):
+            raise error
+
+    def _iter_monitor_dropdown_value_errors(self, 
+        path: list, 
+        config: ValidationConfig,
+        info_api: OpcodeInfoAPI,
+        context: PartialContext | CompleteContext,
+    ) -> Iterator[ValidationError]:
+        """
+        *[Internal Method]* Validate the monitor dropdown values like the validate_monitor_dropdown_values method, but yield every error instead of raising the first one
+        
+        Args:
+            path: the path from the project to itself. Used for better error messages
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+            context: Context about parts of the project. Used to validate dropdowns
+        
+        Returns:
+            an iterator of the validation errors in the order of validation
+        """
         context = self._get_complete_context(partial_context=context)
         for i, monitor in enumerate(self.local_monitors):
-            monitor.validate_dropdown_values(
-                path     = path+["local_monitors", i], 
-                config   = config,
-                info_api = info_api, 
-                context  = context,
-            )
+            try:
+                monitor.validate_dropdown_values(
+                    path     = path+["local_monitors", i], 
+                    config   = config,
+                    info_api = info_api, 
+                    context  = context,
+                )
+            except ValidationError as error:
+                yield error
 
 
 __all__ = ["FRTarget", "FRStage", "FRSprite", "SRTarget", "SRStage", "SRSprite"]
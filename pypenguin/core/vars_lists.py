@@ -1,13 +1,21 @@
 from dataclasses import dataclass
 
-from pypenguin.utility import grepr_dataclass, ValidationConfig, AA_TYPE, AA_TYPES, AA_LIST_OF_TYPES
+from pypenguin.utility import (
+    grepr_dataclass, ContentHashMixin, ValidationConfig, FieldConstraint, compile_field_validator, 
+    AA_TYPE, AA_TYPES, AA_LIST_OF_TYPES,
+)
 
 @grepr_dataclass(grepr_fields=["name", "current_value"])
-class SRVariable:
+class SRVariable(ContentHashMixin):
     
     name: str
     current_value: int | float | str | bool
 
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "name", str),
+        FieldConstraint(AA_TYPES, "current_value", (int, float, str, bool)), # Only these can be saved in Scratch Projects
+    )
+
     def validate(self, path: list, config: ValidationConfig) -> None:
         """
         Ensure a SRVariable is valid, raise ValidationError if not
@@ -22,18 +30,22 @@ class SRVariable:
         Raises:
             ValidationError: if the SRVariable is invalid
         """
-        AA_TYPE(self, path, "name", str)
-        AA_TYPES(self, path, "current_value", (int, float, str, bool)) # Only these can be saved in Scratch Projects
+        self.__validate_fields(path)
 
 class SRCloudVariable(SRVariable):
     pass
 
 @grepr_dataclass(grepr_fields=["name", "current_value"])
-class SRList:
+class SRList(ContentHashMixin):
     
     name: str
     current_value: list[int | float | str | bool]
 
+    __validate_fields = compile_field_validator(
+        FieldConstraint(AA_TYPE, "name", str),
+        FieldConstraint(AA_LIST_OF_TYPES, "current_value", (int, float, str, bool)), # Only these can be saved in Scratch Projects
+    )
+
     def validate(self, path: list, config: ValidationConfig):
         """
         Ensure a SRList is valid, raise ValidationError if not
@@ -48,8 +60,7 @@ class SRList:
         Raises:
             ValidationError: if the SRList is invalid
         """
-        AA_TYPE(self, path, "name", str)
-        AA_LIST_OF_TYPES(self, path, "current_value", (int, float, str, bool)) # Only these can be saved in Scratch Projects
+        self.__validate_fields(path)
 
 
 __all__ = ["SRVariable", "SRCloudVariable", "SRList"]
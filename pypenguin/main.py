@@ -5,7 +5,7 @@ from json import loads
 
 from pypenguin.core import *
 from pypenguin.opcode_info import info_api, InputMode
-from pypenguin.utility import ValidationConfig, grepr
+from pypenguin.utility import ValidationConfig, grepr, grepr_to
 
 file_path = "../assets/from_online/my 1st platformer.pmp"
 #file_path = "../assets/input_modes.pmp"
@@ -20,5 +20,6 @@ project = FRProject.from_file(file_path, info_api=info_api)
 
 
 new_project = project.step(info_api=info_api)
-print(new_project)
+grepr_to(new_project, sys.stdout)
+print()
 new_project.validate(info_api=info_api, config=ValidationConfig())
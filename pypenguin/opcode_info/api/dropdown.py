@@ -1,7 +1,7 @@
 from typing      import Any
 from dataclasses import dataclass, field
 
-from pypenguin.utility import PypenguinEnum, grepr_dataclass, remove_duplicates, BlameDevsError
+from pypenguin.utility import PypenguinEnum, grepr_dataclass, remove_duplicates, SimilarityIndex, BlameDevsError
 
 from pypenguin.core.context import PartialContext, CompleteContext
 
@@ -401,6 +401,55 @@ class DropdownType(PypenguinEnum):
             values.append(dropdown_type_info.fallback)
         return remove_duplicates(values)
 
+    def get_possible_new_dropdown_value_set(self, context: PartialContext|CompleteContext) -> frozenset[tuple[DropdownValueKind, Any]]:
+        """
+        Get the possible values for a SRDropdownValue in certain circumstances(given context) as a set for fast lookups.
+        The set is calculated only once per dropdown type and context and then stored in the context
+
+        Args:
+            context: Context about parts of the project
+
+        Returns:
+            a set of possible values as tuples => (kind, value)
+        """
+        values = context.get_cached_possible_values(self)
+        if values is None:
+            values = frozenset(self.calculate_possible_new_dropdown_values(context=context))
+            context.set_cached_possible_values(self, values)
+        return values
+
+    def get_closest_possible_new_dropdown_values(self, 
+        value: Any, 
+        context: PartialContext|CompleteContext, 
+        n: int,
+    ) -> list[tuple[DropdownValueKind, Any]]:
+        """
+        Get the possible values for a SRDropdownValue in certain circumstances(given context), 
+        which are most similar to an invalid (e.g. misspelled) value. 
+        The n-gram index used for the lookup is built only once per dropdown type and context and then stored in the context
+
+        Args:
+            value: the invalid value
+            context: Context about parts of the project
+            n: the maximum amount of suggested values(possible values with an equal value count as one)
+
+        Returns:
+            the most similar possible values as tuples => (kind, value), best first
+        """
+        value_index = context.get_cached_value_index(self)
+        if value_index is None:
+            values_by_string = {}
+            for possible_value in self.calculate_possible_new_dropdown_values(context=context):
+                values_by_string.setdefault(str(possible_value[1]), []).append(possible_value)
+            value_index = (SimilarityIndex(values_by_string.keys()), values_by_string)
+            context.set_cached_value_index(self, value_index)
+        index, values_by_string = value_index
+        return [
+            possible_value
+            for string in index.get_closest_matches(str(value), n) 
+            for possible_value in values_by_string[string]
+        ]
+
     def guess_possible_new_dropdown_values(self, include_behaviours: bool) -> list[tuple[DropdownValueKind, Any]]:
         """
         Guess all the possible values for a SRDropdownValue without context
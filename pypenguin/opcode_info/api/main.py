@@ -1,9 +1,11 @@
-from typing      import TYPE_CHECKING, Type, Iterable
+from typing      import TYPE_CHECKING, Type, Iterable, Any, Callable
+from types       import MappingProxyType
+from copy        import copy
 from dataclasses import field
 
 from pypenguin.utility import (
-    DualKeyDict, grepr_dataclass, PypenguinEnum, 
-    UnknownOpcodeError, SameOpcodeTwiceError,
+    DualKeyDict, FrozenDualKeyDict, grepr_dataclass, PypenguinEnum, SimilarityIndex, content_hash,
+    OpcodeInfoError, UnknownOpcodeError, SameOpcodeTwiceError, FrozenOpcodeInfoError,
 )
 
 from pypenguin.opcode_info.api.input        import InputInfo, InputType, InputMode
@@ -57,8 +59,80 @@ class OpcodeInfo:
     special_cases: dict[SpecialCaseType, SpecialCase] = field(default_factory=dict)
     old_mutation_cls: Type["FRMutation"] | None = field(init=False, default_factory=type(None))
     new_mutation_cls: Type["SRMutation"] | None = field(init=False, default_factory=type(None))
+    _is_frozen: bool = field(init=False, default=False, compare=False)
+    # Precomputed when freezing, so the hot paths don't need to look up special cases(see freeze)
+    _has_special_cases: bool = field(init=False, default=False, compare=False)
+    _special_case_slots: tuple[SpecialCase | None, ...] = field(init=False, default=(), compare=False)
+    _input_ids_types: FrozenDualKeyDict[str, str, InputType] | None = field(init=False, default=None, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_is_frozen", False):
+            raise FrozenOpcodeInfoError(f"Can't set {name} of a frozen OpcodeInfo")
+        super().__setattr__(name, value)
+    
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["special_cases"] = dict(self.special_cases) # a MappingProxyType can't be pickled
+        return state
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self._is_frozen:
+            self.__dict__["special_cases"] = MappingProxyType(self.special_cases)
+    
+    # Freezing
+    def freeze(self) -> None:
+        """
+        Make the opcode information read-only. Afterwards inputs, dropdowns, special cases and mutation classes can't be changed anymore.
+        The special cases are also stored in slots indexed by SpecialCaseType, 
+        so the special case lookups and checks of the hot paths(e.g. FRBlock.step) become cheap
+        
+        Returns:
+            None
+        """
+        if self._is_frozen:
+            return
+        get_opcode_type_case = self.special_cases.get(SpecialCaseType.GET_OPCODE_TYPE, None)
+        if self.opcode_type == OpcodeType.DYNAMIC:
+            assert get_opcode_type_case is not None, "If opcode_type is DYNAMIC, a special case with type GET_OPCODE_TYPE must be defined"
+        else:
+            assert get_opcode_type_case is None, "If opcode_type is not DYNAMIC, no special case with type GET_OPCODE_TYPE should be defined"
+        
+        special_case_slots = [None] * (max(case_type.value for case_type in SpecialCaseType) + 1)
+        for case_type, special_case in self.special_cases.items():
+            special_case_slots[case_type.value] = special_case
+        self.inputs              = self.inputs.to_frozen()
+        self.dropdowns           = self.dropdowns.to_frozen()
+        self.special_cases       = MappingProxyType(dict(self.special_cases))
+        self._has_special_cases  = bool(self.special_cases)
+        self._special_case_slots = tuple(special_case_slots)
+        if SpecialCaseType.GET_ALL_INPUT_IDS_TYPES not in self.special_cases:
+            self._input_ids_types = FrozenDualKeyDict({
+                (old_id, new_id): input_info.type
+                for old_id, new_id, input_info in self.inputs.items_key1_key2()
+            })
+        self._is_frozen = True
+    def is_frozen(self) -> bool:
+        """
+        Check wether the opcode information was frozen(see freeze)
+        
+        Returns:
+            wether the opcode information is read-only
+        """
+        return self._is_frozen
     
     # Special Cases
+    def has_special_cases(self) -> bool:
+        """
+        Check wether a block opcode has any special behaviour. 
+        Cheaper than looking up every SpecialCaseType, if the opcode information was frozen
+        
+        Returns:
+            wether any special case was added
+        """
+        if self._is_frozen:
+            return self._has_special_cases
+        return bool(self.special_cases)
     def add_special_case(self, special_case: SpecialCase) -> None:
         """
         Add special behaviour to a block opcode
@@ -68,7 +142,12 @@ class OpcodeInfo:
         
         Returns:
             None
+        
+        Raises:
+            FrozenOpcodeInfoError(OpcodeInfoError): if the opcode information was frozen
         """
+        if self._is_frozen:
+            raise FrozenOpcodeInfoError("Can't add a special case to a frozen OpcodeInfo")
         self.special_cases[special_case.type] = special_case
     def get_special_case(self, case_type: SpecialCaseType) -> SpecialCase | None:
         """
@@ -80,6 +159,8 @@ class OpcodeInfo:
         Returns:
             the special case if exists
         """
+        if self._is_frozen:
+            return self._special_case_slots[case_type.value]
         return self.special_cases.get(case_type, None)
 
 
@@ -225,6 +306,8 @@ class OpcodeInfo:
     
     # Get the opcode type. Avoid OpcodeType.DYNAMIC
     def get_opcode_type(self, block: "IRBlock|SRBlock", validation_api: "ValidationAPI") -> OpcodeType:
+        if self._is_frozen and not self._has_special_cases:
+            return self.opcode_type # the special cases were checked when freezing
         instead_case = self.get_special_case(SpecialCaseType.GET_OPCODE_TYPE)
         if self.opcode_type == OpcodeType.DYNAMIC:
             assert instead_case is not None, "If opcode_type is DYNAMIC, a special case with type GET_OPCODE_TYPE must be defined"
@@ -247,6 +330,8 @@ class OpcodeInfo:
         Returns:
             DualKeyDict mapping old input id and new input id to input type
         """
+        if self._input_ids_types is not None:
+            return self._input_ids_types # only set if frozen and there is no special case
         instead_case = self.get_special_case(SpecialCaseType.GET_ALL_INPUT_IDS_TYPES)
         if instead_case is None:
             return DualKeyDict({
@@ -336,10 +421,56 @@ class OpcodeInfoGroup:
 @grepr_dataclass(grepr_fields=["opcode_info"])
 class OpcodeInfoAPI:
     """
-    API which provides a way to fetch information about block opcodes
+    API which provides a way to fetch information about block opcodes. 
+    Lookups may load lazy groups and build caches, so only a frozen API(see freeze) may be shared between threads
     """
 
     opcode_info: DualKeyDict[str, str, OpcodeInfo] = field(default_factory=DualKeyDict)
+    _canonical_strings: dict[str, str] = field(init=False, default_factory=dict)
+    _new_opcode_index: SimilarityIndex | None = field(init=False, default=None, compare=False)
+    _lazy_groups: list[tuple[tuple[str, ...], Callable[["OpcodeInfoAPI"], None]]] = field(init=False, default_factory=list, compare=False)
+    _lazy_extensions: dict[str, tuple[tuple[str, ...], Callable[["OpcodeInfoAPI"], None]]] = field(init=False, default_factory=dict, compare=False)
+    _lazy_new_opcodes: dict[tuple[tuple[str, ...], Callable[["OpcodeInfoAPI"], None]], tuple[str, ...]] = field(init=False, default_factory=dict, compare=False)
+    _group_ids: list[tuple] = field(init=False, default_factory=list, compare=False) # see get_fingerprint
+    _is_frozen: bool = field(init=False, default=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_is_frozen", False):
+            raise FrozenOpcodeInfoError(f"Can't set {name} of a frozen OpcodeInfoAPI")
+        super().__setattr__(name, value)
+
+    # Freezing
+    def freeze(self) -> None:
+        """
+        Make the API immutable, so it can be used from many threads at once without locks. 
+        All lazy groups are loaded and all caches are built first, so lookups only read afterwards. 
+        The opcode information is replaced by frozen copies, so groups shared with other APIs stay unchanged. 
+        Afterwards no groups, special cases or mutation classes can be added anymore
+        
+        Returns:
+            None
+        """
+        if self._is_frozen:
+            return
+        self.load_all_groups()
+        self._lazy_extensions.clear()
+        frozen_opcode_info = {}
+        for old_opcode, new_opcode, opcode_info in self.opcode_info.items_key1_key2():
+            frozen_info = copy(opcode_info)
+            frozen_info.freeze()
+            frozen_opcode_info[(old_opcode, new_opcode)] = frozen_info
+        self.opcode_info = FrozenDualKeyDict(frozen_opcode_info)
+        self._new_opcode_index = SimilarityIndex(self.get_all_new())
+        self._is_frozen = True
+
+    def is_frozen(self) -> bool:
+        """
+        Check wether the API was frozen(see freeze)
+        
+        Returns:
+            wether the API is immutable
+        """
+        return self._is_frozen
 
     # Add Special Cases
     def add_opcode_case(self, old_opcode: str, special_case: SpecialCase) -> None:
@@ -421,7 +552,12 @@ class OpcodeInfoAPI:
         
         Returns:
             None       
+        
+        Raises:
+            FrozenOpcodeInfoError(OpcodeInfoError): if the API was frozen
         """
+        if self._is_frozen:
+            raise FrozenOpcodeInfoError("Can't add a group to a frozen OpcodeInfoAPI")
         for old_opcode, new_opcode, opcode_info in group.opcode_info.items_key1_key2():
             if self.opcode_info.has_key1(old_opcode) or self.opcode_info.has_key2(new_opcode):
                 raise SameOpcodeTwiceError(f"Must not add opcode {(old_opcode, new_opcode)} twice")
@@ -430,17 +566,222 @@ class OpcodeInfoAPI:
                 key2  = new_opcode,
                 value = opcode_info,
             )
+            self._add_canonical_strings(old_opcode, new_opcode)
+            self._add_canonical_strings(*opcode_info.inputs   .keys_key1_key2())
+            self._add_canonical_strings(*opcode_info.dropdowns.keys_key1_key2())
+        self._group_ids.append(("group", group.name, tuple(group.opcode_info.keys_key1_key2())))
+        self._new_opcode_index = None
+    
+    def add_lazy_group(self, 
+        old_opcode_prefixes: Iterable[str], 
+        register: Callable[["OpcodeInfoAPI"], None], 
+        extension_ids: Iterable[str] = (),
+        new_opcodes: Iterable[str] | None = None,
+    ) -> None:
+        """
+        Add a category or extension to the API, which is only loaded when it's needed. 
+        register is called on the first lookup of an old opcode starting with one of the prefixes, 
+        on the first lookup of one of the new opcodes, when all old opcodes are requested 
+        or when a project uses one of the extensions(see load_extensions). 
+        New opcodes don't share prefixes, so they must be declared. Otherwise register is also called 
+        on the first lookup of any unknown new opcode and when all new opcodes are requested. 
+        It must add the group(see add_group) and may then add special cases and mutation classes
+        
+        Args:
+            old_opcode_prefixes: the prefixes all old opcodes of the group start with e.g. "motion_"
+            register: adds the group and everything belonging to it to the API
+            extension_ids: the ids of the extensions the group provides the opcodes for e.g. "pen"
+            new_opcodes: all new opcodes of the group or None if they are unknown
+        
+        Returns:
+            None
+        
+        Raises:
+            FrozenOpcodeInfoError(OpcodeInfoError): if the API was frozen
+        """
+        if self._is_frozen:
+            raise FrozenOpcodeInfoError("Can't add a lazy group to a frozen OpcodeInfoAPI")
+        lazy_group = (tuple(old_opcode_prefixes), register)
+        self._lazy_groups.append(lazy_group)
+        for extension_id in extension_ids:
+            self._lazy_extensions[extension_id] = lazy_group
+        if new_opcodes is not None:
+            new_opcodes = tuple(new_opcodes)
+            self._lazy_new_opcodes[lazy_group] = new_opcodes
+        self._group_ids.append(("lazy_group", lazy_group[0], register.__module__, register.__qualname__, new_opcodes))
+        self._new_opcode_index = None
+
+    def load_extensions(self, extension_ids: Iterable[str]) -> None:
+        """
+        Load the lazy groups of the extensions a project uses(see add_lazy_group), which were not loaded yet. 
+        Unknown extension ids e.g. of custom extensions are ignored
+        
+        Args:
+            extension_ids: the ids of the extensions e.g. FRProject.extensions
+        
+        Returns:
+            None
+        """
+        for extension_id in extension_ids:
+            lazy_group = self._lazy_extensions.get(extension_id, None)
+            if (lazy_group is not None) and (lazy_group in self._lazy_groups):
+                self._load_lazy_group(lazy_group)
+
+    def has_lazy_groups(self) -> bool:
+        """
+        Check wether some lazy groups(see add_lazy_group) were not loaded yet
+        
+        Returns:
+            wether some lazy groups were not loaded yet
+        """
+        return bool(self._lazy_groups)
+
+    def get_fingerprint(self) -> bytes:
+        """
+        Get a hash of the groups added to the API(see add_group and add_lazy_group). 
+        It doesn't change when lazy groups are loaded, so no lazy groups need to be loaded to compute it. 
+        Lazy groups are only identified by their prefixes and register function, 
+        so changes of the source code of the opcode information are not detected
+        
+        Returns:
+            the fingerprint
+        """
+        return content_hash(self._group_ids)
+
+    def load_all_groups(self) -> None:
+        """
+        Load all lazy groups(see add_lazy_group), which were not loaded yet
+        
+        Returns:
+            None
+        """
+        while self._lazy_groups:
+            self._load_lazy_group(self._lazy_groups[0])
+
+    def _load_groups_for_old(self, old: str) -> bool:
+        """
+        *[Internal Method]* Load the lazy groups, which could contain an old opcode
+        
+        Args:
+            old: the old opcode
+        
+        Returns:
+            wether any group was loaded
+        """
+        lazy_groups = [lazy_group for lazy_group in self._lazy_groups if old.startswith(lazy_group[0])]
+        for lazy_group in lazy_groups:
+            self._load_lazy_group(lazy_group)
+        return bool(lazy_groups)
+
+    def _load_groups_for_new(self, new: str | None) -> bool:
+        """
+        *[Internal Method]* Load the lazy groups, which could contain a new opcode(see add_lazy_group)
+        
+        Args:
+            new: the new opcode or None for the groups, which could contain any new opcode
+        
+        Returns:
+            wether any group was loaded
+        """
+        lazy_new_opcodes = self._lazy_new_opcodes
+        lazy_groups = [
+            lazy_group for lazy_group in self._lazy_groups 
+            if (lazy_group not in lazy_new_opcodes) or (new in lazy_new_opcodes[lazy_group])
+        ]
+        for lazy_group in lazy_groups:
+            self._load_lazy_group(lazy_group)
+        return bool(lazy_groups)
+
+    def _load_lazy_group(self, lazy_group: tuple[tuple[str, ...], Callable[["OpcodeInfoAPI"], None]]) -> None:
+        """
+        *[Internal Method]* Load a lazy group and ensure all its old opcodes start with one of its prefixes 
+        and all its new opcodes were declared, if they were declared(see add_lazy_group)
+        
+        Args:
+            lazy_group: the prefixes and the register function of the group
+        
+        Returns:
+            None
+        
+        Raises:
+            OpcodeInfoError: if an old opcode of the group doesn't start with one of its prefixes or a new opcode wasn't declared
+        """
+        self._lazy_groups.remove(lazy_group) # before registering, so lookups while registering don't load it again
+        new_opcodes = self._lazy_new_opcodes.pop(lazy_group, None)
+        old_opcode_prefixes, register = lazy_group
+        known_opcode_count = len(self.opcode_info)
+        known_group_id_count = len(self._group_ids)
+        register(self)
+        del self._group_ids[known_group_id_count:] # the lazy group is already part of the fingerprint
+        for i, (old_opcode, new_opcode) in enumerate(self.opcode_info.keys_key1_key2()):
+            if i < known_opcode_count:
+                continue
+            if not old_opcode.startswith(old_opcode_prefixes):
+                raise OpcodeInfoError(f"Old opcode {repr(old_opcode)} of a lazy group must start with one of {old_opcode_prefixes}")
+            if (new_opcodes is not None) and (new_opcode not in new_opcodes):
+                raise OpcodeInfoError(f"New opcode {repr(new_opcode)} of a lazy group must be one of its declared new opcodes")
+
+    def _add_canonical_strings(self, *strings: str | tuple[str, str]) -> None:
+        """
+        *[Internal Method]* Register strings(or pairs of strings) as canonical, so equal strings can be interned against them
+        
+        Args:
+            *strings: the strings or pairs of strings
+        
+        Returns:
+            None
+        """
+        for string in strings:
+            if isinstance(string, tuple):
+                self._add_canonical_strings(*string)
+            else:
+                self._canonical_strings.setdefault(string, string)
+
+    # String Interning
+    def intern(self, string: str) -> str:
+        """
+        Get the canonical string object for an opcode, input id or dropdown id. 
+        Strings which are not known to the API are returned unchanged.
+        Interning avoids storing thousands of copies of the same string and allows identity comparison. 
+        Strings of lazy groups are only known after the group was loaded(see add_lazy_group)
+        
+        Args:
+            string: the string to intern
+        
+        Returns:
+            the canonical equal string or the string itself
+        """
+        return self._canonical_strings.get(string, string)
+    
+    def intern_keys(self, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Intern all keys of a dict e.g. the input or dropdown ids of a block
+        
+        Args:
+            data: the dict whose keys should be interned
+        
+        Returns:
+            a new dict with interned keys and the same values
+        """
+        canonical_strings = self._canonical_strings
+        return {canonical_strings.get(key, key): value for key, value in data.items()}
     
     
     # Get all opcodes
     def get_all_new(self) -> list[str]:
         """
-        Get a list of all new opcodes
+        Get a list of all new opcodes. 
+        Lazy groups, which declared their new opcodes, are not loaded(see add_lazy_group)
         
         Returns:
             a list of all new opcodes
         """
-        return list(self.opcode_info.keys_key2())
+        if self._lazy_groups:
+            self._load_groups_for_new(None)
+        all_new = list(self.opcode_info.keys_key2())
+        for new_opcodes in self._lazy_new_opcodes.values():
+            all_new.extend(new_opcodes)
+        return all_new
     def get_all_old(self) -> list[str]:
         """
         Get a list of all old opcodes
@@ -448,8 +789,25 @@ class OpcodeInfoAPI:
         Returns:
             a list of all old opcodes
         """
+        self.load_all_groups()
         return list(self.opcode_info.keys_key1())
     
+    def get_closest_new_opcodes(self, new_opcode: str, n: int) -> list[str]:
+        """
+        Get the new opcodes, which are most similar to an unknown (e.g. misspelled) new opcode.
+        The n-gram index used for the lookup is built on the first call
+        
+        Args:
+            new_opcode: the unknown new opcode
+            n: the maximum amount of suggestions
+        
+        Returns:
+            the most similar new opcodes, best first
+        """
+        if self._new_opcode_index is None:
+            self._new_opcode_index = SimilarityIndex(self.get_all_new())
+        return self._new_opcode_index.get_closest_matches(new_opcode, n)
+    
     
     # Get new opcode for old opcode
     def get_new_by_old_safe(self, old: str) -> str | None:
@@ -465,6 +823,8 @@ class OpcodeInfoAPI:
         """
         if self.opcode_info.has_key1(old):
             return self.opcode_info.get_key2_for_key1(old)
+        if self._lazy_groups and self._load_groups_for_old(old):
+            return self.get_new_by_old_safe(old)
         return None
     def get_new_by_old(self, old: str) -> str:
         """
@@ -497,6 +857,8 @@ class OpcodeInfoAPI:
         """
         if self.opcode_info.has_key2(new):
             return self.opcode_info.get_key1_for_key2(new)
+        if self._lazy_groups and self._load_groups_for_new(new):
+            return self.get_old_by_new_safe(new)
         return None
     def get_old_by_new(self, new: str) -> str:
         """
@@ -529,6 +891,8 @@ class OpcodeInfoAPI:
         """
         if self.opcode_info.has_key1(old):
             return self.opcode_info.get_by_key1(old)
+        if self._lazy_groups and self._load_groups_for_old(old):
+            return self.get_info_by_old_safe(old)
         return None
     def get_info_by_old(self, old: str) -> OpcodeInfo:
         """
@@ -561,6 +925,8 @@ class OpcodeInfoAPI:
         """
         if self.opcode_info.has_key2(new):
             return self.opcode_info.get_by_key2(new)
+        if self._lazy_groups and self._load_groups_for_new(new):
+            return self.get_info_by_new_safe(new)
         return None 
     def get_info_by_new(self, new: str) -> OpcodeInfo:
         """
@@ -0,0 +1,103 @@
+import os
+import pickle
+from hashlib  import blake2b
+from sys      import version_info
+from tempfile import mkstemp
+
+from pypenguin.opcode_info.api.main import OpcodeInfoAPI
+
+SNAPSHOT_FORMAT_VERSION = 2
+
+def get_snapshot_version(*source_paths: str) -> str:
+    """
+    Get a version string for a snapshot, which changes whenever one of the source files, the snapshot format or the python version changes
+
+    Args:
+        *source_paths: the paths of the files, whose code builds the OpcodeInfoAPI
+
+    Returns:
+        the version string
+    """
+    hasher = blake2b(digest_size=16)
+    hasher.update(f"{SNAPSHOT_FORMAT_VERSION}/{version_info.major}.{version_info.minor}".encode())
+    for source_path in sorted(source_paths):
+        with open(source_path, "rb") as source_file:
+            hasher.update(b"\x00" + source_file.read())
+    return hasher.hexdigest()
+
+def save_snapshot(info_api: OpcodeInfoAPI, file_path: str, version: str) -> None:
+    """
+    Save a fully built OpcodeInfoAPI to a snapshot file, so it doesn't need to be built again(see load_snapshot).
+    All lazy groups are loaded first. Special case functions and mutation classes are stored as importable references.
+    The file starts with the version and a digest of the pickled API, which load_snapshot checks before unpickling. 
+    Every call writes its own temporary file, which then atomically replaces the snapshot, 
+    so concurrent writers don't interfere and readers never load a partially written snapshot(the last writer wins)
+
+    Args:
+        info_api: the opcode info api
+        file_path: the path of the snapshot file
+        version: the version of the snapshot(see get_snapshot_version)
+
+    Returns:
+        None
+    """
+    info_api.load_all_groups()
+    data = pickle.dumps(info_api, protocol=pickle.HIGHEST_PROTOCOL)
+    header = f"{version}\n{_get_data_digest(data)}\n".encode()
+    file_descriptor, temporary_path = mkstemp(
+        dir    = os.path.dirname(os.path.abspath(file_path)), 
+        prefix = f"{os.path.basename(file_path)}.", 
+        suffix = ".tmp",
+    )
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(header + data)
+        os.chmod(temporary_path, 0o644) # mkstemp only allows the owner to read
+        os.replace(temporary_path, file_path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+def load_snapshot(file_path: str, version: str) -> OpcodeInfoAPI | None:
+    """
+    Load an OpcodeInfoAPI from a snapshot file created with save_snapshot.
+    The digest only detects damaged files. **Only load snapshots you created yourself**, loading a snapshot can execute arbitrary code like unpickling
+
+    Args:
+        file_path: the path of the snapshot file
+        version: the expected version of the snapshot(see get_snapshot_version)
+
+    Returns:
+        the opcode info api or None if the file doesn't exist, is damaged or has a different version
+    """
+    try:
+        with open(file_path, "rb") as file:
+            snapshot_version = file.readline().rstrip(b"\n").decode()
+            digest           = file.readline().rstrip(b"\n").decode()
+            data             = file.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if (snapshot_version != version) or (digest != _get_data_digest(data)):
+        return None
+    try:
+        info_api = pickle.loads(data)
+    except (EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError, ImportError):
+        return None
+    if not isinstance(info_api, OpcodeInfoAPI):
+        return None
+    return info_api
+
+def _get_data_digest(data: bytes) -> str:
+    """
+    *[Internal Function]* Get the digest of the pickled API in a snapshot file
+
+    Args:
+        data: the pickled API
+
+    Returns:
+        the digest as a hex string
+    """
+    return blake2b(data, digest_size=32).hexdigest()
+
+
+__all__ = ["get_snapshot_version", "save_snapshot", "load_snapshot"]
@@ -0,0 +1,5 @@
+from pypenguin.opcode_info.data.main import NEW_OPCODES_PATH, build_new_opcodes
+
+if __name__ == "__main__":
+    build_new_opcodes()
+    print(f"Saved the new opcodes of every category and extension to {NEW_OPCODES_PATH}")
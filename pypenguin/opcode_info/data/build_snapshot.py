@@ -0,0 +1,5 @@
+from pypenguin.opcode_info.data.main import SNAPSHOT_PATH, build_snapshot
+
+if __name__ == "__main__":
+    build_snapshot()
+    print(f"Saved the opcode info snapshot to {SNAPSHOT_PATH}")
@@ -0,0 +1,24 @@
+from pypenguin.utility import DualKeyDict
+
+from pypenguin.opcode_info.api import OpcodeInfoGroup, OpcodeInfo, OpcodeType, InputInfo, InputType, DropdownInfo, DropdownType, MenuInfo
+
+extension_makey_makey = OpcodeInfoGroup(name="extension_makey_makey", opcode_info=DualKeyDict({
+    ("makeymakey_whenMakeyKeyPressed", "when ([MAKEY_KEY]) key pressed"): OpcodeInfo(
+        opcode_type=OpcodeType.HAT,
+        inputs=DualKeyDict({
+            ("KEY", "MAKEY_KEY"): InputInfo(InputType.MAKEY_KEY, menu=MenuInfo("makeymakey_menu_KEY", inner="KEY")),
+        }),
+    ),
+    ("makeymakey_whenCodePressed", "when ([MAKEY_SEQUENCE]) pressed in order"): OpcodeInfo(
+        opcode_type=OpcodeType.HAT,
+        inputs=DualKeyDict({
+            ("SEQUENCE", "MAKEY_SEQUENCE"): InputInfo(InputType.MAKEY_SEQUENCE, menu=MenuInfo("makeymakey_menu_SEQUENCE", inner="SEQUENCE")),
+        }),
+    ),
+    ("makeymakey_isMakeyKeyPressed", "is ([MAKEY_KEY]) pressed"): OpcodeInfo(
+        opcode_type=OpcodeType.BOOLEAN_REPORTER,
+        inputs=DualKeyDict({
+            ("KEY", "MAKEY_KEY"): InputInfo(InputType.MAKEY_KEY, menu=MenuInfo("makeymakey_menu_KEY", inner="KEY")),
+        }),
+    ),
+}))
\ No newline at end of file
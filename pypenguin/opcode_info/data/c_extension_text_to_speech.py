@@ -0,0 +1,30 @@
+from pypenguin.utility import DualKeyDict
+
+from pypenguin.opcode_info.api import OpcodeInfoGroup, OpcodeInfo, OpcodeType, InputInfo, InputType, DropdownInfo, DropdownType, MenuInfo
+
+extension_text_to_speech = OpcodeInfoGroup(name="extension_text_to_speech", opcode_info=DualKeyDict({
+    ("text2speech_speakAndWait", "speak (TEXT)"): OpcodeInfo(
+        opcode_type=OpcodeType.STATEMENT,
+        inputs=DualKeyDict({
+            ("WORDS", "TEXT"): InputInfo(InputType.TEXT),
+        }),
+    ),
+    ("text2speech_setVoice", "set voice to ([VOICE])"): OpcodeInfo(
+        opcode_type=OpcodeType.STATEMENT,
+        inputs=DualKeyDict({
+            ("VOICE", "VOICE"): InputInfo(InputType.TEXT_TO_SPEECH_VOICE, menu=MenuInfo("text2speech_menu_voices", inner="voices")),
+        }),
+    ),
+    ("text2speech_setLanguage", "set language to ([LANGUAGE])"): OpcodeInfo(
+        opcode_type=OpcodeType.STATEMENT,
+        inputs=DualKeyDict({
+            ("LANGUAGE", "LANGUAGE"): InputInfo(InputType.TEXT_TO_SPEECH_LANGUAGE, menu=MenuInfo("text2speech_menu_languages", inner="languages")),
+        }),
+    ),
+    ("text2speech_setSpeed", "set reading speed to (SPEED) %"): OpcodeInfo(
+        opcode_type=OpcodeType.STATEMENT,
+        inputs=DualKeyDict({
+            ("SPEED", "SPEED"): InputInfo(InputType.NUMBER),
+        }),
+    ),
+}))
\ No newline at end of file
@@ -0,0 +1,17 @@
+from pypenguin.utility import DualKeyDict
+
+from pypenguin.opcode_info.api import OpcodeInfoGroup, OpcodeInfo, OpcodeType, InputInfo, InputType, DropdownInfo, DropdownType, MenuInfo
+
+extension_translate = OpcodeInfoGroup(name="extension_translate", opcode_info=DualKeyDict({
+    ("translate_getTranslate", "translate (TEXT) to ([LANGUAGE])"): OpcodeInfo(
+        opcode_type=OpcodeType.STRING_REPORTER,
+        inputs=DualKeyDict({
+            ("WORDS", "TEXT"): InputInfo(InputType.TEXT),
+            ("LANGUAGE", "LANGUAGE"): InputInfo(InputType.TRANSLATE_LANGUAGE, menu=MenuInfo("translate_menu_languages", inner="languages")),
+        }),
+    ),
+    ("translate_getViewerLanguage", "language"): OpcodeInfo(
+        opcode_type=OpcodeType.STRING_REPORTER,
+        can_have_monitor=True,
+    ),
+}))
\ No newline at end of file
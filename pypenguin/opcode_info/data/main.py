@@ -1,168 +1,26 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from copy   import copy, deepcopy
+from glob   import glob
+from json   import dumps
+from os     import path
 
 from pypenguin.utility           import DualKeyDict, InvalidValueError
 from pypenguin.important_opcodes import *
 
+from pypenguin.opcode_info.data.new_opcodes import NEW_OPCODES
+
 from pypenguin.opcode_info.api import (
     OpcodeInfo, OpcodeType, OpcodeInfoGroup, OpcodeInfoAPI, 
     InputInfo, InputType, 
     DropdownInfo, DropdownType, 
     SpecialCase, SpecialCaseType,
+    get_snapshot_version, save_snapshot, load_snapshot,
 )
 
-from pypenguin.opcode_info.data.c_motion    import motion
-from pypenguin.opcode_info.data.c_looks     import looks
-from pypenguin.opcode_info.data.c_sounds    import sounds
-from pypenguin.opcode_info.data.c_events    import events
-from pypenguin.opcode_info.data.c_control   import control
-from pypenguin.opcode_info.data.c_sensing   import sensing
-from pypenguin.opcode_info.data.c_operators import operators
-from pypenguin.opcode_info.data.c_variables import variables
-from pypenguin.opcode_info.data.c_lists     import lists
-
 if TYPE_CHECKING:
     from pypenguin.core.block          import FRBlock, IRBlock, SRBlock
     from pypenguin.core.block_api   import FIConversionAPI, ValidationAPI
 
-from pypenguin.core.block_mutation import FRCustomBlockMutation, FRCustomBlockArgumentMutation, FRCustomBlockCallMutation, FRStopScriptMutation, SRCustomBlockMutation, SRCustomBlockArgumentMutation, SRCustomBlockCallMutation, SRStopScriptMutation
-
-motion.add_opcode("motion_goto_menu", "#REACHABLE TARGET MENU (GO)", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-motion.add_opcode("motion_glideto_menu", "#REACHABLE TARGET MENU (GLIDE)", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-motion.add_opcode("motion_pointtowards_menu", "#OBSERVABLE TARGET MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-
-looks.add_opcode("looks_costume", "#COSTUME MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-looks.add_opcode("looks_backdrops", "#BACKDROP MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-looks.add_opcode("looks_getinput_menu", "#COSTUME PROPERTY MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-looks.add_opcode("looks_changeVisibilityOfSprite_menu", "#SHOW/HIDE SPRITE MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-looks.add_opcode("looks_getOtherSpriteVisible_menu", "#IS SPRITE VISIBLE MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-
-sounds.add_opcode("sound_sounds_menu", "#SOUND MENU", OpcodeInfo( # this is certainly correct
-    opcode_type=OpcodeType.MENU,
-))
-
-control.add_opcode("control_stop_sprite_menu", "#STOP SPRITE MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-control.add_opcode("control_create_clone_of_menu", "#CLONE TARGET MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-control.add_opcode("control_run_as_sprite_menu", "#RUN AS SPRITE MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-
-sensing.add_opcode("sensing_touchingobjectmenu", "#TOUCHING OBJECT MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-sensing.add_opcode("sensing_fulltouchingobjectmenu", "#FULL TOUCHING OBJECT MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-sensing.add_opcode("sensing_touchingobjectmenusprites", "#TOUCHING OBJECT MENU SPRITES", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-sensing.add_opcode("sensing_distancetomenu", "#DISTANCE TO MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-sensing.add_opcode("sensing_keyoptions", "#KEY MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-sensing.add_opcode("sensing_scrolldirections", "#SCROLL DIRECTION MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-sensing.add_opcode("sensing_of_object_menu", "#OJBECT PROPERTY MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-sensing.add_opcode("sensing_fingeroptions", "#FINGER INDEX MENU", OpcodeInfo(
-    opcode_type=OpcodeType.MENU,
-))
-
-variables.add_opcode(OPCODE_VAR_VALUE, NEW_OPCODE_VAR_VALUE, OpcodeInfo(
-    opcode_type=OpcodeType.STRING_REPORTER,
-    dropdowns=DualKeyDict({
-        ("VARIABLE", "VARIABLE"): DropdownInfo(DropdownType.VARIABLE),
-    }),
-    can_have_monitor=True,
-))
-lists.add_opcode(OPCODE_LIST_VALUE, NEW_OPCODE_LIST_VALUE, OpcodeInfo(
-    opcode_type=OpcodeType.STRING_REPORTER,
-    dropdowns=DualKeyDict({
-        ("LIST", "LIST"): DropdownInfo(DropdownType.LIST),
-    }),
-    can_have_monitor=True,
-))
-
-custom_blocks = OpcodeInfoGroup(
-    name="Custom Opcodes",
-    opcode_info=DualKeyDict({
-        (OPCODE_CB_DEF, NEW_OPCODE_CB_DEF): OpcodeInfo(
-            opcode_type=OpcodeType.HAT,
-        ),
-        (OPCODE_CB_DEF_RET, NEW_OPCODE_CB_DEF_REP): OpcodeInfo(
-            opcode_type=OpcodeType.HAT,
-        ),
-        (OPCODE_CB_PROTOTYPE, "#CUSTOM BLOCK PROTOTYPE"): OpcodeInfo( # only temporary
-            opcode_type=OpcodeType.NOT_RELEVANT,
-        ),
-        (OPCODE_CB_CALL, NEW_OPCODE_CB_CALL): OpcodeInfo(
-            opcode_type=OpcodeType.DYNAMIC,
-        ),
-        ("procedures_return", "return (VALUE)"): OpcodeInfo(
-            opcode_type=OpcodeType.ENDING_STATEMENT,
-            inputs=DualKeyDict({
-                ("return", "VALUE"): InputInfo(InputType.TEXT),
-            }),
-        ),
-        ("procedures_set", "set (PARAM) to (VALUE)"): OpcodeInfo(
-            opcode_type=OpcodeType.STATEMENT,
-            inputs=DualKeyDict({
-                ("PARAM", "PARAM"): InputInfo(InputType.ROUND),
-                ("VALUE", "VALUE"): InputInfo(InputType.TEXT),
-            }),
-        ),
-        (OPCODE_CB_ARG_TEXT, "value of text [ARGUMENT]"): OpcodeInfo(
-            opcode_type=OpcodeType.STRING_REPORTER,
-        ),
-        (OPCODE_CB_ARG_BOOL, "value of boolean [ARGUMENT]"): OpcodeInfo(
-            opcode_type=OpcodeType.BOOLEAN_REPORTER,
-        ),
-    }),
-)
-
-info_api = OpcodeInfoAPI()
-info_api.add_group(motion       )
-info_api.add_group(looks        )
-info_api.add_group(sounds       )
-info_api.add_group(events       )
-info_api.add_group(control      )
-info_api.add_group(sensing      )
-info_api.add_group(operators    )
-info_api.add_group(variables    )
-info_api.add_group(lists        )
-info_api.add_group(custom_blocks)
-
-# Mutations
-info_api.set_opcode_mutation_class(OPCODE_STOP_SCRIPT, old_cls=FRStopScriptMutation, new_cls=SRStopScriptMutation)
-info_api.set_opcode_mutation_class(OPCODE_CB_PROTOTYPE, old_cls=FRCustomBlockMutation, new_cls=None)
-info_api.set_opcodes_mutation_class(ANY_OPCODE_CB_DEF, old_cls=None, new_cls=SRCustomBlockMutation)
-info_api.set_opcodes_mutation_class(ANY_OPCODE_CB_ARG, old_cls=FRCustomBlockArgumentMutation, new_cls=SRCustomBlockArgumentMutation)
-info_api.set_opcode_mutation_class(OPCODE_CB_CALL, old_cls=FRCustomBlockCallMutation, new_cls=SRCustomBlockCallMutation)
-
 # Special Cases
 
 def GET_OPCODE_TYPE__STOP_SCRIPT(block: "SRBlock|IRBlock", validation_api: "ValidationAPI") -> OpcodeType:
@@ -170,11 +28,6 @@ def GET_OPCODE_TYPE__STOP_SCRIPT(block: "SRBlock|IRBlock", validation_api: "Vali
     mutation: SRStopScriptMutation = block.mutation
     return OpcodeType.ENDING_STATEMENT if mutation.is_ending_statement else OpcodeType.STATEMENT
 
-info_api.add_opcode_case(OPCODE_STOP_SCRIPT, SpecialCase(
-    type=SpecialCaseType.GET_OPCODE_TYPE,
-    function=GET_OPCODE_TYPE__STOP_SCRIPT,
-))
-
 def GET_OPCODE_TYPE__CB_CALL(block: "SRBlock|IRBlock", validation_api: "ValidationAPI") -> OpcodeType:
     # Get the complete mutation and derive OpcodeType from optype
     from pypenguin.core.block_mutation import SRCustomBlockCallMutation
@@ -182,11 +35,6 @@ def GET_OPCODE_TYPE__CB_CALL(block: "SRBlock|IRBlock", validation_api: "Validati
     complete_mutation = validation_api.get_cb_mutation(partial_mutation.custom_opcode)
     return complete_mutation.optype.get_corresponding_opcode_type()
     
-info_api.add_opcode_case(OPCODE_CB_CALL, SpecialCase(
-    type=SpecialCaseType.GET_OPCODE_TYPE,
-    function=GET_OPCODE_TYPE__CB_CALL,
-))
-
 def PRE__CB_DEF(block: "FRBlock", ficapi: "FIConversionAPI") -> "FRBlock":
     # Transfer mutation from prototype block to definition block
     # Order deletion of the prototype block and its argument blocks
@@ -202,11 +50,6 @@ def PRE__CB_DEF(block: "FRBlock", ficapi: "FIConversionAPI") -> "FRBlock":
     [ficapi.schedule_block_deletion(target_id) for target_id in target_ids]
     return block
 
-info_api.add_opcodes_case(ANY_OPCODE_CB_DEF, SpecialCase(
-    type=SpecialCaseType.PRE_FR_STEP, 
-    function=PRE__CB_DEF,
-))
-
 def PRE__CB_ARG(block: "FRBlock", ficapi: "FIConversionAPI") -> "FRBlock":
     # Transfer argument name from a field into the mutation
     # because only real dropdowns should be listed in "fields"
@@ -217,11 +60,6 @@ def PRE__CB_ARG(block: "FRBlock", ficapi: "FIConversionAPI") -> "FRBlock":
     del block.fields["VALUE"]
     return block
 
-info_api.add_opcodes_case(ANY_OPCODE_CB_ARG, SpecialCase(
-    type=SpecialCaseType.PRE_FR_STEP, 
-    function=PRE__CB_ARG,
-))
-
 def PRE__CB_CALL(block: "FRBlock", ficapi: "FIConversionAPI") -> "FRBlock":
     from pypenguin.core.block_mutation import FRCustomBlockCallMutation
     block = copy(block)
@@ -235,11 +73,6 @@ def PRE__CB_CALL(block: "FRBlock", ficapi: "FIConversionAPI") -> "FRBlock":
     block.inputs = new_inputs
     return block
 
-info_api.add_opcode_case(OPCODE_CB_CALL, SpecialCase(
-    type=SpecialCaseType.PRE_FR_STEP, 
-    function=PRE__CB_CALL,
-))
-
 def FR_STEP__CB_PROTOTYPE(block: "FRBlock", ficapi: "FIConversionAPI") -> "IRBlock":
     # Return an empty, temporary block
     from pypenguin.core.block import IRBlock
@@ -254,11 +87,6 @@ def FR_STEP__CB_PROTOTYPE(block: "FRBlock", ficapi: "FIConversionAPI") -> "IRBlo
         is_top_level = ...,
     )
 
-info_api.add_opcode_case(OPCODE_CB_PROTOTYPE, SpecialCase(
-    type=SpecialCaseType.FR_STEP,
-    function=FR_STEP__CB_PROTOTYPE,
-))
-
 def GET_ALL_INPUT_TYPES__CB_CALL(
     block: "FRBlock|IRBlock|SRBlock", ficapi: "FIConversionAPI|None"
 ) -> DualKeyDict[str, str, InputType]:
@@ -273,11 +101,6 @@ def GET_ALL_INPUT_TYPES__CB_CALL(
     
     return DualKeyDict.from_same_keys(mutation.custom_opcode.get_corresponding_input_types())
 
-info_api.add_opcode_case(OPCODE_CB_CALL, SpecialCase(
-    type=SpecialCaseType.GET_ALL_INPUT_IDS_TYPES,
-    function=GET_ALL_INPUT_TYPES__CB_CALL,
-))
-
 
 def POST_VALIDATION__CB_DEF(path:list, block: "SRBlock") -> None:
     from pypenguin.core.block_mutation import SRCustomBlockMutation
@@ -290,11 +113,494 @@ def POST_VALIDATION__CB_DEF(path:list, block: "SRBlock") -> None:
             raise InvalidValueError(path, f"If mutation.optype of a {block.__class__.__name__} is NOT ...REPORTER, opcode should be {repr(NEW_OPCODE_CB_DEF)}")
     else: raise ValueError()
 
-info_api.add_opcodes_case(ANY_OPCODE_CB_DEF, SpecialCase(
-    type=SpecialCaseType.POST_VALIDATION,
-    function=POST_VALIDATION__CB_DEF,
-))
 
+def _copy_group(group: OpcodeInfoGroup) -> OpcodeInfoGroup:
+    """
+    *[Internal Function]* Copy a group of a category or extension module including its opcode information. 
+    The modules are only imported once, so every API must add menus, special cases and mutation classes to its own copy
+    
+    Args:
+        group: the group defined in a category or extension module
+    
+    Returns:
+        the copy
+    """
+    return deepcopy(group)
+
+
+# Categories
+# Every category is only imported and added to info_api, when one of its opcodes is needed(see OpcodeInfoAPI.add_lazy_group)
+
+def _register_motion(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_motion import motion
+    motion = _copy_group(motion)
+    motion.add_opcode("motion_goto_menu", "#REACHABLE TARGET MENU (GO)", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    motion.add_opcode("motion_glideto_menu", "#REACHABLE TARGET MENU (GLIDE)", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    motion.add_opcode("motion_pointtowards_menu", "#OBSERVABLE TARGET MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(motion)
+
+def _register_looks(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_looks import looks
+    looks = _copy_group(looks)
+    looks.add_opcode("looks_costume", "#COSTUME MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    looks.add_opcode("looks_backdrops", "#BACKDROP MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    looks.add_opcode("looks_getinput_menu", "#COSTUME PROPERTY MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    looks.add_opcode("looks_changeVisibilityOfSprite_menu", "#SHOW/HIDE SPRITE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    looks.add_opcode("looks_getOtherSpriteVisible_menu", "#IS SPRITE VISIBLE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(looks)
+
+def _register_sounds(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_sounds import sounds
+    sounds = _copy_group(sounds)
+    sounds.add_opcode("sound_sounds_menu", "#SOUND MENU", OpcodeInfo( # this is certainly correct
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(sounds)
+
+def _register_events(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_events import events
+    events = _copy_group(events)
+    info_api.add_group(events)
+
+def _register_control(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_control import control
+    control = _copy_group(control)
+    from pypenguin.core.block_mutation import FRStopScriptMutation, SRStopScriptMutation
+    control.add_opcode("control_stop_sprite_menu", "#STOP SPRITE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    control.add_opcode("control_create_clone_of_menu", "#CLONE TARGET MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    control.add_opcode("control_run_as_sprite_menu", "#RUN AS SPRITE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(control)
+    
+    info_api.set_opcode_mutation_class(OPCODE_STOP_SCRIPT, old_cls=FRStopScriptMutation, new_cls=SRStopScriptMutation)
+    info_api.add_opcode_case(OPCODE_STOP_SCRIPT, SpecialCase(
+        type=SpecialCaseType.GET_OPCODE_TYPE,
+        function=GET_OPCODE_TYPE__STOP_SCRIPT,
+    ))
+
+def _register_sensing(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_sensing import sensing
+    sensing = _copy_group(sensing)
+    sensing.add_opcode("sensing_touchingobjectmenu", "#TOUCHING OBJECT MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    sensing.add_opcode("sensing_fulltouchingobjectmenu", "#FULL TOUCHING OBJECT MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    sensing.add_opcode("sensing_touchingobjectmenusprites", "#TOUCHING OBJECT MENU SPRITES", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    sensing.add_opcode("sensing_distancetomenu", "#DISTANCE TO MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    sensing.add_opcode("sensing_keyoptions", "#KEY MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    sensing.add_opcode("sensing_scrolldirections", "#SCROLL DIRECTION MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    sensing.add_opcode("sensing_of_object_menu", "#OJBECT PROPERTY MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    sensing.add_opcode("sensing_fingeroptions", "#FINGER INDEX MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(sensing)
+
+def _register_operators(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_operators import operators
+    operators = _copy_group(operators)
+    info_api.add_group(operators)
+
+def _register_variables(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_variables import variables
+    variables = _copy_group(variables)
+    variables.add_opcode(OPCODE_VAR_VALUE, NEW_OPCODE_VAR_VALUE, OpcodeInfo(
+        opcode_type=OpcodeType.STRING_REPORTER,
+        dropdowns=DualKeyDict({
+            ("VARIABLE", "VARIABLE"): DropdownInfo(DropdownType.VARIABLE),
+        }),
+        can_have_monitor=True,
+    ))
+    info_api.add_group(variables)
+
+def _register_lists(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_lists import lists
+    lists = _copy_group(lists)
+    lists.add_opcode(OPCODE_LIST_VALUE, NEW_OPCODE_LIST_VALUE, OpcodeInfo(
+        opcode_type=OpcodeType.STRING_REPORTER,
+        dropdowns=DualKeyDict({
+            ("LIST", "LIST"): DropdownInfo(DropdownType.LIST),
+        }),
+        can_have_monitor=True,
+    ))
+    info_api.add_group(lists)
+
+def _register_custom_blocks(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.core.block_mutation import (
+        FRCustomBlockMutation, FRCustomBlockArgumentMutation, FRCustomBlockCallMutation, 
+        SRCustomBlockMutation, SRCustomBlockArgumentMutation, SRCustomBlockCallMutation,
+    )
+    custom_blocks = OpcodeInfoGroup(
+        name="Custom Opcodes",
+        opcode_info=DualKeyDict({
+            (OPCODE_CB_DEF, NEW_OPCODE_CB_DEF): OpcodeInfo(
+                opcode_type=OpcodeType.HAT,
+            ),
+            (OPCODE_CB_DEF_RET, NEW_OPCODE_CB_DEF_REP): OpcodeInfo(
+                opcode_type=OpcodeType.HAT,
+            ),
+            (OPCODE_CB_PROTOTYPE, "#CUSTOM BLOCK PROTOTYPE"): OpcodeInfo( # only temporary
+                opcode_type=OpcodeType.NOT_RELEVANT,
+            ),
+            (OPCODE_CB_CALL, NEW_OPCODE_CB_CALL): OpcodeInfo(
+                opcode_type=OpcodeType.DYNAMIC,
+            ),
+            ("procedures_return", "return (VALUE)"): OpcodeInfo(
+                opcode_type=OpcodeType.ENDING_STATEMENT,
+                inputs=DualKeyDict({
+                    ("return", "VALUE"): InputInfo(InputType.TEXT),
+                }),
+            ),
+            ("procedures_set", "set (PARAM) to (VALUE)"): OpcodeInfo(
+                opcode_type=OpcodeType.STATEMENT,
+                inputs=DualKeyDict({
+                    ("PARAM", "PARAM"): InputInfo(InputType.ROUND),
+                    ("VALUE", "VALUE"): InputInfo(InputType.TEXT),
+                }),
+            ),
+            (OPCODE_CB_ARG_TEXT, "value of text [ARGUMENT]"): OpcodeInfo(
+                opcode_type=OpcodeType.STRING_REPORTER,
+            ),
+            (OPCODE_CB_ARG_BOOL, "value of boolean [ARGUMENT]"): OpcodeInfo(
+                opcode_type=OpcodeType.BOOLEAN_REPORTER,
+            ),
+        }),
+    )
+    info_api.add_group(custom_blocks)
+    
+    # Mutations
+    info_api.set_opcode_mutation_class(OPCODE_CB_PROTOTYPE, old_cls=FRCustomBlockMutation, new_cls=None)
+    info_api.set_opcodes_mutation_class(ANY_OPCODE_CB_DEF, old_cls=None, new_cls=SRCustomBlockMutation)
+    info_api.set_opcodes_mutation_class(ANY_OPCODE_CB_ARG, old_cls=FRCustomBlockArgumentMutation, new_cls=SRCustomBlockArgumentMutation)
+    info_api.set_opcode_mutation_class(OPCODE_CB_CALL, old_cls=FRCustomBlockCallMutation, new_cls=SRCustomBlockCallMutation)
+    
+    # Special Cases
+    info_api.add_opcode_case(OPCODE_CB_CALL, SpecialCase(
+        type=SpecialCaseType.GET_OPCODE_TYPE,
+        function=GET_OPCODE_TYPE__CB_CALL,
+    ))
+    info_api.add_opcodes_case(ANY_OPCODE_CB_DEF, SpecialCase(
+        type=SpecialCaseType.PRE_FR_STEP, 
+        function=PRE__CB_DEF,
+    ))
+    info_api.add_opcodes_case(ANY_OPCODE_CB_ARG, SpecialCase(
+        type=SpecialCaseType.PRE_FR_STEP, 
+        function=PRE__CB_ARG,
+    ))
+    info_api.add_opcode_case(OPCODE_CB_CALL, SpecialCase(
+        type=SpecialCaseType.PRE_FR_STEP, 
+        function=PRE__CB_CALL,
+    ))
+    info_api.add_opcode_case(OPCODE_CB_PROTOTYPE, SpecialCase(
+        type=SpecialCaseType.FR_STEP,
+        function=FR_STEP__CB_PROTOTYPE,
+    ))
+    info_api.add_opcode_case(OPCODE_CB_CALL, SpecialCase(
+        type=SpecialCaseType.GET_ALL_INPUT_IDS_TYPES,
+        function=GET_ALL_INPUT_TYPES__CB_CALL,
+    ))
+    info_api.add_opcodes_case(ANY_OPCODE_CB_DEF, SpecialCase(
+        type=SpecialCaseType.POST_VALIDATION,
+        function=POST_VALIDATION__CB_DEF,
+    ))
+
+# Extensions
+# Every extension is only imported and added to info_api, when a project uses it(see OpcodeInfoAPI.load_extensions) 
+# or when one of its opcodes is needed
+
+def _register_pen(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_extension_pen import extension_pen
+    extension_pen = _copy_group(extension_pen)
+    extension_pen.add_opcode("pen_menu_FONT", "#FONT MENU (PEN)", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    extension_pen.add_opcode("pen_menu_colorParam", "#PEN PROPERTY MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(extension_pen)
+
+def _register_music(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_extension_music import extension_music
+    extension_music = _copy_group(extension_music)
+    extension_music.add_opcode("music_menu_DRUM", "#DRUM MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    extension_music.add_opcode("note", "#NOTE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    extension_music.add_opcode("music_menu_INSTRUMENT", "#INSTRUMENT MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(extension_music)
+
+def _register_video_sensing(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_extension_video_sensing import extension_video_sensing
+    extension_video_sensing = _copy_group(extension_video_sensing)
+    extension_video_sensing.add_opcode("videoSensing_menu_ATTRIBUTE", "#VIDEO SENSING PROPERTY MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    extension_video_sensing.add_opcode("videoSensing_menu_SUBJECT", "#VIDEO SENSING TARGET MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    extension_video_sensing.add_opcode("videoSensing_menu_VIDEO_STATE", "#VIDEO STATE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(extension_video_sensing)
+
+def _register_text(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_extension_text import extension_text
+    extension_text = _copy_group(extension_text)
+    extension_text.add_opcode("text_menu_FONT", "#FONT MENU (TEXT)", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(extension_text)
+
+def _register_text_to_speech(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_extension_text_to_speech import extension_text_to_speech
+    extension_text_to_speech = _copy_group(extension_text_to_speech)
+    extension_text_to_speech.add_opcode("text2speech_menu_voices", "#TEXT TO SPEECH VOICE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    extension_text_to_speech.add_opcode("text2speech_menu_languages", "#TEXT TO SPEECH LANGUAGE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(extension_text_to_speech)
+
+def _register_translate(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_extension_translate import extension_translate
+    extension_translate = _copy_group(extension_translate)
+    extension_translate.add_opcode("translate_menu_languages", "#TRANSLATE LANGUAGE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(extension_translate)
+
+def _register_makey_makey(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_extension_makey_makey import extension_makey_makey
+    extension_makey_makey = _copy_group(extension_makey_makey)
+    extension_makey_makey.add_opcode("makeymakey_menu_KEY", "#MAKEY KEY MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    extension_makey_makey.add_opcode("makeymakey_menu_SEQUENCE", "#MAKEY SEQUENCE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(extension_makey_makey)
+
+def _register_tw_files(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_extension_tw_files import extension_tw_files
+    extension_tw_files = _copy_group(extension_tw_files)
+    extension_tw_files.add_opcode("twFiles_menu_encoding", "#READ FILE MODE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    extension_tw_files.add_opcode("twFiles_menu_automaticallyOpen", "#FILE SELECTOR MODE MENU", OpcodeInfo(
+        opcode_type=OpcodeType.MENU,
+    ))
+    info_api.add_group(extension_tw_files)
+
+def _register_json(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_extension_json import extension_json
+    extension_json = _copy_group(extension_json)
+    info_api.add_group(extension_json)
+
+def _register_bitwise(info_api: OpcodeInfoAPI) -> None:
+    from pypenguin.opcode_info.data.c_extension_bitwise import extension_bitwise
+    extension_bitwise = _copy_group(extension_bitwise)
+    info_api.add_group(extension_bitwise)
+
+
+_CATEGORIES: list[tuple[set[str], Callable[[OpcodeInfoAPI], None]]] = [
+    ({"motion_"   }, _register_motion       ),
+    ({"looks_"    }, _register_looks        ),
+    ({"sound_"    }, _register_sounds       ),
+    ({"event_"    }, _register_events       ),
+    ({"control_"  }, _register_control      ),
+    ({"sensing_"  }, _register_sensing      ),
+    ({"operator_" }, _register_operators    ),
+    ({"data_"     }, _register_variables    ),
+    ({"data_"     }, _register_lists        ),
+    ({"procedures_", "argument_"}, _register_custom_blocks),
+]
+
+_EXTENSIONS: list[tuple[str, set[str], Callable[[OpcodeInfoAPI], None]]] = [
+    ("pen"         , {"pen_"         }, _register_pen           ),
+    ("music"       , {"music_", "note"}, _register_music         ),
+    ("videoSensing", {"videoSensing_"}, _register_video_sensing ),
+    ("text"        , {"text_"        }, _register_text          ),
+    ("text2speech" , {"text2speech_" }, _register_text_to_speech),
+    ("translate"   , {"translate_"   }, _register_translate     ),
+    ("makeymakey"  , {"makeymakey_"  }, _register_makey_makey   ),
+    ("twFiles"     , {"twFiles_"     }, _register_tw_files      ),
+    ("jgJSON"      , {"jgJSON_"      }, _register_json          ),
+    ("Bitwise"     , {"Bitwise_"     }, _register_bitwise       ),
+]
+
+# New Opcodes
+# New opcodes don't share prefixes, so the new opcodes of every category and extension are declared in new_opcodes.py. 
+# Then a lookup by new opcode only loads the matching one(see OpcodeInfoAPI.add_lazy_group). 
+# Undeclared ones are loaded on the first lookup of any unknown new opcode
+
+NEW_OPCODES_PATH = path.join(path.dirname(__file__), "new_opcodes.py")
+
+def _get_group_name(register: Callable[[OpcodeInfoAPI], None]) -> str:
+    """
+    *[Internal Function]* Get the name of a category or extension in NEW_OPCODES
+    
+    Args:
+        register: the register function of the category or extension
+    
+    Returns:
+        the name e.g. "motion"
+    """
+    return register.__name__.removeprefix("_register_")
+
+def build_new_opcodes(file_path: str | None = None) -> None:
+    """
+    Register every category and extension and save their new opcodes as the declaration module. 
+    Run "python -m pypenguin.opcode_info.data.build_new_opcodes" after changing the opcodes of a category or extension
+    
+    Args:
+        file_path: the path of the declaration module. Defaults to NEW_OPCODES_PATH
+    
+    Returns:
+        None
+    """
+    registers = [register for _, register in _CATEGORIES] + [register for _, _, register in _EXTENSIONS]
+    lines = [
+        "# Generated by \"python -m pypenguin.opcode_info.data.build_new_opcodes\", don't edit by hand", 
+        "# The new opcodes of every category and extension(see pypenguin.opcode_info.data.main)",
+        "",
+        "NEW_OPCODES: dict[str, tuple[str, ...]] = {",
+    ]
+    for register in registers:
+        group_api = OpcodeInfoAPI()
+        register(group_api)
+        # a json string is also a valid python string
+        lines.append(f"    {dumps(_get_group_name(register))}: (")
+        lines.extend(f"        {dumps(new_opcode, ensure_ascii=False)}," for new_opcode in group_api.opcode_info.keys_key2())
+        lines.append("    ),")
+    lines.append("}")
+    with open(file_path or NEW_OPCODES_PATH, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+
+# Snapshot
+# If a snapshot of the complete info_api exists, it is loaded instead of registering every category(see build_snapshot). 
+# It is only ever written by build_snapshot. An outdated or damaged snapshot is ignored at runtime, so an installed package never writes to its own directory. 
+# Loading a snapshot unpickles it, which can execute arbitrary code. So anyone, who can write to the package directory, 
+# can run code in every process importing pypenguin. Only build snapshots in deployments, whose package directory is not writable by untrusted users
+
+SNAPSHOT_PATH = path.join(path.dirname(__file__), "info_api.snapshot")
+
+def _get_snapshot_version() -> str:
+    """
+    *[Internal Function]* Get the version of the snapshot, which matches the current source code of the opcode information
+    
+    Returns:
+        the snapshot version
+    """
+    import pypenguin.important_opcodes, pypenguin.utility.general, pypenguin.utility.similarity
+    opcode_info_dir = path.dirname(path.dirname(__file__))
+    source_paths = glob(path.join(opcode_info_dir, "api", "*.py")) + glob(path.join(opcode_info_dir, "data", "*.py"))
+    return get_snapshot_version(*source_paths, 
+        pypenguin.important_opcodes.__file__, 
+        pypenguin.utility.general.__file__, # DualKeyDict
+        pypenguin.utility.similarity.__file__,
+    )
+
+def build_snapshot(file_path: str | None = None) -> None:
+    """
+    Build the complete opcode info api and save it as a snapshot, which is loaded instead of building it in the future.
+    Run "python -m pypenguin.opcode_info.data.build_snapshot" e.g. while building a deployment
+    
+    Args:
+        file_path: the path of the snapshot file. Defaults to SNAPSHOT_PATH
+    
+    Returns:
+        None
+    """
+    save_snapshot(_create_info_api(use_snapshot=False), file_path or SNAPSHOT_PATH, _get_snapshot_version())
+
+def _register_from_snapshot(info_api: OpcodeInfoAPI) -> None:
+    """
+    *[Internal Function]* Add all opcodes from the snapshot to the API. 
+    If the snapshot is outdated or damaged, the categories are registered instead. The snapshot is never written here(see build_snapshot)
+    
+    Args:
+        info_api: the opcode info api
+    
+    Returns:
+        None
+    """
+    snapshot_api = load_snapshot(SNAPSHOT_PATH, _get_snapshot_version())
+    if snapshot_api is not None:
+        info_api.add_group(OpcodeInfoGroup(name="Snapshot", opcode_info=snapshot_api.opcode_info))
+        return
+    for _, register in _CATEGORIES:
+        register(info_api)
+    for _, _, register in _EXTENSIONS:
+        register(info_api)
+
+def _create_info_api(use_snapshot: bool) -> OpcodeInfoAPI:
+    """
+    *[Internal Function]* Create the opcode info api. The categories are loaded lazily(see OpcodeInfoAPI.add_lazy_group)
+    
+    Args:
+        use_snapshot: wether to load the snapshot instead of registering the categories, if a snapshot exists
+    
+    Returns:
+        the opcode info api
+    """
+    info_api = OpcodeInfoAPI()
+    if use_snapshot and path.exists(SNAPSHOT_PATH):
+        all_prefixes = set().union(
+            *[old_opcode_prefixes for old_opcode_prefixes, _ in _CATEGORIES],
+            *[old_opcode_prefixes for _, old_opcode_prefixes, _ in _EXTENSIONS],
+        )
+        all_extension_ids = [extension_id for extension_id, _, _ in _EXTENSIONS]
+        all_new_opcodes = [new_opcode for new_opcodes in NEW_OPCODES.values() for new_opcode in new_opcodes]
+        if len(NEW_OPCODES) < (len(_CATEGORIES) + len(_EXTENSIONS)):
+            all_new_opcodes = None # e.g. while building the declarations
+        info_api.add_lazy_group(all_prefixes, _register_from_snapshot, extension_ids=all_extension_ids, new_opcodes=all_new_opcodes)
+    else:
+        for old_opcode_prefixes, register in _CATEGORIES:
+            info_api.add_lazy_group(old_opcode_prefixes, register, new_opcodes=NEW_OPCODES.get(_get_group_name(register), None))
+        for extension_id, old_opcode_prefixes, register in _EXTENSIONS:
+            info_api.add_lazy_group(old_opcode_prefixes, register, 
+                extension_ids={extension_id}, new_opcodes=NEW_OPCODES.get(_get_group_name(register), None),
+            )
+    return info_api
+
+info_api = _create_info_api(use_snapshot=True)
 
-__all__ = ["info_api"]
 
+__all__ = ["info_api", "build_snapshot", "build_new_opcodes"]
@@ -0,0 +1,425 @@
+# Generated by "python -m pypenguin.opcode_info.data.build_new_opcodes", don't edit by hand
+# The new opcodes of every category and extension(see pypenguin.opcode_info.data.main)
+
+NEW_OPCODES: dict[str, tuple[str, ...]] = {
+    "motion": (
+        "move (STEPS) steps",
+        "move back (STEPS) steps",
+        "move [DIRECTION] (STEPS) steps",
+        "turn clockwise (DEGREES) degrees",
+        "turn counterclockwise (DEGREES) degrees",
+        "go to ([TARGET])",
+        "go to x: (X) y: (Y)",
+        "change by x: (DX) y: (DY)",
+        "glide (SECONDS) secs to ([TARGET])",
+        "glide (SECONDS) secs to x: (X) y: (Y)",
+        "point in direction (DIRECTION)",
+        "point towards ([TARGET])",
+        "point towards x: (X) y: (Y)",
+        "turn around",
+        "change x by (DX)",
+        "set x to (X)",
+        "change y by (DY)",
+        "set y to (Y)",
+        "if on edge, bounce",
+        "if touching ([TARGET]), bounce",
+        "set rotation style [STYLE]",
+        "move to stage [ZONE]",
+        "x position",
+        "y position",
+        "direction",
+        "#REACHABLE TARGET MENU (GO)",
+        "#REACHABLE TARGET MENU (GLIDE)",
+        "#OBSERVABLE TARGET MENU",
+    ),
+    "looks": (
+        "say (MESSAGE) for (SECONDS) seconds",
+        "say (MESSAGE)",
+        "think (MESSAGE) for (SECONDS) seconds",
+        "think (MESSAGE)",
+        "stop speaking",
+        "set font to (FONT) with font size (FONT-SIZE)",
+        "set [PROPERTY] color to (COLOR)",
+        "set text bubble [PROPERTY] to (VALUE)",
+        "bubble width",
+        "bubble height",
+        "switch costume to ([COSTUME])",
+        "next costume",
+        "([PROPERTY]) of ([COSTUME])",
+        "switch backdrop to ([BACKDROP])",
+        "next backdrop",
+        "change size by (AMOUNT)",
+        "set size to (SIZE)",
+        "set stretch to x: (X) y: (Y)",
+        "x stretch",
+        "y stretch",
+        "change [EFFECT] sprite effect by (AMOUNT)",
+        "set [EFFECT] sprite effect to (VALUE)",
+        "set tint color to (COLOR)",
+        "clear graphic effects",
+        "[EFFECT] sprite effect",
+        "tint color",
+        "show",
+        "hide",
+        "visible?",
+        "show ([TARGET])",
+        "hide ([TARGET])",
+        "is ([TARGET]) visible?",
+        "go to [LAYER] layer",
+        "go [DIRECTION] (LAYERS) layers",
+        "go to layer (LAYER)",
+        "go [DIRECTION] ([TARGET])",
+        "layer",
+        "costume [PROPERTY]",
+        "backdrop [PROPERTY]",
+        "size",
+        "#COSTUME MENU",
+        "#BACKDROP MENU",
+        "#COSTUME PROPERTY MENU",
+        "#SHOW/HIDE SPRITE MENU",
+        "#IS SPRITE VISIBLE MENU",
+    ),
+    "sounds": (
+        "play sound ([SOUND]) until done",
+        "play sound ([SOUND]) starting at (SECONDS) seconds until done",
+        "stop sound ([SOUND])",
+        "play all sounds",
+        "stop all sounds",
+        "set fadeout to (SECONDS) seconds on ([SOUND])",
+        "is ([SOUND]) playing?",
+        "length of ([SOUND])?",
+        "change [EFFECT] sound effect by (AMOUNT)",
+        "set [EFFECT] sound effect to (VALUE)",
+        "clear sound effects",
+        "[EFFECT] sound effect",
+        "change volume by (AMOUNT)",
+        "set volume to (VALUE)",
+        "volume",
+        "#SOUND MENU",
+    ),
+    "events": (
+        "when green flag clicked",
+        "when stop clicked",
+        "always",
+        "when <CONDITION>",
+        "when [KEY] key pressed",
+        "when [KEY] key hit",
+        "when mouse is scrolled [DIRECTION]",
+        "when this sprite clicked",
+        "when stage clicked",
+        "when backdrop switches to [BACKDROP]",
+        "when [OPTION] > (VALUE)",
+        "when I receive [MESSAGE]",
+        "broadcast ([MESSAGE])",
+        "broadcast ([MESSAGE]) and wait",
+    ),
+    "control": (
+        "wait (SECONDS) seconds",
+        "wait (SECONDS) seconds or until <CONDITION>",
+        "repeat (TIMES) {BODY}",
+        "forever {BODY}",
+        "for each [VARIABLE] in (RANGE) {BODY}",
+        "escape loop",
+        "continue loop",
+        "switch (CONDITION) {CASES}",
+        "switch (CONDITION) {CASES} default {DEFAULT}",
+        "exit case",
+        "run next case when (CONDITION)",
+        "case (CONDITION) {BODY}",
+        "if <CONDITION> then {THEN}",
+        "if <CONDITION> then {THEN} else {ELSE}",
+        "wait until <CONDITION>",
+        "repeat until <CONDITION> {BODY}",
+        "while <CONDITION> {BODY}",
+        "if <CONDITION> then (TRUEVALUE) else (FALSEVALUE)",
+        "all at once {BODY}",
+        "as ([TARGET]) {BODY}",
+        "try to do {TRY} if a block errors {IFERROR}",
+        "throw error (ERROR)",
+        "error",
+        "run flag",
+        "stop sprite ([TARGET])",
+        "stop script [TARGET]",
+        "when I start as a clone",
+        "create clone of ([TARGET])",
+        "delete clones of ([TARGET])",
+        "delete this clone",
+        "is clone?",
+        "#STOP SPRITE MENU",
+        "#CLONE TARGET MENU",
+        "#RUN AS SPRITE MENU",
+    ),
+    "sensing": (
+        "touching ([OBJECT]) ?",
+        "([OBJECT]) touching ([SPRITE]) ?",
+        "([OBJECT]) touching clone of ([SPRITE]) ?",
+        "touching color (COLOR) ?",
+        "color (COLOR1) is touching color (COLOR2) ?",
+        "[COORDINATE] of touching ([OBJECT]) point",
+        "distance to ([OBJECT])",
+        "distance from (X1) (Y1) to (X2) (Y2)",
+        "direction to (X1) (Y1) from (X2) (Y2)",
+        "ask (QUESTION) and wait",
+        "answer",
+        "(STRING) is text?",
+        "(STRING) is number?",
+        "key ([KEY]) pressed?",
+        "key ([KEY]) hit?",
+        "is mouse scrolling ([DIRECTION]) ?",
+        "mouse down?",
+        "mouse clicked?",
+        "mouse x",
+        "mouse y",
+        "add (TEXT) to clipboard",
+        "clipboard item",
+        "set drag mode [MODE]",
+        "draggable?",
+        "loudness",
+        "loud?",
+        "reset timer",
+        "timer",
+        "set [PROPERTY] of ([TARGET]) to (VALUE)",
+        "[PROPERTY] of ([TARGET])",
+        "current [PROPERTY]",
+        "days since 2000",
+        "mobile?",
+        "finger ([INDEX]) down?",
+        "finger ([INDEX]) tapped?",
+        "finger ([INDEX]) x",
+        "finger ([INDEX]) y",
+        "username",
+        "logged in?",
+        "#TOUCHING OBJECT MENU",
+        "#FULL TOUCHING OBJECT MENU",
+        "#TOUCHING OBJECT MENU SPRITES",
+        "#DISTANCE TO MENU",
+        "#KEY MENU",
+        "#SCROLL DIRECTION MENU",
+        "#OJBECT PROPERTY MENU",
+        "#FINGER INDEX MENU",
+    ),
+    "operators": (
+        "(OPERAND1) + (OPERAND2)",
+        "(OPERAND1) - (OPERAND2)",
+        "(OPERAND1) * (OPERAND2)",
+        "(OPERAND1) / (OPERAND2)",
+        "(OPERAND1) ^ (OPERAND2)",
+        "(OPERAND1) * (OPERAND2) [OPERATION] (OPERAND3)",
+        "(OPERAND1) [OPERATION] (OPERAND2)",
+        "pick random (OPERAND1) to (OPERAND2)",
+        "constrain (NUM) min (MIN) max (MAX)",
+        "interpolate (OPERAND1) to (OPERAND2) by (WEIGHT)",
+        "(OPERAND1) > (OPERAND2)",
+        "(OPERAND1) >= (OPERAND2)",
+        "(OPERAND1) < (OPERAND2)",
+        "(OPERAND1) <= (OPERAND2)",
+        "(OPERAND1) = (OPERAND2)",
+        "(OPERAND1) != (OPERAND2)",
+        "true",
+        "false",
+        "<OPERAND1> and <OPERAND2>",
+        "<OPERAND1> or <OPERAND2>",
+        "not <OPERAND>",
+        "new line",
+        "tab character",
+        "join (STRING1) (STRING2)",
+        "join (STRING1) (STRING2) (STRING3)",
+        "index of (SUBSTRING) in (TEXT)",
+        "last index of (SUBSTRING) in (TEXT)",
+        "letter (LETTER) of (STRING)",
+        "letters from (START) to (STOP) in (TEXT)",
+        "length of (TEXT)",
+        "(TEXT) contains (SUBSTRING) ?",
+        "(TEXT) [OPERATION] with (SUBSTRING) ?",
+        "in (TEXT) replace all (OLDVALUE) with (NEWVALUE)",
+        "in (TEXT) replace first (OLDVALUE) with (NEWVALUE)",
+        "match (TEXT) with regex (REGEX) (MODIFIER)",
+        "(TEXT) to [CASE]",
+        "(OPERAND1) mod (OPERAND2)",
+        "round (NUM)",
+        "[OPERATION] of (NUM)",
+        "(VALUE)",
+        "(VALUE) as a boolean",
+    ),
+    "variables": (
+        "set [VARIABLE] to (VALUE)",
+        "change [VARIABLE] by (VALUE)",
+        "show variable [VARIABLE]",
+        "hide variable [VARIABLE]",
+        "value of [VARIABLE]",
+    ),
+    "lists": (
+        "add (ITEM) to [LIST]",
+        "delete (INDEX) of [LIST]",
+        "delete all of [LIST]",
+        "shift [LIST] by (INDEX)",
+        "insert (ITEM) at (INDEX) of [LIST]",
+        "replace item (INDEX) of [LIST] with (ITEM)",
+        "For each item [VARIABLE] in [LIST] {BODY}",
+        "For each item # [VARIABLE] in [LIST] {BODY}",
+        "item (INDEX) of [LIST]",
+        "item # of (ITEM) in [LIST]",
+        "amount of (VALUE) of [LIST]",
+        "length of [LIST]",
+        "[LIST] contains (ITEM) ?",
+        "item (INDEX) exists in [LIST] ?",
+        "is [LIST] empty?",
+        "reverse [LIST]",
+        "set [LIST] to array (VALUE)",
+        "get list [LIST] as an array",
+        "show list [LIST]",
+        "hide list [LIST]",
+        "value of [LIST]",
+    ),
+    "custom_blocks": (
+        "define custom block",
+        "define custom block reporter",
+        "#CUSTOM BLOCK PROTOTYPE",
+        "call custom block",
+        "return (VALUE)",
+        "set (PARAM) to (VALUE)",
+        "value of text [ARGUMENT]",
+        "value of boolean [ARGUMENT]",
+    ),
+    "pen": (
+        "erase all",
+        "stamp",
+        "set print font to ([FONT])",
+        "set print font size to (SIZE)",
+        "set print font color to (COLOR)",
+        "set print font wheight to (WEIGHT)",
+        "set print font italics to [ON_OFF]",
+        "print (TEXT) on x: (X) y: (Y)",
+        "preload image (URI) as (NAME)",
+        "unload image (NAME)",
+        "draw image (URI) at x: (X) y: (Y)",
+        "draw image (URI) at x: (X) y: (Y) width: (WIDTH) height: (HEIGHT) pointed at: (ROTATE)",
+        "draw image (URI) at x: (X) y: (Y) width: (WIDTH) height: (HEIGHT) cropping from x: (CROPX) y: (CROPY) width: (CROPWIDTH) height: (CROPHEIGHT) pointed at: (ROTATE)",
+        "use (COLOR) to draw a square on x: (X) y: (Y) width: (WIDTH) height: (HEIGHT)",
+        "draw polygon from points (POINTS) with fill (COLOR)",
+        "pen down",
+        "pen up",
+        "set pen color to (COLOR)",
+        "change pen ([PROPERTY]) by (VALUE)",
+        "set pen ([PROPERTY]) to (VALUE)",
+        "change pen size by (SIZE)",
+        "set pen size to (SIZE)",
+        "LEGACY - set pen shade to (SHADE)",
+        "LEGACY - change pen shade by (SHADE)",
+        "LEGACY - set pen color to (HUE)",
+        "LEGACY - change pen color by (HUE)",
+        "#FONT MENU (PEN)",
+        "#PEN PROPERTY MENU",
+    ),
+    "music": (
+        "play drum ([DRUM]) for (BEATS) beats",
+        "rest for (BEATS) beats",
+        "play note ([NOTE]) for (BEATS) beats",
+        "set instrument to ([INSTRUMENT])",
+        "set tempo to (TEMPO)",
+        "change tempo by (TEMPO)",
+        "tempo",
+        "#DRUM MENU",
+        "#NOTE MENU",
+        "#INSTRUMENT MENU",
+    ),
+    "video_sensing": (
+        "when video motion > (THRESHOLD)",
+        "video ([PROPERTY]) on ([TARGET])",
+        "turn video ([VIDEO_STATE])",
+        "set video transparency to (TRANSPARENCY)",
+        "#VIDEO SENSING PROPERTY MENU",
+        "#VIDEO SENSING TARGET MENU",
+        "#VIDEO STATE MENU",
+    ),
+    "text": (
+        "show text (TEXT)",
+        "[ANIMATION_TECHNIQUE] text (TEXT)",
+        "show sprite",
+        "set font to ([FONT])",
+        "set text color to (COLOR)",
+        "set width to (WIDTH) aligned [ALIGN]",
+        "rainbow for (SECONDS) seconds",
+        "add line (TEXT)",
+        "set outline width to (WIDTH)",
+        "set outline color to (COLOR)",
+        "is text visible?",
+        "get width of the text",
+        "get height of the text",
+        "displayed text",
+        "get data uri of last rendered text",
+        "#FONT MENU (TEXT)",
+    ),
+    "text_to_speech": (
+        "speak (TEXT)",
+        "set voice to ([VOICE])",
+        "set language to ([LANGUAGE])",
+        "set reading speed to (SPEED) %",
+        "#TEXT TO SPEECH VOICE MENU",
+        "#TEXT TO SPEECH LANGUAGE MENU",
+    ),
+    "translate": (
+        "translate (TEXT) to ([LANGUAGE])",
+        "language",
+        "#TRANSLATE LANGUAGE MENU",
+    ),
+    "makey_makey": (
+        "when ([MAKEY_KEY]) key pressed",
+        "when ([MAKEY_SEQUENCE]) pressed in order",
+        "is ([MAKEY_KEY]) pressed",
+        "#MAKEY KEY MENU",
+        "#MAKEY SEQUENCE MENU",
+    ),
+    "tw_files": (
+        "open a file as ([MODE])",
+        "open a (EXTENSION) file as ([MODE])",
+        "download ([MODE]) (TEXT) as (FILE)",
+        "set open file selector mode to ([MODE])",
+        "last opened file name",
+        "#READ FILE MODE MENU",
+        "#FILE SELECTOR MODE MENU",
+    ),
+    "json": (
+        "is json (JSON) valid?",
+        "get (KEY) from (JSON)",
+        "get path (PATH) from (JSON)",
+        "set (KEY) to (VALUE) in (JSON)",
+        "in json (JSON) delete key (KEY)",
+        "get all values from json (JSON)",
+        "get all keys from json (JSON)",
+        "json (JSON) has key (KEY) ?",
+        "combine json (JSON1) and json (JSON2)",
+        "is array (ARRAY) valid?",
+        "create an array from text (TEXT) with delimeter (DELIMETER)",
+        "create text from array (ARRAY) with delimeter (DELIMETER)",
+        "in array (ARRAY) add (ITEM)",
+        "add items from array (SOURCEARRAY) to array (TARGETARRAY)",
+        "add items from array (SOURCEARRAY1) and array (SOURCEARRAY2) to array (TARGETARRAY)",
+        "in array (ARRAY) delete (INDEX)",
+        "reverse array (ARRAY)",
+        "in array (ARRAY) insert (VALUE) at (INDEX)",
+        "in array (ARRAY) set (INDEX) to (VALUE)",
+        "in array (ARRAY) get (INDEX)",
+        "in array (ARRAY) get index of (VALUE)",
+        "in array (ARRAY) from (START) get index of (VALUE)",
+        "length of array (ARRAY)",
+        "array (ARRAY) contains (VALUE) ?",
+        "flatten nested array (ARRAY) by (LAYERS) layers",
+        "in array (ARRAY) get all items from (START) to (STOP)",
+        "is array (ARRAY) empty?",
+    ),
+    "bitwise": (
+        "is (NUM) binary?",
+        "(NUM) to binary",
+        "(NUM) to number",
+        "(NUM) >> (BITS)",
+        "(NUM) << (BITS)",
+        "(NUM) >>> (BITS)",
+        "(NUM) >> circular (BITS)",
+        "(NUM) << circular (BITS)",
+        "(OPERAND1) and (OPERAND2)",
+        "(OPERAND1) or (OPERAND2)",
+        "(OPERAND1) xor (OPERAND2)",
+        "not (NUM)",
+    ),
+}
@@ -1,3 +1,5 @@
-from pypenguin.utility.general    import *
-from pypenguin.utility.errors     import *
-from pypenguin.utility.validation import *
+from pypenguin.utility.general      import *
+from pypenguin.utility.errors       import *
+from pypenguin.utility.validation   import *
+from pypenguin.utility.content_hash import *
+from pypenguin.utility.similarity   import *
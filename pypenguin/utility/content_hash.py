@@ -0,0 +1,801 @@
+from dataclasses import fields, is_dataclass
+from enum        import Enum
+from hashlib     import blake2b
+from marshal     import dumps
+from sys         import modules
+from typing      import Any, Callable, Iterable
+from uuid        import UUID
+from weakref     import ref
+
+CONTENT_HASH_SIZE = 16 # bytes
+
+_CACHE_ATTR   = "_content_hash_cache"
+_PARENTS_ATTR = "_content_hash_parents"
+
+class ContentHashMixin:
+    """
+    A mixin for dataclasses, which provides a cached structural content hash (see content_hash).
+    Hashes are computed bottom-up: the hash of a node includes the hashes of its child nodes (like a merkle tree).
+    Lists and dicts assigned to an attribute are replaced by tracked copies, so mutating them in place is noticed.
+    **Mutating the assigned list or dict afterwards does not change the node**, use the attribute instead.
+    Setting an attribute or mutating a tracked list or dict invalidates the hash of the node and of all nodes, whose hash includes it.
+    So a cached hash is always up to date and reused without checking the contents again.
+    Only writing to __dict__ directly bypasses the invalidation
+    """
+
+    def content_hash(self) -> bytes:
+        """
+        Get the structural content hash of a node.
+        Nodes with the same content hash are equal. Values of different types(e.g. True, 1 and 1.0) never have the same content hash.
+        The hash is cached, unless the node contains values, whose mutation can't be noticed(e.g. images).
+        Then it is computed again on every call, but the cached hashes of its child nodes are still reused
+
+        Returns:
+            the content hash
+        """
+        cached = self.__dict__.get(_CACHE_ATTR, None)
+        if cached is not None:
+            return cached[0]
+        return _compute_content_hash(self, {})
+
+    def get_cached_content_hash(self) -> bytes | None:
+        """
+        Get the content hash of a node only if it is already cached. Never computes it.
+        The returned object is replaced whenever the hash is computed again, so it can also be compared by identity
+
+        Returns:
+            the cached content hash or None
+        """
+        cached = self.__dict__.get(_CACHE_ATTR, None)
+        return None if cached is None else cached[0]
+
+    def invalidate_content_hash(self) -> None:
+        """
+        Discard the cached content hash of a node and of all nodes, whose content hash includes it.
+        Only needed after writing to __dict__ directly, other changes invalidate the hash automatically
+
+        Returns:
+            None
+        """
+        # uses an explicit stack, because deeply nested nodes have long chains of parents
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.__dict__.pop(_CACHE_ATTR, None) is None:
+                continue # the hashes of parents can't depend on an uncached hash
+            for parent_ref in _iter_references(node.__dict__.pop(_PARENTS_ATTR, None)):
+                parent = parent_ref()
+                if parent is not None:
+                    stack.append(parent)
+
+    def _get_content_hash_items(self) -> Iterable[tuple[str, Any]]:
+        """
+        *[Internal Method]* Get the named values, which make up the content hash.
+        Defaults to all existing dataclass fields, which are used for comparison.
+        Override this method, if __eq__ is customized.
+        Values derived from lists or dicts of the node must be tuples, see _get_content_hash_dependencies
+
+        Returns:
+            the field names and values
+        """
+        for field in fields(self):
+            if field.compare and hasattr(self, field.name):
+                yield field.name, getattr(self, field.name)
+
+    def _get_content_hash_dependencies(self) -> Iterable[Any]:
+        """
+        *[Internal Method]* Get the lists and dicts of a node, which are not returned by _get_content_hash_items,
+        but which the returned values were derived from. Mutating them invalidates the content hash
+
+        Returns:
+            the lists and dicts
+        """
+        return ()
+
+    def _compare_content_hashes(self, other: "ContentHashMixin") -> bool | None:
+        """
+        *[Internal Method]* Compare two nodes of the same class by their cached content hashes
+
+        Args:
+            other: the other node
+
+        Returns:
+            wether the nodes are equal or None if it can't be decided from the cached hashes
+        """
+        self_cached  = self .__dict__.get(_CACHE_ATTR, None)
+        other_cached = other.__dict__.get(_CACHE_ATTR, None)
+        if (self_cached is None) or (other_cached is None):
+            return None
+        if self_cached[0] == other_cached[0]:
+            return True
+        # e.g. 1 == 1.0, although their hashes differ
+        if self_cached[1] or other_cached[1]:
+            return None
+        return False
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if type(value) in _TRACKED_TYPES:
+            value = _track(value)
+        super().__setattr__(name, value)
+        if _CACHE_ATTR in self.__dict__:
+            self.invalidate_content_hash()
+
+    def __eq__(self, other) -> bool:
+        """
+        Return self == other. Compares the dataclass fields like the generated dataclass __eq__.
+        If both nodes have a cached content hash, the hashes are compared instead
+
+        Args:
+            other: value to compare to
+
+        Returns:
+            self == other
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if self is other:
+            return True
+        is_equal = self._compare_content_hashes(other)
+        if is_equal is not None:
+            return is_equal
+        for name in _get_layout(self.__class__)[1]:
+            self_value  = getattr(self , name)
+            other_value = getattr(other, name)
+            if not((self_value is other_value) or (self_value == other_value)):
+                return False
+        return True
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Exclude the cache from copies and pickles, a copy must not share the parents of the original
+
+        Returns:
+            the state of the object
+        """
+        state = self.__dict__.copy()
+        state.pop(_CACHE_ATTR  , None)
+        state.pop(_PARENTS_ATTR, None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """
+        Restore the state of a copied or unpickled node. Copied lists and dicts are tracked again
+
+        Args:
+            state: the state of the object
+
+        Returns:
+            None
+        """
+        self.__dict__.update({name: _track(value) for name, value in state.items()})
+
+def content_hash(value: Any, known_digests: dict[int, bytes] | None = None) -> bytes:
+    """
+    Compute a stable structural hash of any value composed of dataclasses, containers, enums, numbers etc.
+    Dicts and sets in different order have equal hashes.
+    Values of different types never have equal hashes(e.g. True, 1 and 1.0), so values with equal hashes are also validated equally.
+    UUIDs in dataclass fields with compare=False are ignored.
+    The cached hashes of nodes, which inherit from ContentHashMixin, are reused.
+    Deeply nested nodes are handled with an explicit stack, so they don't hit the recursion limit
+
+    Args:
+        value: the value to hash
+        known_digests: pass the same dict to several calls, so nodes without a cached hash are only hashed once (optional).
+            It maps ids of nodes to their content hashes, so the values must neither change nor be deleted between the calls
+
+    Returns:
+        the content hash
+    """
+    if isinstance(value, ContentHashMixin):
+        cached = value.__dict__.get(_CACHE_ATTR, None)
+        if cached is not None:
+            return cached[0]
+        return _compute_content_hash(value, {} if known_digests is None else known_digests)
+    encoding = []
+    children = []
+    containers = []
+    flags = _convert(value, encoding, children, containers)
+    if known_digests is None:
+        known_digests = {}
+    _hash_children(children, known_digests, 0)
+    return _finish_encoding(None, encoding[0], children, containers, flags, known_digests)
+
+
+def _invalidate_owners(container: "_TrackedList | _TrackedDict") -> None:
+    """
+    *[Internal Function]* Discard the cached content hashes of the nodes containing a tracked container.
+    They register again, when their hash is computed the next time
+
+    Args:
+        container: the tracked list or dict
+
+    Returns:
+        None
+    """
+    owners = container._owners
+    if owners is not None:
+        container._owners = None
+        for owner_ref in _iter_references(owners):
+            owner = owner_ref()
+            if owner is not None:
+                owner.invalidate_content_hash()
+
+def _add_reference(references: "ref | dict[int, ref] | None", node_id: int, node_ref: ref) -> "ref | dict[int, ref]":
+    """
+    *[Internal Function]* Add a weak reference to a node to the parents of a node or the owners of a container.
+    Most have only one, so a single reference is stored until there are several. Removed nodes are not kept alive
+
+    Args:
+        references: the weak reference, the weak references by the id of their node or None
+        node_id: the id of the node. Nodes are unhashable, so they are identified by id
+        node_ref: the weak reference to the node
+
+    Returns:
+        the updated references
+    """
+    if references is None:
+        return node_ref
+    elif type(references) is dict:
+        references[node_id] = node_ref
+        return references
+    other_node = references()
+    if (other_node is None) or (id(other_node) == node_id):
+        return node_ref
+    return {id(other_node): references, node_id: node_ref}
+
+def _iter_references(references: "ref | dict[int, ref] | None") -> Iterable[ref]:
+    """
+    *[Internal Function]* Get the weak references stored by _add_reference
+
+    Args:
+        references: the stored references
+
+    Returns:
+        the weak references
+    """
+    if references is None:
+        return ()
+    elif type(references) is dict:
+        return references.values()
+    return (references,)
+
+class _TrackedList(list):
+    """
+    *[Internal Class]* A list stored in a node. Mutating it invalidates the content hashes of the nodes containing it.
+    Copies and pickles are plain lists
+    """
+    __slots__ = ("_owners",)
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        super().__init__(items)
+        self._owners: dict[int, ref] | None = None
+
+    def __setitem__(self, index, value) -> None:
+        _invalidate_owners(self)
+        if isinstance(index, slice):
+            value = [_track(item) for item in value]
+        else:
+            value = _track(value)
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index) -> None:
+        _invalidate_owners(self)
+        super().__delitem__(index)
+
+    def __iadd__(self, items: Iterable[Any]) -> "_TrackedList":
+        _invalidate_owners(self)
+        return super().__iadd__([_track(item) for item in items])
+
+    def __imul__(self, count: int) -> "_TrackedList":
+        _invalidate_owners(self)
+        return super().__imul__(count)
+
+    def append(self, item: Any) -> None:
+        _invalidate_owners(self)
+        super().append(_track(item))
+
+    def extend(self, items: Iterable[Any]) -> None:
+        _invalidate_owners(self)
+        super().extend([_track(item) for item in items])
+
+    def insert(self, index: int, item: Any) -> None:
+        _invalidate_owners(self)
+        super().insert(index, _track(item))
+
+    def pop(self, index: int = -1) -> Any:
+        _invalidate_owners(self)
+        return super().pop(index)
+
+    def remove(self, item: Any) -> None:
+        _invalidate_owners(self)
+        super().remove(item)
+
+    def clear(self) -> None:
+        _invalidate_owners(self)
+        super().clear()
+
+    def sort(self, *, key=None, reverse: bool = False) -> None:
+        _invalidate_owners(self)
+        super().sort(key=key, reverse=reverse)
+
+    def reverse(self) -> None:
+        _invalidate_owners(self)
+        super().reverse()
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        return (list, (list(self),))
+
+class _TrackedDict(dict):
+    """
+    *[Internal Class]* A dict stored in a node. Mutating it invalidates the content hashes of the nodes containing it.
+    Copies and pickles are plain dicts
+    """
+    __slots__ = ("_owners",)
+
+    def __init__(self, items: dict[Any, Any] | None = None) -> None:
+        super().__init__(() if items is None else items)
+        self._owners: dict[int, ref] | None = None
+
+    def __setitem__(self, key, value) -> None:
+        _invalidate_owners(self)
+        super().__setitem__(key, _track(value))
+
+    def __delitem__(self, key) -> None:
+        _invalidate_owners(self)
+        super().__delitem__(key)
+
+    def __ior__(self, items) -> "_TrackedDict":
+        self.update(items)
+        return self
+
+    def pop(self, key, *default) -> Any:
+        _invalidate_owners(self)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[Any, Any]:
+        _invalidate_owners(self)
+        return super().popitem()
+
+    def clear(self) -> None:
+        _invalidate_owners(self)
+        super().clear()
+
+    def update(self, *args, **kwargs) -> None:
+        _invalidate_owners(self)
+        super().update({key: _track(value) for key, value in dict(*args, **kwargs).items()})
+
+    def setdefault(self, key, default=None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return self[key]
+
+    def __reduce_ex__(self, protocol: int) -> tuple:
+        return (dict, (dict(self),))
+
+def _track(value: Any) -> Any:
+    """
+    *[Internal Function]* Replace a plain list or dict by a tracked copy. Nested lists and dicts are replaced too,
+    but not the ones inside tuples or other values
+
+    Args:
+        value: the value to store in a node
+
+    Returns:
+        the tracked copy or the value itself
+    """
+    value_type = type(value)
+    if value_type is list:
+        return _TrackedList(map(_track, value))
+    elif value_type is dict:
+        return _TrackedDict({key: _track(item) for key, item in value.items()})
+    return value
+
+_TRACKED_TYPES = frozenset({list, dict})
+
+
+class _Missing:
+    """
+    *[Internal Class]* Marks a dataclass field, which wasn't set
+    """
+    __slots__ = ()
+
+_MISSING = _Missing()
+
+# Values are converted to a canonical structure of these types, which is serialized with marshal.
+# Version 2 never depends on object identity(e.g. references or interned strings), so equal structures give equal bytes
+_PLAIN_TYPES = frozenset({str, type(None), int, bytes})
+# Values of these types can be equal to values of other types(e.g. True == 1 == 1.0), although their content hashes differ
+_AMBIGUOUS_TYPES = frozenset({bool, float, complex})
+_MARSHAL_VERSION = 2
+
+# Flags of an encoding, combined with |
+_UNPROVABLE = 1 # a mutation of the values might not invalidate the cached hash
+_AMBIGUOUS  = 2 # the values might be equal to values of other types e.g. 1 == 1.0
+
+# Nodes nested deeper are hashed with an explicit stack instead of recursion
+_MAX_RECURSION_DEPTH = 64
+
+# Every other value is converted to a tuple, which starts with one of these tags. 
+# So plain values, child nodes(a list with their content hash, see _convert) and other values never have equal encodings
+_MISSING_TAG   = b"M"
+_LIST_TAG      = b"L"
+_TUPLE_TAG     = b"T"
+_DICT_TAG      = b"D"
+_SET_TAG       = b"Z"
+_UUID_TAG      = b"U"
+_ENUM_TAG      = b"E"
+_DATACLASS_TAG = b"C"
+_BYTEARRAY_TAG = b"A"
+_ELEMENT_TAG   = b"X"
+_IMAGE_TAG     = b"P"
+_REPR_TAG      = b"R"
+
+_MISSING_PART    = (_MISSING_TAG,)
+_EMPTY_DICT_PART = (_DICT_TAG,)
+
+def _get_element_types() -> tuple[type, ...]:
+    """
+    *[Internal Function]* Get the XML element type, without importing the slow ElementTree module.
+    An element can only exist once ElementTree was imported
+
+    Returns:
+        a tuple of the element type or an empty tuple if ElementTree wasn't imported yet
+    """
+    element_tree = modules.get("xml.etree.ElementTree", None)
+    return () if element_tree is None else (element_tree.Element,)
+
+def _get_qualified_name(cls: type) -> str:
+    """
+    *[Internal Function]* Get the name of a class including its module
+
+    Args:
+        cls: the class
+
+    Returns:
+        the qualified name
+    """
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+_layouts: dict[type, tuple[str, tuple[str, ...]]] = {}
+
+def _get_layout(cls: type) -> tuple[str, tuple[str, ...]]:
+    """
+    *[Internal Function]* Get the qualified class name and the names of the compared fields of a dataclass. 
+    They are computed once per class. The class name also determines the fields, so their names aren't encoded
+
+    Args:
+        cls: the dataclass
+
+    Returns:
+        the qualified class name and the names of the compared fields
+    """
+    layout = _layouts.get(cls, None)
+    if layout is None:
+        layout = (_get_qualified_name(cls), tuple(field.name for field in fields(cls) if field.compare))
+        _layouts[cls] = layout
+    return layout
+
+# by class and name, because members of different IntEnums can be equal
+_enum_parts: dict[tuple[type, str], tuple[tuple[bytes, str, str], int]] = {}
+
+def _convert(value: Any, out: list[Any], children: list[list[Any]], containers: list[Any]) -> int:
+    """
+    *[Internal Function]* Convert a value to its canonical encoding and add it to a list. 
+    The exact type is part of the encoding, so e.g. True, 1 and 1.0 are encoded differently.
+    A child node is encoded as a list, which only contains the node itself. 
+    Its content hash replaces it later(see _finish_encoding)
+
+    Args:
+        value: the value to convert
+        out: the list to add the encoding to
+        children: the encodings of the child nodes. New ones are added
+        containers: the tracked lists and dicts. New ones are added
+
+    Returns:
+        the flags of the encoding
+    """
+    value_type = type(value)
+    if value_type in _PLAIN_TYPES:
+        out.append(value)
+        return 0
+    elif value is _MISSING:
+        out.append(_MISSING_PART)
+        return 0
+    elif isinstance(value, ContentHashMixin):
+        placeholder = [value]
+        children.append(placeholder)
+        out.append(placeholder)
+        return 0
+    elif value_type in _AMBIGUOUS_TYPES:
+        out.append(value)
+        # NaN isn't even equal to itself
+        return _AMBIGUOUS if value == value else (_AMBIGUOUS | _UNPROVABLE)
+
+    flags = 0
+    if (value_type is _TrackedList) or (value_type is _TrackedDict):
+        containers.append(value)
+    elif isinstance(value, (list, dict, set)):
+        flags = _UNPROVABLE # mutating it wouldn't invalidate the cached hash
+    if isinstance(value, (list, tuple)):
+        items = [_LIST_TAG if isinstance(value, list) else _TUPLE_TAG]
+        for item in value:
+            if type(item) in _PLAIN_TYPES:
+                items.append(item)
+            else:
+                flags |= _convert(item, items, children, containers)
+        out.append(tuple(items))
+    elif isinstance(value, dict):
+        items = [_DICT_TAG]
+        try:
+            # the keys of a dict are unequal, so sorting the items only compares the keys and defines a canonical order
+            sorted_items = sorted(value.items())
+        except TypeError: # e.g. enums can't be sorted, but their encodings can
+            sorted_items = sorted(value.items(), key=lambda item: _encode_key(item[0])[0])
+        for key, item in sorted_items:
+            flags |= _convert(key, items, children, containers)
+            if type(item) in _PLAIN_TYPES:
+                items.append(item)
+            else:
+                flags |= _convert(item, items, children, containers)
+        out.append(tuple(items))
+    elif isinstance(value, (set, frozenset)):
+        encoded_items = []
+        for item in value:
+            encoded_item, item_flags = _encode_key(item)
+            flags |= item_flags
+            encoded_items.append(encoded_item)
+        encoded_items.sort()
+        out.append((_SET_TAG, *encoded_items))
+    elif isinstance(value, Enum):
+        enum_key = (value_type, value._name_)
+        enum_part = _enum_parts.get(enum_key, None)
+        if enum_part is None:
+            # e.g. an IntEnum equals an int
+            enum_part = (
+                (_ENUM_TAG, _get_qualified_name(value_type), value.name), 
+                0 if value_type._member_type_ is object else _AMBIGUOUS,
+            )
+            _enum_parts[enum_key] = enum_part
+        out.append(enum_part[0])
+        flags |= enum_part[1]
+    elif value_type is UUID:
+        out.append((_UUID_TAG, value.bytes))
+    elif is_dataclass(value) and not isinstance(value, type):
+        if not value_type.__dataclass_params__.frozen:
+            flags |= _UNPROVABLE
+        qualified_name, names = _get_layout(value_type)
+        items = [_DATACLASS_TAG, qualified_name]
+        for name in names:
+            flags |= _convert(getattr(value, name, _MISSING), items, children, containers)
+        out.append(tuple(items))
+    else:
+        flags |= _UNPROVABLE # the other values might be mutable
+        if value_type is bytearray:
+            out.append((_BYTEARRAY_TAG, bytes(value)))
+        elif isinstance(value, _get_element_types()):
+            out.append((_ELEMENT_TAG, modules["xml.etree.ElementTree"].tostring(value)))
+        elif hasattr(value, "tobytes") and hasattr(value, "mode") and hasattr(value, "size"):
+            # e.g. PIL images, which compare by mode, size and pixel data
+            out.append((_IMAGE_TAG, str(value.mode), repr(value.size), value.tobytes()))
+        else:
+            out.append((_REPR_TAG, _get_qualified_name(value_type), repr(value)))
+    return flags
+
+def _encode_key(key: Any) -> tuple[bytes, int]:
+    """
+    *[Internal Function]* Encode a dict key or set item on its own, so it can be sorted. Hashable values never contain nodes
+
+    Args:
+        key: the key or item
+
+    Returns:
+        the encoding of the key and its flags
+    """
+    out = []
+    flags = _convert(key, out, [], [])
+    return dumps(out[0], _MARSHAL_VERSION), flags
+
+# The encoding of one field value in a compiled node encoder, with inline cases for the most common values
+_FIELD_ENCODER_TEMPLATE = """
+    value = get({name!r}, _MISSING)
+    if type(value) in _PLAIN_TYPES:
+        encoding.append(value)
+    elif value is _MISSING:
+        encoding.append(_MISSING_PART)
+    elif isinstance(value, ContentHashMixin):
+        placeholder = [value]
+        children.append(placeholder)
+        encoding.append(placeholder)
+    elif (type(value) is _TrackedDict) and not value:
+        containers.append(value)
+        encoding.append(_EMPTY_DICT_PART)
+    else:
+        flags |= _convert(value, encoding, children, containers)"""
+
+def _compile_node_encoder(cls: type) -> Callable[[Any], tuple[list[Any], list[list[Any]], list[Any], int]]:
+    """
+    *[Internal Function]* Compile a specialized function, which encodes the fields of a node class like _convert.
+    The loop over the fields is unrolled and the most common values are handled inline
+
+    Args:
+        cls: the node class, which uses the default content hash items
+
+    Returns:
+        the function, which returns the encoding, the encodings of the child nodes, the tracked containers and the flags
+    """
+    qualified_name, names = _get_layout(cls)
+    namespace = {
+        "_MISSING": _MISSING, "_PLAIN_TYPES": _PLAIN_TYPES, "_TrackedDict": _TrackedDict, "ContentHashMixin": ContentHashMixin,
+        "_convert": _convert, "_MISSING_PART": _MISSING_PART, "_EMPTY_DICT_PART": _EMPTY_DICT_PART, "qualified_name": qualified_name,
+    }
+    lines = [
+        "def encode_node(node):",
+        "    get = node.__dict__.get",
+        "    encoding = [qualified_name]",
+        "    children = []",
+        "    containers = []",
+        "    flags = 0",
+    ]
+    lines.extend(_FIELD_ENCODER_TEMPLATE.format(name=name) for name in names)
+    lines.append("    return encoding, children, containers, flags")
+    exec("\n".join(lines), namespace)
+    return namespace["encode_node"]
+
+_node_encoders: dict[type, Callable[[Any], tuple[list[Any], list[list[Any]], list[Any], int]]] = {}
+
+def _encode_node(node: ContentHashMixin) -> tuple[list[Any], list[list[Any]], list[Any], int]:
+    """
+    *[Internal Function]* Encode the values of a node, without the content hashes of its child nodes
+
+    Args:
+        node: the node
+
+    Returns:
+        the encoding, the encodings of the child nodes, the tracked containers and the flags
+    """
+    node_class = node.__class__
+    encoder = _node_encoders.get(node_class, None)
+    if encoder is not None:
+        return encoder(node)
+    if node_class._get_content_hash_items is ContentHashMixin._get_content_hash_items:
+        encoder = _node_encoders[node_class] = _compile_node_encoder(node_class)
+        return encoder(node)
+
+    # the names are encoded too, because the items might differ between nodes of the class
+    encoding = [_get_qualified_name(node_class)]
+    children = []
+    containers = []
+    flags = 0
+    for name, value in node._get_content_hash_items():
+        encoding.append(name)
+        flags |= _convert(value, encoding, children, containers)
+    for dependency in node._get_content_hash_dependencies():
+        if type(dependency) in (_TrackedList, _TrackedDict):
+            containers.append(dependency)
+        else:
+            flags |= _UNPROVABLE
+    return encoding, children, containers, flags
+
+def _finish_encoding(
+    node: ContentHashMixin | None, encoding: Any, children: list[list[Any]], 
+    containers: list[Any], flags: int, known_digests: dict[int, bytes],
+) -> bytes:
+    """
+    *[Internal Function]* Fill in the content hashes of the child nodes and compute the content hash of a node or value.
+    The hash of a node is cached, if every mutation of its values and child nodes invalidates it.
+    So a cached node only contains nodes with a cached hash
+
+    Args:
+        node: the node or None for other values
+        encoding: the encoding of the node or value
+        children: the encodings of the child nodes, which must already be hashed
+        containers: the tracked lists and dicts
+        flags: the flags of the encoding
+        known_digests: the content hashes of the nodes without a cached hash, which were already hashed
+
+    Returns:
+        the content hash
+    """
+    if node is None:
+        flags |= _UNPROVABLE
+    child_nodes = []
+    for placeholder in children:
+        child = placeholder[0]
+        child_nodes.append(child)
+        cached = child.__dict__.get(_CACHE_ATTR, None)
+        if cached is None:
+            flags |= _UNPROVABLE
+            placeholder[0] = known_digests[id(child)]
+        else:
+            placeholder[0] = cached[0]
+            if cached[1]:
+                flags |= _AMBIGUOUS
+    digest = blake2b(dumps(encoding, _MARSHAL_VERSION), digest_size=CONTENT_HASH_SIZE).digest()
+    if flags & _UNPROVABLE:
+        if node is not None:
+            known_digests[id(node)] = digest
+        return digest
+
+    node_id = id(node)
+    node_ref = ref(node)
+    for child in child_nodes:
+        child_dict = child.__dict__
+        child_dict[_PARENTS_ATTR] = _add_reference(child_dict.get(_PARENTS_ATTR, None), node_id, node_ref)
+    for container in containers:
+        container._owners = _add_reference(container._owners, node_id, node_ref)
+    node.__dict__[_CACHE_ATTR] = (digest, bool(flags & _AMBIGUOUS))
+    return digest
+
+def _hash_children(children: list[list[Any]], known_digests: dict[int, bytes], depth: int) -> None:
+    """
+    *[Internal Function]* Compute the content hashes of child nodes, which have no cached or known hash yet.
+    Recurses up to a fixed depth, deeper nodes are hashed with an explicit stack(see _hash_nodes)
+
+    Args:
+        children: the encodings of the child nodes
+        known_digests: the content hashes of the nodes without a cached hash, which were already hashed. New ones are added
+        depth: the depth of the child nodes
+
+    Returns:
+        None
+    """
+    for placeholder in children:
+        child = placeholder[0]
+        if (_CACHE_ATTR in child.__dict__) or (id(child) in known_digests):
+            continue # e.g. a node contained twice
+        if depth >= _MAX_RECURSION_DEPTH:
+            _hash_nodes([child], known_digests)
+            continue
+        encoding, grandchildren, containers, flags = _encode_node(child)
+        if grandchildren:
+            _hash_children(grandchildren, known_digests, depth + 1)
+        _finish_encoding(child, encoding, grandchildren, containers, flags, known_digests)
+
+def _hash_nodes(nodes: list[ContentHashMixin], known_digests: dict[int, bytes]) -> None:
+    """
+    *[Internal Function]* Compute the content hashes of nodes and their child nodes with an explicit stack, 
+    so deeply nested nodes don't hit the recursion limit.
+    Nodes with a cached or known hash are not encoded again. Each node is hashed after its child nodes(bottom-up)
+
+    Args:
+        nodes: the nodes to hash
+        known_digests: the content hashes of the nodes without a cached hash, which were already hashed. New ones are added
+
+    Returns:
+        None
+    """
+    stack: list[tuple[ContentHashMixin, tuple | None]] = [(node, None) for node in nodes]
+    while stack:
+        node, node_encoding = stack.pop()
+        if node_encoding is None:
+            if (_CACHE_ATTR in node.__dict__) or (id(node) in known_digests):
+                continue
+            node_encoding = _encode_node(node)
+            pending = [
+                (placeholder[0], None) for placeholder in node_encoding[1]
+                if (_CACHE_ATTR not in placeholder[0].__dict__) and (id(placeholder[0]) not in known_digests)
+            ]
+            if pending:
+                stack.append((node, node_encoding))
+                stack.extend(pending)
+                continue
+        _finish_encoding(node, *node_encoding, known_digests)
+
+def _compute_content_hash(node: ContentHashMixin, known_digests: dict[int, bytes]) -> bytes:
+    """
+    *[Internal Function]* Compute the content hash of a node without a cached hash
+
+    Args:
+        node: the node
+        known_digests: the content hashes of the nodes without a cached hash, which were already hashed. New ones are added
+
+    Returns:
+        the content hash
+    """
+    _hash_children([[node]], known_digests, 0)
+    cached = node.__dict__.get(_CACHE_ATTR, None)
+    return known_digests[id(node)] if cached is None else cached[0]
+
+
+__all__ = ["CONTENT_HASH_SIZE", "ContentHashMixin", "content_hash"]
@@ -17,6 +17,7 @@ class ThanksError(PypenguinError):
 class OpcodeInfoError(PypenguinError): pass
 class UnknownOpcodeError(OpcodeInfoError): pass
 class SameOpcodeTwiceError(OpcodeInfoError): pass
+class FrozenOpcodeInfoError(OpcodeInfoError): pass
 
 ###############################################################
 #                  ERRORS FOR DESERIALIZATION                 #
@@ -35,6 +36,12 @@ class FirstToSecondConversionError(ConversionError): pass
 class FirstToInterConversionError(FirstToSecondConversionError): pass
 class InterToSecondConversionError(FirstToSecondConversionError): pass
 
+###############################################################
+#                  ERRORS FOR DIFFS AND PATCHES               #
+###############################################################
+
+class PatchError(PypenguinError): pass
+
 ###############################################################
 #                    ERRORS FOR VALIDATION                    #
 ###############################################################
@@ -55,6 +62,10 @@ class ValidationError(PypenguinError): pass
 
 class PathValidationError(ValidationError):
     def __init__(self, path: list, msg: str, condition: str|None = None) -> None:
+        path = list(path) # materializes lazy paths(see PathNode)
+        self.path      = path
+        self.msg       = msg
+        self.condition = condition
         path_string = _generate_path_string(path)
         full_message = ""
         if path_string != "":
@@ -64,6 +75,10 @@ class PathValidationError(ValidationError):
         full_message += msg
         super().__init__(full_message)
     
+    def __reduce__(self):
+        # the default implementation would call __init__ with the full message only
+        return (self.__class__, (self.path, self.msg, self.condition))
+    
 class TypeValidationError(PathValidationError): pass
 class InvalidValueError(PathValidationError): pass
 class RangeValidationError(PathValidationError): pass
@@ -80,8 +95,25 @@ class InvalidBlockShapeError(PathValidationError): pass
 
 class SpriteLayerStackError(PathValidationError): pass
 
+###############################################################
+#            ERRORS FOR PRE-VALIDATION OF RAW DATA            #
+###############################################################
+
+class RawDataError(PathValidationError): pass
+class RawMissingKeyError(RawDataError): pass
+class RawTypeError(RawDataError): pass
+class RawReferenceError(RawDataError): pass
+class RawOpcodeError(RawDataError): pass
+class RawMutationError(RawDataError): pass
+
 class SameValueTwiceError(ValidationError):
     def __init__(self, path1: list, path2: list, msg: str, condition: str|None = None) -> None:
+        path1 = list(path1) # materializes lazy paths(see PathNode)
+        path2 = list(path2)
+        self.path1     = path1
+        self.path2     = path2
+        self.msg       = msg
+        self.condition = condition
         path1_string = _generate_path_string(path1)
         path2_string = _generate_path_string(path2)
         full_message = f"At {path1_string} and {path2_string}: "
@@ -89,18 +121,22 @@ class SameValueTwiceError(ValidationError):
             full_message += f"{condition}: "
         full_message += msg
         super().__init__(full_message)
+    
+    def __reduce__(self):
+        return (self.__class__, (self.path1, self.path2, self.msg, self.condition))
 
 
 
 __all__ = [
-    "PypenguinError", "BlameDevsError", "ThanksError", 
-    "OpcodeInfoError", "UnknownOpcodeError", "SameOpcodeTwiceError", 
+    "PypenguinError", "BlameDevsError", "PathError", "ThanksError", 
+    "OpcodeInfoError", "UnknownOpcodeError", "SameOpcodeTwiceError", "FrozenOpcodeInfoError", 
     "DeserializationError", "ConversionError", "FirstToSecondConversionError",
-    "FirstToInterConversionError", "InterToSecondConversionError", 
+    "FirstToInterConversionError", "InterToSecondConversionError", "PatchError",
     "ValidationError", "PathValidationError", "TypeValidationError", "InvalidValueError",
     "RangeValidationError", "MissingInputError", "UnnecessaryInputError", 
     "MissingDropdownError", "UnnecessaryDropdownError", "InvalidDropdownValueError", 
     "InvalidOpcodeError", "InvalidBlockShapeError", "SpriteLayerStackError", 
-    "SameValueTwiceError",
+    "SameValueTwiceError", "RawDataError", "RawMissingKeyError", "RawTypeError", 
+    "RawReferenceError", "RawOpcodeError", "RawMutationError",
 ]
 
@@ -1,8 +1,136 @@
 # Utility functions
 
-def grepr(obj, annotate_fields=True, include_attributes=False, *, indent=4):
-    def _grepr(obj, level=0):
-        is_compatible = bool(getattr(obj, "_grepr", False))
+from io        import StringIO
+from itertools import islice
+from typing    import Any, Iterator, TextIO
+
+def grepr(obj, annotate_fields=True, include_attributes=False, *, indent=4, 
+        max_depth: int | None = None, max_items: int | None = None, max_chars: int | None = None,
+    ) -> str:
+    """
+    Get a good, human readable representation of an object. 
+    Lists, tuples, dicts, DualKeyDicts and grepr dataclasses(see grepr_dataclass) are displayed nested and indented.
+    The limits allow bounded summaries, e.g. SRSprite(name="Player", scripts=[…42 items]) (also see grepr_summary)
+    
+    Args:
+        obj: the object to represent
+        annotate_fields: wether to show the field names of grepr dataclasses
+        include_attributes: wether to also show the _attributes of grepr dataclasses
+        indent: the indentation per level as a string or an amount of spaces. None puts everything on one line
+        max_depth: the amount of nesting levels to show, deeper objects are elided except for containers of plain values (optional)
+        max_items: the maximum amount of items to show per list, tuple, dict and DualKeyDict (optional)
+        max_chars: the representation is cut off after this many characters, followed by "…" (optional)
+    
+    Returns:
+        the representation
+    """
+    is_compatible = bool(getattr(obj, "_grepr", False))
+    if not(is_compatible) and not(isinstance(obj, (list, tuple, dict, str, DualKeyDict))):
+        string = repr(obj)
+        if (max_chars is not None) and (len(string) > max_chars):
+            string = string[:max_chars] + "…"
+        return string
+    stream = StringIO()
+    grepr_to(obj, stream, annotate_fields, include_attributes, indent=indent, 
+        max_depth=max_depth, max_items=max_items, max_chars=max_chars,
+    )
+    return stream.getvalue()
+
+def grepr_to(obj, stream: TextIO, annotate_fields=True, include_attributes=False, *, indent=4, 
+        max_depth: int | None = None, max_items: int | None = None, max_chars: int | None = None,
+    ) -> None:
+    """
+    Write the representation of grepr to a file-like stream piece by piece instead of building it in memory. 
+    Nested objects are handled with an explicit stack, so deeply nested objects don't hit the recursion limit
+    
+    Args:
+        obj: the object to represent
+        stream: the text stream to write to (only its write method is used)
+        annotate_fields: wether to show the field names of grepr dataclasses
+        include_attributes: wether to also show the _attributes of grepr dataclasses
+        indent: the indentation per level as a string or an amount of spaces. None puts everything on one line
+        max_depth: the amount of nesting levels to show, deeper objects are elided except for containers of plain values (optional)
+        max_items: the maximum amount of items to show per list, tuple, dict and DualKeyDict (optional)
+        max_chars: writing stops after this many characters, followed by "…" (optional)
+    
+    Returns:
+        None
+    """
+    if indent is not None and not isinstance(indent, str):
+        indent = ' ' * indent
+
+    def _get_args(obj) -> list[tuple[str | None, Any]]:
+        # the (name, value) pairs to show for a grepr dataclass. The name is None if it isn't shown
+        cls = type(obj)
+        args = []
+        for name in obj._grepr_fields:
+            if not hasattr(obj, name):
+                continue
+            args.append((name if annotate_fields else None, getattr(obj, name)))
+        if include_attributes and obj._attributes:
+            for name in obj._attributes:
+                try:
+                    value = getattr(obj, name)
+                except AttributeError:
+                    continue
+                if value is None and getattr(cls, name, ...) is None:
+                    continue
+                args.append((name, value))
+        return args
+
+    def _is_leaf(obj) -> bool:
+        return not(isinstance(obj, (list, tuple, dict, DualKeyDict)) or getattr(obj, "_grepr", False))
+
+    def _is_elided(obj, depth: int) -> bool:
+        # containers of plain values, like coordinate pairs, are still shown at max_depth
+        if (max_depth is None) or (depth < max_depth):
+            return False
+        if isinstance(obj, (list, tuple)):
+            return not all(_is_leaf(item) for item in islice(obj, max_items))
+        elif isinstance(obj, dict):
+            return not all(_is_leaf(key) and _is_leaf(value) for key, value in islice(obj.items(), max_items))
+        return True
+
+    def _is_simple(obj, depth: int) -> bool:
+        # wether the representation of obj never spans multiple lines
+        if isinstance(obj, (list, tuple, dict, DualKeyDict)):
+            return (not obj) or _is_elided(obj, depth)
+        elif isinstance(obj, str):
+            return True
+        elif getattr(obj, "_grepr", False):
+            return _is_elided(obj, depth) or not _get_args(obj)
+        return True
+
+    def _count_items(count: int, adjective: str = "") -> str:
+        return f"{count} {adjective}item" if count == 1 else f"{count} {adjective}items"
+
+    def _get_elided(obj) -> str:
+        # a one line placeholder for an object deeper than max_depth
+        if isinstance(obj, (list, tuple, dict, DualKeyDict)):
+            if   isinstance(obj, list):
+                start, end = '[', ']'
+            elif isinstance(obj, tuple):
+                start, end = '(', ')'
+            elif isinstance(obj, dict):
+                start, end = '{', '}'
+            else:
+                start, end = 'DKD{', '}'
+            return (start + end) if not obj else f"{start}…{_count_items(len(obj))}{end}"
+        class_name = getattr(obj, "_grepr_class_name", obj.__class__.__name__)
+        return f"{class_name}(…)" if _get_args(obj) else f"{class_name}()"
+
+    def _get_step(obj, level: int, depth: int) -> "str | Iterator":
+        # leaves are represented directly, everything else gets a generator of steps
+        if isinstance(obj, str):
+            return f'"{obj.replace('"', '\\"')}"'
+        elif isinstance(obj, (list, tuple, dict, DualKeyDict)) or getattr(obj, "_grepr", False):
+            if _is_elided(obj, depth):
+                return _get_elided(obj)
+            return _steps(obj, level, depth)
+        return repr(obj)
+
+    def _steps(obj, level: int, depth: int) -> Iterator:
+        # yields the pieces of the representation: strings to write and steps of nested objects
         if indent is not None:
             level += 1
             prefix = '\n' + indent * level
@@ -12,72 +140,124 @@ def grepr(obj, annotate_fields=True, include_attributes=False, *, indent=4):
             prefix = ''
             sep = ', '
             end_sep = ""
-        if isinstance(obj, list):
-            if not obj:
-                return '[]', True
-            return '[%s%s%s]' % (prefix, sep.join(_grepr(x, level)[0] for x in obj), end_sep), False
-        if isinstance(obj, tuple):
+        depth += 1
+        if isinstance(obj, (list, tuple, dict, DualKeyDict)) and (max_items is not None) and (len(obj) > max_items):
+            hidden_items = f"…{_count_items(len(obj) - max_items, 'more ')}"
+        else:
+            hidden_items = None
+        
+        if isinstance(obj, list) or (isinstance(obj, tuple) and len(obj) > 2):
+            start, end = ('[', ']') if isinstance(obj, list) else ('(', ')')
             if not obj:
-                return '()', True
-            if len(obj) <= 2:
-                return '(%s)' % (", ".join(_grepr(x, level)[0] for x in obj)), False
-            else:
-                return '(%s%s%s)' % (prefix, sep.join(_grepr(x, level)[0] for x in obj), end_sep), False
+                yield start + end
+                return
+            yield start + prefix
+            for i, item in enumerate(obj):
+                if i == max_items:
+                    break
+                if i:
+                    yield sep
+                yield _get_step(item, level, depth)
+            if hidden_items is not None:
+                yield (sep if max_items else '') + hidden_items
+            yield end_sep + end
+        elif isinstance(obj, tuple):
+            yield '('
+            for i, item in enumerate(obj):
+                if i == max_items:
+                    break
+                if i:
+                    yield ", "
+                yield _get_step(item, level, depth)
+            if hidden_items is not None:
+                yield (", " if max_items else '') + hidden_items
+            yield ')'
         elif isinstance(obj, dict):
             if not obj:
-                return '{}', True
-            args = [f'{_grepr(key, level)[0]}: {_grepr(value, level)[0]}' for key,value in obj.copy().items()]    
-            return '{%s%s%s}' % (prefix, sep.join(args), end_sep), False
-        elif isinstance(obj, str):
-            return f'"{obj.replace('"', '\\"')}"', True
+                yield '{}'
+                return
+            yield '{' + prefix
+            for i, (key, value) in enumerate(obj.items()):
+                if i == max_items:
+                    break
+                if i:
+                    yield sep
+                yield _get_step(key, level, depth)
+                yield ": "
+                yield _get_step(value, level, depth)
+            if hidden_items is not None:
+                yield (sep if max_items else '') + hidden_items
+            yield end_sep + '}'
         elif isinstance(obj, DualKeyDict):
             if not obj:
-                return 'DKD{}', True
-            args = []
-            for key1, key2, value in obj.items_key1_key2():
-                key1_str, _ = _grepr(key1, level)
-                key2_str, _ = _grepr(key2, level)
-                value_str, _ = _grepr(value, level)
-                args.append(f'{key1_str} / {key2_str}: {value_str}')
-            return 'DKD{%s%s%s}' % (prefix, sep.join(args), end_sep), False
-        elif is_compatible:
-            cls = type(obj)
-            args = []
-            allsimple = True
-            keywords = annotate_fields
-            for name in obj._grepr_fields:
-                if not hasattr(obj, name):
-                    continue
-                value = getattr(obj, name)
-                value, simple = _grepr(value, level)
-                allsimple = allsimple and simple
-                if keywords:
-                    args.append('%s=%s' % (name, value))
-                else:
-                    args.append(value)
-            if include_attributes and obj._attributes:
-                for name in obj._attributes:
-                    try:
-                        value = getattr(obj, name)
-                    except AttributeError:
-                        continue
-                    if value is None and getattr(cls, name, ...) is None:
-                        continue
-                    value, simple = _grepr(value, level)
-                    allsimple = allsimple and simple
-                    args.append('%s=%s' % (name, value))
+                yield 'DKD{}'
+                return
+            yield 'DKD{' + prefix
+            for i, (key1, key2, value) in enumerate(obj.items_key1_key2()):
+                if i == max_items:
+                    break
+                if i:
+                    yield sep
+                yield _get_step(key1, level, depth)
+                yield " / "
+                yield _get_step(key2, level, depth)
+                yield ": "
+                yield _get_step(value, level, depth)
+            if hidden_items is not None:
+                yield (sep if max_items else '') + hidden_items
+            yield end_sep + '}'
+        else:
+            args = _get_args(obj)
             class_name = getattr(obj, "_grepr_class_name", obj.__class__.__name__)
-            if allsimple and len(args) <= 3:
-                return '%s(%s)' % (class_name, ', '.join(args)), not args
-            return '%s(%s%s%s)' % (class_name, prefix, sep.join(args), end_sep), False
-        return repr(obj), True
- 
-    is_compatible = bool(getattr(obj, "_grepr", False))
-    if not(is_compatible) and not(isinstance(obj, (list, tuple, dict, str, DualKeyDict))):
-        return repr(obj)
-    if indent is not None and not isinstance(indent, str):
-        indent = ' ' * indent
-    return _grepr(obj)[0]
+            if len(args) <= 3 and all(_is_simple(value, depth) for _, value in args):
+                yield class_name + '('
+                arg_sep = ''
+                next_sep = ', '
+                end = ')'
+            else:
+                yield class_name + '(' + prefix
+                arg_sep = ''
+                next_sep = sep
+                end = end_sep + ')'
+            for name, value in args:
+                yield arg_sep if name is None else f'{arg_sep}{name}='
+                yield _get_step(value, level, depth)
+                arg_sep = next_sep
+            yield end
+
+    write = stream.write
+    remaining_chars = max_chars
+    stack = [iter([_get_step(obj, 0, 0)])]
+    while stack:
+        step = next(stack[-1], None)
+        if step is None:
+            stack.pop()
+        elif isinstance(step, str):
+            if remaining_chars is not None:
+                if len(step) > remaining_chars:
+                    write(step[:remaining_chars] + "…")
+                    return
+                remaining_chars -= len(step)
+            write(step)
+        else:
+            stack.append(step)
+
+def grepr_summary(obj, *, indent=None, max_depth: int = 2, max_items: int = 5, max_chars: int = 500) -> str:
+    """
+    Get a short, bounded representation of an object for logs and error reports, e.g. SRSprite(name="Player", scripts=[…42 items]).
+    Only the shown part of the object is traversed, so it is cheap even for huge objects
+    
+    Args:
+        obj: the object to represent
+        indent: the indentation per level as a string or an amount of spaces. None puts everything on one line
+        max_depth: the amount of nesting levels to show, deeper objects are elided
+        max_items: the maximum amount of items to show per list, tuple, dict and DualKeyDict
+        max_chars: the summary is cut off after this many characters, followed by "…"
+    
+    Returns:
+        the summary
+    """
+    return grepr(obj, indent=indent, max_depth=max_depth, max_items=max_items, max_chars=max_chars)
 
 # Files
 import zipfile
@@ -116,7 +296,7 @@ def ensure_correct_path(_path: str, target_folder_name: str = "pypenguin") -> st
 
 # Utility Classes
 from enum        import Enum
-from typing      import TypeVar, Generic, Iterator
+from typing      import TypeVar, Generic, Iterator, Iterable
 from dataclasses import dataclass
 
 class PypenguinEnum(Enum):
@@ -160,12 +340,14 @@ V  = TypeVar("V" )
 
 class DualKeyDict(Generic[K1, K2, V]):
     """
-    A custom dictionary system, which allows access by key1 or key2
+    A custom dictionary system, which allows access by key1 or key2. 
+    Every entry is stored once as a (key1, key2, value) record, which both keys map to
     """
+    __slots__ = ("_by_key1", "_by_key2")
+
     def __init__(self, data: dict[tuple[K1, K2], V] | None = None, /) -> None:
-        self._values  : dict[K1, V ] = {}
-        self._k2_to_k1: dict[K2, K1] = {}
-        self._k1_to_k2: dict[K1, K2] = {}
+        self._by_key1: dict[K1, tuple[K1, K2, V]] = {}
+        self._by_key2: dict[K2, tuple[K1, K2, V]] = {}
         if data is not None:
             for keys, value in data.items():
                 key1, key2 = keys
@@ -173,41 +355,48 @@ class DualKeyDict(Generic[K1, K2, V]):
 
     @classmethod
     def from_same_keys(cls, data: dict[K1, V]) -> "DualKeyDict[K1, K1, V]":
-        return DualKeyDict({
-            (key, key): value for key, value in data.items()
-        })
+        records = {key: (key, key, value) for key, value in data.items()}
+        dual_key_dict = DualKeyDict.__new__(DualKeyDict)
+        dual_key_dict._by_key1 = records
+        dual_key_dict._by_key2 = records.copy()
+        return dual_key_dict if cls is DualKeyDict else cls(dual_key_dict)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, DualKeyDict):
             return NotImplemented
-        return (self._values == other._values) and (self._k2_to_k1 == other._k2_to_k1) and (self._k1_to_k2 == other._k1_to_k2)
+        return self._by_key1 == other._by_key1 # the records by key2 are the same records
 
     def __repr__(self) -> str:
         return grepr(self)
 
     def set(self, key1: K1, key2: K2, value: V) -> None:
-        self._values[key1] = value
-        self._k2_to_k1[key2] = key1
-        self._k1_to_k2[key1] = key2
+        old_record = self._by_key1.get(key1, None)
+        if (old_record is not None) and (old_record[1] != key2):
+            del self._by_key2[old_record[1]]
+        old_record = self._by_key2.get(key2, None)
+        if (old_record is not None) and (old_record[0] != key1):
+            del self._by_key1[old_record[0]]
+        record = (key1, key2, value)
+        self._by_key1[key1] = record
+        self._by_key2[key2] = record
 
     def get_by_key1(self, key1: K1) -> V:
-        return self._values[key1]
+        return self._by_key1[key1][2]
 
     def get_by_key2(self, key2: K2) -> V:
-        key1 = self.get_key1_for_key2(key2)
-        return self._values[key1]
+        return self._by_key2[key2][2]
 
     def get_key1_for_key2(self, key2: K2) -> K1:
-        return self._k2_to_k1[key2]
+        return self._by_key2[key2][0]
 
     def get_key2_for_key1(self, key1: K1) -> K2:
-        return self._k1_to_k2[key1]
+        return self._by_key1[key1][1]
 
     def has_key1(self, key1: K1) -> bool:
-        return key1 in self._values
+        return key1 in self._by_key1
     
     def has_key2(self, key2: K2) -> bool:
-        return key2 in self._k2_to_k1
+        return key2 in self._by_key2
 
     # Dict-like behavior (explicitly discouraged)
     def __iter__(self):
@@ -217,45 +406,134 @@ class DualKeyDict(Generic[K1, K2, V]):
         raise NotImplementedError("Don't check whether a DualKeyDict contains something like a normal dict. Use has_key1 or has_key2 instead")
 
     def __len__(self) -> int:
-        return len(self._values)
+        return len(self._by_key1)
+
+    # Iteration methods
+    def keys_key1(self) -> Iterable[K1]:
+        return self._by_key1.keys()
+    
+    def keys_key2(self) -> Iterable[K2]:
+        return self._by_key2.keys()
+    
+    def keys_key1_key2(self) -> Iterable[tuple[K1, K2]]:
+        return [(key1, key2) for key1, key2, _ in self._by_key1.values()]
+    
+    def values(self) -> Iterable[V]:
+        return [value for _, _, value in self._by_key1.values()]
+    
+    def items_key1(self) -> Iterable[tuple[K1, V]]:
+        return [(key1, value) for key1, _, value in self._by_key1.values()]
+
+    def items_key2(self) -> Iterable[tuple[K2, V]]:
+        return [(key2, value) for _, key2, value in self._by_key2.values()]
+    
+    def items_key1_key2(self) -> Iterable[tuple[K1, K2, V]]:
+        return self._by_key2.values()
+
+    def to_frozen(self) -> "FrozenDualKeyDict[K1, K2, V]":
+        """
+        Get an immutable copy(see FrozenDualKeyDict)
+        
+        Returns:
+            the FrozenDualKeyDict
+        """
+        return FrozenDualKeyDict(self)
+
+class FrozenDualKeyDict(DualKeyDict[K1, K2, V]):
+    """
+    An immutable DualKeyDict, whose keys, values and items are precomputed once. 
+    Safe to share between threads
+    """
+    __slots__ = ("_keys_key1", "_keys_key2", "_keys_key1_key2", "_values", "_items_key1", "_items_key2", "_items_key1_key2")
+
+    def __init__(self, data: "dict[tuple[K1, K2], V] | DualKeyDict[K1, K2, V] | None" = None, /) -> None:
+        if isinstance(data, DualKeyDict):
+            by_key1 = dict(data._by_key1)
+            by_key2 = dict(data._by_key2)
+        else:
+            dual_key_dict = DualKeyDict(data)
+            by_key1 = dual_key_dict._by_key1
+            by_key2 = dual_key_dict._by_key2
+        set_attr = object.__setattr__
+        set_attr(self, "_by_key1", by_key1)
+        set_attr(self, "_by_key2", by_key2)
+        records = tuple(by_key1.values())
+        set_attr(self, "_keys_key1"      , tuple(by_key1))
+        set_attr(self, "_keys_key2"      , tuple(by_key2))
+        set_attr(self, "_keys_key1_key2" , tuple((key1, key2) for key1, key2, _ in records))
+        set_attr(self, "_values"         , tuple(value for _, _, value in records))
+        set_attr(self, "_items_key1"     , tuple((key1, value) for key1, _, value in records))
+        set_attr(self, "_items_key2"     , tuple((key2, value) for _, key2, value in by_key2.values()))
+        set_attr(self, "_items_key1_key2", tuple(by_key2.values()))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self) -> tuple:
+        return (_create_frozen_dual_key_dict, (self._items_key1_key2,))
+
+    def set(self, key1: K1, key2: K2, value: V) -> None:
+        raise TypeError(f"{self.__class__.__name__} is immutable")
 
     # Iteration methods
-    def keys_key1(self) -> Iterator[K1]:
-        return self._values.keys()
+    def keys_key1(self) -> tuple[K1, ...]:
+        return self._keys_key1
     
-    def keys_key2(self) -> Iterator[K2]:
-        return self._k2_to_k1.keys()
+    def keys_key2(self) -> tuple[K2, ...]:
+        return self._keys_key2
     
-    def keys_key1_key2(self) -> Iterator[tuple[K1, K2]]:
-        return self._k1_to_k2.items()
+    def keys_key1_key2(self) -> tuple[tuple[K1, K2], ...]:
+        return self._keys_key1_key2
     
-    def values(self) -> Iterator[V]:
-        return self._values.values()
+    def values(self) -> tuple[V, ...]:
+        return self._values
     
-    def items_key1(self) -> Iterator[tuple[K1, V]]:
-        return self._values.items()
+    def items_key1(self) -> tuple[tuple[K1, V], ...]:
+        return self._items_key1
 
-    def items_key2(self) -> Iterator[tuple[K2, V]]:
-        for key2 in self._k2_to_k1.keys():
-            yield (key2, self.get_by_key2(key2))
+    def items_key2(self) -> tuple[tuple[K2, V], ...]:
+        return self._items_key2
     
-    def items_key1_key2(self) -> Iterator[tuple[K1, K2, V]]:
-        for key2, key1 in self._k2_to_k1.items():
-            yield (key1, key2, self.get_by_key1(key1))
+    def items_key1_key2(self) -> tuple[tuple[K1, K2, V], ...]:
+        return self._items_key1_key2
+
+    def to_frozen(self) -> "FrozenDualKeyDict[K1, K2, V]":
+        return self
+
+def _create_frozen_dual_key_dict(records: tuple[tuple[K1, K2, V], ...]) -> FrozenDualKeyDict[K1, K2, V]:
+    """
+    *[Internal Function]* Recreate a FrozenDualKeyDict from its records when unpickling or copying
+    
+    Args:
+        records: the (key1, key2, value) records, ordered by key2
+    
+    Returns:
+        the FrozenDualKeyDict
+    """
+    return FrozenDualKeyDict({(key1, key2): value for key1, key2, value in records})
 
 # Data Functions
-from difflib import SequenceMatcher
-from hashlib import sha256
+from difflib     import SequenceMatcher
+from hashlib     import sha256
+from copy        import copy
+from dataclasses import fields
 
 TOKEN_CHARSET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ!#%()*+,-./:;=?@[]^_`{|}~"
 
 def remove_duplicates(items: list) -> list:
-    seen = []
+    seen = set()
+    seen_unhashable = []
     result = []
     for item in items:
-        if item not in seen:
-            seen.append(item)
-            result.append(item)
+        try:
+            if item in seen:
+                continue
+            seen.add(item)
+        except TypeError: # unhashable items are compared one by one
+            if item in seen_unhashable:
+                continue
+            seen_unhashable.append(item)
+        result.append(item)
     return result
 
 def lists_equal_ignore_order(a: list, b: list) -> bool:
@@ -286,6 +564,37 @@ def tuplify(obj):
     else:
         return obj
 
+def evolve_dataclass(obj, **changes):
+    """
+    Create a structurally sharing copy of a dataclass instance with some fields replaced.
+    Lists, dicts and sets directly stored in fields are copied shallowly, so adding or removing items is safe.
+    Their items are shared with the original and must be replaced(e.g. with evolve_dataclass) instead of mutated in place.
+    Unlike dataclasses.replace, fields with init=False (e.g. SRSprite.uuid) are kept
+
+    Args:
+        obj: the dataclass instance
+        **changes: the new values of the fields to replace
+
+    Returns:
+        the new dataclass instance
+
+    Raises:
+        TypeError: if a change doesn't belong to a field of the dataclass
+    """
+    field_names = {field.name for field in fields(obj)}
+    for name in changes:
+        if name not in field_names:
+            raise TypeError(f"{type(obj).__name__} has no field {repr(name)}")
+    new_obj = copy(obj)
+    for name in field_names:
+        if name in changes:
+            setattr(new_obj, name, changes[name])
+        elif hasattr(obj, name):
+            value = getattr(obj, name)
+            if isinstance(value, (list, dict, set)):
+                setattr(new_obj, name, copy(value))
+    return new_obj
+
 def string_to_sha256(primary: str, secondary: str|None=None) -> str:
     def _string_to_sha256(input_string: str, digits: int) -> str:
         hex_hash = sha256(input_string.encode()).hexdigest()
@@ -304,8 +613,8 @@ def string_to_sha256(primary: str, secondary: str|None=None) -> str:
 
 
 __all__ = [
-    "grepr", "read_all_files_of_zip", "ensure_correct_path", 
-    "PypenguinEnum", "grepr_dataclass", "DualKeyDict", 
-    "remove_duplicates", "lists_equal_ignore_order", "get_closest_matches", "tuplify", "string_to_sha256",
+    "grepr", "grepr_to", "grepr_summary", "read_all_files_of_zip", "ensure_correct_path", 
+    "PypenguinEnum", "grepr_dataclass", "DualKeyDict", "FrozenDualKeyDict", 
+    "remove_duplicates", "lists_equal_ignore_order", "get_closest_matches", "tuplify", "evolve_dataclass", "string_to_sha256",
 ]
 
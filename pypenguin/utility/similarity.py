@@ -0,0 +1,97 @@
+from difflib import SequenceMatcher
+from heapq   import nlargest
+from typing  import Iterable
+
+_NGRAM_SIZE     : int = 3
+_MIN_CANDIDATES : int = 30 # how many candidates are compared exactly at least
+_CANDIDATE_RATIO: int = 3  # how many candidates are compared exactly per requested match
+
+def _get_ngrams(string: str) -> set[str]:
+    """
+    *[Internal Function]* Get the character n-grams of a string.
+    The string is lowercased and padded, so short strings and the start and end of a string have n-grams too
+
+    Args:
+        string: the string
+
+    Returns:
+        the set of n-grams
+    """
+    padded = ("\x00" * (_NGRAM_SIZE-1)) + string.lower() + "\x00"
+    return {padded[i:i+_NGRAM_SIZE] for i in range(len(padded) - _NGRAM_SIZE + 1)}
+
+class SimilarityIndex:
+    """
+    A character n-gram index over a fixed collection of strings for fast "did you mean" suggestions.
+    Candidates, which share many n-grams with the query, are found with an inverted index.
+    Only they are ranked with the exact but slow difflib similarity, which get_closest_matches computes for every string
+    """
+
+    def __init__(self, strings: Iterable[str]) -> None:
+        """
+        Build a SimilarityIndex. Duplicate strings are only stored once
+
+        Args:
+            strings: the strings to suggest
+
+        Returns:
+            None
+        """
+        self._strings     : list[str]            = list(dict.fromkeys(strings))
+        self._ngram_counts: list[int]            = []
+        self._postings    : dict[str, list[int]] = {}
+        for i, string in enumerate(self._strings):
+            ngrams = _get_ngrams(string)
+            self._ngram_counts.append(len(ngrams))
+            for ngram in ngrams:
+                self._postings.setdefault(ngram, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self)} strings, {len(self._postings)} n-grams)"
+
+    def get_closest_matches(self, string: str, n: int) -> list[str]:
+        """
+        Get the strings, which are most similar to the given string.
+        The ranking matches difflib.get_close_matches(without a cutoff) for all strings similar enough to be found by the n-gram index
+
+        Args:
+            string: the (misspelled) string
+            n: the maximum amount of matches
+
+        Returns:
+            the closest matches, best first
+        """
+        ngrams = _get_ngrams(string)
+        shared_counts: dict[int, int] = {}
+        for ngram in ngrams:
+            for i in self._postings.get(ngram, ()):
+                shared_counts[i] = shared_counts.get(i, 0) + 1
+
+        ngram_count  = len(ngrams)
+        ngram_counts = self._ngram_counts
+        candidate_count = max(n * _CANDIDATE_RATIO, _MIN_CANDIDATES)
+        candidates = nlargest(candidate_count, shared_counts,
+            key=lambda i: shared_counts[i] / (ngram_count + ngram_counts[i]), # proportional to the dice coefficient
+        )
+        if len(candidates) < n:
+            # too few strings share an n-gram with the query, so fill up with the others
+            candidate_set = set(candidates)
+            candidates.extend(i for i in range(len(self._strings)) if i not in candidate_set)
+
+        # like difflib.get_close_matches the query is the second sequence, 
+        # because SequenceMatcher only preprocesses the second sequence and can then reuse it for every candidate
+        matcher = SequenceMatcher()
+        matcher.set_seq2(string)
+        scored_candidates = []
+        for i in candidates:
+            candidate = self._strings[i]
+            matcher.set_seq1(candidate)
+            scored_candidates.append((matcher.ratio(), candidate))
+        # equally similar strings are ordered by the strings in reverse, just like difflib.get_close_matches
+        return [candidate for _, candidate in nlargest(n, scored_candidates)]
+
+
+__all__ = ["SimilarityIndex"]
@@ -1,10 +1,16 @@
-import json
+import os
 import re
-from typing       import Any
+import json
+from collections  import OrderedDict
+from glob         import glob
+from hashlib      import blake2b
+from inspect      import signature
+from typing       import Any, Callable, Hashable, Iterable
 from urllib.parse import urlparse
 
-from pypenguin.utility.errors  import TypeValidationError, RangeValidationError, InvalidValueError
-from pypenguin.utility.general import grepr_dataclass
+from pypenguin.utility.errors       import TypeValidationError, RangeValidationError, InvalidValueError
+from pypenguin.utility.general      import grepr_dataclass, PypenguinEnum
+from pypenguin.utility.content_hash import content_hash
 
 def _value_and_descr(obj, attr: str) -> tuple[Any, str]:
     return getattr(obj, attr), f"{attr} of a {_repr_type(obj.__class__)}"
@@ -135,13 +141,8 @@ def AA_BOXED_COORD_PAIR(
 
 def AA_JSON_COMPATIBLE(obj, path, attr, condition=None):
     attr_value, descr = _value_and_descr(obj, attr)
-    try:
-        json.dumps(attr_value)
-        error = None
-    except (TypeError, OverflowError):
-        error = TypeValidationError(path, f"{descr} must be JSON-compatible", condition)
-    if error is not None: # Trick to avoid "during handling of above exception"
-        raise error
+    if not is_json_compatible(attr_value):
+        raise TypeValidationError(path, f"{descr} must be JSON-compatible", condition)
 
 def AA_EQUAL(obj, path, attr, value, condition=None):
     attr_value, descr = _value_and_descr(obj, attr)
@@ -159,12 +160,14 @@ def AA_NOT_ONE_OF(obj, path, attr, forbidden_values, condition=None):
     if attr_value in forbidden_values:
         raise InvalidValueError(path, f"{descr} must not be one of {repr(forbidden_values)}")
 
+_HEX_COLOR_PATTERN = re.compile(r'#([0-9a-fA-F]{6})')
+
 def AA_HEX_COLOR(obj, path, attr, condition=None):
     attr_value, descr = _value_and_descr(obj, attr)
     msg = f"{descr} must be a valid hex color eg. '#FF0956'"
     if not isinstance(attr_value, str):
         raise TypeValidationError(path, msg)
-    if not bool(re.fullmatch(r'#([0-9a-fA-F]{6})', attr_value)):
+    if _HEX_COLOR_PATTERN.fullmatch(attr_value) is None:
         raise InvalidValueError(path, msg)
 
 def AA_ALNUM(obj, path, attr, condition=None):
@@ -173,6 +176,172 @@ def AA_ALNUM(obj, path, attr, condition=None):
     if not attr_value.isalnum():
         raise InvalidValueError(path, f"{descr} must contain only alpha-numeric characters")
 
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+def is_json_compatible(value: Any) -> bool:
+    """
+    Check wether a value can be converted to JSON, without actually converting it. 
+    Accepts the same values as json.dumps
+    
+    Args:
+        value: the value to check
+    
+    Returns:
+        wether the value is JSON-compatible
+    """
+    if isinstance(value, _JSON_SCALAR_TYPES):
+        return True
+    stack: list[tuple[Any, bool]] = [(value, False)]
+    containers_on_path: set[int] = set()
+    while stack:
+        item, is_leaving = stack.pop()
+        if is_leaving:
+            containers_on_path.discard(id(item))
+            continue
+        if isinstance(item, _JSON_SCALAR_TYPES):
+            continue
+        if isinstance(item, (list, tuple)):
+            children = item
+        elif isinstance(item, dict):
+            for key in item.keys():
+                if not isinstance(key, _JSON_SCALAR_TYPES):
+                    return False
+            children = item.values()
+        else:
+            return False
+        if id(item) in containers_on_path:
+            return False # circular reference
+        containers_on_path.add(id(item))
+        stack.append((item, True))
+        stack.extend((child, False) for child in children)
+    return True
+
+def _all_of_types(items: Iterable[Any], ts: type | tuple[type, ...]) -> bool:
+    for item in items:
+        if not isinstance(item, ts):
+            return False
+    return True
+
+class FieldConstraint:
+    """
+    A declarative constraint for one attribute, described by an AA_* helper and its arguments.
+    Eg. FieldConstraint(AA_RANGE, "volume", min=0, max=100) describes AA_RANGE(obj, path, "volume", min=0, max=100).
+    Multiple constraints are compiled into one validator function with compile_field_validator
+    """
+
+    def __init__(self, check: Callable[..., None], attr: str, *args, **kwargs) -> None:
+        """
+        Create a FieldConstraint
+        
+        Args:
+            check: the AA_* helper
+            attr: the name of the attribute
+            *args: further positional arguments for the helper
+            **kwargs: further keyword arguments for the helper
+        
+        Returns:
+            None
+        """
+        self.check  = check
+        self.attr   = attr
+        self.args   = args
+        self.kwargs = kwargs
+    
+    def __repr__(self) -> str:
+        args = [self.check.__name__, repr(self.attr)]
+        args.extend(repr(arg) for arg in self.args)
+        args.extend(f"{name}={value!r}" for name, value in self.kwargs.items())
+        return f"FieldConstraint({', '.join(args)})"
+
+# Cheap checks, which are True exactly when the corresponding AA_* helper does not raise. 
+# "v" is the attribute value, the placeholders are the names of the helper parameters
+_FAST_CHECK_TEMPLATES: dict[Callable[..., None], str] = {
+    AA_TYPE            : "isinstance(v, {t})",
+    AA_TYPES           : "isinstance(v, {ts})",
+    AA_NONE            : "v is None",
+    AA_NONE_OR_TYPE    : "(v is None) or isinstance(v, {t})",
+    AA_LIST_OF_TYPE    : "isinstance(v, list) and _all_of_types(v, {t})",
+    AA_LIST_OF_TYPES   : "isinstance(v, list) and _all_of_types(v, {ts})",
+    AA_TUPLE_OF_TYPES  : "isinstance(v, tuple) and _all_of_types(v, {ts})",
+    AA_DICT_OF_TYPE    : "isinstance(v, dict) and _all_of_types(v.keys(), {key_t}) and _all_of_types(v.values(), {value_t})",
+    AA_MIN             : "not (v < {min})",
+    AA_MAX             : "not (v > {max})",
+    AA_RANGE           : "not ((v < {min}) or (v > {max}))",
+    AA_MIN_LEN         : "not (len(v) < {min_len})",
+    AA_EXACT_LEN       : "len(v) == {length}",
+    AA_COORD_PAIR      : "isinstance(v, tuple) and (len(v) == 2) and isinstance(v[0], (int, float)) and isinstance(v[1], (int, float))",
+    AA_BOXED_COORD_PAIR: (
+        "isinstance(v, tuple) and (len(v) == 2) and isinstance(v[0], (int, float)) and isinstance(v[1], (int, float)) and not ("
+        "(({min_x} is not None) and (v[0] < {min_x})) or (({max_x} is not None) and (v[0] > {max_x})) or "
+        "(({min_y} is not None) and (v[1] < {min_y})) or (({max_y} is not None) and (v[1] > {max_y})))"
+    ),
+    AA_JSON_COMPATIBLE : "is_json_compatible(v)",
+    AA_EQUAL           : "not (v != {value})",
+    AA_NOT_ONE_OF      : "not (v in {forbidden_values})",
+    AA_HEX_COLOR       : "isinstance(v, str) and (_HEX_COLOR_PATTERN.fullmatch(v) is not None)",
+    AA_ALNUM           : "v.isalnum()",
+}
+
+def compile_field_validator(*constraints: FieldConstraint) -> Callable[[Any, list], None]:
+    """
+    Compile field constraints into one specialized validator function(obj, path). 
+    The function checks the constraints in order with cheap inline checks. 
+    Only when a check fails, the AA_* helper is called to build the error message and raise the ValidationError.
+    Helpers without an inline check are always called
+    
+    Args:
+        *constraints: the field constraints
+    
+    Returns:
+        the validator function, which raises ValidationError if a constraint is violated
+    """
+    namespace: dict[str, Any] = {
+        "_all_of_types": _all_of_types, "is_json_compatible": is_json_compatible, "_HEX_COLOR_PATTERN": _HEX_COLOR_PATTERN,
+    }
+    lines = ["def validate_fields(obj, path):"]
+    for i, constraint in enumerate(constraints):
+        if not constraint.attr.isidentifier():
+            raise ValueError(f"Invalid attribute name: {constraint.attr!r}")
+        namespace[f"check_{i}"] = constraint.check
+        namespace[f"args_{i}"  ] = constraint.args
+        namespace[f"kwargs_{i}"] = constraint.kwargs
+        call = f"check_{i}(obj, path, {constraint.attr!r}, *args_{i}, **kwargs_{i})"
+        
+        template = _FAST_CHECK_TEMPLATES.get(constraint.check, None)
+        if template is None:
+            lines.append(f"    {call}")
+            continue
+        bound = signature(constraint.check).bind(None, None, constraint.attr, *constraint.args, **constraint.kwargs)
+        placeholders = {}
+        for name, value in bound.arguments.items():
+            namespace[f"{name}_{i}"] = value
+            placeholders[name] = f"{name}_{i}"
+        lines.append(f"    v = obj.{constraint.attr}")
+        lines.append(f"    if not ({template.format(**placeholders)}):")
+        lines.append(f"        {call}")
+    lines.append("    return None")
+    exec("\n".join(lines), namespace)
+    return namespace["validate_fields"]
+
+def lazy_field_validator(get_constraints: Callable[[], Iterable[FieldConstraint]]) -> Callable[[Any, list], None]:
+    """
+    Like compile_field_validator, but the constraints are only created and compiled when the validator is first called. 
+    Useful when a constraint references a class, which is defined later in the module
+    
+    Args:
+        get_constraints: a function, which returns the field constraints
+    
+    Returns:
+        the validator function, which raises ValidationError if a constraint is violated
+    """
+    compiled = None
+    def validate_fields(obj, path: list) -> None:
+        nonlocal compiled
+        if compiled is None:
+            compiled = compile_field_validator(*get_constraints())
+        compiled(obj, path)
+    return validate_fields
+
 def is_valid_js_data_uri(s) -> bool:
     pattern = r"^data:application/javascript(;charset=[^,]+)?,.*"
     return re.match(pattern, s) is not None
@@ -188,10 +357,343 @@ def is_valid_url(url: str) -> bool:
     except Exception:
         return False
 
-@grepr_dataclass(grepr_fields=["raise_when_monitor_position_outside_stage", "raise_when_monitor_bigger_then_stage"])
+class PathNode:
+    """
+    A lazily materialized validation path. 
+    Instead of copying its parent path, a node only links to it and stores its own segment, so creating a child path is O(1).
+    It is only turned into a list when needed(eg. when a ValidationError is raised).
+    It can be used wherever a path list is expected: it can be iterated and `path+[...]` returns a list
+    """
+    __slots__ = ("parent", "segment")
+
+    def __init__(self, parent: "PathNode | list", *segment: Any) -> None:
+        """
+        Create a PathNode
+
+        Args:
+            parent: the parent path
+            *segment: the items appended to the parent path eg. "inputs", ("CONDITION",)
+
+        Returns:
+            None
+        """
+        self.parent  = parent
+        self.segment = segment
+
+    def to_list(self) -> list:
+        """
+        Materialize the path
+
+        Returns:
+            the path as a list
+        """
+        segments = []
+        node = self
+        while isinstance(node, PathNode):
+            segments.append(node.segment)
+            node = node.parent
+        path = list(node)
+        for segment in reversed(segments):
+            path.extend(segment)
+        return path
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __len__(self) -> int:
+        return len(self.to_list())
+
+    def __getitem__(self, index):
+        return self.to_list()[index]
+
+    def __add__(self, other: list) -> list:
+        return self.to_list() + list(other)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (PathNode, list)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_list()!r})"
+
+class ValidationLevel(PypenguinEnum):
+    """
+    How thoroughly a project is validated. Every level includes the checks of the levels below it
+    """
+
+    STRUCTURAL  = 0 # the types and shapes of all parts, the opcodes, inputs and dropdown ids of blocks and unique names
+    REFERENTIAL = 1 # also the dropdown values(which need the project context) and custom block calls(which need their definition)
+    FULL        = 2 # also opcode specific checks(see SpecialCaseType.POST_VALIDATION)
+
+    def includes(self, other: "ValidationLevel") -> bool:
+        """
+        Check wether the checks of another level are part of this level
+
+        Args:
+            other: the other level
+
+        Returns:
+            wether this level includes the other level
+        """
+        return self.value >= other.value
+
+@grepr_dataclass(grepr_fields=["raise_when_monitor_position_outside_stage", "raise_when_monitor_bigger_then_stage", "level"])
 class ValidationConfig:
     raise_when_monitor_position_outside_stage: bool = True
     raise_when_monitor_bigger_then_stage: bool = True
+    level: ValidationLevel = ValidationLevel.FULL # lower levels are faster, e.g. for trusted programmatically created projects
+
+class ValidationCache:
+    """
+    Remembers which parts of a project were already validated successfully, so unchanged parts can be skipped.
+    The keys are made up of content hashes (see ContentHashMixin), so changing a part automatically makes it "dirty".
+    Only successful validations are remembered. The least recently used keys are dropped, when max_size is exceeded.
+    The cache is cleared automatically when it is used with a different opcode info api.
+    One cache can be shared between projects: scripts, which only differ in their context, only need their dropdowns checked again.
+    It can be saved to and loaded from disk(see save and load)
+    """
+
+    def __init__(self, max_size: int = 100_000) -> None:
+        """
+        Create an empty ValidationCache
+        
+        Args:
+            max_size: the maximum amount of remembered keys
+        
+        Returns:
+            None
+        """
+        self.max_size = max_size
+        self._keys: OrderedDict[tuple, None] = OrderedDict()
+        self._info_api: "OpcodeInfoAPI | None" = None
+        self._info_api_fingerprint: bytes | None = None # only known for loaded caches until the first bind
+        self._config_hash: bytes | None = None
+
+    def bind(self, config: ValidationConfig, info_api: "OpcodeInfoAPI") -> None:
+        """
+        Prepare the cache for a validation run with the given config and info api. 
+        Keys of different configs are kept apart, a different info api clears the cache
+        
+        Args:
+            config: Configuration for Validation Behaviour
+            info_api: the opcode info api used to fetch information about opcodes
+        
+        Returns:
+            None
+        """
+        if info_api is not self._info_api:
+            if (self._info_api is not None) or (self._info_api_fingerprint is None):
+                self.clear()
+            elif _get_info_api_fingerprint(info_api) != self._info_api_fingerprint:
+                self.clear() # the loaded keys were created with different opcodes
+            self._info_api = info_api
+            self._info_api_fingerprint = None
+        self._config_hash = content_hash(config)
+
+    def is_valid(self, *key_parts: Hashable) -> bool:
+        """
+        Check wether a part of a project with the given key was already validated successfully
+        
+        Args:
+            *key_parts: the parts of the key, usually a kind name and content hashes
+        
+        Returns:
+            wether the key is remembered
+        """
+        key = (self._config_hash, *key_parts)
+        if key in self._keys:
+            self._keys.move_to_end(key)
+            return True
+        return False
+
+    def mark_valid(self, *key_parts: Hashable) -> None:
+        """
+        Remember that a part of a project with the given key was validated successfully
+        
+        Args:
+            *key_parts: the parts of the key, usually a kind name and content hashes
+        
+        Returns:
+            None
+        """
+        key = (self._config_hash, *key_parts)
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+
+    def get_keys(self) -> list[tuple]:
+        """
+        Get all remembered keys, from the least to the most recently used one. 
+        Used to transfer the results of validation in another process
+        
+        Returns:
+            the keys
+        """
+        return list(self._keys)
+
+    def add_keys(self, keys: Iterable[tuple]) -> None:
+        """
+        Remember keys, which were returned by get_keys of a cache bound to an equal config and info api
+        
+        Args:
+            keys: the keys
+        
+        Returns:
+            None
+        """
+        for key in keys:
+            self._keys[key] = None
+            self._keys.move_to_end(key)
+        while len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Forget all remembered keys
+        
+        Returns:
+            None
+        """
+        self._keys.clear()
+
+    def save(self, file_path: str) -> None:
+        """
+        Save the remembered keys to a JSON file, so they can be reused across processes and runs(see load). 
+        The file also contains a fingerprint of the source code and the opcode groups of the bound info api
+        
+        Args:
+            file_path: the path of the file
+        
+        Returns:
+            None
+        
+        Raises:
+            ValueError: if the cache was never bound to an info api
+        """
+        if self._info_api is not None:
+            fingerprint = _get_info_api_fingerprint(self._info_api)
+        elif self._info_api_fingerprint is not None:
+            fingerprint = self._info_api_fingerprint
+        else:
+            raise ValueError("A ValidationCache must be bound to an info api to be saved (see bind)")
+        data = {
+            "version"    : _CACHE_FILE_VERSION,
+            "fingerprint": fingerprint.hex(),
+            "keys"       : [[_encode_key_part(part) for part in key] for key in self._keys],
+        }
+        with open(file_path, "w") as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, file_path: str, max_size: int = 100_000) -> "ValidationCache":
+        """
+        Load a ValidationCache saved with save. 
+        The keys are discarded on the first bind, if the source code or the opcode groups of the info api changed since saving. 
+        A file of an older format version results in an empty cache
+        
+        Args:
+            file_path: the path of the file
+            max_size: the maximum amount of remembered keys
+        
+        Returns:
+            the loaded cache
+        """
+        with open(file_path, "r") as file:
+            data = json.load(file)
+        cache = cls(max_size=max_size)
+        if data.get("version", None) != _CACHE_FILE_VERSION:
+            return cache
+        cache._info_api_fingerprint = bytes.fromhex(data["fingerprint"])
+        cache.add_keys(tuple(_decode_key_part(part) for part in key) for key in data["keys"])
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+_CACHE_FILE_VERSION = 2
+
+_source_hash: bytes | None = None
+
+def _get_source_hash() -> bytes:
+    """
+    *[Internal Function]* Get a hash of the source code of pypenguin, which contains the validation code and the opcode information. 
+    It is only computed once per process
+    
+    Returns:
+        the source hash
+    """
+    global _source_hash
+    if _source_hash is None:
+        package_dir = os.path.dirname(os.path.dirname(__file__))
+        hasher = blake2b(digest_size=16)
+        for source_path in sorted(glob(os.path.join(package_dir, "**", "*.py"), recursive=True)):
+            with open(source_path, "rb") as source_file:
+                hasher.update(b"\x00" + source_file.read())
+        _source_hash = hasher.digest()
+    return _source_hash
+
+def _get_info_api_fingerprint(info_api: "OpcodeInfoAPI") -> bytes:
+    """
+    *[Internal Function]* Get a hash of the source code and the groups of an info api(see OpcodeInfoAPI.get_fingerprint). 
+    Used to detect stale ValidationCache files. Doesn't load any lazy groups
+    
+    Args:
+        info_api: the opcode info api
+    
+    Returns:
+        the fingerprint
+    """
+    return content_hash((_get_source_hash(), info_api.get_fingerprint()))
+
+def _encode_key_part(part: Hashable) -> list:
+    """
+    *[Internal Function]* Encode a part of a ValidationCache key as JSON compatible data, tagged with its type
+    
+    Args:
+        part: the key part. Must be bytes, a str, an int, a bool, None or a tuple of those
+    
+    Returns:
+        the encoded key part
+    
+    Raises:
+        TypeError: if the key part has an unsupported type
+    """
+    if   part is None:
+        return ["n"]
+    elif isinstance(part, bytes):
+        return ["b", part.hex()]
+    elif isinstance(part, str):
+        return ["s", part]
+    elif isinstance(part, bool):
+        return ["?", part]
+    elif isinstance(part, int):
+        return ["i", part]
+    elif isinstance(part, tuple):
+        return ["t", [_encode_key_part(item) for item in part]]
+    raise TypeError(f"Can't save a ValidationCache key part of type {type(part).__name__}: {part!r}")
+
+def _decode_key_part(data: list) -> Hashable:
+    """
+    *[Internal Function]* Decode a part of a ValidationCache key encoded with _encode_key_part
+    
+    Args:
+        data: the encoded key part
+    
+    Returns:
+        the key part
+    """
+    tag = data[0]
+    if   tag == "n":
+        return None
+    elif tag == "b":
+        return bytes.fromhex(data[1])
+    elif tag == "t":
+        return tuple(_decode_key_part(item) for item in data[1])
+    return data[1]
 
 
 __all__ = [
@@ -199,6 +701,7 @@ __all__ = [
     "AA_LIST_OF_TYPE", "AA_LIST_OF_TYPES", "AA_TUPLE_OF_TYPES", "AA_DICT_OF_TYPE",
     "AA_MIN", "AA_MAX", "AA_RANGE", "AA_MIN_LEN", "AA_EXACT_LEN", "AA_COORD_PAIR", "AA_BOXED_COORD_PAIR",
     "AA_JSON_COMPATIBLE", "AA_EQUAL", "AA_BIGGER_OR_EQUAL", "AA_NOT_ONE_OF", "AA_HEX_COLOR", "AA_ALNUM",
-    "is_valid_js_data_uri", "is_valid_url", "ValidationConfig",
+    "is_json_compatible", "is_valid_js_data_uri", "is_valid_url", 
+    "FieldConstraint", "compile_field_validator", "lazy_field_validator", "PathNode", "ValidationLevel", "ValidationConfig", "ValidationCache",
 ]
 
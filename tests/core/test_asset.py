@@ -1,8 +1,12 @@
+from io         import BytesIO
+from subprocess import run
+from sys        import executable
+
 from pytest import fixture
 
 from pypenguin.utility import ValidationConfig, TypeValidationError
 
-from pypenguin.core.asset import FRCostume, FRSound, SRCostume, SRSound
+from pypenguin.core.asset import FRCostume, FRSound, SRCostume, SRVectorCostume, SRBitmapCostume, SRRawCostume, SRSound
 
 from tests.utility import execute_attr_validation_tests
 
@@ -76,6 +80,54 @@ def test_FRCostume_step_bitmap_resolution():
     assert srcostume.bitmap_resolution == 1
 
 
+def test_FRCostume_step_decode_assets(config):
+    from PIL import Image
+    png_file = BytesIO()
+    Image.new("RGB", (2, 3)).save(png_file, format="png")
+    asset_files = {
+        "a.svg": b'<svg xmlns="http://www.w3.org/2000/svg" width="2" height="3"></svg>',
+        "b.png": png_file.getvalue(),
+    }
+    vector_costume = FRCostume(
+        name="vector", asset_id="a", data_format="svg", md5ext="a.svg",
+        rotation_center_x=1, rotation_center_y=2, bitmap_resolution=1,
+    ).step(asset_files)
+    assert isinstance(vector_costume, SRVectorCostume)
+    vector_costume.validate(path=[], config=config)
+    bitmap_costume = FRCostume(
+        name="bitmap", asset_id="b", data_format="png", md5ext="b.png",
+        rotation_center_x=1, rotation_center_y=2, bitmap_resolution=2,
+    ).step(asset_files)
+    assert isinstance(bitmap_costume, SRBitmapCostume)
+    assert bitmap_costume.content.size == (2, 3)
+    bitmap_costume.validate(path=[], config=config)
+
+def test_FRCostume_step_raw(config):
+    frcostume = FRCostume(
+        name="bitmap", asset_id="b", data_format="png", md5ext="b.png",
+        rotation_center_x=1, rotation_center_y=2, bitmap_resolution=2,
+    )
+    srcostume = frcostume.step({"b.png": b"not decoded"}, decode_assets=False)
+    assert isinstance(srcostume, SRRawCostume)
+    assert srcostume.content == b"not decoded"
+    assert srcostume.rotation_center == (1, 2)
+    srcostume.validate(path=[], config=config)
+    
+    execute_attr_validation_tests(
+        obj=srcostume,
+        attr_tests=[
+            ("content", "not bytes", TypeValidationError),
+        ],
+        validate_func=SRRawCostume.validate,
+        func_args=[[], config],
+    )
+
+def test_asset_libraries_imported_lazily():
+    code = "import sys, pypenguin; print(sorted({'PIL', 'pydub', 'xml.etree.ElementTree'} & set(sys.modules)))"
+    result = run([executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
 
 def test_FRSound_from_data():
     sound_data = {
@@ -0,0 +1,189 @@
+from copy   import deepcopy
+from pickle import dumps, loads
+
+from pytest import raises
+
+from pypenguin.utility     import ValidationConfig, ValidationCache, SameValueTwiceError
+from pypenguin.opcode_info import info_api
+
+from pypenguin.core.block          import SRScript, SRBlock, SRBlockAndTextInputValue, SRScriptInputValue
+from pypenguin.core.block_index    import SRBlockIndex
+from pypenguin.core.block_mutation import SRCustomBlockMutation
+from pypenguin.core.context        import PartialContext
+from pypenguin.core.custom_block   import SRCustomBlockOpcode, SRCustomBlockOptype
+from pypenguin.core.project        import SRProject
+from pypenguin.core.target         import SRSprite
+
+
+def create_script(steps: str = "10") -> SRScript:
+    return SRScript(
+        position=(0, 0),
+        blocks=[
+            SRBlock(
+                opcode="when green flag clicked",
+                inputs={},
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+            SRBlock(
+                opcode="forever {BODY}",
+                inputs={
+                    "BODY": SRScriptInputValue(blocks=[
+                        SRBlock(
+                            opcode="move (STEPS) steps",
+                            inputs={"STEPS": SRBlockAndTextInputValue(block=None, text=steps)},
+                            dropdowns={},
+                            comment=None,
+                            mutation=None,
+                        ),
+                    ]),
+                },
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+        ],
+    )
+
+def create_definition(name: str) -> SRScript:
+    return SRScript(
+        position=(0, 0),
+        blocks=[
+            SRBlock(
+                opcode="define custom block reporter",
+                inputs={},
+                dropdowns={},
+                comment=None,
+                mutation=SRCustomBlockMutation(
+                    custom_opcode=SRCustomBlockOpcode(segments=(name,)),
+                    no_screen_refresh=False,
+                    optype=SRCustomBlockOptype.NUMBER_REPORTER,
+                    main_color="#FF6680",
+                    prototype_color="#FF4D6A",
+                    outline_color="#FF3355",
+                ),
+            ),
+        ],
+    )
+
+def create_context() -> PartialContext:
+    return PartialContext(
+        scope_variables=[],
+        scope_lists=[],
+        all_sprite_variables=[],
+        sprite_only_variables={},
+        sprite_only_lists={},
+        other_sprites=[],
+        backdrops=[],
+    )
+
+
+
+def test_block_index_entries():
+    scripts = [create_script(), create_script("5")]
+    index = SRBlockIndex.from_scripts(scripts)
+    assert len(index) == 6
+    assert [entry.opcode for entry in index] == ["when green flag clicked", "forever {BODY}", "move (STEPS) steps"] * 2
+
+    forever_block = scripts[1].blocks[1]
+    move_block = forever_block.inputs["BODY"].blocks[0]
+    assert index.get_path(move_block) == ["scripts", 1, "blocks", 1, "inputs", ("BODY",), "blocks", 0]
+    assert index.get_parent(move_block) is forever_block
+    assert index.get_parent(forever_block) is None
+    assert index.get_blocks_by_opcode("move (STEPS) steps") == [scripts[0].blocks[1].inputs["BODY"].blocks[0], move_block]
+    assert index.get_blocks_by_opcode("not an opcode") == []
+    with raises(KeyError):
+        index.get_entry(deepcopy(move_block))
+
+def test_block_index_script_has_dropdowns():
+    scripts = [create_script(), create_script()]
+    scripts[1].blocks[1].inputs["BODY"].blocks[0].dropdowns["DROPDOWN"] = None
+    index = SRBlockIndex.from_scripts(scripts)
+    assert index.script_has_dropdowns(0) is False
+    assert index.script_has_dropdowns(1) is True
+
+def test_block_index_invalid_scripts():
+    script = create_script()
+    script.blocks[1].inputs["BODY"].blocks.append("not a block")
+    script.blocks[1].inputs["EXTRA"] = 5
+    index = SRBlockIndex.from_scripts([script, "not a script", SRScript(position=(0, 0), blocks=None)])
+    assert len(index) == 3
+
+def test_block_index_update():
+    scripts = [create_script(), create_script("5")]
+    for script in scripts:
+        script.content_hash()
+    index = SRBlockIndex.from_scripts(scripts)
+    unchanged_entry = index.get_entry(scripts[0].blocks[0])
+    move_block = scripts[1].blocks[1].inputs["BODY"].blocks[0]
+
+    move_block.opcode = "turn right (DEGREES) degrees"
+    scripts.insert(0, create_script("7"))
+    index.update(scripts)
+    assert index.get_entry(scripts[1].blocks[0]) is unchanged_entry
+    assert index.get_entry(move_block).opcode == "turn right (DEGREES) degrees"
+    assert index.get_path(move_block) == ["scripts", 2, "blocks", 1, "inputs", ("BODY",), "blocks", 0]
+    assert len(index.get_blocks_by_opcode("turn right (DEGREES) degrees")) == 1
+
+    removed_block = scripts.pop(1).blocks[0]
+    index.update(scripts)
+    assert removed_block not in index
+    assert len(index) == 6
+
+def test_block_index_update_in_place():
+    scripts = [create_script(), create_script("5")]
+    for script in scripts:
+        script.content_hash()
+    index = SRBlockIndex.from_scripts(scripts)
+
+    new_block = deepcopy(scripts[0].blocks[0])
+    scripts[0].blocks[1].inputs["BODY"].blocks.append(new_block)
+    scripts[0].content_hash()
+    index.update(scripts)
+    assert index.get_parent(new_block) is scripts[0].blocks[1]
+
+    equal_block = deepcopy(scripts[1].blocks[0]) # the content hash of the script stays equal
+    scripts[1].blocks[0] = equal_block
+    scripts[1].content_hash()
+    index.update(scripts)
+    assert index.get_path(equal_block) == ["scripts", 1, "blocks", 0]
+
+def test_block_index_cb_mutations():
+    scripts = [create_definition("a"), create_script()]
+    index = SRBlockIndex.from_scripts(scripts)
+    assert list(index.get_cb_mutations()) == [SRCustomBlockOpcode(segments=("a",))]
+    scripts.append(create_definition("b"))
+    index.update(scripts)
+    assert len(index.get_cb_mutations()) == 2
+
+def test_SRTarget_get_block_index():
+    sprite = SRSprite.create_empty(name="sprite1")
+    sprite.scripts = [create_script()]
+    index = sprite.get_block_index()
+    assert sprite.get_block_index() is index
+    assert len(index) == 3
+    sprite.scripts.append(create_script())
+    assert len(sprite.get_block_index()) == 6
+    assert "_block_index" not in loads(dumps(sprite)).__dict__
+
+def test_SRTarget_validate_scripts_in_place_mutation():
+    project = SRProject.create_empty()
+    sprite = SRSprite.create_empty(name="sprite1")
+    sprite.scripts = [create_definition("a"), create_script()]
+    project.sprites = [sprite]
+    project.sprite_layer_stack = [sprite.uuid]
+    cache = ValidationCache()
+    project.validate(ValidationConfig(), info_api, cache)
+
+    sprite.scripts[1].blocks[:] = create_definition("a").blocks # a second definition of the same custom block
+    with raises(SameValueTwiceError):
+        project.validate(ValidationConfig(), info_api, cache)
+
+def test_SRTarget_validate_scripts_duplicate_custom_opcode():
+    sprite = SRSprite.create_empty(name="sprite1")
+    sprite.scripts = [create_definition("a"), create_script(), create_definition("a")]
+    with raises(SameValueTwiceError) as exc_info:
+        sprite.validate_scripts(["sprites", 0], ValidationConfig(), info_api, create_context())
+    assert exc_info.value.path1 == ["sprites", 0, "scripts", 0, "blocks", 0]
+    assert exc_info.value.path2 == ["sprites", 0, "scripts", 2, "blocks", 0]
@@ -0,0 +1,213 @@
+from pytest import fixture, raises
+from copy   import deepcopy
+from json   import dumps, loads
+
+from pypenguin.utility     import FirstToInterConversionError, DeserializationError
+from pypenguin.opcode_info import info_api
+
+from pypenguin.core.block          import FRBlock
+from pypenguin.core.block_api      import FIConversionAPI
+from pypenguin.core.block_mutation import FRCustomBlockMutation
+from pypenguin.core.block_store    import FRBlockStore
+from pypenguin.core.comment        import SRComment
+
+
+BLOCKS_DATA = {
+    "a": {
+        "opcode": "event_whenflagclicked",
+        "next": "b",
+        "parent": None,
+        "inputs": {},
+        "fields": {},
+        "shadow": False,
+        "topLevel": True,
+        "x": 10,
+        "y": 20,
+    },
+    "b": {
+        "opcode": "motion_movesteps",
+        "next": None,
+        "parent": "a",
+        "inputs": {
+            "STEPS": [1, [4, "10"]],
+        },
+        "fields": {},
+        "shadow": False,
+        "topLevel": False,
+        "comment": "z",
+    },
+    "c": {
+        "opcode": "procedures_definition",
+        "next": None,
+        "parent": None,
+        "inputs": {
+            "custom_block": [1, "d"],
+        },
+        "fields": {},
+        "shadow": False,
+        "topLevel": True,
+        "x": 300,
+        "y": 400,
+    },
+    "d": {
+        "opcode": "procedures_prototype",
+        "next": None,
+        "parent": "c",
+        "inputs": {
+            "?+wI)AquGQlzMnn5I8tA": [1, "e"],
+        },
+        "fields": {},
+        "shadow": True,
+        "topLevel": False,
+        "mutation": {
+            "tagName": "mutation",
+            "children": [],
+            "proccode": "do sth %s",
+            "argumentids": "[\"?+wI)AquGQlzMnn5I8tA\"]",
+            "argumentnames": "[\"a text arg\"]",
+            "argumentdefaults": "[\"\"]",
+            "warp": "false",
+        },
+    },
+    "e": {
+        "opcode": "argument_reporter_string_number",
+        "next": None,
+        "parent": "d",
+        "inputs": {},
+        "fields": {
+            "VALUE": ["a text arg", ";jX/UwBwE{CX@UdiwnJd"],
+        },
+        "shadow": True,
+        "topLevel": False,
+        "mutation": {
+            "tagName": "mutation",
+            "children": [],
+            "color": "[\"#FF6680\",\"#FF4D6A\",\"#FF3355\"]",
+        },
+    },
+    "f": [12, "my variable", "`jEk@4|i[#Fk?(8x)AV.-my variable", 446, 652],
+}
+
+
+@fixture
+def store():
+    return FRBlockStore.from_data(deepcopy(BLOCKS_DATA), info_api=info_api)
+
+@fixture
+def blocks():
+    return {
+        block_id: (
+            FRBlock.from_tuple(tuple(block_data), parent_id=None)
+            if isinstance(block_data, list)
+            else FRBlock.from_data(block_data, info_api=info_api)
+        )
+        for block_id, block_data in deepcopy(BLOCKS_DATA).items()
+    }
+
+
+
+def test_FRBlockStore_from_data(store: FRBlockStore, blocks: dict[str, FRBlock]):
+    assert len(store) == len(blocks)
+    assert list(store) == list(blocks)
+    assert dict(store) == blocks
+
+
+def test_FRBlockStore_from_blocks(blocks: dict[str, FRBlock]):
+    store = FRBlockStore.from_blocks(blocks)
+    assert dict(store) == blocks
+
+
+def test_FRBlockStore_from_blocks_tuple():
+    store = FRBlockStore.from_blocks({"f": tuple(BLOCKS_DATA["f"])})
+    assert store["f"] == FRBlock.from_tuple(tuple(BLOCKS_DATA["f"]), parent_id=None)
+
+
+def test_FRBlockStore_getitem_copy(store: FRBlockStore):
+    block = store["b"]
+    del block.inputs["STEPS"]
+    assert "STEPS" in store["b"].inputs
+
+
+def test_FRBlockStore_getitem_missing(store: FRBlockStore):
+    assert "x" not in store
+    with raises(KeyError):
+        store["x"]
+
+
+def test_FRBlockStore_lookups(store: FRBlockStore):
+    assert store.get_opcode("b") == "motion_movesteps"
+    assert store.get_parent_id("b") == "a"
+    assert store.get_parent_id("a") is None
+    assert store.get_next_id("a") == "b"
+    assert store.is_top_level("c")
+    assert not store.is_top_level("d")
+    assert store.get_top_level_block_ids() == ["a", "c", "f"]
+
+
+def test_FRBlockStore_unknown_reference():
+    block_data = deepcopy(BLOCKS_DATA["b"])
+    store = FRBlockStore.from_data({"b": block_data}, info_api=info_api)
+    assert store["b"].parent == "a"
+    assert store.get_block_ids_by_parent_id("a") == {"b"}
+
+
+def test_FRBlockStore_invalid_mutation():
+    block_data = deepcopy(BLOCKS_DATA["b"])
+    block_data["mutation"] = {"tagName": "mutation", "children": []}
+    with raises(DeserializationError):
+        FRBlockStore.from_data({"b": block_data}, info_api=info_api)
+    with raises(DeserializationError):
+        FRBlock.from_data(block_data, info_api=info_api)
+
+
+def test_FRBlockStore_get_block_ids_by_parent_id(store: FRBlockStore):
+    assert store.get_block_ids_by_parent_id("a") == {"b"}
+    assert store.get_block_ids_by_parent_id("d") == {"e"}
+    assert store.get_block_ids_by_parent_id("e") == set()
+
+
+def test_FRBlockStore_get_cb_mutation(store: FRBlockStore):
+    mutation = store.get_cb_mutation("do sth %s")
+    assert isinstance(mutation, FRCustomBlockMutation)
+    assert mutation == store["d"].mutation
+    assert store.get_cb_mutation("undefined %s") is None
+
+
+def test_FIConversionAPI_with_FRBlockStore(store: FRBlockStore, blocks: dict[str, FRBlock]):
+    ficapi = FIConversionAPI(blocks=store, block_comments={})
+    dict_ficapi = FIConversionAPI(blocks=blocks, block_comments={})
+    assert ficapi.get_block("d") == dict_ficapi.get_block("d")
+    assert ficapi.get_block_ids_by_parent_id("c") == dict_ficapi.get_block_ids_by_parent_id("c")
+    assert ficapi.get_cb_mutation("do sth %s") == dict_ficapi.get_cb_mutation("do sth %s")
+    with raises(FirstToInterConversionError):
+        ficapi.get_cb_mutation("undefined %s")
+
+
+def test_FRBlockStore_step(store: FRBlockStore, blocks: dict[str, FRBlock]):
+    comments = {"z": SRComment(position=(0, 0), size=(200, 200), is_minimized=False, text="hi")}
+    ficapi = FIConversionAPI(blocks=store, block_comments=comments)
+    dict_ficapi = FIConversionAPI(blocks=blocks, block_comments=comments)
+    for block_id in ["a", "b", "c", "f"]:
+        assert (
+            store[block_id].step(ficapi=ficapi, info_api=info_api, own_id=block_id)
+            == blocks[block_id].step(ficapi=dict_ficapi, info_api=info_api, own_id=block_id)
+        )
+    assert ficapi.scheduled_block_deletions == dict_ficapi.scheduled_block_deletions
+
+
+def test_FRBlockStore_interned_strings(store: FRBlockStore, blocks: dict[str, FRBlock]):
+    canonical_opcode = info_api.get_old_by_new("move (STEPS) steps")
+    canonical_input_id = info_api.get_info_by_old(canonical_opcode).get_old_input_id("STEPS")
+    for block in (store["b"], blocks["b"]):
+        assert block.opcode is canonical_opcode
+        assert next(iter(block.inputs)) is canonical_input_id
+
+def test_FRBlockStore_interned_strings_shared_between_stores():
+    # parsing the json twice creates separate but equal strings, like loading two projects
+    data_json = dumps(BLOCKS_DATA)
+    store_a = FRBlockStore.from_data(loads(data_json), info_api=info_api)
+    store_b = FRBlockStore.from_data(loads(data_json), info_api=info_api)
+    for block_id in ("a", "b", "e"):
+        assert store_a[block_id].opcode is store_b[block_id].opcode
+    assert next(iter(store_a["b"].inputs)) is next(iter(store_b["b"].inputs))
+    assert next(iter(store_a["e"].fields)) is next(iter(store_b["e"].fields))
@@ -0,0 +1,214 @@
+import pickle
+from copy import copy, deepcopy
+
+from pypenguin.utility     import content_hash
+from pypenguin.opcode_info import DropdownValueKind
+
+from pypenguin.core.block      import SRScript, SRBlock, SRBlockAndTextInputValue, SRScriptInputValue
+from pypenguin.core.dropdown   import SRDropdownValue
+from pypenguin.core.project    import SRProject
+from pypenguin.core.target     import SRSprite
+from pypenguin.core.vars_lists import SRVariable
+
+
+def create_script(steps: str = "10") -> SRScript:
+    return SRScript(
+        position=(0, 0),
+        blocks=[
+            SRBlock(
+                opcode="when green flag clicked",
+                inputs={},
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+            SRBlock(
+                opcode="forever {BODY}",
+                inputs={
+                    "BODY": SRScriptInputValue(blocks=[
+                        SRBlock(
+                            opcode="move (STEPS) steps",
+                            inputs={"STEPS": SRBlockAndTextInputValue(block=None, text=steps)},
+                            dropdowns={},
+                            comment=None,
+                            mutation=None,
+                        ),
+                    ]),
+                },
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+        ],
+    )
+
+
+
+def test_content_hash_equal():
+    assert create_script().content_hash() == create_script().content_hash()
+    assert create_script().content_hash() != create_script("20").content_hash()
+
+def test_content_hash_values():
+    assert len({content_hash(1), content_hash(1.0), content_hash(True)}) == 3 # the exact type matters
+    assert content_hash(1.5) != content_hash(1)
+    assert content_hash({"a": 1, "b": 2}) == content_hash({"b": 2, "a": 1})
+    assert content_hash([1, 2]) != content_hash((1, 2))
+    assert content_hash("1") != content_hash(1)
+    assert content_hash(DropdownValueKind.VARIABLE) != content_hash(DropdownValueKind.LIST)
+
+def test_content_hash_invalidation():
+    script = create_script()
+    old_hash = script.content_hash()
+    move_block = script.blocks[1].inputs["BODY"].blocks[0]
+    move_block.inputs["STEPS"].text = "20"
+    assert script.get_cached_content_hash() is None
+    assert script.content_hash() == create_script("20").content_hash()
+    move_block.inputs["STEPS"].text = "10"
+    assert script.content_hash() == old_hash
+
+def test_content_hash_invalidate_in_place():
+    script = create_script()
+    script.content_hash()
+    block = script.blocks[0]
+    block.dropdowns["X"] = SRDropdownValue(kind=DropdownValueKind.STANDARD, value="a")
+    assert script.get_cached_content_hash() is None
+
+def test_content_hash_tracks_in_place_mutation():
+    def mutate_and_check(mutate) -> None:
+        script = create_script()
+        script.content_hash()
+        mutate(script)
+        assert script.get_cached_content_hash() is None
+        fresh_script = deepcopy(script)
+        assert script.content_hash() == fresh_script.content_hash()
+
+    body = lambda script: script.blocks[1].inputs["BODY"]
+    mutate_and_check(lambda script: script.blocks.append(create_script().blocks[0]))
+    mutate_and_check(lambda script: script.blocks.pop())
+    mutate_and_check(lambda script: script.blocks.reverse())
+    mutate_and_check(lambda script: script.blocks.__setitem__(slice(0, 1), []))
+    mutate_and_check(lambda script: body(script).blocks.clear())
+    mutate_and_check(lambda script: body(script).blocks[0].inputs.pop("STEPS"))
+    mutate_and_check(lambda script: body(script).blocks[0].inputs.update(X=SRBlockAndTextInputValue(block=None, text="1")))
+    mutate_and_check(lambda script: body(script).blocks[0].inputs["STEPS"].__setattr__("text", "20"))
+
+def test_content_hash_invalidate_dict_write():
+    script = create_script()
+    script.content_hash()
+    script.blocks[0].__dict__["opcode"] = "forever {BODY}" # bypasses the tracking
+    assert script.get_cached_content_hash() is not None
+    script.blocks[0].invalidate_content_hash()
+    assert script.get_cached_content_hash() is None
+
+def test_content_hash_assigned_list_is_copied():
+    blocks = list(create_script().blocks)
+    script = SRScript(position=(0, 0), blocks=blocks)
+    old_hash = script.content_hash()
+    blocks.pop() # only the list of the script is tracked
+    assert len(script.blocks) == 2
+    assert script.content_hash() == old_hash
+    script.blocks.pop()
+    assert script.content_hash() != old_hash
+
+def test_content_hash_copies_are_tracked():
+    script = create_script()
+    for script_copy in (deepcopy(script), pickle.loads(pickle.dumps(script))):
+        script_copy.content_hash()
+        script_copy.blocks[1].inputs["BODY"].blocks.pop()
+        assert script_copy.get_cached_content_hash() is None
+        assert script_copy.content_hash() != script.content_hash()
+
+def test_content_hash_copy():
+    script = create_script()
+    script.content_hash()
+    script_copy = copy(script)
+    assert script_copy.get_cached_content_hash() is None
+    script_copy.position = (5, 5)
+    assert script.get_cached_content_hash() is not None
+    assert deepcopy(script).content_hash() == script.content_hash()
+
+def test_content_hash_eq():
+    script_a = create_script()
+    script_b = create_script("20")
+    assert script_a != script_b
+    script_a.content_hash()
+    script_b.content_hash()
+    assert script_a != script_b
+    assert script_a == create_script()
+
+def test_content_hash_eq_uses_cached_hashes(monkeypatch):
+    def fail_eq(self, other) -> bool:
+        raise AssertionError("the fields shouldn't be compared")
+
+    script_a = create_script()
+    script_b = create_script()
+    script_a.content_hash()
+    script_b.content_hash()
+    monkeypatch.setattr(SRBlock, "__eq__", fail_eq)
+    assert script_a == script_b
+    assert script_a != SRScript(position=(0, 0), blocks=[])
+
+def test_content_hash_eq_ambiguous():
+    script_a = SRScript(position=(0, 0  ), blocks=[])
+    script_b = SRScript(position=(0, 0.0), blocks=[])
+    assert script_a.content_hash() != script_b.content_hash()
+    assert script_a == script_b # 0 == 0.0, so the fields are compared
+
+def test_content_hash_ignores_uuid():
+    project_a = SRProject.create_empty()
+    project_b = SRProject.create_empty()
+    for project in (project_a, project_b):
+        sprite_1 = SRSprite.create_empty(name="sprite1")
+        sprite_2 = SRSprite.create_empty(name="sprite2")
+        sprite_1.scripts.append(create_script())
+        project.sprites = [sprite_1, sprite_2]
+        project.sprite_layer_stack = [sprite_2.uuid, sprite_1.uuid]
+    assert project_a.content_hash() == project_b.content_hash()
+    assert project_a == project_b
+
+    project_b.sprite_layer_stack = list(reversed(project_b.sprite_layer_stack))
+    assert project_a.content_hash() != project_b.content_hash()
+    assert project_a != project_b
+
+def test_content_hash_shared_subtree():
+    project = SRProject.create_empty()
+    project.sprites = [SRSprite.create_empty(name="sprite1")]
+    project.sprite_layer_stack = [project.sprites[0].uuid]
+    evolved = project.evolve(all_sprite_variables=[SRVariable(name="a var", current_value=0)])
+    project_hash = project.content_hash()
+    evolved_hash = evolved.content_hash()
+    assert project_hash != evolved_hash
+
+    project.sprites[0].volume = 50 # the sprite is shared
+    assert project.get_cached_content_hash() is None
+    assert evolved.get_cached_content_hash() is None
+
+def test_content_hash_eq_after_in_place_mutation():
+    sprite_a = SRSprite.create_empty(name="sprite1")
+    sprite_b = SRSprite.create_empty(name="sprite1")
+    sprite_a.content_hash() # outdated after the in place mutation below
+    sprite_a.sprite_only_variables.append(SRVariable(name="a var", current_value=0))
+    sprite_b.sprite_only_variables.append(SRVariable(name="a var", current_value=0))
+    sprite_b.content_hash()
+    assert sprite_a == sprite_b
+
+def test_content_hash_deep_nesting():
+    def create_deep_script(depth: int, text: str) -> SRScript:
+        block = None
+        for _ in range(depth):
+            block = SRBlock(
+                opcode="join (STRING1) (STRING2)",
+                inputs={
+                    "STRING1": SRBlockAndTextInputValue(block=block, text="a"),
+                    "STRING2": SRBlockAndTextInputValue(block=None, text=text),
+                },
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            )
+        return SRScript(position=(0, 0), blocks=[block])
+    
+    script = create_deep_script(3000, "b")
+    assert script.content_hash() == create_deep_script(3000, "b").content_hash()
+    assert script.content_hash() != create_deep_script(3000, "c").content_hash()
+    assert content_hash([script]) == content_hash([create_deep_script(3000, "b")])
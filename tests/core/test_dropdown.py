@@ -67,3 +67,37 @@ def test_SRDropdownValue_validate_value(config, context):
     )
 
 
+def test_SRDropdownValue_validate_value_cached_set(config, context):
+    dropdown_value = SRDropdownValue(kind=DropdownValueKind.SPRITE, value="Player")
+    dropdown_value.validate_value([], config, DropdownType.MOUSE_OR_OTHER_SPRITE, context)
+    possible_values = context.get_cached_possible_values(DropdownType.MOUSE_OR_OTHER_SPRITE)
+    assert isinstance(possible_values, frozenset)
+    assert (DropdownValueKind.SPRITE, "Player") in possible_values
+    assert DropdownType.MOUSE_OR_OTHER_SPRITE.get_possible_new_dropdown_value_set(context) is possible_values
+
+    context.other_sprites = [(DropdownValueKind.SPRITE, "Sprite2")]
+    assert context.get_cached_possible_values(DropdownType.MOUSE_OR_OTHER_SPRITE) is None
+    with raises(InvalidDropdownValueError):
+        dropdown_value.validate_value([], config, DropdownType.MOUSE_OR_OTHER_SPRITE, context)
+
+def test_SRDropdownValue_validate_value_default_kind(config, context):
+    dropdown_value = SRDropdownValue(kind=DropdownValueKind.BROADCAST_MSG, value="any message")
+    dropdown_value.validate_value([], config, DropdownType.BROADCAST, context)
+    dropdown_value.kind = DropdownValueKind.STANDARD
+    with raises(InvalidDropdownValueError):
+        dropdown_value.validate_value([], config, DropdownType.BROADCAST, context)
+
+
+def test_SRDropdownValue_validate_value_closest_matches(config, context):
+    dropdown_value = SRDropdownValue(kind=DropdownValueKind.SPRITE, value="Playr")
+    with raises(InvalidDropdownValueError) as exc_info:
+        dropdown_value.validate_value([], config, DropdownType.MOUSE_OR_OTHER_SPRITE, context)
+    assert str(exc_info.value).endswith(
+        "The closest matches are: \n- (DropdownValueKind.SPRITE, 'Player')" + "".join(
+            "\n- "+repr(value) for value in 
+            DropdownType.MOUSE_OR_OTHER_SPRITE.get_closest_possible_new_dropdown_values("Playr", context, n=5)[1:]
+        )
+    )
+    assert context.get_cached_value_index(DropdownType.MOUSE_OR_OTHER_SPRITE) is not None
+    context.other_sprites = []
+    assert context.get_cached_value_index(DropdownType.MOUSE_OR_OTHER_SPRITE) is None
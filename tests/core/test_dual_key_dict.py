@@ -0,0 +1,86 @@
+from copy   import copy, deepcopy
+from pickle import dumps, loads
+
+from pytest import raises
+
+from pypenguin.utility import DualKeyDict, FrozenDualKeyDict, grepr
+
+
+def create_dual_key_dict() -> DualKeyDict[str, str, int]:
+    return DualKeyDict({("a", "A"): 1, ("b", "B"): 2, ("c", "C"): 3})
+
+
+
+def test_dual_key_dict_lookups():
+    dual_key_dict = create_dual_key_dict()
+    assert dual_key_dict.get_by_key1("b") == 2
+    assert dual_key_dict.get_by_key2("C") == 3
+    assert dual_key_dict.get_key1_for_key2("A") == "a"
+    assert dual_key_dict.get_key2_for_key1("a") == "A"
+    assert dual_key_dict.has_key1("a") and not dual_key_dict.has_key1("A")
+    assert dual_key_dict.has_key2("A") and not dual_key_dict.has_key2("a")
+    assert len(dual_key_dict) == 3
+    with raises(KeyError):
+        dual_key_dict.get_by_key2("D")
+    with raises(NotImplementedError):
+        "a" in dual_key_dict
+
+def test_dual_key_dict_views():
+    dual_key_dict = create_dual_key_dict()
+    assert list(dual_key_dict.keys_key1()) == ["a", "b", "c"]
+    assert list(dual_key_dict.keys_key2()) == ["A", "B", "C"]
+    assert list(dual_key_dict.keys_key1_key2()) == [("a", "A"), ("b", "B"), ("c", "C")]
+    assert list(dual_key_dict.values()) == [1, 2, 3]
+    assert list(dual_key_dict.items_key1()) == [("a", 1), ("b", 2), ("c", 3)]
+    assert list(dual_key_dict.items_key2()) == [("A", 1), ("B", 2), ("C", 3)]
+    assert list(dual_key_dict.items_key1_key2()) == [("a", "A", 1), ("b", "B", 2), ("c", "C", 3)]
+
+def test_dual_key_dict_set():
+    dual_key_dict = create_dual_key_dict()
+    dual_key_dict.set("a", "A", 10)
+    assert dual_key_dict.get_by_key2("A") == 10
+    dual_key_dict.set("b", "X", 20) # key2 of b changes
+    assert not dual_key_dict.has_key2("B")
+    assert dual_key_dict.get_key1_for_key2("X") == "b"
+    dual_key_dict.set("d", "C", 30) # key1 of C changes
+    assert not dual_key_dict.has_key1("c")
+    assert dual_key_dict.get_by_key1("d") == 30
+    assert len(dual_key_dict) == 3
+
+def test_dual_key_dict_from_same_keys():
+    dual_key_dict = DualKeyDict.from_same_keys({"x": 1, "y": 2})
+    assert dual_key_dict == DualKeyDict({("x", "x"): 1, ("y", "y"): 2})
+    dual_key_dict.set("x", "z", 3) # the records by key1 and key2 are independent
+    assert dual_key_dict.get_by_key2("z") == 3
+    assert not dual_key_dict.has_key2("x")
+    assert dual_key_dict.has_key2("y")
+    assert isinstance(FrozenDualKeyDict.from_same_keys({"x": 1}), FrozenDualKeyDict)
+
+def test_dual_key_dict_eq():
+    assert create_dual_key_dict() == DualKeyDict({("c", "C"): 3, ("b", "B"): 2, ("a", "A"): 1})
+    assert create_dual_key_dict() != DualKeyDict({("a", "A"): 1, ("b", "B"): 2, ("c", "X"): 3})
+    assert create_dual_key_dict() == create_dual_key_dict().to_frozen()
+    assert copy(create_dual_key_dict()) == create_dual_key_dict()
+    assert loads(dumps(create_dual_key_dict())) == create_dual_key_dict()
+
+def test_frozen_dual_key_dict():
+    dual_key_dict = create_dual_key_dict()
+    frozen = dual_key_dict.to_frozen()
+    dual_key_dict.set("d", "D", 4) # the frozen copy doesn't change
+    assert not frozen.has_key1("d")
+    assert frozen.to_frozen() is frozen
+    assert frozen.get_by_key2("B") == 2
+    assert frozen.items_key1_key2() == (("a", "A", 1), ("b", "B", 2), ("c", "C", 3))
+    assert frozen.keys_key2() == ("A", "B", "C")
+    assert grepr(frozen) == grepr(create_dual_key_dict())
+    with raises(TypeError):
+        frozen.set("d", "D", 4)
+    with raises(AttributeError):
+        frozen._by_key1 = {}
+
+def test_frozen_dual_key_dict_copy():
+    frozen = FrozenDualKeyDict({("a", "A"): [1], ("b", "B"): [2]})
+    for copied in (copy(frozen), deepcopy(frozen), loads(dumps(frozen))):
+        assert isinstance(copied, FrozenDualKeyDict)
+        assert copied == frozen
+        assert copied.items_key2() == (("A", [1]), ("B", [2]))
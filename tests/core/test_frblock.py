@@ -1,4 +1,5 @@
 from pytest import fixture, raises
+from json   import loads
 
 from pypenguin.utility            import DeserializationError
 from pypenguin.opcode_info        import InputMode, info_api
@@ -39,6 +40,21 @@ def test_FRBlock_from_data():
     assert frblock.shadow    == data["shadow"]
     assert frblock.top_level == data["topLevel"]
 
+def test_FRBlock_from_data_interned_strings():
+    # parsing the json twice creates separate but equal strings, like loading two projects
+    data_json = '''{
+        "opcode": "data_setvariableto", "next": null, "parent": null, 
+        "inputs": {"VALUE": [1, [10, "0"]]}, "fields": {"VARIABLE": ["my variable", "]zYMvs0rF)-eOEt26c|,"]}, 
+        "shadow": false, "topLevel": true, "x": 0, "y": 0
+    }'''
+    data_a, data_b = loads(data_json), loads(data_json)
+    assert data_a["opcode"] is not data_b["opcode"]
+    frblock_a = FRBlock.from_data(data_a, info_api=info_api)
+    frblock_b = FRBlock.from_data(data_b, info_api=info_api)
+    assert frblock_a.opcode is frblock_b.opcode
+    assert next(iter(frblock_a.inputs)) is next(iter(frblock_b.inputs))
+    assert next(iter(frblock_a.fields)) is next(iter(frblock_b.fields))
+
 def test_FRBlock_from_data_comment():
     data = ALL_FR_BLOCK_DATAS["b"]
     frblock = FRBlock.from_data(data, info_api=info_api)
@@ -0,0 +1,59 @@
+from io  import StringIO
+from sys import getrecursionlimit
+
+from pypenguin.utility import grepr, grepr_to, grepr_summary, grepr_dataclass, DualKeyDict
+
+from pypenguin.core.target import SRSprite
+
+
+@grepr_dataclass(grepr_fields=["name", "items"])
+class Node:
+    name: str
+    items: list
+
+
+
+def test_grepr_inline_and_nested():
+    assert grepr(Node(name="a", items=[])) == 'Node(name="a", items=[])'
+    assert grepr(Node(name="a", items=[1])) == 'Node(\n    name="a",\n    items=[\n        1,\n    ],\n)'
+    assert grepr({"k": (1, 2)}, indent=None) == '{"k": (1, 2)}'
+    assert grepr(DualKeyDict({("a", "b"): 'say "hi"'}), indent=None) == 'DKD{"a" / "b": "say \\"hi\\""}'
+    assert grepr(Node(name="a", items=[1]), annotate_fields=False, indent=None) == 'Node("a", [1])'
+    assert grepr(5) == "5"
+
+def test_grepr_to():
+    node = Node(name="root", items=[Node(name="child", items=[(1, 2, 3), {"x": None}])])
+    stream = StringIO()
+    grepr_to(node, stream)
+    assert stream.getvalue() == grepr(node) == repr(node)
+
+def test_grepr_to_deeply_nested():
+    depth = getrecursionlimit() * 2
+    node = Node(name="leaf", items=[])
+    for _ in range(depth):
+        node = Node(name="node", items=[node])
+    text = grepr(node, indent=None)
+    assert text.count("Node(") == depth + 1
+    assert text.endswith('Node(name="leaf", items=[])' + "])" * depth)
+
+def test_grepr_bounded():
+    node = Node(name="root", items=[Node(name=str(i), items=[i]) for i in range(42)])
+    assert grepr(node, indent=None, max_depth=1) == 'Node(name="root", items=[…42 items])'
+    assert grepr(node, indent=None, max_depth=2, max_items=2) == (
+        'Node(name="root", items=[Node(…), Node(…), …40 more items])'
+    )
+    assert grepr(Node(name="a", items=[0, 0]), indent=None, max_depth=1) == 'Node(name="a", items=[0, 0])'
+    assert grepr(node, max_chars=11) == "Node(\n    n…"
+    assert grepr("x" * 20, max_chars=3) == '"xx…'
+
+def test_grepr_summary():
+    sprite = SRSprite.create_empty(name="Player")
+    summary = grepr_summary(sprite)
+    assert summary.startswith('SRSprite(scripts=[], ')
+    assert len(grepr_summary(sprite, max_chars=20)) == 21
+    sprite.content_hash()
+    sprite.name = "Enemy"
+    assert 'name="Enemy"' in grepr_summary(sprite)
+    sprite.content_hash()
+    sprite.costumes.clear() # in place mutations are shown as well
+    assert 'costumes=[]' in grepr_summary(sprite)
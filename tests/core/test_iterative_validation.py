@@ -0,0 +1,89 @@
+from pytest import fixture, raises
+
+from pypenguin.utility     import ValidationConfig, TypeValidationError, InvalidBlockShapeError
+from pypenguin.opcode_info import info_api, DropdownValueKind
+
+from pypenguin.core.block     import (
+    SRScript, SRBlock, SRBlockAndTextInputValue, SRBlockOnlyInputValue, SRScriptInputValue,
+)
+from pypenguin.core.block_api import ValidationAPI
+from pypenguin.core.context   import CompleteContext
+
+
+def create_join_chain(depth: int) -> SRBlock:
+    block = None
+    for _ in range(depth):
+        block = SRBlock(
+            opcode="join (STRING1) (STRING2)",
+            inputs={
+                "STRING1": SRBlockAndTextInputValue(block=block, text="a"),
+                "STRING2": SRBlockAndTextInputValue(block=None, text="b"),
+            },
+            dropdowns={},
+            comment=None,
+            mutation=None,
+        )
+    return block
+
+def create_if_chain(depth: int) -> SRBlock:
+    blocks = []
+    for _ in range(depth):
+        blocks = [SRBlock(
+            opcode="if <CONDITION> then {THEN}",
+            inputs={"CONDITION": SRBlockOnlyInputValue(block=None), "THEN": SRScriptInputValue(blocks=blocks)},
+            dropdowns={},
+            comment=None,
+            mutation=None,
+        )]
+    return blocks[0]
+
+@fixture
+def config():
+    return ValidationConfig()
+
+@fixture
+def context():
+    return CompleteContext(
+        scope_variables=[(DropdownValueKind.VARIABLE, "my variable")],
+        scope_lists=[],
+        all_sprite_variables=[(DropdownValueKind.VARIABLE, "my variable")],
+        sprite_only_variables=[],
+        sprite_only_lists=[],
+        other_sprites=[],
+        backdrops=[],
+        costumes=[],
+        sounds=[],
+        is_stage=False,
+    )
+
+
+
+def test_validate_deeply_nested_reporters(config, context):
+    script = SRScript(position=(0, 0), blocks=[create_join_chain(3000)])
+    script.validate([], config, info_api, ValidationAPI(scripts=[script]), context)
+
+def test_validate_deeply_nested_substacks(config, context):
+    script = SRScript(position=(0, 0), blocks=[create_if_chain(3000)])
+    script.validate([], config, info_api, ValidationAPI(scripts=[script]), context)
+
+def test_validate_nested_error_path(config, context):
+    innermost = create_join_chain(1)
+    block = create_join_chain(3)
+    block.inputs["STRING1"].block.inputs["STRING1"].block = innermost
+    innermost.inputs["STRING2"].text = 5
+    script = SRScript(position=(0, 0), blocks=[block])
+    with raises(TypeValidationError) as exc_info:
+        script.validate(["sprites", 0, "scripts", 0], config, info_api, ValidationAPI(scripts=[script]), context)
+    assert exc_info.value.path == [
+        "sprites", 0, "scripts", 0, "blocks", 0, 
+        "inputs", ("STRING1",), "block", "inputs", ("STRING1",), "block", "inputs", ("STRING2",),
+    ]
+
+def test_validate_substack_order(config, context):
+    # the shape of a block in a substack is checked after the block itself
+    block = create_if_chain(2)
+    block.inputs["THEN"].blocks.append(create_join_chain(1))
+    script = SRScript(position=(0, 0), blocks=[block])
+    with raises(InvalidBlockShapeError) as exc_info:
+        script.validate([], config, info_api, ValidationAPI(scripts=[script]), context)
+    assert exc_info.value.path == ["blocks", 0, "inputs", ("THEN",), "blocks", 1]
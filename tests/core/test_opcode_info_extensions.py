@@ -0,0 +1,88 @@
+from json       import loads
+from os         import path
+from subprocess import run
+from sys        import executable
+
+from pytest import fixture, mark
+
+from pypenguin.utility               import read_all_files_of_zip, ValidationConfig
+from pypenguin.opcode_info.data      import main as data_main
+from pypenguin.opcode_info.data.main import SNAPSHOT_PATH
+from pypenguin.core                  import FRProject
+
+
+@fixture(scope="module")
+def project_contents() -> dict[str, bytes]:
+    return read_all_files_of_zip("../tests/assets/testing_blocks.pmp")
+
+def add_extension_blocks(project_data: dict) -> None:
+    # adds a pen and a music script including their menu blocks to the first sprite
+    project_data["extensions"] = ["pen", "music"]
+    project_data["targets"][1]["blocks"].update({
+        "pen_a": {
+            "opcode": "pen_penDown", "next": "pen_b", "parent": None, "inputs": {}, "fields": {},
+            "shadow": False, "topLevel": True, "x": 0, "y": 600,
+        },
+        "pen_b": {
+            "opcode": "pen_setPenColorParamTo", "next": "music_a", "parent": "pen_a",
+            "inputs": {"COLOR_PARAM": [1, "pen_menu"], "VALUE": [1, [10, "50"]]}, "fields": {},
+            "shadow": False, "topLevel": False,
+        },
+        "pen_menu": {
+            "opcode": "pen_menu_colorParam", "next": None, "parent": "pen_b", "inputs": {},
+            "fields": {"colorParam": ["color", None]}, "shadow": True, "topLevel": False,
+        },
+        "music_a": {
+            "opcode": "music_playDrumForBeats", "next": None, "parent": "pen_b",
+            "inputs": {"DRUM": [1, "music_menu"], "BEATS": [1, [4, "0.25"]]}, "fields": {},
+            "shadow": False, "topLevel": False,
+        },
+        "music_menu": {
+            "opcode": "music_menu_DRUM", "next": None, "parent": "music_a", "inputs": {},
+            "fields": {"DRUM": ["1", None]}, "shadow": True, "topLevel": False,
+        },
+    })
+
+
+
+def test_load_extensions():
+    api = data_main._create_info_api(use_snapshot=False)
+    api.load_extensions(["pen", "an unknown extension"])
+    assert api.get_info_by_old_safe("pen_penDown") is not None
+    assert "music_playDrumForBeats" not in api.opcode_info.keys_key1()
+    assert "motion_movesteps" not in api.opcode_info.keys_key1() # categories stay lazy
+    api.load_extensions(["pen"]) # loading twice is fine
+
+    assert api.get_info_by_old("music_playDrumForBeats").opcode_type == api.get_info_by_old("pen_penDown").opcode_type
+    assert api.get_info_by_old("text2speech_speakAndWait") is not None
+    assert "text_setText" not in api.opcode_info.keys_key1() # "text_" doesn't match "text2speech_"
+
+def test_load_extensions_from_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_main, "SNAPSHOT_PATH", str(tmp_path / "info_api.snapshot"))
+    data_main.build_snapshot()
+    api = data_main._create_info_api(use_snapshot=True)
+    api.load_extensions(["jgJSON"])
+    assert not api.has_lazy_groups()
+    assert api.get_info_by_old_safe("jgJSON_json_validate") is not None
+    assert api.get_info_by_old_safe("Bitwise_bitwiseRightShift") is not None
+
+def test_convert_project_with_extensions(project_contents):
+    project_data = loads(project_contents["project.json"].decode("utf-8"))
+    add_extension_blocks(project_data)
+    asset_files = {name: content for name, content in project_contents.items() if name != "project.json"}
+    api = data_main._create_info_api(use_snapshot=False)
+    frproject = FRProject.from_data(project_data, asset_files=asset_files, info_api=api, prevalidate=True)
+    srproject = frproject.step(api, decode_assets=False)
+    srproject.validate(ValidationConfig(), api)
+    assert [extension.id for extension in srproject.extensions] == ["pen", "music"]
+
+@mark.skipif(path.exists(SNAPSHOT_PATH), reason="a built snapshot replaces the categories")
+def test_import_does_not_load_extensions():
+    code = (
+        "import sys\n"
+        "from pypenguin.opcode_info import info_api\n"
+        "info_api.get_info_by_old('motion_movesteps')\n"
+        "print(any(module.startswith('pypenguin.opcode_info.data.c_extension_') for module in sys.modules))\n"
+    )
+    result = run([executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,89 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy               import deepcopy
+from pickle             import dumps, loads
+
+from pytest import raises
+
+from pypenguin.utility               import FrozenOpcodeInfoError
+from pypenguin.opcode_info           import OpcodeInfoAPI, OpcodeInfo, SpecialCase, SpecialCaseType, OpcodeType, info_api
+from pypenguin.opcode_info.data      import main as data_main
+from pypenguin.core                  import FRProject
+
+
+def create_frozen_api() -> OpcodeInfoAPI:
+    api = data_main._create_info_api(use_snapshot=False)
+    api.freeze()
+    return api
+
+
+
+def test_freeze():
+    api = create_frozen_api()
+    assert api.is_frozen()
+    assert not api.has_lazy_groups()
+    assert sorted(api.get_all_old()) == sorted(info_api.get_all_old())
+    assert api.get_closest_new_opcodes("move (STEPS) stps", 1) == info_api.get_closest_new_opcodes("move (STEPS) stps", 1)
+    api.freeze() # freezing twice is fine
+
+    opcode_info = api.get_info_by_old("control_stop")
+    assert opcode_info.is_frozen()
+    assert opcode_info == info_api.get_info_by_old("control_stop")
+    assert not info_api.get_info_by_old("control_stop").is_frozen() # shared groups stay unchanged
+
+def test_freeze_prevents_changes():
+    api = create_frozen_api()
+    special_case = SpecialCase(type=SpecialCaseType.GET_OPCODE_TYPE, function=lambda block, validation_api: OpcodeType.STATEMENT)
+    with raises(FrozenOpcodeInfoError):
+        api.add_opcode_case("motion_movesteps", special_case)
+    with raises(FrozenOpcodeInfoError):
+        api.set_opcode_mutation_class("motion_movesteps", old_cls=None, new_cls=None)
+    with raises(FrozenOpcodeInfoError):
+        api.add_lazy_group({"a_"}, lambda api: None)
+    with raises(FrozenOpcodeInfoError):
+        api.opcode_info = None
+    with raises(TypeError):
+        api.get_info_by_old("motion_movesteps").special_cases[SpecialCaseType.GET_OPCODE_TYPE] = special_case
+
+def test_freeze_copy_and_pickle():
+    api = create_frozen_api()
+    for copied_api in (deepcopy(api), loads(dumps(api))):
+        assert copied_api.is_frozen()
+        opcode_info = copied_api.get_info_by_old("control_stop")
+        assert opcode_info.is_frozen()
+        assert opcode_info == api.get_info_by_old("control_stop")
+        with raises(FrozenOpcodeInfoError):
+            opcode_info.add_special_case(SpecialCase(type=SpecialCaseType.GET_OPCODE_TYPE, function=print))
+
+def test_freeze_concurrent_conversion():
+    api = create_frozen_api()
+    frproject = FRProject.from_file("../tests/assets/testing_blocks.pmp", api)
+    expected = frproject.step(api, decode_assets=False).content_hash()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: frproject.step(api, decode_assets=False).content_hash(), range(8)))
+    assert results == [expected] * 8
+
+def test_freeze_special_case_slots():
+    api = create_frozen_api()
+    for old_opcode in ("control_stop", "procedures_call", "motion_movesteps"):
+        frozen_info   = api.get_info_by_old(old_opcode)
+        unfrozen_info = info_api.get_info_by_old(old_opcode)
+        assert frozen_info.has_special_cases() == unfrozen_info.has_special_cases()
+        for case_type in SpecialCaseType:
+            assert frozen_info.get_special_case(case_type) == unfrozen_info.get_special_case(case_type)
+    
+    opcode_info = api.get_info_by_old("motion_movesteps")
+    assert not opcode_info.has_special_cases()
+    assert opcode_info.get_opcode_type(block=None, validation_api=None) is OpcodeType.STATEMENT
+    assert opcode_info.get_input_ids_types(block=None, ficapi=None) == info_api.get_info_by_old("motion_movesteps").get_input_ids_types(block=None, ficapi=None)
+    
+    for copied_info in (deepcopy(opcode_info), loads(dumps(opcode_info))):
+        assert copied_info.get_special_case(SpecialCaseType.FR_STEP) is None
+        assert copied_info.get_input_ids_types(block=None, ficapi=None) == opcode_info.get_input_ids_types(block=None, ficapi=None)
+
+def test_freeze_checks_dynamic_opcode_type():
+    with raises(AssertionError):
+        OpcodeInfo(opcode_type=OpcodeType.DYNAMIC).freeze()
+    opcode_info = OpcodeInfo(opcode_type=OpcodeType.STATEMENT)
+    opcode_info.add_special_case(SpecialCase(type=SpecialCaseType.GET_OPCODE_TYPE, function=print))
+    with raises(AssertionError):
+        opcode_info.freeze()
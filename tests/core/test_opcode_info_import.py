@@ -0,0 +1,130 @@
+from subprocess import run
+from sys        import executable
+
+from pytest import raises
+
+from pypenguin.utility               import DualKeyDict, OpcodeInfoError
+from pypenguin.opcode_info           import (
+    OpcodeInfoAPI, OpcodeInfoGroup, OpcodeInfo, OpcodeType, SpecialCase, SpecialCaseType, info_api,
+)
+from pypenguin.opcode_info.data      import main as data_main
+
+
+CATEGORY_MODULE_PREFIX = "pypenguin.opcode_info.data.c_"
+
+def get_import_times(code: str) -> dict[str, tuple[int, int]]:
+    # runs code in a fresh interpreter and parses the output of python -X importtime
+    result = run([executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative_time, module = line.removeprefix("import time:").split("|")
+        import_times[module.strip()] = (int(self_time), int(cumulative_time))
+    return import_times
+
+def get_loaded_categories(lookup: str, snapshot_path: str) -> list[str]:
+    # the module level info api might use a built snapshot, so a fresh api with a snapshot path, which doesn't exist, is used
+    import_times = get_import_times(
+        "from pypenguin.opcode_info.data import main as data_main; "
+        f"data_main.SNAPSHOT_PATH = {repr(snapshot_path)}; "
+        f"api = data_main._create_info_api(use_snapshot=True); {lookup}"
+    )
+    return [module for module in import_times if module.startswith(CATEGORY_MODULE_PREFIX)]
+
+def create_group(name: str, old_opcode: str, new_opcode: str) -> OpcodeInfoGroup:
+    return OpcodeInfoGroup(name=name, opcode_info=DualKeyDict({
+        (old_opcode, new_opcode): OpcodeInfo(opcode_type=OpcodeType.STATEMENT),
+    }))
+
+
+
+def test_import_time_categories_are_lazy():
+    import_times = get_import_times("import pypenguin.opcode_info")
+    assert "pypenguin.opcode_info.data.main" in import_times
+    assert not any(module.startswith(CATEGORY_MODULE_PREFIX) for module in import_times)
+
+def test_import_time_lookup_loads_one_category(tmp_path):
+    snapshot_path = str(tmp_path / "info_api.snapshot")
+    loaded_categories = get_loaded_categories("api.get_info_by_old('motion_movesteps')", snapshot_path)
+    assert loaded_categories == [CATEGORY_MODULE_PREFIX+"motion"]
+    loaded_categories = get_loaded_categories("api.get_info_by_new('erase all')", snapshot_path)
+    assert loaded_categories == [CATEGORY_MODULE_PREFIX+"extension_pen"]
+    loaded_categories = get_loaded_categories("api.get_info_by_new_safe('an unknown opcode'); api.get_all_new()", snapshot_path)
+    assert loaded_categories == []
+
+def test_lazy_groups():
+    api = OpcodeInfoAPI()
+    registered = []
+    def register_a(api: OpcodeInfoAPI) -> None:
+        registered.append("a")
+        api.add_group(create_group("a", "a_block", "block a"))
+    def register_b(api: OpcodeInfoAPI) -> None:
+        registered.append("b")
+        api.add_group(create_group("b", "b_block", "block b"))
+    api.add_lazy_group({"a_"}, register_a)
+    api.add_lazy_group({"b_"}, register_b)
+
+    assert api.get_info_by_old_safe("c_block") is None
+    assert registered == []
+    assert api.get_new_by_old("a_block") == "block a"
+    assert registered == ["a"]
+    assert api.get_info_by_new("block b").opcode_type is OpcodeType.STATEMENT
+    assert registered == ["a", "b"]
+    assert not api.has_lazy_groups()
+
+def test_lazy_groups_new_opcodes():
+    api = OpcodeInfoAPI()
+    registered = []
+    def register_a(api: OpcodeInfoAPI) -> None:
+        registered.append("a")
+        api.add_group(create_group("a", "a_block", "block a"))
+    def register_b(api: OpcodeInfoAPI) -> None:
+        registered.append("b")
+        api.add_group(create_group("b", "b_block", "block b"))
+    api.add_lazy_group({"a_"}, register_a, new_opcodes=["block a"])
+    api.add_lazy_group({"b_"}, register_b, new_opcodes=["block b"])
+
+    assert api.get_info_by_new_safe("block c") is None
+    assert sorted(api.get_all_new()) == ["block a", "block b"]
+    assert registered == []
+    assert api.get_old_by_new("block b") == "b_block"
+    assert registered == ["b"]
+    assert sorted(api.get_all_new()) == ["block a", "block b"]
+    assert registered == ["b"]
+
+def test_lazy_groups_undeclared_new_opcode():
+    api = OpcodeInfoAPI()
+    api.add_lazy_group({"a_"}, lambda api: api.add_group(create_group("a", "a_block", "block b")), new_opcodes=["block a"])
+    with raises(OpcodeInfoError):
+        api.load_all_groups()
+
+def test_new_opcodes_declaration(tmp_path):
+    file_path = tmp_path / "new_opcodes.py"
+    data_main.build_new_opcodes(str(file_path))
+    with open(data_main.NEW_OPCODES_PATH, encoding="utf-8") as file:
+        assert file_path.read_text(encoding="utf-8") == file.read(), "run python -m pypenguin.opcode_info.data.build_new_opcodes"
+
+def test_lazy_groups_wrong_prefix():
+    api = OpcodeInfoAPI()
+    api.add_lazy_group({"a_"}, lambda api: api.add_group(create_group("a", "b_block", "block b")))
+    with raises(OpcodeInfoError):
+        api.load_all_groups()
+
+def test_info_api_all_opcodes():
+    assert "motion_movesteps" in info_api.get_all_old()
+    assert "define custom block" in info_api.get_all_new()
+    assert info_api.get_info_by_old("data_variable").can_have_monitor
+    assert info_api.get_info_by_old("procedures_call").old_mutation_cls is not None
+
+def test_info_apis_dont_share_opcode_info():
+    api_a = data_main._create_info_api(use_snapshot=False)
+    api_b = data_main._create_info_api(use_snapshot=False)
+    api_a.add_opcode_case("motion_movesteps", SpecialCase(
+        type=SpecialCaseType.GET_OPCODE_TYPE, function=lambda block, validation_api: OpcodeType.STATEMENT,
+    ))
+    api_a.load_extensions(["pen"])
+    api_b.load_extensions(["pen"]) # registering a group again must not fail
+    assert api_a.get_info_by_old("motion_movesteps").has_special_cases()
+    assert not api_b.get_info_by_old("motion_movesteps").has_special_cases()
+    assert api_a.get_info_by_old("pen_penDown") is not api_b.get_info_by_old("pen_penDown")
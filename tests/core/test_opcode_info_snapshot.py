@@ -0,0 +1,72 @@
+from pypenguin.opcode_info           import OpcodeInfoAPI, get_snapshot_version, save_snapshot, load_snapshot
+from pypenguin.opcode_info.data      import main as data_main
+from pypenguin.opcode_info.data.main import build_snapshot, GET_OPCODE_TYPE__STOP_SCRIPT
+
+
+def test_snapshot_save_load(tmp_path):
+    file_path = str(tmp_path / "info_api.snapshot")
+    build_snapshot(file_path)
+    snapshot_api = load_snapshot(file_path, data_main._get_snapshot_version())
+    assert isinstance(snapshot_api, OpcodeInfoAPI)
+    assert not snapshot_api.has_lazy_groups()
+    assert sorted(snapshot_api.get_all_old()) == sorted(data_main.info_api.get_all_old())
+    assert snapshot_api.get_new_by_old("motion_movesteps") == data_main.info_api.get_new_by_old("motion_movesteps")
+
+    special_cases = snapshot_api.get_info_by_old("control_stop").special_cases.values()
+    assert any(special_case.function is GET_OPCODE_TYPE__STOP_SCRIPT for special_case in special_cases)
+
+def test_snapshot_invalid(tmp_path):
+    file_path = str(tmp_path / "info_api.snapshot")
+    assert load_snapshot(file_path, "v1") is None
+    save_snapshot(OpcodeInfoAPI(), file_path, "v1")
+    assert isinstance(load_snapshot(file_path, "v1"), OpcodeInfoAPI)
+    assert load_snapshot(file_path, "v2") is None
+    with open(file_path, "wb") as file:
+        file.write(b"damaged")
+    assert load_snapshot(file_path, "v1") is None
+
+def test_snapshot_digest(tmp_path):
+    file_path = str(tmp_path / "info_api.snapshot")
+    save_snapshot(OpcodeInfoAPI(), file_path, "v1")
+    with open(file_path, "rb") as file:
+        content = file.read()
+    with open(file_path, "wb") as file:
+        file.write(content[:-1]) # e.g. a truncated file
+    assert load_snapshot(file_path, "v1") is None
+    with open(file_path, "wb") as file:
+        file.write(content[:-1] + bytes([content[-1] ^ 1]))
+    assert load_snapshot(file_path, "v1") is None
+    save_snapshot(OpcodeInfoAPI(), file_path, "v1")
+    assert isinstance(load_snapshot(file_path, "v1"), OpcodeInfoAPI)
+    assert [path.name for path in tmp_path.iterdir()] == ["info_api.snapshot"] # no temporary files are left
+
+def test_snapshot_version(tmp_path):
+    source_path = tmp_path / "source.py"
+    source_path.write_text("a = 1")
+    version = get_snapshot_version(str(source_path))
+    assert get_snapshot_version(str(source_path)) == version
+    source_path.write_text("a = 2")
+    assert get_snapshot_version(str(source_path)) != version
+
+def test_snapshot_outdated_not_written(tmp_path, monkeypatch):
+    file_path = str(tmp_path / "info_api.snapshot")
+    monkeypatch.setattr(data_main, "SNAPSHOT_PATH", file_path)
+    save_snapshot(OpcodeInfoAPI(), file_path, "outdated")
+    with open(file_path, "rb") as file:
+        content = file.read()
+
+    api = data_main._create_info_api(use_snapshot=True)
+    assert api.get_new_by_old("looks_say") == data_main.info_api.get_new_by_old("looks_say")
+    assert sorted(api.get_all_old()) == sorted(data_main.info_api.get_all_old())
+    with open(file_path, "rb") as file:
+        assert file.read() == content # the categories were registered instead, the snapshot is only written by build_snapshot
+    assert [path.name for path in tmp_path.iterdir()] == ["info_api.snapshot"]
+
+def test_snapshot_used(tmp_path, monkeypatch):
+    file_path = str(tmp_path / "info_api.snapshot")
+    monkeypatch.setattr(data_main, "SNAPSHOT_PATH", file_path)
+    build_snapshot(file_path)
+    api = data_main._create_info_api(use_snapshot=True)
+    monkeypatch.setattr(data_main, "_CATEGORIES", []) # only the snapshot can provide the opcodes now
+    assert api.get_new_by_old("looks_say") == data_main.info_api.get_new_by_old("looks_say")
+    assert not api.has_lazy_groups()
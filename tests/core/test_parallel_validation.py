@@ -0,0 +1,125 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from pickle             import dumps, loads
+
+from pytest import fixture, raises
+
+from pypenguin.utility     import (
+    ValidationConfig, ValidationCache, MissingInputError, SameValueTwiceError, TypeValidationError,
+)
+from pypenguin.opcode_info import info_api
+
+from pypenguin.core.block   import SRScript, SRBlock, SRBlockAndTextInputValue
+from pypenguin.core.project import SRProject
+from pypenguin.core.target  import SRSprite
+
+
+def create_script(steps: str = "10") -> SRScript:
+    return SRScript(
+        position=(0, 0),
+        blocks=[
+            SRBlock(
+                opcode="when green flag clicked",
+                inputs={},
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+            SRBlock(
+                opcode="move (STEPS) steps",
+                inputs={"STEPS": SRBlockAndTextInputValue(block=None, text=steps)},
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+        ],
+    )
+
+def create_project(sprite_count: int = 4) -> SRProject:
+    project = SRProject.create_empty()
+    for i in range(sprite_count):
+        sprite = SRSprite.create_empty(name=f"sprite{i}")
+        sprite.scripts = [create_script(), create_script("5")]
+        project.sprites.append(sprite)
+        project.sprite_layer_stack.append(sprite.uuid)
+    return project
+
+def break_sprite(project: SRProject, index: int) -> None:
+    project.sprites[index].scripts[1].blocks[1].inputs = {}
+
+@fixture
+def config():
+    return ValidationConfig()
+
+
+
+def test_validate_with_executor(config):
+    project = create_project()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        project.validate(config, info_api, executor=executor)
+        break_sprite(project, 3)
+        break_sprite(project, 1)
+        with raises(MissingInputError) as exc_info:
+            project.validate(config, info_api, executor=executor)
+    assert exc_info.value.path == ["sprites", 1, "scripts", 1, "blocks", 1]
+
+def test_validate_with_process_pool(config):
+    project = create_project()
+    break_sprite(project, 2)
+    cache = ValidationCache()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        errors = project.get_validation_errors(config, info_api, cache, executor=executor)
+    assert len(errors) == 1
+    assert isinstance(errors[0], MissingInputError)
+    assert errors[0].path == ["sprites", 2, "scripts", 1, "blocks", 1]
+
+    # the valid targets were recorded by the workers
+    cached_keys = len(cache)
+    assert cached_keys > 0
+    cached_errors = project.get_validation_errors(config, info_api, cache)
+    assert [str(error) for error in cached_errors] == [str(error) for error in errors]
+    assert len(cache) == cached_keys
+
+def test_get_validation_errors(config):
+    project = create_project()
+    assert project.get_validation_errors(config, info_api) == []
+    break_sprite(project, 3)
+    break_sprite(project, 0)
+    errors = project.get_validation_errors(config, info_api)
+    assert [error.path[:2] for error in errors] == [["sprites", 0], ["sprites", 3]]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        concurrent_errors = project.get_validation_errors(config, info_api, executor=executor)
+    assert [str(error) for error in concurrent_errors] == [str(error) for error in errors]
+
+def test_get_validation_errors_structure(config):
+    project = create_project()
+    break_sprite(project, 0)
+    project.sprites[1].name = "sprite2"
+    errors = project.get_validation_errors(config, info_api)
+    assert isinstance(errors[0], SameValueTwiceError)
+    assert [error.path for error in errors[1:]] == [["sprites", 0, "scripts", 1, "blocks", 1]]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        concurrent_errors = project.get_validation_errors(config, info_api, executor=executor)
+    assert [str(error) for error in concurrent_errors] == [str(error) for error in errors]
+
+def test_validate_with_executor_cancels(config):
+    project = create_project(sprite_count=8)
+    for i in range(8):
+        break_sprite(project, i)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with raises(MissingInputError) as exc_info:
+            project.validate(config, info_api, executor=executor)
+        errors = project.iter_validation_errors(config, info_api, executor=executor, max_errors=2)
+        assert [error.path[:2] for error in errors] == [["sprites", 0], ["sprites", 1]]
+    assert exc_info.value.path == ["sprites", 0, "scripts", 1, "blocks", 1]
+
+def test_validation_error_pickle():
+    error = TypeValidationError(["sprites", 0, "volume"], "volume must be an int", condition="Some condition")
+    unpickled = loads(dumps(error))
+    assert type(unpickled) is TypeValidationError
+    assert unpickled.path == error.path
+    assert str(unpickled) == str(error)
+
+    error = SameValueTwiceError(["sprites", 0], ["sprites", 1], "Two sprites mustn't have the same name")
+    unpickled = loads(dumps(error))
+    assert (unpickled.path1, unpickled.path2) == (error.path1, error.path2)
+    assert str(unpickled) == str(error)
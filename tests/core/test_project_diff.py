@@ -0,0 +1,128 @@
+from pytest import fixture, raises
+
+from pypenguin.utility import PatchError
+
+from pypenguin.core.block        import SRScript, SRBlock, SRBlockAndTextInputValue
+from pypenguin.core.project_diff import SRChangeKind, SRChange, diff, apply_patch
+from pypenguin.core.project      import SRProject
+from pypenguin.core.target       import SRSprite
+from pypenguin.core.vars_lists   import SRVariable
+
+
+def create_script(steps: str = "10") -> SRScript:
+    return SRScript(
+        position=(0, 0),
+        blocks=[
+            SRBlock(
+                opcode="when green flag clicked",
+                inputs={},
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+            SRBlock(
+                opcode="move (STEPS) steps",
+                inputs={"STEPS": SRBlockAndTextInputValue(block=None, text=steps)},
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+        ],
+    )
+
+def create_project() -> SRProject:
+    project = SRProject.create_empty()
+    sprite_a = SRSprite.create_empty(name="sprite1")
+    sprite_b = SRSprite.create_empty(name="sprite2")
+    sprite_a.scripts = [create_script(), create_script("5")]
+    project.sprites = [sprite_a, sprite_b]
+    project.sprite_layer_stack = [sprite_a.uuid, sprite_b.uuid]
+    project.all_sprite_variables = [SRVariable(name="score", current_value=0)]
+    return project
+
+@fixture
+def project():
+    return create_project()
+
+
+
+def test_diff_equal(project: SRProject):
+    assert diff(project, create_project()) == []
+
+def test_diff_modified_input(project: SRProject):
+    new_project = create_project()
+    new_project.sprites[0].scripts[1].blocks[1].inputs["STEPS"].text = "7"
+    changes = diff(project, new_project)
+    assert changes == [SRChange(
+        kind=SRChangeKind.MODIFIED,
+        path=["sprites", 0, "scripts", 1, "blocks", 1, "inputs", ("STEPS",), "text"],
+        old="5",
+        new="7",
+    )]
+    assert apply_patch(project, changes) == new_project
+
+def test_diff_added_removed(project: SRProject):
+    new_project = create_project()
+    new_project.sprites[0].scripts.pop(0)
+    new_project.sprites[0].scripts.append(create_script("99"))
+    new_project.all_sprite_variables.append(SRVariable(name="lives", current_value=3))
+    changes = diff(project, new_project)
+    kinds = sorted((change.kind.name, tuple(map(str, change.path))) for change in changes)
+    assert ("ADDED", ("all_sprite_variables", "1")) in kinds
+    assert ("REMOVED", ("sprites", "0", "scripts", "0")) in kinds
+    assert apply_patch(project, changes) == new_project
+
+def test_diff_sprites(project: SRProject):
+    new_project = create_project()
+    sprite_c = SRSprite.create_empty(name="sprite3")
+    new_project.sprites = [new_project.sprites[1], sprite_c]
+    new_project.sprite_layer_stack = [sprite_c.uuid, new_project.sprites[0].uuid]
+    new_project.tempo = 100
+    changes = diff(project, new_project)
+    assert SRChange(kind=SRChangeKind.MODIFIED, path=["tempo"], old=60, new=100) in changes
+    assert SRChange(
+        kind=SRChangeKind.MODIFIED, path=["sprite_layer_stack"], old=["sprite1", "sprite2"], new=["sprite3", "sprite2"],
+    ) in changes
+    assert apply_patch(project, changes) == new_project
+
+def test_apply_patch_shares_unchanged(project: SRProject):
+    new_project = create_project()
+    new_project.sprites[1].volume = 50
+    patched = apply_patch(project, diff(project, new_project))
+    assert patched == new_project
+    assert patched.sprites[0] is project.sprites[0]
+    assert project.sprites[1].volume == 100
+
+def test_apply_patch_invalid(project: SRProject):
+    with raises(PatchError):
+        apply_patch(project, [SRChange(kind=SRChangeKind.REMOVED, path=["sprites", 5])])
+
+def test_diff_deep_nesting():
+    def create_deep_project(depth: int, text: str) -> SRProject:
+        block = None
+        for _ in range(depth):
+            block = SRBlock(
+                opcode="join (STRING1) (STRING2)",
+                inputs={
+                    "STRING1": SRBlockAndTextInputValue(block=block, text=text),
+                    "STRING2": SRBlockAndTextInputValue(block=None, text="b"),
+                },
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            )
+        project = create_project()
+        project.sprites[1].scripts = [SRScript(position=(0, 0), blocks=[block])]
+        return project
+    
+    old_project = create_deep_project(1000, "a")
+    new_project = create_deep_project(1000, "a")
+    assert diff(old_project, new_project) == []
+    innermost_block = new_project.sprites[1].scripts[0].blocks[0]
+    for _ in range(999):
+        innermost_block = innermost_block.inputs["STRING1"].block
+    innermost_block.inputs["STRING1"].text = "c"
+    changes = diff(old_project, new_project)
+    assert len(changes) == 1
+    assert len(changes[0].path) == 6 + 3*999 + 3
+    assert apply_patch(old_project, changes).content_hash() == new_project.content_hash()
@@ -0,0 +1,57 @@
+from pytest import raises
+from uuid   import uuid4
+
+from pypenguin.core.project    import SRProject
+from pypenguin.core.target     import SRSprite
+from pypenguin.core.vars_lists import SRVariable
+
+
+def test_SRProject_clone():
+    srproject = SRProject.create_empty()
+    sprite = SRSprite.create_empty(name="sprite1")
+    srproject.sprites = [sprite]
+    srproject.sprite_layer_stack = [sprite.uuid]
+
+    clone = srproject.clone()
+    assert clone == srproject
+    assert clone.stage is srproject.stage
+    assert clone.sprites[0] is sprite
+    assert clone.sprites is not srproject.sprites
+
+    clone.sprites.append(SRSprite.create_empty(name="sprite2"))
+    assert len(srproject.sprites) == 1
+
+def test_SRProject_evolve():
+    srproject = SRProject.create_empty()
+    variable = SRVariable(name="a var", current_value=5)
+    evolved = srproject.evolve(tempo=120, all_sprite_variables=[variable])
+    assert evolved.tempo == 120
+    assert evolved.all_sprite_variables == [variable]
+    assert srproject.tempo == 60
+    assert srproject.all_sprite_variables == []
+    assert evolved.stage is srproject.stage
+    with raises(TypeError):
+        srproject.evolve(not_a_field=5)
+
+def test_SRProject_evolve_stage():
+    srproject = SRProject.create_empty()
+    evolved = srproject.evolve_stage(volume=50)
+    assert evolved.stage.volume == 50
+    assert srproject.stage.volume == 100
+    assert evolved.stage.costumes[0] is srproject.stage.costumes[0]
+
+def test_SRProject_evolve_sprite():
+    srproject = SRProject.create_empty()
+    sprite_a = SRSprite.create_empty(name="sprite1")
+    sprite_b = SRSprite.create_empty(name="sprite2")
+    srproject.sprites = [sprite_a, sprite_b]
+    srproject.sprite_layer_stack = [sprite_a.uuid, sprite_b.uuid]
+
+    evolved = srproject.evolve_sprite(0, name="renamed")
+    assert evolved.sprites[0].name == "renamed"
+    assert evolved.sprites[0].uuid == sprite_a.uuid
+    assert evolved.sprites[1] is sprite_b
+    assert sprite_a.name == "sprite1"
+    assert srproject.sprites[0] is sprite_a
+    with raises(AttributeError):
+        srproject.evolve_sprite(0, uuid=uuid4())
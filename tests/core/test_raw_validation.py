@@ -0,0 +1,80 @@
+from copy import deepcopy
+from json import loads
+
+from pytest import fixture, raises
+
+from pypenguin.utility     import (
+    read_all_files_of_zip, RawMissingKeyError, RawTypeError, RawReferenceError, RawOpcodeError, RawMutationError,
+)
+from pypenguin.opcode_info import info_api
+
+from pypenguin.core.project        import FRProject
+from pypenguin.core.raw_validation import prevalidate_project_data
+
+
+@fixture(scope="module")
+def project_data() -> dict:
+    contents = read_all_files_of_zip("../tests/assets/testing_blocks.pmp")
+    return loads(contents["project.json"].decode("utf-8"))
+
+def get_block_dicts(target_data: dict) -> dict[str, dict]:
+    return {block_id: block_data for block_id, block_data in target_data["blocks"].items() if isinstance(block_data, dict)}
+
+
+
+def test_prevalidate_valid(project_data):
+    report = prevalidate_project_data(project_data, info_api)
+    assert report.is_valid()
+    assert not report.is_truncated
+    report.raise_first()
+
+def test_prevalidate_missing_keys(project_data):
+    data = deepcopy(project_data)
+    del data["meta"]
+    report = prevalidate_project_data(data, info_api)
+    assert [type(error) for error in report.errors] == [RawMissingKeyError]
+
+    data = deepcopy(project_data)
+    del data["targets"][0]["tempo"]
+    data["targets"][1]["blocks"] = []
+    report = prevalidate_project_data(data, info_api)
+    assert report.get_error_counts() == {"RawMissingKeyError": 1, "RawTypeError": 1}
+    assert report.errors[1].path == [("targets",), 1, ("blocks",)]
+
+def test_prevalidate_blocks(project_data):
+    data = deepcopy(project_data)
+    target_data = next(target_data for target_data in data["targets"] if get_block_dicts(target_data))
+    block_id, block_data = next(iter(get_block_dicts(target_data).items()))
+    block_data["next"] = "missing block"
+    block_data["opcode"] = "not_an_opcode"
+    report = prevalidate_project_data(data, info_api)
+    assert {type(error) for error in report.errors} == {RawReferenceError, RawOpcodeError}
+    assert report.errors[0].path[-2:] == [(block_id,), ("opcode",)]
+    with raises(RawOpcodeError):
+        FRProject.from_data(data, asset_files={}, info_api=info_api, prevalidate=True)
+
+def test_prevalidate_mutation(project_data):
+    data = deepcopy(project_data)
+    for target_data in data["targets"]:
+        for block_data in get_block_dicts(target_data).values():
+            if "mutation" in block_data:
+                del block_data["mutation"]
+            elif block_data["opcode"] == "motion_movesteps":
+                block_data["mutation"] = {}
+    report = prevalidate_project_data(data, info_api, max_errors=None)
+    assert len(report.errors) > 0
+    assert all(isinstance(error, RawMutationError) for error in report.errors)
+
+def test_prevalidate_max_errors(project_data):
+    data = deepcopy(project_data)
+    for target_data in data["targets"]:
+        for block_data in get_block_dicts(target_data).values():
+            block_data["parent"] = "missing block"
+    report = prevalidate_project_data(data, info_api, max_errors=3)
+    assert len(report.errors) == 3
+    assert report.is_truncated
+    assert report.get_error_counts() == {"RawReferenceError": 3}
+
+def test_prevalidate_not_an_object():
+    report = prevalidate_project_data([], info_api)
+    assert [type(error) for error in report.errors] == [RawTypeError]
@@ -0,0 +1,29 @@
+from difflib import get_close_matches
+
+from pypenguin.utility     import SimilarityIndex, get_closest_matches
+from pypenguin.opcode_info import info_api
+
+
+
+def test_similarity_index():
+    index = SimilarityIndex(["move (STEPS) steps", "turn right (DEGREES) degrees", "say (MESSAGE)", "say (MESSAGE)"])
+    assert len(index) == 3
+    assert index.get_closest_matches("mov (STEPS) step", n=1) == ["move (STEPS) steps"]
+    assert index.get_closest_matches("sy (MESSAGE)", n=2)[0] == "say (MESSAGE)"
+    assert len(index.get_closest_matches("", n=10)) == 3 # filled up, although nothing is similar
+    assert SimilarityIndex([]).get_closest_matches("a", n=5) == []
+
+def test_similarity_index_matches_difflib():
+    all_new = info_api.get_all_new()
+    index = SimilarityIndex(all_new)
+    for typo in ["mvoe (STEPS) steps", "if <CONDITION> then {THEN} else {ELSE", "whn green flag clicked", "sya (MESSAGE)"]:
+        assert index.get_closest_matches(typo, n=3) == get_closest_matches(typo, all_new, n=3)
+
+def test_similarity_index_matches_difflib_get_close_matches():
+    all_new = info_api.get_all_new()
+    index = SimilarityIndex(all_new)
+    for typo in ["mvoe (STEPS) steps", "sya (MESSAGE)", "chnage [EFFECT] efect by (VALUE)", "stop all soundz", "(A) = (B"]:
+        assert index.get_closest_matches(typo, n=3) == get_close_matches(typo, all_new, n=3, cutoff=0)
+
+def test_info_api_get_closest_new_opcodes():
+    assert info_api.get_closest_new_opcodes("move (STEP) steps", n=1) == ["move (STEPS) steps"]
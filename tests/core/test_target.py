@@ -215,6 +215,25 @@ def test_SRTarget_validate(config):
         func_args=[[], config, info_api],
     )
 
+def test_SRTarget_validate_order(config):
+    srtarget = SRTarget.create_empty()
+    srtarget.costume_index = 3
+    srtarget.sounds = "a str"
+    srtarget.volume = 105
+    with raises(RangeValidationError) as exc_info:
+        srtarget.validate([], config, info_api)
+    assert exc_info.value.msg.startswith("costume_index of")
+
+    srtarget.costume_index = 0
+    with raises(TypeValidationError) as exc_info:
+        srtarget.validate([], config, info_api)
+    assert exc_info.value.msg.startswith("sounds of")
+
+    srtarget.costumes = []
+    with raises(RangeValidationError) as exc_info:
+        srtarget.validate([], config, info_api)
+    assert exc_info.value.msg.startswith("costumes of")
+
 def test_SRTarget_validate_same_costume_name(config):
     srtarget = SRTarget.create_empty()
     srtarget.costumes = [
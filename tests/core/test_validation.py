@@ -0,0 +1,82 @@
+from pytest import raises
+
+from pypenguin.utility import (
+    FieldConstraint, compile_field_validator, lazy_field_validator, is_json_compatible, PathNode,
+    AA_TYPE, AA_RANGE, AA_JSON_COMPATIBLE, AA_BOXED_COORD_PAIR, AA_BIGGER_OR_EQUAL,
+    TypeValidationError, RangeValidationError,
+)
+from pypenguin.utility.general import grepr_dataclass
+
+
+@grepr_dataclass(grepr_fields=["volume", "value", "position", "low", "high"])
+class Item:
+    volume: int
+    value: object = None
+    position: tuple = (0, 0)
+    low: int = 0
+    high: int = 0
+
+validate_item = compile_field_validator(
+    FieldConstraint(AA_TYPE, "volume", int),
+    FieldConstraint(AA_RANGE, "volume", min=0, max=100),
+    FieldConstraint(AA_JSON_COMPATIBLE, "value"),
+    FieldConstraint(AA_BOXED_COORD_PAIR, "position", min_x=-10, max_x=10, min_y=None, max_y=None),
+    FieldConstraint(AA_BIGGER_OR_EQUAL, "high", "low"), # has no inline check
+)
+
+
+
+def test_compile_field_validator():
+    validate_item(Item(volume=50, value={"a": [1, 2.5, None]}, position=(10, 1000)), [])
+    with raises(TypeValidationError):
+        validate_item(Item(volume="50"), [])
+    with raises(RangeValidationError):
+        validate_item(Item(volume=101), [])
+    with raises(TypeValidationError):
+        validate_item(Item(volume=0, value={1, 2}), [])
+    with raises(RangeValidationError):
+        validate_item(Item(volume=0, position=(11, 0)), [])
+    with raises(RangeValidationError):
+        validate_item(Item(volume=0, low=5, high=4), [])
+
+def test_compile_field_validator_message():
+    with raises(RangeValidationError) as exc_info:
+        validate_item(Item(volume=-1), ["sprites", 0])
+    assert str(exc_info.value).endswith("Item must be at least 0 and at most 100")
+    assert str(exc_info.value).startswith("At .sprites[0]: volume of a")
+
+def test_compile_field_validator_invalid_attr():
+    with raises(ValueError):
+        compile_field_validator(FieldConstraint(AA_TYPE, "not an attr", int))
+
+def test_lazy_field_validator():
+    validate = lazy_field_validator(lambda: (FieldConstraint(AA_TYPE, "volume", LaterDefined),))
+    validate(Item(volume=LaterDefined()), [])
+    with raises(TypeValidationError):
+        validate(Item(volume=5), [])
+
+class LaterDefined:
+    pass
+
+def test_is_json_compatible():
+    assert is_json_compatible(None)
+    assert is_json_compatible([1, "a", True, 2.5, (3, 4), {"b": [None], 5: {}}])
+    assert not is_json_compatible({"a": {1, 2}})
+    assert not is_json_compatible({("a",): 1})
+    assert not is_json_compatible(object())
+    shared = [1]
+    assert is_json_compatible([shared, shared])
+    circular = []
+    circular.append(circular)
+    assert not is_json_compatible(circular)
+
+def test_path_node():
+    path = PathNode(PathNode(["sprites", 0], "scripts", 1), "blocks", 2)
+    assert path.to_list() == ["sprites", 0, "scripts", 1, "blocks", 2]
+    assert path == ["sprites", 0, "scripts", 1, "blocks", 2]
+    assert path+["opcode"] == ["sprites", 0, "scripts", 1, "blocks", 2, "opcode"]
+    assert len(path) == 6
+    with raises(RangeValidationError) as exc_info:
+        validate_item(Item(volume=-1), path)
+    assert exc_info.value.path == ["sprites", 0, "scripts", 1, "blocks", 2]
+    assert str(exc_info.value).startswith("At .sprites[0].scripts[1].blocks[2]: ")
@@ -0,0 +1,220 @@
+import sys
+
+from pytest import fixture, raises
+
+from pypenguin.utility     import ValidationConfig, ValidationCache, PathError, MissingInputError, InvalidDropdownValueError, TypeValidationError
+from pypenguin.opcode_info           import OpcodeInfoAPI, info_api
+from pypenguin.opcode_info.data      import main as data_main
+
+from pypenguin.core.block      import SRScript, SRBlock, SRBlockAndTextInputValue
+from pypenguin.core.dropdown   import SRDropdownValue, DropdownValueKind
+from pypenguin.core.project    import SRProject
+from pypenguin.core.target     import SRSprite
+from pypenguin.core.vars_lists import SRVariable
+
+
+def create_script(steps: str = "10") -> SRScript:
+    return SRScript(
+        position=(0, 0),
+        blocks=[
+            SRBlock(
+                opcode="when green flag clicked",
+                inputs={},
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+            SRBlock(
+                opcode="move (STEPS) steps",
+                inputs={"STEPS": SRBlockAndTextInputValue(block=None, text=steps)},
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+        ],
+    )
+
+def create_project() -> SRProject:
+    project = SRProject.create_empty()
+    sprite = SRSprite.create_empty(name="sprite1")
+    sprite.scripts = [create_script(), create_script("5")]
+    project.sprites = [sprite]
+    project.sprite_layer_stack = [sprite.uuid]
+    return project
+
+@fixture
+def config():
+    return ValidationConfig()
+
+
+
+def test_validation_cache_reuse(config):
+    project = create_project()
+    cache = ValidationCache()
+    project.validate(config, info_api, cache)
+    cached_keys = len(cache)
+    assert cached_keys > 0
+    project.validate(config, info_api, cache)
+    assert len(cache) == cached_keys
+
+    project.sprites[0].scripts[0].blocks[1].inputs["STEPS"].text = "20"
+    project.validate(config, info_api, cache)
+    assert len(cache) > cached_keys
+
+def test_validation_cache_hashes_once(config, monkeypatch):
+    content_hash_module = sys.modules["pypenguin.utility.content_hash"]
+    encode_node = content_hash_module._encode_node
+    encoded_nodes = []
+    def count_encode_node(node):
+        encoded_nodes.append(id(node))
+        return encode_node(node)
+    monkeypatch.setattr(content_hash_module, "_encode_node", count_encode_node)
+
+    project = create_project()
+    cache = ValidationCache()
+    project.validate(config, info_api, cache)
+    assert len(encoded_nodes) == len(set(encoded_nodes))
+    encoded_nodes.clear()
+    project.validate(config, info_api, cache)
+    assert encoded_nodes == [] # the cached hashes are reused
+
+    project.sprites[0].scripts[0].blocks[1].inputs["STEPS"].text = "20"
+    project.validate(config, info_api, cache)
+    assert len(encoded_nodes) == 3 # the input, its block and the script
+
+def test_validation_cache_setattr(config):
+    project = create_project()
+    cache = ValidationCache()
+    project.validate(config, info_api, cache)
+    project.sprites[0].scripts[1].blocks[1].inputs = {}
+    with raises(MissingInputError):
+        project.validate(config, info_api, cache)
+
+def test_validation_cache_mark_dirty(config):
+    project = create_project()
+    cache = ValidationCache()
+    project.validate(config, info_api, cache)
+    project.sprites[0].scripts[1].blocks[1].inputs.pop("STEPS")
+    with raises(MissingInputError): # in place mutation is detected without mark_dirty
+        project.validate(config, info_api, cache)
+    project.mark_dirty(["sprites", 0, "scripts", 1, "blocks", 1, "inputs"])
+    with raises(MissingInputError):
+        project.validate(config, info_api, cache)
+
+def test_validation_cache_type_strict(config):
+    project = create_project()
+    cache = ValidationCache()
+    project.validate(config, info_api, cache)
+    project.sprites[0].is_visible = 1 # equal to True, but not a bool
+    with raises(TypeValidationError):
+        project.validate(config, info_api, cache)
+    
+    project.sprites[0].is_visible = True
+    project.validate(config, info_api, cache)
+    project.sprites[0].scripts[0].blocks[1].inputs["STEPS"].text = 10 # equal hashes would skip the type check
+    with raises(TypeValidationError):
+        project.validate(config, info_api, cache)
+
+def test_validation_cache_mark_dirty_invalid_path():
+    project = create_project()
+    with raises(PathError):
+        project.mark_dirty(["sprites", 5])
+    with raises(PathError):
+        project.mark_dirty(["sprites", 0, "scripts", 0, "blocks", 1, "inputs", ("NOT_AN_INPUT",)])
+
+def test_validation_cache_config(config):
+    project = create_project()
+    cache = ValidationCache()
+    project.validate(config, info_api, cache)
+    cached_keys = len(cache)
+    project.validate(ValidationConfig(raise_when_monitor_bigger_then_stage=False), info_api, cache)
+    assert len(cache) == 2 * cached_keys
+
+def test_validation_cache_max_size():
+    cache = ValidationCache(max_size=2)
+    cache.bind(ValidationConfig(), info_api)
+    cache.mark_valid("a")
+    cache.mark_valid("b")
+    assert cache.is_valid("a")
+    cache.mark_valid("c")
+    assert len(cache) == 2
+    assert cache.is_valid("a")
+    assert not cache.is_valid("b")
+
+    cache.bind(ValidationConfig(), object())
+    assert len(cache) == 0
+
+
+def create_variable_project(variable_name: str) -> SRProject:
+    project = create_project()
+    project.all_sprite_variables = [SRVariable(name=variable_name, current_value=0)]
+    project.sprites[0].scripts.append(SRScript(
+        position=(0, 0),
+        blocks=[SRBlock(
+            opcode="set [VARIABLE] to (VALUE)",
+            inputs={"VALUE": SRBlockAndTextInputValue(block=None, text="1")},
+            dropdowns={"VARIABLE": SRDropdownValue(kind=DropdownValueKind.VARIABLE, value="shared")},
+            comment=None,
+            mutation=None,
+        )],
+    ))
+    return project
+
+def test_validation_cache_shared_between_projects(config, monkeypatch):
+    cache = ValidationCache()
+    create_variable_project("shared").validate(config, info_api, cache)
+    calls = []
+    monkeypatch.setattr(SRScript, "validate", lambda self, *args, **kwargs: calls.append(self))
+    project = create_variable_project("shared")
+    project.all_sprite_variables.append(SRVariable(name="extra", current_value=5)) # a different context
+    project.validate(config, info_api, cache)
+    with raises(InvalidDropdownValueError):
+        create_variable_project("other").validate(config, info_api, cache)
+    assert calls == [] # only the dropdowns were checked again
+
+def test_validation_cache_shared_without_dropdowns(config, monkeypatch):
+    cache = ValidationCache()
+    create_project().validate(config, info_api, cache)
+    calls = []
+    monkeypatch.setattr(SRScript, "validate", lambda self, *args, **kwargs: calls.append(self))
+    monkeypatch.setattr(SRScript, "validate_dropdown_values", lambda self, *args, **kwargs: calls.append(self))
+    project = create_project()
+    project.all_sprite_variables.append(SRVariable(name="extra", current_value=5)) # a different context
+    project.validate(config, info_api, cache)
+    assert calls == [] # scripts without dropdowns don't depend on the context at all
+
+def test_validation_cache_save_load(config, tmp_path):
+    project = create_project()
+    cache = ValidationCache()
+    project.validate(config, info_api, cache)
+    file_path = str(tmp_path / "cache.json")
+    cache.save(file_path)
+
+    loaded_cache = ValidationCache.load(file_path)
+    assert loaded_cache.get_keys() == cache.get_keys()
+    loaded_cache.bind(config, info_api)
+    assert len(loaded_cache) == len(cache)
+
+    loaded_cache = ValidationCache.load(file_path)
+    loaded_cache.bind(config, OpcodeInfoAPI())
+    assert len(loaded_cache) == 0
+
+    with raises(ValueError):
+        ValidationCache().save(file_path)
+
+def test_validation_cache_fingerprint_keeps_groups_lazy(config, tmp_path):
+    api = data_main._create_info_api(use_snapshot=False)
+    cache = ValidationCache()
+    cache.bind(config, api)
+    cache.mark_valid("kind", b"hash")
+    file_path = str(tmp_path / "cache.json")
+    cache.save(file_path)
+    assert api.has_lazy_groups()
+
+    api.load_all_groups()
+    cache.save(file_path) # loading groups doesn't change the fingerprint
+    other_api = data_main._create_info_api(use_snapshot=False)
+    loaded_cache = ValidationCache.load(file_path)
+    loaded_cache.bind(config, other_api)
+    assert len(loaded_cache) == 1
+    assert other_api.has_lazy_groups()
@@ -0,0 +1,114 @@
+from pytest import fixture
+
+from pypenguin.utility     import (
+    ValidationConfig, ValidationCache, MissingInputError, SameValueTwiceError, TypeValidationError,
+)
+from pypenguin.opcode_info import info_api
+
+from pypenguin.core.block   import SRScript, SRBlock, SRBlockAndTextInputValue
+from pypenguin.core.project import SRProject
+from pypenguin.core.target  import SRSprite
+
+
+def create_script(steps: str = "10") -> SRScript:
+    return SRScript(
+        position=(0, 0),
+        blocks=[
+            SRBlock(
+                opcode="when green flag clicked",
+                inputs={},
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+            SRBlock(
+                opcode="move (STEPS) steps",
+                inputs={"STEPS": SRBlockAndTextInputValue(block=None, text=steps)},
+                dropdowns={},
+                comment=None,
+                mutation=None,
+            ),
+        ],
+    )
+
+def create_project(sprite_count: int = 3) -> SRProject:
+    project = SRProject.create_empty()
+    for i in range(sprite_count):
+        sprite = SRSprite.create_empty(name=f"sprite{i}")
+        sprite.scripts = [create_script(), create_script("5"), create_script("7")]
+        project.sprites.append(sprite)
+        project.sprite_layer_stack.append(sprite.uuid)
+    return project
+
+def break_script(project: SRProject, sprite_index: int, script_index: int) -> None:
+    project.sprites[sprite_index].scripts[script_index].blocks[1].inputs = {}
+
+@fixture
+def config():
+    return ValidationConfig()
+
+
+
+def test_iter_validation_errors_valid(config):
+    assert list(create_project().iter_validation_errors(config, info_api)) == []
+
+def test_iter_validation_errors_all_scripts(config):
+    project = create_project()
+    break_script(project, 2, 1)
+    break_script(project, 0, 0)
+    break_script(project, 0, 2)
+    errors = list(project.iter_validation_errors(config, info_api))
+    assert all(isinstance(error, MissingInputError) for error in errors)
+    assert [error.path for error in errors] == [
+        ["sprites", 0, "scripts", 0, "blocks", 1],
+        ["sprites", 0, "scripts", 2, "blocks", 1],
+        ["sprites", 2, "scripts", 1, "blocks", 1],
+    ]
+    # the first error is the one validate raises
+    assert str(errors[0]) == str(project.get_validation_errors(config, info_api)[0])
+
+def test_iter_validation_errors_structure(config):
+    project = create_project()
+    project.sprites[0].volume = "loud"
+    project.sprites[1].name = "sprite2"
+    project.all_sprite_variables = []
+    break_script(project, 0, 0)
+    break_script(project, 1, 0)
+    errors = list(project.iter_validation_errors(config, info_api))
+    assert isinstance(errors[0], TypeValidationError)
+    assert errors[0].path == ["sprites", 0]
+    assert isinstance(errors[1], SameValueTwiceError)
+    assert (errors[1].path1, errors[1].path2) == (["sprites", 1], ["sprites", 2])
+    # the scripts of the invalid sprite are skipped
+    assert [error.path for error in errors[2:]] == [["sprites", 1, "scripts", 0, "blocks", 1]]
+
+def test_iter_validation_errors_invalid_fields(config):
+    project = create_project()
+    project.sprites = "no sprites"
+    errors = list(project.iter_validation_errors(config, info_api))
+    assert len(errors) == 1
+    assert isinstance(errors[0], TypeValidationError)
+
+def test_iter_validation_errors_limits(config):
+    project = create_project()
+    for i in range(3):
+        break_script(project, i, 0)
+        break_script(project, i, 1)
+    assert len(list(project.iter_validation_errors(config, info_api))) == 6
+    assert len(list(project.iter_validation_errors(config, info_api, max_errors=4))) == 4
+    assert list(project.iter_validation_errors(config, info_api, max_errors=0)) == []
+    # the budget is checked after the structure, which is valid
+    assert list(project.iter_validation_errors(config, info_api, time_budget=0)) == []
+    project.sprites[0].volume = "loud"
+    assert len(list(project.iter_validation_errors(config, info_api, time_budget=0))) == 1
+
+def test_iter_validation_errors_cache(config):
+    project = create_project()
+    break_script(project, 1, 2)
+    cache = ValidationCache()
+    errors = list(project.iter_validation_errors(config, info_api, cache))
+    assert len(errors) == 1
+    cached_keys = len(cache)
+    cached_errors = list(project.iter_validation_errors(config, info_api, cache))
+    assert [str(error) for error in cached_errors] == [str(error) for error in errors]
+    assert len(cache) == cached_keys
@@ -0,0 +1,95 @@
+from pytest import raises
+
+from pypenguin.utility     import ValidationConfig, ValidationLevel, ValidationCache, ValidationError, InvalidValueError
+from pypenguin.opcode_info import info_api, DropdownValueKind
+
+from pypenguin.core.block          import SRScript, SRBlock, SRBlockAndTextInputValue
+from pypenguin.core.block_mutation import SRCustomBlockMutation, SRCustomBlockCallMutation
+from pypenguin.core.custom_block   import SRCustomBlockOpcode, SRCustomBlockOptype
+from pypenguin.core.dropdown       import SRDropdownValue
+from pypenguin.core.project        import SRProject
+from pypenguin.core.target         import SRSprite
+
+
+def create_project(*blocks: SRBlock) -> SRProject:
+    project = SRProject.create_empty()
+    sprite = SRSprite.create_empty(name="sprite1")
+    sprite.scripts = [SRScript(position=(0, 0), blocks=[block]) for block in blocks]
+    project.sprites.append(sprite)
+    project.sprite_layer_stack.append(sprite.uuid)
+    return project
+
+def create_set_variable_block(variable_name: str) -> SRBlock:
+    return SRBlock(
+        opcode="set [VARIABLE] to (VALUE)",
+        inputs={"VALUE": SRBlockAndTextInputValue(block=None, text="5")},
+        dropdowns={"VARIABLE": SRDropdownValue(kind=DropdownValueKind.VARIABLE, value=variable_name)},
+        comment=None,
+        mutation=None,
+    )
+
+def create_definition_block(optype: SRCustomBlockOptype) -> SRBlock:
+    return SRBlock(
+        opcode="define custom block",
+        inputs={},
+        dropdowns={},
+        comment=None,
+        mutation=SRCustomBlockMutation(
+            custom_opcode=SRCustomBlockOpcode(segments=("jump",)),
+            no_screen_refresh=False,
+            optype=optype,
+            main_color="#FF6680",
+            prototype_color="#FF4D6A",
+            outline_color="#FF3355",
+        ),
+    )
+
+def config_with_level(level: ValidationLevel) -> ValidationConfig:
+    return ValidationConfig(level=level)
+
+
+
+def test_validation_level_includes():
+    assert ValidationConfig().level is ValidationLevel.FULL
+    assert ValidationLevel.FULL.includes(ValidationLevel.REFERENTIAL)
+    assert ValidationLevel.REFERENTIAL.includes(ValidationLevel.REFERENTIAL)
+    assert not ValidationLevel.STRUCTURAL.includes(ValidationLevel.REFERENTIAL)
+
+def test_structural_skips_dropdown_values():
+    project = create_project(create_set_variable_block("not defined"))
+    project.validate(config_with_level(ValidationLevel.STRUCTURAL), info_api)
+    with raises(ValidationError):
+        project.validate(config_with_level(ValidationLevel.REFERENTIAL), info_api)
+
+def test_structural_skips_custom_block_calls():
+    call_block = SRBlock(
+        opcode="call custom block",
+        inputs={},
+        dropdowns={},
+        comment=None,
+        mutation=SRCustomBlockCallMutation(custom_opcode=SRCustomBlockOpcode(segments=("not defined",))),
+    )
+    project = create_project(call_block)
+    project.validate(config_with_level(ValidationLevel.STRUCTURAL), info_api)
+    with raises(ValidationError):
+        project.validate(config_with_level(ValidationLevel.REFERENTIAL), info_api)
+
+def test_structural_checks_shapes():
+    project = create_project(create_set_variable_block("not defined"))
+    project.sprites[0].scripts[0].blocks[0].inputs = {}
+    assert len(project.get_validation_errors(config_with_level(ValidationLevel.STRUCTURAL), info_api)) == 1
+
+def test_full_runs_post_validation():
+    # a reporter definition must use a different opcode
+    project = create_project(create_definition_block(SRCustomBlockOptype.NUMBER_REPORTER))
+    project.validate(config_with_level(ValidationLevel.REFERENTIAL), info_api)
+    with raises(InvalidValueError):
+        project.validate(config_with_level(ValidationLevel.FULL), info_api)
+
+def test_validation_level_cache():
+    project = create_project(create_set_variable_block("not defined"))
+    cache = ValidationCache()
+    project.validate(config_with_level(ValidationLevel.STRUCTURAL), info_api, cache)
+    # scripts validated structurally are not assumed to be valid on a higher level
+    with raises(ValidationError):
+        project.validate(config_with_level(ValidationLevel.FULL), info_api, cache)